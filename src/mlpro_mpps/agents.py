@@ -0,0 +1,85 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : agents.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides MLPro agents and players for the decentralized agents of MPPS-based
+environments.
+
+A standard MLPro agent extracts its observation from the state of the environment dimension by
+dimension. The agents of this module take their observations as views of the agent partition
+instead, see MPPSEnv.get_agent_observation(). An agent is created with the name of its part in the
+agent partition of the environment.
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.bf.systems import State
+from mlpro.rl.models_agents import Agent, Policy
+from mlpro.gt.dynamicgames.basics import Player
+from mlpro_mpps.envs import MPPSEnv
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MPPSAgent(Agent):
+    """
+    This class is an MLPro agent, which observes its part of the agent partition of an MPPS-based
+    environment. See super class for further parameters.
+
+    Parameters
+    ----------
+    p_env : MPPSEnv
+        Environment, whose agent partition contains the name of the agent.
+    p_policy : Policy
+        Policy of the agent, whose observation space is spawned by MPPSEnv.get_agent_spaces().
+    p_name : str
+        Name of the agent in the agent partition.
+    """
+
+    C_TYPE = 'MPPS Agent'
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_env:MPPSEnv, p_policy:Policy, p_name:str, p_logging=Log.C_LOG_ALL, **p_kwargs):
+
+        if p_name not in p_env.get_agent_partition():
+            raise ValueError('Agent ' + p_name + ' is not part of the agent partition of ' + type(p_env).__name__)
+
+        self._mpps_env = p_env
+        self._mpps_part = p_name
+        super().__init__(p_policy=p_policy, p_name=p_name, p_logging=p_logging, **p_kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _extract_observation(self, p_state:State) -> State:
+        if p_state.get_related_set() == self.get_observation_space():
+            return p_state
+
+        observation = State(self.get_observation_space())
+        observation.set_values(self._mpps_env.get_agent_observation(self._mpps_part, p_state))
+        return observation
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MPPSPlayer(MPPSAgent, Player):
+    """
+    This class is an MLPro player, which observes its part of the agent partition of an MPPS-based
+    game board. See class MPPSAgent.
+    """
+
+    C_TYPE = 'MPPS Player'
@@ -0,0 +1,260 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : aio.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a coroutine-friendly stepper for the batched environment of mlpro_mpps.batch,
+so that many instances of an MPPS-based environment can be driven from asyncio-based code, e.g.
+one coroutine per plant instance that interleaves its steps with I/O.
+
+Each coroutine awaits the step of its instance. The stepper collects the step requests, which are
+submitted in the same iteration of the event loop (or within a short waiting time), and processes
+them by a single masked step of the batched environment in an executor. The event loop is thus
+neither blocked by the simulation nor burdened with one executor job per instance.
+
+Single environments provide the awaitable methods reset_async() and step_async(), see
+mlpro_mpps.envs.MPPSEnv.
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.envs import MPPSEnv
+from mlpro_mpps.batch import BatchedMPPSEnv
+import numpy as np
+import asyncio
+import time
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class AsyncBatchStepper(Log):
+    """
+    This class provides awaitable resets and steps of the single instances of a batched
+    environment. Concurrent requests are processed in batches.
+
+    Parameters
+    ----------
+    p_batch : BatchedMPPSEnv
+        Batched environment.
+    p_executor :
+        Executor of the batched steps and resets, e.g. a ThreadPoolExecutor, or
+        MPPSEnv.C_EXECUTOR_INLINE to run them directly on the event loop. Default: None (default
+        executor of the event loop).
+    p_max_wait : float
+        Maximum time in seconds to wait for the requests of further instances before a batch is
+        processed. A batch is processed at once, if all instances requested a step. Default: 0.0
+        (only requests of the same iteration of the event loop are collected).
+    p_logging :
+        Log level. Default: Log.C_LOG_NOTHING.
+
+    Attributes
+    ----------
+    C_TYPE : str
+        Type of the class. Default: 'Async Batch Stepper'.
+    C_NAME : str
+        Name of the class. Default: 'MPPS'.
+    """
+
+    C_TYPE = 'Async Batch Stepper'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_batch:BatchedMPPSEnv,
+                 p_executor=None,
+                 p_max_wait:float=0.0,
+                 p_logging=Log.C_LOG_NOTHING):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._batch = p_batch
+        self._executor = p_executor
+        self._max_wait = p_max_wait
+        self._num_envs = p_batch.get_num_envs()
+
+        num_actions = p_batch.get_envs()[0].get_action_space().get_num_dim()
+        self._actions = np.zeros((self._num_envs, num_actions))
+        self._requests = {}
+        self._flush_task = None
+        self._loop = None
+        self._complete = None
+        self._lock = None
+
+        self._num_steps = 0
+        self._num_batches = 0
+        self._max_batch_size = 0
+        self._busy = 0.0
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_batch(self) -> BatchedMPPSEnv:
+        return self._batch
+
+
+## -------------------------------------------------------------------------------------------------
+    def _bind(self):
+        # Synchronization objects are bound to the running event loop
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._complete = asyncio.Event()
+            self._lock = asyncio.Lock()
+        return loop
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _run(self, p_fct, *p_args):
+        start = time.perf_counter()
+        try:
+            if self._executor == MPPSEnv.C_EXECUTOR_INLINE:
+                return p_fct(*p_args)
+            return await self._loop.run_in_executor(self._executor, p_fct, *p_args)
+        finally:
+            self._busy += time.perf_counter() - start
+
+
+## -------------------------------------------------------------------------------------------------
+    async def reset(self, p_index=None) -> np.ndarray:
+        """
+        Resets the given instances, see BatchedMPPSEnv.reset().
+
+        Parameters
+        ----------
+        p_index : int or list
+            Index or indices of the instances. Default: None (all instances).
+
+        Returns
+        -------
+        np.ndarray
+            Observation of the instance, if a single index is given, otherwise a copy of the
+            observations of all instances.
+        """
+
+        idx = np.arange(self._num_envs) if p_index is None else np.atleast_1d(p_index)
+        for i in idx:
+            if int(i) in self._requests:
+                raise RuntimeError('Instance ' + str(i) + ' has a pending step')
+
+        self._bind()
+        async with self._lock:
+            obs = await self._run(self._batch.reset, idx)
+
+        if np.isscalar(p_index):
+            return obs[p_index].copy()
+        return obs.copy()
+
+
+## -------------------------------------------------------------------------------------------------
+    async def step(self, p_index:int, p_action):
+        """
+        Requests a step of an instance and waits for its result.
+
+        Parameters
+        ----------
+        p_index : int
+            Index of the instance.
+        p_action : list or np.ndarray
+            Normalized action values, sorted in the order of the action space.
+
+        Returns
+        -------
+        obs : np.ndarray
+            Observation after the step. If the instance was reset automatically, it is the first
+            observation of the new episode.
+        rewards : np.ndarray
+            Rewards of the step.
+        terminated : bool
+            True, if the production target is reached.
+        truncated : bool
+            True, if the cycle limit is reached.
+        """
+
+        p_index = int(p_index)
+        if p_index in self._requests:
+            raise RuntimeError('Instance ' + str(p_index) + ' has a pending step')
+
+        loop = self._bind()
+        future = loop.create_future()
+        self._actions[p_index] = p_action
+        self._requests[p_index] = future
+
+        if len(self._requests) == self._num_envs:
+            self._complete.set()
+
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+
+        return await future
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _flush(self):
+        try:
+            while self._requests:
+
+                # 1. Collect the requests of further coroutines
+                await asyncio.sleep(0)
+                if (self._max_wait > 0) and (len(self._requests) < self._num_envs):
+                    self._complete.clear()
+                    try:
+                        await asyncio.wait_for(self._complete.wait(), self._max_wait)
+                    except asyncio.TimeoutError:
+                        pass
+
+                # 2. One masked step of the batched environment
+                async with self._lock:
+                    requests = self._requests
+                    self._requests = {}
+                    idx = np.fromiter(requests.keys(), dtype=int, count=len(requests))
+
+                    try:
+                        obs, rewards, terminated, truncated = await self._run(self._batch.step, self._actions, idx)
+                    except Exception as error:
+                        self.log(self.C_LOG_TYPE_E, 'Batched step failed:', repr(error))
+                        for future in requests.values():
+                            if not future.done():
+                                future.set_exception(error)
+                        continue
+
+                    self._num_steps += idx.size
+                    self._num_batches += 1
+                    self._max_batch_size = max(self._max_batch_size, idx.size)
+
+                    # 3. Results are copied, since the buffers are overwritten by the next step
+                    for i, future in requests.items():
+                        if not future.done():
+                            future.set_result((obs[i].copy(), rewards[i].copy(), bool(terminated[i]), bool(truncated[i])))
+
+        finally:
+            self._flush_task = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_statistics(self) -> dict:
+        """
+        Returns the statistics of the stepper.
+
+        Returns
+        -------
+        dict
+            steps (instance steps), batches, mean_batch_size, max_batch_size and busy_time (time in
+            seconds spent in batched steps and resets).
+        """
+
+        return {'steps'           : self._num_steps,
+                'batches'         : self._num_batches,
+                'mean_batch_size' : self._num_steps / self._num_batches if self._num_batches > 0 else 0.0,
+                'max_batch_size'  : self._max_batch_size,
+                'busy_time'       : self._busy}
@@ -0,0 +1,277 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : batch.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version, masked reset and termination masks
+## -- 2026-10-19  1.1.0     SY       Masked step of a subset of instances
+## -- 2026-10-19  1.1.1     SY       Rewards allocated by the constructor
+## -- 2026-10-19  1.2.0     SY       Reward components of the instances before their automatic reset
+## -- 2026-10-19  1.2.1     SY       ValueError for rewards of unexpected size
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.1 (2026-10-19)
+
+This module provides a batched environment, which runs a number of instances of an MPPS-based
+environment in lockstep for batched rollouts.
+
+Observations, rewards, cycle counters and termination/truncation masks of all instances are kept
+in preallocated NumPy arrays. Resets can be applied to a subset of instances by a boolean mask,
+whereby the initial fill levels of all selected instances are sampled at once from a single random
+generator. Finished instances are optionally reset automatically at the end of a step. A step can
+also be restricted to a subset of instances by a mask.
+"""
+
+
+from mlpro.bf.various import Log
+import numpy as np
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class BatchedMPPSEnv(Log):
+    """
+    This class runs p_num_envs instances of an MPPS-based environment (a child of MPPSEnv) in
+    lockstep.
+
+    Parameters
+    ----------
+    p_env_cls : type
+        Class of the environment, e.g. BGLP_RLEnv.
+    p_num_envs : int
+        Number of instances.
+    p_seed : int
+        Seed of the random generator for the initial fill levels. Default: None.
+    p_auto_reset : bool
+        If True, instances that are terminated or truncated are reset at the end of a step. Their
+        last observations and reward components are available via get_final_observations() and
+        get_final_components(). Default: True.
+    p_logging :
+        Log level of the batched environment. Default: Log.C_LOG_NOTHING.
+    p_kwargs : dict
+        Further parameters for the constructor of the environment. The log level of the instances
+        is set to Log.C_LOG_NOTHING, if not specified otherwise.
+
+    Attributes
+    ----------
+    C_TYPE : str
+        Type of the class. Default: 'Batched Environment'.
+    C_NAME : str
+        Name of the class. Default: 'MPPS'.
+    """
+
+    C_TYPE = 'Batched Environment'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_env_cls,
+                 p_num_envs:int,
+                 p_seed=None,
+                 p_auto_reset:bool=True,
+                 p_logging=Log.C_LOG_NOTHING,
+                 **p_kwargs):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        p_kwargs.setdefault('p_logging', Log.C_LOG_NOTHING)
+        self._envs = [p_env_cls(**p_kwargs) for _ in range(p_num_envs)]
+        self._num_envs = p_num_envs
+        self._auto_reset = p_auto_reset
+        self._rng = np.random.default_rng(p_seed)
+
+        env = self._envs[0]
+        self._num_levels = len(env.set_fill_levels)
+        self._num_actions = env.get_action_space().get_num_dim()
+
+        self._obs = np.zeros((p_num_envs, env.get_state_space().get_num_dim()))
+        self._final_obs = np.zeros_like(self._obs)
+        self._final_components = {}
+        # One reward per agent of the partition, see MPPSEnv.get_reward_values()
+        self._rewards = np.zeros((p_num_envs, len(env.get_agent_partition())))
+        self._num_cycles = np.zeros(p_num_envs, dtype=int)
+        self._terminated = np.zeros(p_num_envs, dtype=bool)
+        self._truncated = np.zeros(p_num_envs, dtype=bool)
+        self._prod_reached = np.zeros(p_num_envs)
+
+        # Continuous production scenarios never terminate
+        self._prod_target = np.array([np.inf if e.prod_scenario == 'continuous' else getattr(e, 'prod_target', np.inf)
+                                      for e in self._envs], dtype=float)
+        self._cycle_limit = np.array([e.get_cycle_limit() for e in self._envs], dtype=int)
+
+        self.log(self.C_LOG_TYPE_I, str(p_num_envs), 'instances of', p_env_cls.__name__, 'instantiated')
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_envs(self) -> list:
+        return self._envs
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_envs(self) -> int:
+        return self._num_envs
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_observations(self) -> np.ndarray:
+        return self._obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_final_observations(self) -> np.ndarray:
+        """
+        Returns the last observations of the instances that were terminated or truncated in the
+        last step, i.e. before their automatic reset. Only the rows of these instances are valid.
+        """
+
+        return self._final_obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_final_components(self) -> dict:
+        """
+        Returns the accumulated reward components of the last action of the instances that were
+        terminated or truncated in the last step, i.e. before their automatic reset, see
+        MPPSEnv.get_accumulated_components().
+
+        Returns
+        -------
+        dict
+            {instance index: {component_name: np.ndarray}}
+        """
+
+        return self._final_components
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self, p_mask:np.ndarray=None) -> np.ndarray:
+        """
+        Resets the selected instances. The initial fill levels of all selected instances are drawn
+        at once and inventory, actuators, sensors and counters are reset.
+
+        Parameters
+        ----------
+        p_mask : np.ndarray
+            Boolean mask of shape (num_envs,) or array of instance indices. Default: None (all
+            instances).
+
+        Returns
+        -------
+        np.ndarray
+            Observations of all instances.
+        """
+
+        if p_mask is None:
+            idx = np.arange(self._num_envs)
+        else:
+            p_mask = np.asarray(p_mask)
+            idx = np.flatnonzero(p_mask) if p_mask.dtype == bool else p_mask
+
+        if idx.size == 0:
+            return self._obs
+
+        levels = self._rng.uniform(size=(idx.size, self._num_levels))
+        for i, row in zip(idx, levels):
+            env = self._envs[i]
+            env._reset_episode(row)
+            env._num_cycles = 0
+            self._obs[i] = env.get_state().get_values()
+
+        self._num_cycles[idx] = 0
+        self._prod_reached[idx] = 0
+        self._terminated[idx] = False
+        self._truncated[idx] = False
+        self.log(self.C_LOG_TYPE_I, 'Reset of', str(idx.size), 'instances')
+        return self._obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def step(self, p_actions:np.ndarray, p_mask:np.ndarray=None):
+        """
+        Processes one action per instance and computes rewards and termination masks.
+
+        Parameters
+        ----------
+        p_actions : np.ndarray
+            Normalized actions of shape (num_envs, num_actions).
+        p_mask : np.ndarray
+            Boolean mask of shape (num_envs,) or array of instance indices of the instances to be
+            stepped. The other instances keep their state and their rows of the observations and
+            rewards, and their termination and truncation flags are False. Default: None (all
+            instances).
+
+        Returns
+        -------
+        obs : np.ndarray
+            Observations of shape (num_envs, num_states). Rows of instances that were reset
+            automatically contain the first observation of the new episode.
+        rewards : np.ndarray
+            Rewards of shape (num_envs, num_rewards).
+        terminated : np.ndarray
+            Boolean mask of instances that reached their production target.
+        truncated : np.ndarray
+            Boolean mask of instances that reached their cycle limit.
+
+        The returned arrays are internal buffers, which are overwritten by the next step.
+        """
+
+        p_actions = np.asarray(p_actions, dtype=float).reshape(self._num_envs, self._num_actions)
+
+        if p_mask is None:
+            idx = range(self._num_envs)
+        else:
+            p_mask = np.asarray(p_mask)
+            idx = np.flatnonzero(p_mask) if p_mask.dtype == bool else p_mask
+
+        for i in idx:
+            env = self._envs[i]
+            env.process_action_values(p_actions[i])
+            self._obs[i] = env.get_state().get_values()
+            reward = env.get_reward_values()
+            if reward.size != self._rewards.shape[1]:
+                raise ValueError('Environment ' + str(i) + ' provides ' + str(reward.size) + ' reward values instead of ' +
+                                 str(self._rewards.shape[1]) + ', see MPPSEnv.get_reward_values()')
+            self._rewards[i] = reward
+            self._prod_reached[i] = getattr(env, 'prod_reached', 0)
+
+        if p_mask is None:
+            self._num_cycles += 1
+        else:
+            self._num_cycles[idx] += 1
+        np.greater_equal(self._prod_reached, self._prod_target, out=self._terminated)
+        np.greater_equal(self._num_cycles, self._cycle_limit, out=self._truncated)
+        self._truncated &= (self._cycle_limit > 0) & ~self._terminated
+        if p_mask is not None:
+            stepped = np.zeros(self._num_envs, dtype=bool)
+            stepped[idx] = True
+            self._terminated &= stepped
+            self._truncated &= stepped
+
+        for i in np.flatnonzero(self._terminated):
+            self._envs[i].get_state().set_terminal(True)
+            self._envs[i].get_state().set_success(True)
+        for i in np.flatnonzero(self._truncated):
+            self._envs[i].get_state().set_timeout(True)
+
+        done = self._terminated | self._truncated
+        self._final_components = {}
+        if done.any():
+            self._final_obs[done] = self._obs[done]
+            # A reset starts new accumulators, the previous ones are kept as they are
+            self._final_components = {i:self._envs[i].get_accumulated_components() for i in np.flatnonzero(done)}
+
+            if self._auto_reset:
+                terminated = self._terminated.copy()
+                truncated = self._truncated.copy()
+                self.reset(done)
+                self._terminated[:] = terminated
+                self._truncated[:] = truncated
+
+        return self._obs, self._rewards, self._terminated, self._truncated
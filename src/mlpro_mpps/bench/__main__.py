@@ -0,0 +1,109 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.bench
+## -- Module  : __main__.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Scaling benchmark of generated production lines
+## -- 2026-10-19  1.2.0     SY       Throughput benchmark of the plant server
+## -- 2026-10-19  1.2.1     SY       Serial-parallel topology of the scaling benchmark removed
+## -- 2026-10-19  1.2.2     SY       Serial-parallel topology of the scaling benchmark restored
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.2.2 (2026-10-19)
+
+Command line entry point of the benchmarks, e.g.
+
+    python -m mlpro_mpps.bench --plants BGLP LS_BGLP --batch-sizes 1 16 256 --output bench.json
+
+The option --imports adds the import-time report of mlpro_mpps.bench.imports, the option
+--imports-only skips the engine benchmarks. Accordingly, the options --scaling and --scaling-only
+add the scaling benchmark of generated production lines of mlpro_mpps.bench.scaling, e.g.
+
+    python -m mlpro_mpps.bench --scaling-only --scaling-buffers 10 100 1000 10000
+    python -m mlpro_mpps.bench --scaling-only --scaling-topology serial_parallel --scaling-width 2
+
+The options --server and --server-only add the throughput benchmark of the plant server of
+mlpro_mpps.bench.server with a local client, e.g.
+
+    python -m mlpro_mpps.bench --server-only --plants BGLP LS_BGLP --server-transports tcp unix
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.bench.engines import EngineBenchmark
+from mlpro_mpps.bench.imports import ImportBenchmark
+from mlpro_mpps.bench.scaling import ScalingBenchmark
+from mlpro_mpps.bench.server import ServerBenchmark
+from datetime import datetime
+import argparse
+import json
+
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m mlpro_mpps.bench',
+                                     description='Benchmark of the MPPS engines and pool environments')
+    parser.add_argument('--plants', nargs='+', default=None, choices=list(EngineBenchmark.C_PLANTS.keys()))
+    parser.add_argument('--steps', type=int, default=1000, help='Steps of the single-instance measurements')
+    parser.add_argument('--repeats', type=int, default=5, help='Repetitions of construction and reset')
+    parser.add_argument('--batch-sizes', type=int, nargs='*', default=None, help='Numbers of instances of the batched engine')
+    parser.add_argument('--batch-steps', type=int, default=100, help='Steps per batch size')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--imports', action='store_true', help='Add the import-time report')
+    parser.add_argument('--imports-only', action='store_true', help='Only report the import times')
+    parser.add_argument('--import-budget', type=float, default=ImportBenchmark.C_BUDGET, help='Import-time budget in seconds')
+    parser.add_argument('--scaling', action='store_true', help='Add the scaling benchmark of generated lines')
+    parser.add_argument('--scaling-only', action='store_true', help='Only run the scaling benchmark')
+    parser.add_argument('--scaling-buffers', type=int, nargs='+', default=None, help='Numbers of buffers of the generated lines')
+    parser.add_argument('--scaling-topology', default='serial', choices=['serial', 'parallel', 'serial_parallel'])
+    parser.add_argument('--scaling-width', type=int, default=1, help='Number of lanes of the generated lines')
+    parser.add_argument('--scaling-time', type=float, default=10.0, help='Maximum duration of the step measurement per line')
+    parser.add_argument('--server', action='store_true', help='Add the throughput benchmark of the plant server')
+    parser.add_argument('--server-only', action='store_true', help='Only run the plant server benchmark')
+    parser.add_argument('--server-transports', nargs='+', default=None, choices=ServerBenchmark.C_TRANSPORTS)
+    parser.add_argument('--server-duration', type=float, default=1.0, help='Duration of each server measurement')
+    parser.add_argument('--output', default=None, help='JSON file of the results')
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+    logging = Log.C_LOG_NOTHING if args.quiet else Log.C_LOG_ALL
+
+    if args.imports_only or args.scaling_only or args.server_only:
+        results = {'machine': EngineBenchmark.get_machine_info(), 'plants': {}}
+    else:
+        benchmark = EngineBenchmark(p_plants=args.plants,
+                                    p_steps=args.steps,
+                                    p_repeats=args.repeats,
+                                    p_batch_sizes=args.batch_sizes,
+                                    p_batch_steps=args.batch_steps,
+                                    p_seed=args.seed,
+                                    p_logging=logging)
+        results = benchmark.run()
+
+    if args.imports or args.imports_only:
+        results['imports'] = ImportBenchmark(p_budget=args.import_budget, p_logging=logging).run()
+
+    if args.scaling or args.scaling_only:
+        results['scaling'] = ScalingBenchmark(p_buffers=args.scaling_buffers,
+                                              p_topology=args.scaling_topology,
+                                              p_width=args.scaling_width,
+                                              p_steps=args.steps,
+                                              p_time_limit=args.scaling_time,
+                                              p_seed=args.seed,
+                                              p_logging=logging).run()
+
+    if args.server or args.server_only:
+        results['server'] = ServerBenchmark(p_plants=args.plants,
+                                            p_transports=args.server_transports,
+                                            p_duration=args.server_duration,
+                                            p_seed=args.seed,
+                                            p_logging=logging).run()
+
+    output = args.output or 'mpps_bench_' + datetime.now().strftime('%Y%m%d_%H%M%S') + '.json'
+    EngineBenchmark.save(results, output)
+    print(json.dumps({key:results[key] for key in ['plants', 'imports', 'scaling', 'server'] if key in results}, indent=2))
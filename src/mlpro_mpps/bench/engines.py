@@ -0,0 +1,250 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.bench
+## -- Module  : engines.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a benchmark of the simulation engines of the MPPS-based pool environments.
+
+For each plant (BGLP, Liquid_Station, LS_BGLP, LS_BGLP_SP), the following quantities are measured:
+
+    - construction time of the environment,
+    - reset time,
+    - raw state transitions via simulate_reaction() of the plant,
+    - full MLPro steps via process_action() and compute_reward() of the environment,
+    - throughput of the batched engine (mlpro_mpps.batch) for several numbers of instances.
+
+The results are returned as a dictionary together with information about the machine, so that
+runs can be stored as JSON and compared over time. The benchmark is started via
+
+    python -m mlpro_mpps.bench
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.bf.systems import Action
+from mlpro_mpps.batch import BatchedMPPSEnv
+from datetime import datetime
+import numpy as np
+import importlib.metadata
+import platform
+import json
+import time
+import os
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class EngineBenchmark(Log):
+    """
+    This class benchmarks the simulation engines of the MPPS-based pool environments.
+
+    Parameters
+    ----------
+    p_plants : list
+        Names of the plants to be benchmarked, see C_PLANTS. Default: None (all plants).
+    p_steps : int
+        Number of steps of the single-instance measurements. Default: 1000.
+    p_repeats : int
+        Number of repetitions of the construction and reset measurements. Default: 5.
+    p_batch_sizes : list
+        Numbers of instances of the batched engine. Default: C_BATCH_SIZES.
+    p_batch_steps : int
+        Number of steps per batch size. Default: 100.
+    p_seed : int
+        Seed of the random actions. Default: 0.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_PLANTS : dict
+        Benchmarked plants in the form {name: (module, class of the environment)}.
+    C_BATCH_SIZES : list
+        Default numbers of instances of the batched engine.
+    """
+
+    C_TYPE = 'Benchmark'
+    C_NAME = 'MPPS Engines'
+
+    C_PLANTS = {'BGLP'           : ('mlpro_mpps.pool.ml.rl_environment.RL001_BGLP', 'BGLP_RLEnv'),
+                'Liquid_Station' : ('mlpro_mpps.pool.ml.rl_environment.RL002_LS', 'LS_RLEnv'),
+                'LS_BGLP'        : ('mlpro_mpps.pool.ml.gt_gameboard.GT001_LS_BGLP', 'LS_BGLP_GTGameBoard'),
+                'LS_BGLP_SP'     : ('mlpro_mpps.pool.ml.gt_gameboard.GT002_LS_BGLP_SP', 'LS_BGLP_SP_GTGameBoard')}
+
+    C_BATCH_SIZES = [1, 4, 16, 64, 256, 1024, 4096]
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_plants:list=None,
+                 p_steps:int=1000,
+                 p_repeats:int=5,
+                 p_batch_sizes:list=None,
+                 p_batch_steps:int=100,
+                 p_seed:int=0,
+                 p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._plants = p_plants or list(self.C_PLANTS.keys())
+        self._steps = p_steps
+        self._repeats = max(p_repeats, 1)
+        self._batch_sizes = self.C_BATCH_SIZES if p_batch_sizes is None else p_batch_sizes
+        self._batch_steps = p_batch_steps
+        self._rng = np.random.default_rng(p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def get_machine_info() -> dict:
+        """
+        Determines information about the machine and the installed packages.
+        """
+
+        info = {'timestamp' : datetime.now().isoformat(timespec='seconds'),
+                'platform'  : platform.platform(),
+                'machine'   : platform.machine(),
+                'processor' : platform.processor(),
+                'cpu_count' : os.cpu_count(),
+                'python'    : platform.python_version(),
+                'numpy'     : np.__version__}
+
+        for package in ['mlpro', 'mlpro-mpps']:
+            try:
+                info[package] = importlib.metadata.version(package)
+            except Exception:
+                info[package] = None
+
+        return info
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def get_env_cls(cls, p_plant:str):
+        module, name = cls.C_PLANTS[p_plant]
+        return getattr(importlib.import_module(module), name)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_actions(self, p_env, p_num:int) -> list:
+        space = p_env.get_action_space()
+        values = self._rng.uniform(size=(p_num, space.get_num_dim()))
+        return [Action(p_agent_id=0, p_action_space=space, p_values=row) for row in values]
+
+
+## -------------------------------------------------------------------------------------------------
+    def bench_plant(self, p_plant:str) -> dict:
+        """
+        Runs all measurements of a single plant.
+
+        Returns
+        -------
+        dict
+            Results of the plant. Times are given in seconds, rates in steps per second.
+        """
+
+        env_cls = self.get_env_cls(p_plant)
+        result = {'env': env_cls.__name__}
+
+        # 1. Construction
+        durations = []
+        for _ in range(self._repeats):
+            tstart = time.perf_counter()
+            env = env_cls(p_logging=Log.C_LOG_NOTHING, recording='none')
+            durations.append(time.perf_counter() - tstart)
+        result['construction_time'] = min(durations)
+
+        # 2. Reset
+        durations = []
+        for seed in range(self._repeats):
+            tstart = time.perf_counter()
+            env.reset(seed)
+            durations.append(time.perf_counter() - tstart)
+        result['reset_time'] = min(durations)
+
+        # 3. Raw state transitions of the plant
+        actions = self._create_actions(env, self._steps)
+        plant = env._fct_strans
+        state = env.get_state()
+        env.reset(0)
+        tstart = time.perf_counter()
+        for action in actions:
+            plant.simulate_reaction(state, action)
+        result['simulate_reaction_steps_per_sec'] = self._steps / (time.perf_counter() - tstart)
+
+        # 4. Full MLPro steps
+        env.reset(0)
+        tstart = time.perf_counter()
+        for action in actions:
+            state_old = env.get_state()
+            env.process_action(action)
+            env.compute_reward(state_old, env.get_state())
+        result['process_action_steps_per_sec'] = self._steps / (time.perf_counter() - tstart)
+
+        # 5. Batched engine
+        result['batched'] = {}
+        for num_envs in self._batch_sizes:
+            tstart = time.perf_counter()
+            batch = BatchedMPPSEnv(env_cls, num_envs, p_seed=0, recording='none')
+            construction = time.perf_counter() - tstart
+
+            batch.reset()
+            actions = self._rng.uniform(size=(self._batch_steps, num_envs, batch._num_actions))
+            tstart = time.perf_counter()
+            for step_actions in actions:
+                batch.step(step_actions)
+            duration = time.perf_counter() - tstart
+
+            result['batched'][str(num_envs)] = {'construction_time'   : construction,
+                                                'steps_per_sec'       : self._batch_steps / duration,
+                                                'transitions_per_sec' : num_envs * self._batch_steps / duration}
+            self.log(self.C_LOG_TYPE_I, p_plant, 'batched N=' + str(num_envs) + ':',
+                     '%.0f transitions/s' % result['batched'][str(num_envs)]['transitions_per_sec'])
+
+        self.log(self.C_LOG_TYPE_I, p_plant, 'simulate_reaction: %.0f steps/s,' % result['simulate_reaction_steps_per_sec'],
+                 'process_action: %.0f steps/s' % result['process_action_steps_per_sec'])
+
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def run(self) -> dict:
+        """
+        Runs the benchmark of all plants.
+
+        Returns
+        -------
+        dict
+            {'machine': machine info, 'config': parameters, 'plants': {plant: results}}
+        """
+
+        results = {'machine' : self.get_machine_info(),
+                   'config'  : {'steps'       : self._steps,
+                                'repeats'     : self._repeats,
+                                'batch_sizes' : list(self._batch_sizes),
+                                'batch_steps' : self._batch_steps},
+                   'plants'  : {}}
+
+        for plant in self._plants:
+            self.log(self.C_LOG_TYPE_I, 'Benchmark of', plant, 'started')
+            results['plants'][plant] = self.bench_plant(plant)
+
+        return results
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def save(p_results:dict, p_file:str):
+        with open(p_file, 'w') as f:
+            json.dump(p_results, f, indent=2)
@@ -0,0 +1,161 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.bench
+## -- Module  : imports.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a benchmark of the import time of MPPS modules, which is relevant for the
+start-up of headless worker processes.
+
+Each module is imported in a fresh interpreter with the option -X importtime. The report contains
+the cumulative import time of the module, the slowest nested imports and whether the import time is
+within a given budget.
+"""
+
+
+from mlpro.bf.various import Log
+import subprocess
+import sys
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ImportBenchmark(Log):
+    """
+    This class measures the import time of modules in fresh interpreters.
+
+    Parameters
+    ----------
+    p_modules : list
+        Names of the modules. Default: C_MODULES.
+    p_budget : float
+        Budget of the cumulative import time per module in seconds. Default: C_BUDGET.
+    p_repeats : int
+        Number of measurements per module, of which the fastest is reported. Default: 3.
+    p_top : int
+        Number of reported nested imports. Default: 10.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_MODULES : list
+        Default modules, i.e. the plant with the most components.
+    C_BUDGET : float
+        Default budget in seconds.
+    """
+
+    C_TYPE = 'Benchmark'
+    C_NAME = 'MPPS Imports'
+
+    C_MODULES = ['mlpro_mpps.pool.mpps.PS003_LS_BGLP']
+    C_BUDGET = 1.0
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_modules:list=None,
+                 p_budget:float=C_BUDGET,
+                 p_repeats:int=3,
+                 p_top:int=10,
+                 p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._modules = p_modules or self.C_MODULES
+        self._budget = p_budget
+        self._repeats = max(p_repeats, 1)
+        self._top = p_top
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def parse_importtime(p_output:str) -> list:
+        """
+        Parses the output of -X importtime.
+
+        Returns
+        -------
+        list
+            List of tuples (module, self time, cumulative time, depth) with times in seconds.
+        """
+
+        entries = []
+        for line in p_output.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            fields = line[len('import time:'):].split('|')
+            try:
+                self_us, cum_us = int(fields[0]), int(fields[1])
+            except ValueError:
+                continue        # Header line
+            name = fields[2].rstrip()
+            depth = (len(name) - len(name.lstrip())) // 2
+            entries.append((name.strip(), self_us * 1e-6, cum_us * 1e-6, depth))
+
+        return entries
+
+
+## -------------------------------------------------------------------------------------------------
+    def measure(self, p_module:str) -> dict:
+        """
+        Measures the import time of a single module.
+
+        Returns
+        -------
+        dict
+            Cumulative import time, budget, flag within_budget and the slowest nested imports.
+        """
+
+        best = None
+        for _ in range(self._repeats):
+            process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + p_module],
+                                     capture_output=True, text=True)
+            if process.returncode != 0:
+                raise ImportError('Import of ' + p_module + ' failed:\n' + process.stderr[-2000:])
+
+            entries = self.parse_importtime(process.stderr)
+            total = next(cum for name, _, cum, depth in entries if (name == p_module) and (depth == 0))
+            if (best is None) or (total < best[0]):
+                best = (total, entries)
+
+        total, entries = best
+        nested = sorted([entry for entry in entries if entry[0] != p_module], key=lambda entry: entry[2], reverse=True)
+
+        result = {'cumulative'    : total,
+                  'budget'        : self._budget,
+                  'within_budget' : total <= self._budget,
+                  'top'           : [{'module': name, 'self': self_time, 'cumulative': cum}
+                                     for name, self_time, cum, _ in nested[:self._top]]}
+
+        if result['within_budget']:
+            self.log(self.C_LOG_TYPE_I, 'Import of', p_module, 'took', '%.3f s' % total)
+        else:
+            self.log(self.C_LOG_TYPE_W, 'Import of', p_module, 'took', '%.3f s,' % total,
+                     'budget of', '%.3f s' % self._budget, 'exceeded')
+
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def run(self) -> dict:
+        """
+        Measures the import time of all modules.
+
+        Returns
+        -------
+        dict
+            {module: results}
+        """
+
+        return {module:self.measure(module) for module in self._modules}
@@ -0,0 +1,191 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.bench
+## -- Module  : scaling.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Topology and width validated before the measurements
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides a scaling benchmark of the MPPS engine based on generated production lines,
+see mlpro_mpps.pool.ml.gt_gameboard.GT003_Lines.
+
+For each number of buffers, the following quantities are measured:
+
+    - construction time of the environment,
+    - memory allocated by the construction (peak and retained), measured via tracemalloc in a
+      separate construction,
+    - reset time,
+    - steps per second via process_action_values().
+
+The transfer functions of the pool log their instantiation regardless of the log level of the
+plant. Their output is discarded during the measurements, so that the results do not depend on the
+terminal.
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.pool.ml.gt_gameboard.GT003_Lines import ProductionLine_GTGameBoard
+from mlpro_mpps.pool.specs.PS003_Lines import LineSpecGenerator
+import numpy as np
+import contextlib
+import tracemalloc
+import time
+import os
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ScalingBenchmark(Log):
+    """
+    This class benchmarks generated production lines of increasing size.
+
+    Parameters
+    ----------
+    p_buffers : list
+        Total numbers of buffers of the lines, excluding loading silos and inventories. Default:
+        C_BUFFERS.
+    p_topology : str
+        Topology of the lines, i.e. 'serial', 'parallel' or 'serial_parallel', see
+        mlpro_mpps.pool.specs.PS003_Lines. Default: 'serial'.
+    p_width : int
+        Number of lanes. The length of the lanes is the number of buffers divided by the width.
+        Serial-parallel lines require at least two lanes. Default: 1.
+    p_steps : int
+        Maximum number of steps per line. Default: 100.
+    p_time_limit : float
+        Maximum duration of the step measurement per line in seconds. At least 3 steps are
+        measured. Default: 10.0.
+    p_memory : bool
+        If True, the memory is measured. Default: True.
+    p_seed : int
+        Seed of the random actions. Default: 0.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_BUFFERS : list
+        Default numbers of buffers.
+    """
+
+    C_TYPE = 'Benchmark'
+    C_NAME = 'MPPS Scaling'
+
+    C_BUFFERS = [10, 100, 1000, 10000]
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_buffers:list=None,
+                 p_topology:str='serial',
+                 p_width:int=1,
+                 p_steps:int=100,
+                 p_time_limit:float=10.0,
+                 p_memory:bool=True,
+                 p_seed:int=0,
+                 p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        # Invalid combinations of topology and width are rejected before any measurement
+        LineSpecGenerator(p_topology=p_topology, p_width=p_width)
+
+        self._buffers = p_buffers or self.C_BUFFERS
+        self._topology = p_topology
+        self._width = p_width
+        self._steps = p_steps
+        self._time_limit = p_time_limit
+        self._memory = p_memory
+        self._rng = np.random.default_rng(p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_env(self, p_length:int):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return ProductionLine_GTGameBoard(p_logging=Log.C_LOG_NOTHING,
+                                              topology=self._topology,
+                                              length=p_length,
+                                              width=self._width,
+                                              recording='none')
+
+
+## -------------------------------------------------------------------------------------------------
+    def bench_line(self, p_buffers:int) -> dict:
+        """
+        Runs all measurements of a single line.
+
+        Returns
+        -------
+        dict
+            Results of the line. Times are given in seconds, memory in bytes and rates in steps per
+            second.
+        """
+
+        length = max(p_buffers // self._width, 1)
+        result = {'buffers': length * self._width, 'length': length, 'width': self._width}
+
+        # 1. Construction
+        tstart = time.perf_counter()
+        env = self._create_env(length)
+        result['construction_time'] = time.perf_counter() - tstart
+
+        plant = env._fct_strans
+        result['actuators'] = env.get_action_space().get_num_dim()
+        result['signals'] = len(plant._signals)
+        result['stations'] = plant.get_elements().get_num_dim()
+
+        # 2. Memory
+        if self._memory:
+            tracemalloc.start()
+            env_mem = self._create_env(length)
+            result['memory_retained'], result['memory_peak'] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result['memory_per_buffer'] = result['memory_retained'] / result['buffers']
+            del env_mem
+
+        # 3. Reset
+        tstart = time.perf_counter()
+        env.reset(0)
+        result['reset_time'] = time.perf_counter() - tstart
+
+        # 4. Steps
+        num_actions = result['actuators']
+        steps = 0
+        tstart = time.perf_counter()
+        while (steps < 3) or ((steps < self._steps) and (time.perf_counter() - tstart < self._time_limit)):
+            env.process_action_values(self._rng.uniform(size=num_actions))
+            steps += 1
+        duration = time.perf_counter() - tstart
+        result['steps'] = steps
+        result['steps_per_sec'] = steps / duration
+        result['buffer_steps_per_sec'] = steps * result['buffers'] / duration
+
+        self.log(self.C_LOG_TYPE_I, str(result['buffers']), 'buffers:',
+                 'construction %.3f s,' % result['construction_time'],
+                 'memory %.1f MB,' % (result.get('memory_retained', 0) / 2**20),
+                 '%.1f steps/s' % result['steps_per_sec'])
+
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def run(self) -> dict:
+        """
+        Runs the benchmark of all lines.
+
+        Returns
+        -------
+        dict
+            {number of buffers: results}
+        """
+
+        return {str(buffers):self.bench_line(buffers) for buffers in self._buffers}
@@ -0,0 +1,223 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.bench
+## -- Module  : server.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Server processes via FrameServer.spawn_process()
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides a throughput benchmark of the plant server of mlpro_mpps.remote with a local
+client. The server runs in a separate process, so that client and server do not share the GIL.
+
+For each plant and transport (TCP on localhost, Unix socket), the following quantities are
+measured:
+
+    - polling of single channels, i.e. one request per channel,
+    - bulk read of all channels by one request,
+    - bulk write of all actuators by one request,
+    - scan cycles of a PLC-style controller, i.e. write actuators, step, read all channels,
+    - notifications of a subscription to all channels per step.
+
+Rates are given in requests (resp. cycles or notifications) per second, and additionally in
+channel values per second.
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.remote.plant_server import PlantServer
+from mlpro_mpps.remote.plant_client import PlantClient
+from mlpro_mpps.remote.protocol import FrameProtocol
+from mlpro_mpps.remote.server import FrameServer
+import numpy as np
+import tempfile
+import socket
+import time
+import os
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ServerBenchmark(Log):
+    """
+    This class benchmarks the plant server with a local client.
+
+    Parameters
+    ----------
+    p_plants : list
+        Names of the plants, see EngineBenchmark.C_PLANTS. Default: ['BGLP'].
+    p_transports : list
+        Transports, see C_TRANSPORTS. Default: all transports available on the platform.
+    p_duration : float
+        Duration of each measurement in seconds. Default: 1.0.
+    p_seed : int
+        Seed of the random actuator values. Default: 0.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_TRANSPORTS : list
+        Supported transports.
+    """
+
+    C_TYPE = 'Benchmark'
+    C_NAME = 'MPPS Plant Server'
+
+    C_TRANSPORT_TCP = 'tcp'
+    C_TRANSPORT_UNIX = 'unix'
+    C_TRANSPORTS = [C_TRANSPORT_TCP, C_TRANSPORT_UNIX]
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_plants:list=None,
+                 p_transports:list=None,
+                 p_duration:float=1.0,
+                 p_seed:int=0,
+                 p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._plants = p_plants or ['BGLP']
+        if p_transports is None:
+            p_transports = [t for t in self.C_TRANSPORTS if (t != self.C_TRANSPORT_UNIX) or hasattr(socket, 'AF_UNIX')]
+        self._transports = p_transports
+        self._duration = p_duration
+        self._rng = np.random.default_rng(p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _start_server(self, p_plant:str, p_address):
+        return FrameServer.spawn_process(PlantServer.serve_plant, p_plant=p_plant, p_address=p_address)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _measure(self, p_fct) -> tuple:
+        num = 0
+        tstart = time.perf_counter()
+        while True:
+            p_fct()
+            num += 1
+            duration = time.perf_counter() - tstart
+            if duration >= self._duration:
+                return num, duration
+
+
+## -------------------------------------------------------------------------------------------------
+    def bench_server(self, p_plant:str, p_transport:str) -> dict:
+        """
+        Runs all measurements of a plant and transport.
+
+        Returns
+        -------
+        dict
+            Results in requests and channel values per second.
+        """
+
+        path = None
+        if p_transport == self.C_TRANSPORT_UNIX:
+            path = os.path.join(tempfile.mkdtemp(), 'plant.sock')
+            address = path
+        else:
+            address = ('127.0.0.1', 0)
+
+        process, address = self._start_server(p_plant, address)
+        result = {'plant': p_plant, 'transport': p_transport}
+
+        try:
+            with PlantClient(address) as client:
+                num_channels = len(client.channels)
+                acts = client.get_indices(client.get_names(FrameProtocol.C_KIND_ACTUATOR))
+                bounds = np.array([client.channels[idx][3:5] for idx in acts])
+                values = bounds[:,0] + self._rng.uniform(size=(64, acts.size)) * (bounds[:,1] - bounds[:,0])
+                single = [np.array([idx], dtype='<u2') for idx in range(num_channels)]
+                result['channels'] = num_channels
+                result['actuators'] = int(acts.size)
+                pos = [0]
+
+                def poll_single():
+                    client.read(single[pos[0] % num_channels])
+                    pos[0] += 1
+
+                def write_actuators():
+                    client.write(acts, values[pos[0] % 64])
+                    pos[0] += 1
+
+                def scan_cycle():
+                    write_actuators()
+                    client.step()
+                    client.read()
+
+                # 1. Polling of single channels
+                num, duration = self._measure(poll_single)
+                result['single_reads_per_sec'] = num / duration
+                result['single_values_per_sec'] = num / duration
+
+                # 2. Bulk read
+                num, duration = self._measure(client.read)
+                result['bulk_reads_per_sec'] = num / duration
+                result['bulk_values_per_sec'] = num * num_channels / duration
+
+                # 3. Bulk write
+                num, duration = self._measure(write_actuators)
+                result['bulk_writes_per_sec'] = num / duration
+                result['bulk_written_values_per_sec'] = num * acts.size / duration
+
+                # 4. Scan cycles
+                num, duration = self._measure(scan_cycle)
+                result['scan_cycles_per_sec'] = num / duration
+
+                # 5. Notifications per step
+                client.subscribe()
+                client.get_notifications(p_timeout=1.0)
+                counts = [0, 0]
+
+                def notified_step():
+                    client.step()
+                    for _, _, indices, _ in client.get_notifications():
+                        counts[0] += 1
+                        counts[1] += indices.size
+
+                num, duration = self._measure(notified_step)
+                result['notified_steps_per_sec'] = num / duration
+                result['notifications_per_sec'] = counts[0] / duration
+                result['notified_values_per_sec'] = counts[1] / duration
+
+        finally:
+            process.terminate()
+            process.join()
+            if path is not None:
+                if os.path.exists(path):
+                    os.unlink(path)
+                os.rmdir(os.path.dirname(path))
+
+        self.log(self.C_LOG_TYPE_I, p_plant, 'via', p_transport + ':',
+                 '%.0f single reads/s,' % result['single_reads_per_sec'],
+                 '%.0f bulk reads/s (%.0f values/s),' % (result['bulk_reads_per_sec'], result['bulk_values_per_sec']),
+                 '%.0f scan cycles/s' % result['scan_cycles_per_sec'])
+
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def run(self) -> dict:
+        """
+        Runs the benchmark of all plants and transports.
+
+        Returns
+        -------
+        dict
+            {plant: {transport: results}}
+        """
+
+        return {plant:{transport:self.bench_server(plant, transport) for transport in self._transports}
+                for plant in self._plants}
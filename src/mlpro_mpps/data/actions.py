@@ -0,0 +1,138 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : actions.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides action generators for the generation of datasets from MPPS-based
+environments without an MLPro agent.
+
+An action generator computes normalized actions in [0,1] for a batch of observations. It holds its
+own random generator, so that a given seed always reproduces the same sequence of actions.
+"""
+
+
+import numpy as np
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ActionGenerator:
+    """
+    Base class of all action generators.
+
+    Parameters
+    ----------
+    p_num_actions : int
+        Number of action dimensions.
+    p_seed : int or np.random.SeedSequence
+        Seed of the random generator. Default: None.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_num_actions:int, p_seed=None):
+        self._num_actions = p_num_actions
+        self.set_random_seed(p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_random_seed(self, p_seed=None):
+        self._rng = np.random.default_rng(p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_actions(self) -> int:
+        return self._num_actions
+
+
+## -------------------------------------------------------------------------------------------------
+    def compute_actions(self, p_obs:np.ndarray) -> np.ndarray:
+        """
+        Custom method to compute actions for a batch of observations.
+
+        Parameters
+        ----------
+        p_obs : np.ndarray
+            Observations of shape (num_envs, num_states).
+
+        Returns
+        -------
+        np.ndarray
+            Normalized actions of shape (num_envs, num_actions).
+        """
+
+        raise NotImplementedError
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RandomActionGenerator(ActionGenerator):
+    """
+    Generates uniformly distributed actions in [0,1], independent of the observations.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def compute_actions(self, p_obs:np.ndarray) -> np.ndarray:
+        return self._rng.uniform(size=(p_obs.shape[0], self._num_actions))
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class HoldActionGenerator(ActionGenerator):
+    """
+    Generates uniformly distributed actions in [0,1], which are held for a random number of steps
+    between p_min_hold and p_max_hold. This results in more realistic trajectories than
+    independent random actions.
+
+    Parameters
+    ----------
+    p_num_actions : int
+        Number of action dimensions.
+    p_seed : int or np.random.SeedSequence
+        Seed of the random generator. Default: None.
+    p_min_hold : int
+        Minimum number of steps an action is held. Default: 1.
+    p_max_hold : int
+        Maximum number of steps an action is held. Default: 10.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_num_actions:int, p_seed=None, p_min_hold:int=1, p_max_hold:int=10):
+        self._min_hold = p_min_hold
+        self._max_hold = p_max_hold
+        self._actions = None
+        super().__init__(p_num_actions, p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    def compute_actions(self, p_obs:np.ndarray) -> np.ndarray:
+        num_envs = p_obs.shape[0]
+
+        if (self._actions is None) or (self._actions.shape[0] != num_envs):
+            self._actions = self._rng.uniform(size=(num_envs, self._num_actions))
+            self._hold = self._rng.integers(self._min_hold, self._max_hold+1, size=num_envs)
+
+        self._hold -= 1
+        renew = self._hold < 0
+        num_renew = int(renew.sum())
+        if num_renew > 0:
+            self._actions[renew] = self._rng.uniform(size=(num_renew, self._num_actions))
+            self._hold[renew] = self._rng.integers(self._min_hold, self._max_hold+1, size=num_renew) - 1
+
+        return self._actions
@@ -0,0 +1,233 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : archive.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a compact archive format for trajectories of MPPS-based plants, e.g. the
+recorded episodes of BGLP or LS_BGLP_SP.
+
+Each channel (a time series with the steps along the first axis) is encoded according to its kind:
+
+    - C_KIND_DELTA: Continuous channels, e.g. fill levels, are rounded to float32. The successive
+      differences of their bit patterns are stored, which are small integers for slowly varying
+      signals and thus compress well. The decoding is exact with respect to float32.
+    - C_KIND_BITS: Binary channels, e.g. sensors and switches, are stored as packed bits.
+    - C_KIND_SPARSE: Mostly-zero channels, e.g. overflow, are stored as pairs of indices and
+      float32 values of the non-zero entries.
+
+The kind of a channel is determined automatically, if it is not given. All encoded arrays and the
+meta data are stored in a single compressed .npz container. The decoding only consists of
+vectorized NumPy operations (cumsum, unpackbits, scatter) and runs close to memory bandwidth.
+"""
+
+
+import numpy as np
+import json
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class TrajectoryArchive:
+    """
+    This class provides the encoding and decoding of trajectory archives.
+
+    Attributes
+    ----------
+    C_KIND_DELTA : str
+        Continuous channel, stored as float32 bit-pattern deltas.
+    C_KIND_BITS : str
+        Binary channel, stored as packed bits.
+    C_KIND_SPARSE : str
+        Sparse channel, stored as indices and float32 values of the non-zero entries.
+    C_META : str
+        Name of the meta data entry in the container.
+    C_SEP : str
+        Separator of frame id and channel name of archived recorders.
+    """
+
+    C_KIND_DELTA = 'delta'
+    C_KIND_BITS = 'bits'
+    C_KIND_SPARSE = 'sparse'
+    C_META = '__meta__'
+    C_SEP = '/'
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def get_kind(cls, p_values:np.ndarray, p_sparsity:float=0.1) -> str:
+        """
+        Determines the kind of a channel from its values.
+
+        Parameters
+        ----------
+        p_values : np.ndarray
+            Values of the channel.
+        p_sparsity : float
+            Maximum share of non-zero entries of a sparse channel. Default: 0.1.
+        """
+
+        if p_values.dtype == bool:
+            return cls.C_KIND_BITS
+
+        if (p_values.size > 0) and not np.isnan(p_values).any():
+            if np.all((p_values == 0) | (p_values == 1)):
+                return cls.C_KIND_BITS
+            if np.count_nonzero(p_values) <= p_sparsity * p_values.size:
+                return cls.C_KIND_SPARSE
+
+        return cls.C_KIND_DELTA
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def _encode(cls, p_name:str, p_values:np.ndarray, p_kind:str, p_data:dict) -> dict:
+        meta = {'kind': p_kind, 'shape': list(p_values.shape), 'dtype': p_values.dtype.str}
+
+        if p_kind == cls.C_KIND_DELTA:
+            bits = np.ascontiguousarray(p_values, dtype=np.float32).view(np.int32)
+            p_data[p_name] = np.diff(bits, axis=0, prepend=np.zeros_like(bits[:1]))
+        elif p_kind == cls.C_KIND_BITS:
+            p_data[p_name] = np.packbits(p_values.astype(bool), axis=0)
+        elif p_kind == cls.C_KIND_SPARSE:
+            flat = p_values.ravel()
+            idx = np.flatnonzero(flat)
+            p_data[p_name + '.idx'] = idx.astype(np.uint32 if flat.size < 2**32 else np.uint64)
+            p_data[p_name + '.val'] = flat[idx].astype(np.float32)
+        else:
+            raise ValueError('Kind ' + str(p_kind) + ' of channel ' + p_name + ' is not supported')
+
+        return meta
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def _decode(cls, p_name:str, p_meta:dict, p_data) -> np.ndarray:
+        shape = tuple(p_meta['shape'])
+        kind = p_meta['kind']
+
+        if kind == cls.C_KIND_DELTA:
+            return np.cumsum(p_data[p_name], axis=0, dtype=np.int32).view(np.float32)
+        elif kind == cls.C_KIND_BITS:
+            bits = np.unpackbits(p_data[p_name], axis=0, count=shape[0]).view(bool)
+            return bits if np.dtype(p_meta['dtype']) == bool else bits.astype(np.float32)
+        else:
+            values = np.zeros(int(np.prod(shape)), dtype=np.float32)
+            values[p_data[p_name + '.idx']] = p_data[p_name + '.val']
+            return values.reshape(shape)
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def save(cls, p_file, p_channels:dict, p_kinds:dict=None, p_sparsity:float=0.1, p_attrs:dict=None):
+        """
+        Encodes and stores channels in a compressed archive.
+
+        Parameters
+        ----------
+        p_file : str or file
+            Target file, see np.savez_compressed().
+        p_channels : dict
+            Channels in the form {name: np.ndarray}, with the steps along the first axis.
+        p_kinds : dict
+            Kinds of the channels in the form {name: kind}. Missing kinds are determined by
+            get_kind(). Default: None.
+        p_sparsity : float
+            Maximum share of non-zero entries of a sparse channel. Default: 0.1.
+        p_attrs : dict
+            Further JSON-serializable attributes, e.g. plant parameters. Default: None.
+        """
+
+        p_kinds = p_kinds or {}
+        data = {}
+        meta = {'channels': {}, 'attrs': p_attrs or {}}
+
+        for name, values in p_channels.items():
+            values = np.asarray(values)
+            kind = p_kinds.get(name) or cls.get_kind(values, p_sparsity)
+            meta['channels'][name] = cls._encode(name, values, kind, data)
+
+        data[cls.C_META] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+        np.savez_compressed(p_file, **data)
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def load(cls, p_file, p_channels:list=None):
+        """
+        Loads and decodes channels of an archive.
+
+        Parameters
+        ----------
+        p_file : str or file
+            Archive file.
+        p_channels : list
+            Names of the channels to be decoded. Default: None (all channels).
+
+        Returns
+        -------
+        channels : dict
+            Decoded channels in the form {name: np.ndarray}. Continuous and sparse channels are
+            float32, binary channels are bool or float32 according to their original data type.
+        attrs : dict
+            Further attributes of the archive.
+        """
+
+        with np.load(p_file) as data:
+            meta = json.loads(data[cls.C_META].tobytes().decode())
+            names = p_channels or list(meta['channels'].keys())
+            channels = {name:cls._decode(name, meta['channels'][name], data) for name in names}
+
+        return channels, meta['attrs']
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def save_recorder(cls, p_file, p_recorder, p_kinds:dict=None, p_sparsity:float=0.1, p_attrs:dict=None):
+        """
+        Stores all frames of an EpisodeRecorder, e.g. the attribute data_storing of the pool
+        environments. The channels are named <frame_id>/<variable>.
+        """
+
+        channels = {}
+        for frame in p_recorder.frame_id:
+            values = p_recorder.get_frame(frame)
+            for idx, name in enumerate(p_recorder.names):
+                channels[str(frame) + cls.C_SEP + name] = values[:,idx]
+
+        kinds = None
+        if p_kinds is not None:
+            kinds = {key:p_kinds[key.split(cls.C_SEP, 1)[1]] for key in channels if key.split(cls.C_SEP, 1)[1] in p_kinds}
+
+        cls.save(p_file, channels, p_kinds=kinds, p_sparsity=p_sparsity, p_attrs=p_attrs)
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def load_frames(cls, p_file) -> dict:
+        """
+        Loads an archive of an EpisodeRecorder.
+
+        Returns
+        -------
+        dict
+            {frame_id: {variable: np.ndarray}}
+        """
+
+        channels, _ = cls.load(p_file)
+        frames = {}
+        for key, values in channels.items():
+            frame, name = key.split(cls.C_SEP, 1)
+            frames.setdefault(frame, {})[name] = values
+
+        return frames
@@ -0,0 +1,233 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : bits.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a bit-packed recorder for the binary channels of an MPPS, i.e. all sensors and
+actuators with base set Z and boundaries [0,1], e.g. SiloLoadingSensor1, Hopper9_Sensor1,
+TankSensor1..3 or the Switch of a vibratory conveyor.
+
+The values of all binary channels of a step are packed into a single row of bytes (np.packbits),
+which takes one bit per channel and step instead of a Python object or a float. Queries over
+several channels, e.g. "steps where any high-level sensor was set", are evaluated directly on the
+packed bytes with a bit mask.
+"""
+
+
+from mlpro.bf.math import Dimension
+import numpy as np
+import fnmatch
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class BinaryChannelRecorder:
+    """
+    This class records the binary sensors and actuators of an MPPS as a packed bit matrix.
+
+    Parameters
+    ----------
+    p_mpps : SimMPPS
+        Plant, whose binary channels are recorded.
+    p_capacity : int
+        Initial number of steps, which grows by doubling. Default: 1024.
+
+    Attributes
+    ----------
+    names : list
+        Names of the recorded channels (sensors first, then actuators).
+    frame_id : list
+        Ids of the recorded frames (e.g. episodes).
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_mpps, p_capacity:int=1024):
+
+        elems = list(p_mpps.get_sensors().items()) + list(p_mpps.get_actuators().items())
+        elems = [(name, elem) for name, elem in elems if self.is_binary(elem)]
+
+        self.names = [name for name, _ in elems]
+        self.frame_id = []
+        self._elems = [elem for _, elem in elems]
+        self._col = {name:idx for idx, name in enumerate(self.names)}
+        self._num_bytes = (len(self.names) + 7) // 8
+        self._data = np.zeros((max(int(p_capacity), 1), self._num_bytes), dtype=np.uint8)
+        self._row = np.zeros(len(self.names), dtype=bool)
+        self._size = 0
+        self._frames = []
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def is_binary(p_elem) -> bool:
+        """
+        Checks whether a sensor or an actuator is binary, i.e. its base set is Z and its boundaries
+        are [0,1].
+        """
+
+        return (p_elem.get_base_set() == Dimension.C_BASE_SET_Z) and (list(p_elem.get_boundaries()) == [0,1])
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_frame(self, p_frame_id):
+        """
+        Starts a new frame (e.g. an episode) at the current step.
+        """
+
+        self._frames.append(self._size)
+        self.frame_id.append(p_frame_id)
+
+
+## -------------------------------------------------------------------------------------------------
+    def memorize(self):
+        """
+        Reads the current values of all binary channels and stores them as a packed row. Deactivated
+        elements (value None) are stored as 0.
+        """
+
+        if self._size == self._data.shape[0]:
+            data = np.zeros((2*self._size, self._num_bytes), dtype=np.uint8)
+            data[:self._size] = self._data
+            self._data = data
+
+        row = self._row
+        for idx, elem in enumerate(self._elems):
+            row[idx] = bool(elem._value)
+
+        self._data[self._size] = np.packbits(row)
+        self._size += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_steps(self) -> int:
+        return self._size
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_packed(self, p_frame_id=None) -> np.ndarray:
+        """
+        Returns the packed rows of all steps or of a frame as an array of shape (num_steps,
+        num_bytes).
+        """
+
+        if p_frame_id is None:
+            return self._data[:self._size]
+
+        idx = self.frame_id.index(p_frame_id)
+        end = self._frames[idx+1] if idx+1 < len(self._frames) else self._size
+        return self._data[self._frames[idx]:end]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_channel_names(self, p_pattern:str='*') -> list:
+        """
+        Returns the names of all channels matching a shell-style pattern, e.g. '*Sensor1'.
+        """
+
+        return fnmatch.filter(self.names, p_pattern)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_mask(self, p_channels) -> np.ndarray:
+        if p_channels is None:
+            p_channels = self.names
+        elif isinstance(p_channels, str):
+            p_channels = self.get_channel_names(p_channels)
+
+        bits = np.zeros(self._num_bytes * 8, dtype=bool)
+        bits[[self._col[name] for name in p_channels]] = True
+        return np.packbits(bits)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_bits(self, p_channels=None, p_frame_id=None) -> np.ndarray:
+        """
+        Unpacks the values of the given channels.
+
+        Parameters
+        ----------
+        p_channels : list or str
+            Names of the channels or a shell-style pattern. Default: None (all channels).
+        p_frame_id : str
+            Id of the frame. Default: None (all steps).
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape (num_steps, num_channels).
+        """
+
+        bits = np.unpackbits(self.get_packed(p_frame_id), axis=1, count=len(self.names)).view(bool)
+
+        if p_channels is None:
+            return bits
+        if isinstance(p_channels, str):
+            p_channels = self.get_channel_names(p_channels)
+
+        return bits[:, [self._col[name] for name in p_channels]]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_channel(self, p_channel:str, p_frame_id=None) -> np.ndarray:
+        """
+        Returns the values of a single channel as a boolean array of shape (num_steps,).
+        """
+
+        idx = self._col[p_channel]
+        return (self.get_packed(p_frame_id)[:, idx // 8] & (0x80 >> (idx % 8))) != 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def any_set(self, p_channels=None, p_frame_id=None) -> np.ndarray:
+        """
+        Determines the steps, in which any of the given channels was set.
+
+        Parameters
+        ----------
+        p_channels : list or str
+            Names of the channels or a shell-style pattern. Default: None (all channels).
+        p_frame_id : str
+            Id of the frame. Default: None (all steps).
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of shape (num_steps,).
+        """
+
+        return (self.get_packed(p_frame_id) & self._get_mask(p_channels)).any(axis=1)
+
+
+## -------------------------------------------------------------------------------------------------
+    def all_set(self, p_channels=None, p_frame_id=None) -> np.ndarray:
+        """
+        Determines the steps, in which all of the given channels were set. See any_set().
+        """
+
+        mask = self._get_mask(p_channels)
+        return ((self.get_packed(p_frame_id) & mask) == mask).all(axis=1)
+
+
+## -------------------------------------------------------------------------------------------------
+    def count_set(self, p_channels=None, p_frame_id=None) -> np.ndarray:
+        """
+        Counts the steps, in which each of the given channels was set.
+
+        Returns
+        -------
+        np.ndarray
+            Number of steps per channel.
+        """
+
+        return self.get_bits(p_channels, p_frame_id).sum(axis=0)
@@ -0,0 +1,289 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : generator.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Shards without steps, complete plant parameters in the manifest
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides a sharded parallel dataset generator for MPPS-based environments, e.g.
+LS_SLEnv.
+
+The dataset is split into shards, which are generated independently by a pool of worker
+processes. Each shard is a trajectory store (see mlpro_mpps.data.trajectories) and has its own
+deterministic seed stream, spawned from a single root seed via np.random.SeedSequence. The initial
+fill levels as well as the actions of a shard are drawn from this seed stream, so the same root
+seed always reproduces the same shards, independent of the number of worker processes.
+
+A manifest (manifest.json) records the environment, the given parameters and all parameters of
+its constructor (see MPPSEnv.get_plant_parameters()), the root seed and the seed, number of
+episodes and number of rows of each shard. Shards without any step (no episodes or cycles) have no
+trajectory store and no dimensions.
+
+Each row of a shard contains the state before the action, the action and the resulting rewards.
+
+The generator can also be started from the command line, e.g.
+
+    python -m mlpro_mpps.data.generator mlpro_mpps.pool.ml.sl_environment.SL001_LS:LS_SLEnv <path>
+        --workers 8 --shards 32 --episodes 10 --cycles 1000 --seed 1
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.data.trajectories import TrajectoryStore
+from mlpro_mpps.data.actions import RandomActionGenerator
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import importlib
+import argparse
+import json
+import time
+import os
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _generate_shard(p_job:dict) -> dict:
+    """
+    Generates a single shard. This function is executed by the worker processes.
+    """
+
+    env_cls = p_job['env_cls']
+    env = env_cls(p_logging=Log.C_LOG_NOTHING, **p_job['env_kwargs'])
+
+    seed = np.random.SeedSequence(entropy=p_job['entropy'], spawn_key=tuple(p_job['spawn_key']))
+    seed_levels, seed_actions = seed.spawn(2)
+    rng_levels = np.random.default_rng(seed_levels)
+    action_gen = p_job['action_cls'](env.get_action_space().get_num_dim(), seed_actions, **p_job['action_kwargs'])
+
+    store = None
+    obs = np.zeros((1, env.get_state_space().get_num_dim()))
+    tstart = time.perf_counter()
+
+    for episode in range(p_job['num_episodes']):
+        env._reset_episode(rng_levels.uniform(size=len(env.set_fill_levels)))
+        env._num_cycles = 0
+
+        for cycle in range(p_job['num_cycles']):
+            obs[0] = env.get_state().get_values()
+            action = action_gen.compute_actions(obs)[0]
+            env.process_action_values(action)
+            reward = env.get_reward_values()
+
+            if store is None:
+                store = TrajectoryStore(p_job['path'],
+                                        p_dims={'states'  : obs.shape[1],
+                                                'actions' : action.size,
+                                                'rewards' : reward.size},
+                                        p_capacity=p_job['num_episodes']*p_job['num_cycles'])
+                store.add_episode()
+            elif cycle == 0:
+                store.add_episode()
+
+            store.append(obs[0], action, reward)
+
+    # The dimension of the rewards is only known after the first step, so that no store is
+    # created for a shard without steps
+    if store is not None:
+        store.close()
+        num_rows, dims = store.get_num_rows(), store.get_dims()
+    else:
+        num_rows, dims = 0, None
+
+    return {'path'         : os.path.basename(p_job['path']),
+            'spawn_key'    : list(p_job['spawn_key']),
+            'num_episodes' : p_job['num_episodes'],
+            'num_rows'     : num_rows,
+            'dims'         : dims,
+            'duration'     : time.perf_counter() - tstart,
+            'mpps'         : env._fct_strans.get_name(),
+            'env_params'   : env.get_plant_parameters(),
+            't_set'        : getattr(env, 't_set', None)}
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ShardedDataGenerator(Log):
+    """
+    This class generates a sharded dataset from an MPPS-based environment with a pool of worker
+    processes.
+
+    Parameters
+    ----------
+    p_env_cls : type
+        Class of the environment, e.g. LS_SLEnv.
+    p_path : str
+        Root directory of the dataset.
+    p_num_shards : int
+        Number of shards.
+    p_num_episodes : int
+        Number of episodes per shard.
+    p_num_cycles : int
+        Number of cycles per episode.
+    p_num_workers : int
+        Number of worker processes. Default: None (number of CPUs).
+    p_seed : int
+        Root seed of the dataset. Default: None (random root seed, which is recorded in the
+        manifest).
+    p_env_kwargs : dict
+        Further parameters for the constructor of the environment. Default: None.
+    p_action_cls : type
+        Class of the action generator, see mlpro_mpps.data.actions. Default: RandomActionGenerator.
+    p_action_kwargs : dict
+        Further parameters for the constructor of the action generator. Default: None.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_MANIFEST : str
+        File name of the manifest.
+    """
+
+    C_TYPE = 'Data Generator'
+    C_NAME = 'MPPS'
+    C_MANIFEST = 'manifest.json'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_env_cls,
+                 p_path:str,
+                 p_num_shards:int,
+                 p_num_episodes:int,
+                 p_num_cycles:int,
+                 p_num_workers:int=None,
+                 p_seed:int=None,
+                 p_env_kwargs:dict=None,
+                 p_action_cls=RandomActionGenerator,
+                 p_action_kwargs:dict=None,
+                 p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._env_cls = p_env_cls
+        self._path = p_path
+        self._num_shards = p_num_shards
+        self._num_episodes = p_num_episodes
+        self._num_cycles = p_num_cycles
+        self._num_workers = p_num_workers or os.cpu_count()
+        self._seed = np.random.SeedSequence(p_seed)
+        self._env_kwargs = p_env_kwargs or {}
+        self._action_cls = p_action_cls
+        self._action_kwargs = p_action_kwargs or {}
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_shard_path(self, p_shard:int) -> str:
+        return self._path + os.sep + 'shard-%05d' % p_shard
+
+
+## -------------------------------------------------------------------------------------------------
+    def run(self) -> dict:
+        """
+        Generates all shards and writes the manifest.
+
+        Returns
+        -------
+        dict
+            Manifest of the dataset.
+        """
+
+        os.makedirs(self._path, exist_ok=True)
+
+        jobs = [{'env_cls'       : self._env_cls,
+                 'env_kwargs'    : self._env_kwargs,
+                 'action_cls'    : self._action_cls,
+                 'action_kwargs' : self._action_kwargs,
+                 'entropy'       : self._seed.entropy,
+                 'spawn_key'     : seed.spawn_key,
+                 'num_episodes'  : self._num_episodes,
+                 'num_cycles'    : self._num_cycles,
+                 'path'          : self.get_shard_path(idx)}
+                for idx, seed in enumerate(self._seed.spawn(self._num_shards))]
+
+        self.log(self.C_LOG_TYPE_I, 'Generation of', str(self._num_shards), 'shards with',
+                 str(self._num_workers), 'workers started')
+        tstart = time.perf_counter()
+
+        if self._num_workers > 1:
+            with ProcessPoolExecutor(max_workers=self._num_workers) as executor:
+                shards = list(executor.map(_generate_shard, jobs))
+        else:
+            shards = [_generate_shard(job) for job in jobs]
+
+        duration = time.perf_counter() - tstart
+        num_rows = sum(shard['num_rows'] for shard in shards)
+
+        manifest = {'env'           : self._env_cls.__module__ + ':' + self._env_cls.__qualname__,
+                    'env_kwargs'    : self._env_kwargs,
+                    'env_params'    : shards[0]['env_params'] if len(shards) > 0 else None,
+                    'action'        : self._action_cls.__module__ + ':' + self._action_cls.__qualname__,
+                    'action_kwargs' : self._action_kwargs,
+                    'mpps'          : shards[0]['mpps'] if len(shards) > 0 else None,
+                    't_set'         : shards[0]['t_set'] if len(shards) > 0 else None,
+                    'seed'          : str(self._seed.entropy),
+                    'num_episodes'  : self._num_episodes,
+                    'num_cycles'    : self._num_cycles,
+                    'num_rows'      : num_rows,
+                    'num_workers'   : self._num_workers,
+                    'duration'      : duration,
+                    'shards'        : [{key:shard[key] for key in ['path', 'spawn_key', 'num_episodes', 'num_rows', 'dims']}
+                                       for shard in shards]}
+
+        with open(self._path + os.sep + self.C_MANIFEST, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        self.log(self.C_LOG_TYPE_I, 'Generation of', str(num_rows), 'rows finished after',
+                 '%.2f' % duration, 's (%.0f rows/s)' % (num_rows/max(duration, 1e-9)))
+        return manifest
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def load_manifest(p_path:str) -> dict:
+        with open(p_path + os.sep + ShardedDataGenerator.C_MANIFEST, 'r') as f:
+            return json.load(f)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def _import_class(p_name:str):
+    module, qualname = p_name.split(':')
+    return getattr(importlib.import_module(module), qualname)
+
+
+## -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Sharded parallel dataset generator for MPPS-based environments')
+    parser.add_argument('env', help='Environment class, e.g. mlpro_mpps.pool.ml.sl_environment.SL001_LS:LS_SLEnv')
+    parser.add_argument('path', help='Root directory of the dataset')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--shards', type=int, default=os.cpu_count())
+    parser.add_argument('--episodes', type=int, default=1)
+    parser.add_argument('--cycles', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--env-kwargs', type=json.loads, default=None, help='JSON dict of environment parameters')
+    args = parser.parse_args()
+
+    ShardedDataGenerator(p_env_cls=_import_class(args.env),
+                         p_path=args.path,
+                         p_num_shards=args.shards,
+                         p_num_episodes=args.episodes,
+                         p_num_cycles=args.cycles,
+                         p_num_workers=args.workers,
+                         p_seed=args.seed,
+                         p_env_kwargs=args.env_kwargs).run()
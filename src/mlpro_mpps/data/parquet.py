@@ -0,0 +1,289 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : parquet.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Rows without a started episode are rejected
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides a log sink, which streams simulation logs of MPPS-based environments to
+Parquet or Arrow IPC files while simulating.
+
+The rows are buffered in a preallocated NumPy array and written as typed row groups (float32 or
+bool) as soon as the buffer is full. Each episode (frame) is written into its own partition
+<path>/episode=<frame_id>/, which can be read directly by pyarrow.dataset or pandas. The names and
+units of the columns and of all elements of the underlying plant are stored as schema metadata.
+
+The log sink provides the same interface as EpisodeRecorder (add_frame(), memorize_row()) and can
+thus replace the attribute data_storing of the pool environments. The package pyarrow is optional
+and only required, if this module is used.
+"""
+
+
+import numpy as np
+import json
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ParquetLogSink:
+    """
+    This class streams rows of a fixed set of variables to Parquet or Arrow IPC files, partitioned by
+    episode.
+
+    Parameters
+    ----------
+    p_path : str
+        Root directory of the partitioned dataset.
+    p_variables : list
+        List of column names, which is equal to the order of the values of each row.
+    p_dtypes : dict
+        Data types of the columns in the form {name: 'float32' or 'bool'}. Columns not listed are
+        stored as float32. Default: None.
+    p_units : dict
+        Units of the columns in the form {name: unit}. Default: None.
+    p_mpps : SimMPPS
+        Plant, whose element names and units are stored as schema metadata. Default: None.
+    p_format : str
+        C_FORMAT_PARQUET or C_FORMAT_ARROW. Default: C_FORMAT_PARQUET.
+    p_row_group_size : int
+        Number of rows per row group. Default: 8192.
+    p_compression : str
+        Compression of the Parquet files. Default: 'zstd'.
+
+    Attributes
+    ----------
+    C_FORMAT_PARQUET : str
+        Parquet files.
+    C_FORMAT_ARROW : str
+        Arrow IPC files.
+    C_PARTITION : str
+        Name of the partition key. Default: 'episode'.
+    """
+
+    C_FORMAT_PARQUET = 'parquet'
+    C_FORMAT_ARROW = 'arrow'
+    C_PARTITION = 'episode'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_path:str,
+                 p_variables:list,
+                 p_dtypes:dict=None,
+                 p_units:dict=None,
+                 p_mpps=None,
+                 p_format:str=C_FORMAT_PARQUET,
+                 p_row_group_size:int=8192,
+                 p_compression:str='zstd'):
+
+        if pa is None:
+            raise ImportError('Package pyarrow is required for ParquetLogSink, please install it via pip install pyarrow')
+
+        if p_format not in [self.C_FORMAT_PARQUET, self.C_FORMAT_ARROW]:
+            raise ValueError('Format ' + str(p_format) + ' is not supported')
+
+        self.names = list(p_variables)
+        self.frame_id = []
+        self._path = p_path
+        self._format = p_format
+        self._compression = p_compression
+        self._row_group_size = max(int(p_row_group_size), 1)
+
+        p_dtypes = p_dtypes or {}
+        p_units = p_units or {}
+        self._bool_cols = [name for name in self.names if p_dtypes.get(name) == 'bool']
+        fields = [pa.field(name,
+                           pa.bool_() if name in self._bool_cols else pa.float32(),
+                           metadata={'unit': p_units.get(name, '')})
+                  for name in self.names]
+
+        metadata = {'columns': json.dumps({name:p_units.get(name, '') for name in self.names})}
+        if p_mpps is not None:
+            metadata['mpps'] = p_mpps.get_name()
+            metadata['mpps_elements'] = json.dumps(self.get_mpps_elements(p_mpps))
+
+        self._schema = pa.schema(fields, metadata=metadata)
+        self._is_bool = np.array([name in self._bool_cols for name in self.names])
+        self._buffer = np.zeros((self._row_group_size, len(self.names)))
+        self._size = 0
+        self._writer = None
+        self._num_rows = 0
+
+        os.makedirs(self._path, exist_ok=True)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def get_mpps_elements(p_mpps) -> dict:
+        """
+        Determines the names and units of all actuators, sensors and component states of a plant.
+
+        Returns
+        -------
+        dict
+            {'actuators': {name: unit}, 'sensors': {name: unit}, 'states': {name: unit}}
+        """
+
+        return {'actuators' : {name:elem.get_unit() for name, elem in p_mpps.get_actuators().items()},
+                'sensors'   : {name:elem.get_unit() for name, elem in p_mpps.get_sensors().items()},
+                'states'    : {name:elem.get_unit() for name, elem in p_mpps.get_component_states().items()}}
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_schema(self):
+        return self._schema
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_path(self, p_frame_id=None) -> str:
+        """
+        Returns the root directory of the dataset or the file of a frame.
+        """
+
+        if p_frame_id is None:
+            return self._path
+
+        return (self._path + os.sep + self.C_PARTITION + '=' + str(p_frame_id) + os.sep
+                + 'part-0.' + self._format)
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_frame(self, p_frame_id):
+        """
+        Starts a new episode and thus a new partition. The previous episode is flushed and closed.
+
+        Parameters
+        ----------
+        p_frame_id : str
+            Id of the episode.
+        """
+
+        self._close_writer()
+
+        path = self.get_path(p_frame_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if self._format == self.C_FORMAT_PARQUET:
+            self._writer = pq.ParquetWriter(path, self._schema, compression=self._compression)
+        else:
+            self._sink = pa.OSFile(path, 'wb')
+            self._writer = pa.ipc.new_file(self._sink, self._schema)
+
+        self.frame_id.append(p_frame_id)
+
+
+## -------------------------------------------------------------------------------------------------
+    def memorize_row(self, p_row):
+        """
+        Stores the values of all variables of one step. A row group is written as soon as the
+        buffer is full. An episode must have been started by add_frame() before.
+
+        Parameters
+        ----------
+        p_row : list or np.ndarray
+            Values in the order of the variables.
+        """
+
+        if self._writer is None:
+            raise RuntimeError('No episode started, see add_frame()')
+
+        self._buffer[self._size] = p_row
+        self._size += 1
+
+        if self._size == self._row_group_size:
+            self.flush()
+
+
+## -------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Writes the buffered rows as a row group into the file of the current episode.
+        """
+
+        if (self._size == 0) or (self._writer is None):
+            return
+
+        data = self._buffer[:self._size]
+        arrays = []
+        for idx in range(len(self.names)):
+            if self._is_bool[idx]:
+                arrays.append(pa.array(np.nan_to_num(data[:,idx]) != 0))
+            else:
+                arrays.append(pa.array(data[:,idx].astype(np.float32)))
+
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self._num_rows += self._size
+        self._size = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _close_writer(self):
+        if self._writer is None:
+            return
+
+        self.flush()
+        self._writer.close()
+        if self._format == self.C_FORMAT_ARROW:
+            self._sink.close()
+        self._writer = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Flushes and closes the current episode. It is to be called at the end of a run.
+        """
+
+        self._close_writer()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_rows(self) -> int:
+        return self._num_rows + self._size
+
+
+## -------------------------------------------------------------------------------------------------
+    def save_data(self, p_path=None, p_filename=None, p_delimiter=None) -> bool:
+        """
+        Counterpart of EpisodeRecorder.save_data(). Since all rows are already streamed to the
+        dataset, the current episode is only flushed and closed. The parameters are ignored.
+        """
+
+        self.close()
+        return True
+
+
+## -------------------------------------------------------------------------------------------------
+    def read(self, p_frame_id=None):
+        """
+        Reads the dataset or a single episode as a pyarrow Table. Only closed episodes can be read.
+        """
+
+        if p_frame_id is not None:
+            path = self.get_path(p_frame_id)
+            if self._format == self.C_FORMAT_PARQUET:
+                return pq.read_table(path)
+            else:
+                with pa.memory_map(path, 'r') as source:
+                    return pa.ipc.open_file(source).read_all()
+
+        import pyarrow.dataset as ds
+        return ds.dataset(self._path, format='parquet' if self._format == self.C_FORMAT_PARQUET else 'arrow',
+                          partitioning='hive').to_table()
@@ -0,0 +1,341 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : recorder.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       New class EpisodeSummary with streaming aggregates per frame
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides a columnar episode recorder for MPPS-based environments.
+
+In contrast to MLPro's DataStoring, which appends every single value to a Python list, the recorder
+preallocates a NumPy array per episode (frame) and writes one row per step with a single indexed
+assignment. The array grows by doubling its capacity. The export via save_data() is compatible with
+DataStoring.save_data().
+
+For long runs, in which only episode KPIs are relevant, the class EpisodeSummary keeps streaming
+aggregates per episode instead of all rows.
+"""
+
+
+import numpy as np
+import csv
+import os
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class EpisodeRecorder:
+    """
+    This class provides a functionality to record the values of a fixed set of variables row by row
+    during training/simulation.
+
+    Parameters
+    ----------
+    p_variables : list
+        List of variable names, which is equal to the column order of the rows.
+    p_capacity : int
+        Initial number of rows per frame. Default: 1024.
+    p_dtype :
+        Data type of the columns. Default: np.float64.
+
+    Attributes
+    ----------
+    C_VAR0 : str
+        Name of the frame column of the exported file, see DataStoring.C_VAR0.
+    """
+
+    C_VAR0 = 'Frame ID'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_variables:list, p_capacity:int=1024, p_dtype=np.float64):
+
+        self.names = list(p_variables)
+        self.frame_id = []
+        self._col = {name:idx for idx, name in enumerate(self.names)}
+        self._capacity = max(int(p_capacity), 1)
+        self._dtype = p_dtype
+        self._frames = {}
+        self._data = None
+        self._size = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_frame(self, p_frame_id):
+        """
+        Starts a new frame (e.g. an episode). The buffer of the previous frame is trimmed to its
+        number of rows.
+
+        Parameters
+        ----------
+        p_frame_id : str
+            Id of the frame.
+        """
+
+        self._close_frame()
+        self._data = np.empty((self._capacity, len(self.names)), dtype=self._dtype)
+        self._size = 0
+        self._frame = p_frame_id
+        self._frames[p_frame_id] = None
+        self.frame_id.append(p_frame_id)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _close_frame(self):
+        if self._data is not None:
+            self._frames[self._frame] = self._data[:self._size].copy()
+            self._data = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def memorize_row(self, p_row):
+        """
+        Stores the values of all variables of one step at once.
+
+        Parameters
+        ----------
+        p_row : list or np.ndarray
+            Values in the order of the variables.
+        """
+
+        if self._size == self._data.shape[0]:
+            data = np.empty((2*self._size, len(self.names)), dtype=self._dtype)
+            data[:self._size] = self._data
+            self._data = data
+
+        self._data[self._size] = p_row
+        self._size += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_frame(self, p_frame_id=None) -> np.ndarray:
+        """
+        Returns the recorded rows of a frame as a 2D array of shape (num_rows, num_variables).
+
+        Parameters
+        ----------
+        p_frame_id : str
+            Id of the frame. Default: None (current frame).
+        """
+
+        if (p_frame_id is None) or ((self._data is not None) and (p_frame_id == self._frame)):
+            return self._data[:self._size]
+
+        return self._frames[p_frame_id]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self, p_variable, p_frame_id=None):
+        """
+        To obtain values from the memory, see DataStoring.get_values().
+
+        Returns
+        -------
+        np.ndarray or dict
+            Values of the variable in the given frame, or {frame_id: values} of all frames.
+        """
+
+        col = self._col[p_variable]
+
+        if p_frame_id is None:
+            return {frame:self.get_frame(frame)[:,col] for frame in self.frame_id}
+
+        return self.get_frame(p_frame_id)[:,col]
+
+
+## -------------------------------------------------------------------------------------------------
+    def save_data(self, p_path, p_filename, p_delimiter="\t") -> bool:
+        """
+        To save the recorded data in the same file format as DataStoring.save_data().
+        """
+
+        if (p_filename is None) or (p_filename == ''):
+            return False
+
+        try:
+            if not os.path.exists(p_path):
+                os.makedirs(p_path)
+            path_save = p_path + os.sep + p_filename + ".csv"
+            with open(path_save, "w", newline="") as write_file:
+                writer = csv.writer(write_file, delimiter=p_delimiter, quoting=csv.QUOTE_ALL)
+                writer.writerow([self.C_VAR0] + self.names)
+                writer = csv.writer(write_file, delimiter=p_delimiter)
+                for frame in self.frame_id:
+                    for row in self.get_frame(frame).tolist():
+                        writer.writerow([frame] + row)
+            return True
+        except:
+            return False
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class EpisodeSummary:
+    """
+    This class provides the same interface as EpisodeRecorder, but only maintains streaming
+    aggregates (count, sum, mean, min, max and variance) of each variable per frame. The variance is
+    updated with Welford's algorithm, so the memory per frame is constant, independent of the
+    number of steps.
+
+    Parameters
+    ----------
+    p_variables : list
+        List of variable names, which is equal to the column order of the rows.
+
+    Attributes
+    ----------
+    C_VAR0 : str
+        Name of the frame column of the exported file, see DataStoring.C_VAR0.
+    C_AGGREGATES : list
+        Names of the aggregates per variable.
+    """
+
+    C_VAR0 = 'Frame ID'
+    C_AGGREGATES = ['count', 'sum', 'mean', 'min', 'max', 'var']
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_variables:list):
+
+        self.names = list(p_variables)
+        self.frame_id = []
+        self._col = {name:idx for idx, name in enumerate(self.names)}
+        self._frames = {}
+        self._counts = {}
+        self._frame = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_frame(self, p_frame_id):
+        """
+        Starts a new frame (e.g. an episode) with empty aggregates.
+
+        Parameters
+        ----------
+        p_frame_id : str
+            Id of the frame.
+        """
+
+        num = len(self.names)
+        self._count = 0
+        self._sum = np.zeros(num)
+        self._mean = np.zeros(num)
+        self._m2 = np.zeros(num)
+        self._min = np.full(num, np.inf)
+        self._max = np.full(num, -np.inf)
+        self._frame = p_frame_id
+        self._frames[p_frame_id] = (self._sum, self._mean, self._m2, self._min, self._max)
+        self._counts[p_frame_id] = 0
+        self.frame_id.append(p_frame_id)
+
+
+## -------------------------------------------------------------------------------------------------
+    def memorize_row(self, p_row):
+        """
+        Updates the aggregates of the current frame with the values of all variables of one step.
+
+        Parameters
+        ----------
+        p_row : list or np.ndarray
+            Values in the order of the variables.
+        """
+
+        row = np.asarray(p_row, dtype=float)
+        self._count += 1
+        self._counts[self._frame] = self._count
+
+        delta = row - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (row - self._mean)
+        self._sum += row
+        np.minimum(self._min, row, out=self._min)
+        np.maximum(self._max, row, out=self._max)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_summary(self, p_frame_id=None) -> dict:
+        """
+        Returns the aggregates of a frame.
+
+        Parameters
+        ----------
+        p_frame_id : str
+            Id of the frame. Default: None (current frame).
+
+        Returns
+        -------
+        dict
+            {variable: {aggregate: value}}
+        """
+
+        if p_frame_id is None:
+            p_frame_id = self._frame
+
+        count = self._counts[p_frame_id]
+        sum_, mean, m2, min_, max_ = self._frames[p_frame_id]
+        var = m2 / count if count > 0 else np.zeros_like(m2)
+
+        return {name:{'count' : count,
+                      'sum'   : sum_[idx],
+                      'mean'  : mean[idx],
+                      'min'   : min_[idx],
+                      'max'   : max_[idx],
+                      'var'   : var[idx]}
+                for idx, name in enumerate(self.names)}
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_values(self, p_variable, p_frame_id=None):
+        """
+        Counterpart of EpisodeRecorder.get_values(), which returns the aggregates of a variable
+        instead of its values.
+
+        Returns
+        -------
+        dict
+            Aggregates of the variable in the given frame, or {frame_id: aggregates} of all frames.
+        """
+
+        if p_frame_id is None:
+            return {frame:self.get_summary(frame)[p_variable] for frame in self.frame_id}
+
+        return self.get_summary(p_frame_id)[p_variable]
+
+
+## -------------------------------------------------------------------------------------------------
+    def save_data(self, p_path, p_filename, p_delimiter="\t") -> bool:
+        """
+        To save the aggregates of all frames as a CSV file with one row per frame and one column
+        per variable and aggregate.
+        """
+
+        if (p_filename is None) or (p_filename == ''):
+            return False
+
+        try:
+            if not os.path.exists(p_path):
+                os.makedirs(p_path)
+            path_save = p_path + os.sep + p_filename + ".csv"
+            with open(path_save, "w", newline="") as write_file:
+                writer = csv.writer(write_file, delimiter=p_delimiter, quoting=csv.QUOTE_ALL)
+                writer.writerow([self.C_VAR0] + [name + '_' + aggr for name in self.names for aggr in self.C_AGGREGATES])
+                writer = csv.writer(write_file, delimiter=p_delimiter)
+                for frame in self.frame_id:
+                    summary = self.get_summary(frame)
+                    writer.writerow([frame] + [summary[name][aggr] for name in self.names for aggr in self.C_AGGREGATES])
+            return True
+        except:
+            return False
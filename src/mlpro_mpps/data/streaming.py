@@ -0,0 +1,225 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : streaming.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Reward components of the last step of an episode before the automatic reset
+## -- 2026-10-19  1.0.2     SY       Stop-aware prefetching of sentinel and errors; same seed streams per iteration
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.2 (2026-10-19)
+
+This module provides a torch IterableDataset, which streams transitions of MPPS-based environments
+directly from the simulator to the learner, without writing them to disk.
+
+The transitions are simulated by a BatchedMPPSEnv with actions of a pluggable action generator
+(see mlpro_mpps.data.actions). Each item is a batch of tensors (states, actions, next_states,
+reward_components) of one step of all instances. The next states and reward components of the last
+step of an episode are the ones before the automatic reset of the instance. The batches are
+prefetched by a background thread, so that the learner does not have to wait for the simulation.
+
+If the dataset is used by a DataLoader with several workers, each worker simulates its own
+instances with an independent seed stream.
+"""
+
+
+from mlpro_mpps.batch import BatchedMPPSEnv
+from mlpro_mpps.data.actions import RandomActionGenerator
+import numpy as np
+import threading
+import queue
+
+try:
+    import torch
+    from torch.utils.data import IterableDataset, get_worker_info
+except ImportError:
+    torch = None
+    IterableDataset = object
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SimulatorIterableDataset(IterableDataset):
+    """
+    This class provides a torch IterableDataset of transitions, which are simulated on the fly.
+
+    Parameters
+    ----------
+    p_env_cls : type
+        Class of the environment, e.g. LS_SLEnv.
+    p_num_envs : int
+        Number of instances, which is equal to the number of transitions per batch.
+    p_num_batches : int
+        Number of batches per iteration. Default: None (endless stream).
+    p_seed : int
+        Seed of the initial fill levels and of the actions. Default: None.
+    p_action_cls : type
+        Class of the action generator, see mlpro_mpps.data.actions. Default: RandomActionGenerator.
+    p_action_kwargs : dict
+        Further parameters for the constructor of the action generator. Default: None.
+    p_prefetch : int
+        Maximum number of batches, which are prefetched by the background thread. If 0, the
+        batches are simulated in the iterating thread. Default: 4.
+    p_dtype :
+        Data type of the tensors. Default: torch.float32.
+    p_kwargs : dict
+        Further parameters for the constructor of the environment.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_env_cls,
+                 p_num_envs:int,
+                 p_num_batches:int=None,
+                 p_seed:int=None,
+                 p_action_cls=RandomActionGenerator,
+                 p_action_kwargs:dict=None,
+                 p_prefetch:int=4,
+                 p_dtype=None,
+                 **p_kwargs):
+
+        if torch is None:
+            raise ImportError('Package torch is required for SimulatorIterableDataset')
+
+        super().__init__()
+
+        self._env_cls = p_env_cls
+        self._num_envs = p_num_envs
+        self._num_batches = p_num_batches
+        self._entropy = np.random.SeedSequence(p_seed).entropy
+        self._action_cls = p_action_cls
+        self._action_kwargs = p_action_kwargs or {}
+        self._prefetch = p_prefetch
+        self._dtype = p_dtype or torch.float32
+        self._kwargs = p_kwargs
+        self._component_names = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_component_names(self) -> list:
+        """
+        Returns the names of the columns of the reward components. They are available after the
+        first batch has been simulated.
+        """
+
+        return self._component_names
+
+
+## -------------------------------------------------------------------------------------------------
+    def _generate(self, p_seed:np.random.SeedSequence):
+        """
+        Simulates the batches of one iteration.
+        """
+
+        seed_levels, seed_actions = p_seed.spawn(2)
+        batch = BatchedMPPSEnv(self._env_cls,
+                               self._num_envs,
+                               p_seed=np.random.default_rng(seed_levels),
+                               **self._kwargs)
+        envs = batch.get_envs()
+        action_gen = self._action_cls(batch._num_actions, seed_actions, **self._action_kwargs)
+
+        obs = batch.reset()
+        components = None
+        num_batches = 0
+
+        while (self._num_batches is None) or (num_batches < self._num_batches):
+            states = obs.copy()
+            actions = np.array(action_gen.compute_actions(states), dtype=float)
+            obs, _, terminated, truncated = batch.step(actions)
+
+            next_states = obs.copy()
+            done = terminated | truncated
+            if done.any():
+                next_states[done] = batch.get_final_observations()[done]
+            final_components = batch.get_final_components()
+
+            for i, env in enumerate(envs):
+                if i in final_components:
+                    values = final_components[i]
+                else:
+                    values = env.get_accumulated_components()
+                if components is None:
+                    self._component_names = [name + ('' if np.size(value) == 1 else '_%d' % k)
+                                             for name, value in values.items()
+                                             for k in range(np.size(value))]
+                    components = np.zeros((self._num_envs, len(self._component_names)))
+                if len(values) > 0:
+                    components[i] = np.concatenate([np.ravel(value) for value in values.values()])
+
+            yield (torch.from_numpy(states).to(self._dtype),
+                   torch.from_numpy(actions).to(self._dtype),
+                   torch.from_numpy(next_states).to(self._dtype),
+                   torch.from_numpy(components.copy()).to(self._dtype))
+
+            num_batches += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _put(self, p_item, p_queue:queue.Queue, p_stop:threading.Event) -> bool:
+        """
+        Puts an item into the queue, unless the iteration is stopped in the meantime. Returns True,
+        if the item has been put.
+        """
+
+        while not p_stop.is_set():
+            try:
+                p_queue.put(p_item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _prefetch_batches(self, p_generator, p_queue:queue.Queue, p_stop:threading.Event):
+        try:
+            for item in p_generator:
+                if not self._put(item, p_queue, p_stop):
+                    return
+        except Exception as error:
+            self._put(error, p_queue, p_stop)
+            return
+
+        self._put(None, p_queue, p_stop)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __iter__(self):
+        # Each iteration starts with a fresh seed sequence of the same root entropy, since spawning
+        # changes the state of a seed sequence
+        seed = np.random.SeedSequence(self._entropy)
+        worker = get_worker_info()
+        if worker is not None:
+            seed = seed.spawn(worker.num_workers)[worker.id]
+
+        generator = self._generate(seed)
+
+        if self._prefetch <= 0:
+            yield from generator
+            return
+
+        batches = queue.Queue(maxsize=self._prefetch)
+        stop = threading.Event()
+        thread = threading.Thread(target=self._prefetch_batches, args=(generator, batches, stop), daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                item = batches.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
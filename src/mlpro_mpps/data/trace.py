@@ -0,0 +1,249 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : trace.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides deterministic action traces of MPPS-based environments and their headless
+replay.
+
+An action trace contains the environment class, its plant parameters and, per episode, the seed,
+the initial fill levels and the exact sequence of plain action values. Optionally, the observation
+before each action is stored as well, so that a replay can be verified against the original run.
+Traces are recorded by the environments themselves, see MPPSEnv.enable_trace_recording().
+
+The class TraceReplay re-simulates a trace without any agent, scenario or policy object, at full
+engine speed. It can also be started from the command line:
+
+    python -m mlpro_mpps.data.trace <trace file> [--no-verify]
+"""
+
+
+from mlpro.bf.various import Log
+import numpy as np
+import importlib
+import argparse
+import json
+import time
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ActionTrace:
+    """
+    This class records the action trace of an environment.
+
+    Parameters
+    ----------
+    p_env_cls : str
+        Class of the environment in the form 'module:qualname'.
+    p_env_kwargs : dict
+        Plant parameters, i.e. the parameters of the constructor of the environment.
+    p_observations : bool
+        If True, the observation before each action is recorded for verification. Default: True.
+    """
+
+    C_META = '__meta__'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_env_cls:str, p_env_kwargs:dict, p_observations:bool=True):
+
+        self.env_cls = p_env_cls
+        self.env_kwargs = p_env_kwargs
+        self._with_obs = p_observations
+        self.episodes = []
+        self.levels = []
+        self.actions = []
+        self.observations = []
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_episode(self, p_levels, p_seed=None):
+        """
+        Starts a new episode with the given initial fill levels.
+        """
+
+        self.episodes.append({'seed': p_seed, 'start': len(self.actions)})
+        self.levels.append(np.array(p_levels, dtype=float))
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_action(self, p_action, p_obs=None):
+        """
+        Records the plain action values and optionally the observation before the action.
+        """
+
+        self.actions.append(np.array(p_action, dtype=float))
+        if self._with_obs and (p_obs is not None):
+            self.observations.append(np.array(p_obs, dtype=float))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_actions(self) -> int:
+        return len(self.actions)
+
+
+## -------------------------------------------------------------------------------------------------
+    def save(self, p_file):
+        """
+        Stores the trace in a compressed .npz file. Actions and observations are stored in float64,
+        so that the replay is exact.
+        """
+
+        meta = {'env'        : self.env_cls,
+                'env_kwargs' : self.env_kwargs,
+                'episodes'   : self.episodes}
+
+        data = {self.C_META : np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8),
+                'levels'    : np.array(self.levels, dtype=float),
+                'actions'   : np.array(self.actions, dtype=float)}
+        if len(self.observations) == len(self.actions):
+            data['observations'] = np.array(self.observations, dtype=float)
+
+        np.savez_compressed(p_file, **data)
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def load(cls, p_file):
+        """
+        Loads a trace from a .npz file.
+        """
+
+        with np.load(p_file) as data:
+            meta = json.loads(data[cls.C_META].tobytes().decode())
+            trace = cls(meta['env'], meta['env_kwargs'], p_observations='observations' in data)
+            trace.episodes = meta['episodes']
+            trace.levels = list(data['levels'])
+            trace.actions = list(data['actions'])
+            if 'observations' in data:
+                trace.observations = list(data['observations'])
+
+        return trace
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class TraceReplay(Log):
+    """
+    This class re-simulates an action trace with plain action values, without agents, scenario and
+    per-step recording of the environment.
+
+    Parameters
+    ----------
+    p_trace : ActionTrace or str
+        Action trace or its file.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE = 'Trace Replay'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_trace, p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        if isinstance(p_trace, str):
+            p_trace = ActionTrace.load(p_trace)
+
+        self._trace = p_trace
+        module, qualname = p_trace.env_cls.split(':')
+        env_cls = getattr(importlib.import_module(module), qualname)
+        kwargs = dict(p_trace.env_kwargs)
+        kwargs['recording'] = 'none'
+        self._env = env_cls(p_logging=Log.C_LOG_NOTHING, **kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_env(self):
+        return self._env
+
+
+## -------------------------------------------------------------------------------------------------
+    def run(self, p_verify:bool=True, p_atol:float=1e-9) -> dict:
+        """
+        Replays all episodes of the trace.
+
+        Parameters
+        ----------
+        p_verify : bool
+            If True, the observations are compared with the recorded ones, if available.
+            Default: True.
+        p_atol : float
+            Absolute tolerance of the verification. Default: 1e-9.
+
+        Returns
+        -------
+        dict
+            Number of steps, duration, steps per second, maximum deviation of the observations and
+            index of the first deviating step (None, if all observations match).
+        """
+
+        env = self._env
+        trace = self._trace
+        actions = trace.actions
+        observations = trace.observations if (p_verify and len(trace.observations) == len(actions)) else None
+        max_dev = 0.0
+        first_dev = None
+
+        bounds = [episode['start'] for episode in trace.episodes[1:]] + [len(actions)]
+        tstart = time.perf_counter()
+
+        for episode, (levels, end) in enumerate(zip(trace.levels, bounds)):
+            env._reset_episode(levels)
+            env._num_cycles = 0
+
+            for idx in range(trace.episodes[episode]['start'], end):
+                if observations is not None:
+                    dev = np.max(np.abs(env._get_observation() - observations[idx]), initial=0.0)
+                    if dev > max_dev:
+                        max_dev = float(dev)
+                    if (dev > p_atol) and (first_dev is None):
+                        first_dev = idx
+                env.process_action_values(actions[idx])
+
+        duration = time.perf_counter() - tstart
+        result = {'steps'           : len(actions),
+                  'duration'        : duration,
+                  'steps_per_sec'   : len(actions) / max(duration, 1e-9),
+                  'verified'        : observations is not None,
+                  'max_deviation'   : max_dev,
+                  'first_deviation' : first_dev}
+
+        self.log(self.C_LOG_TYPE_I, 'Replay of', str(len(actions)), 'steps finished after', '%.3f' % duration,
+                 's (%.0f steps/s)' % result['steps_per_sec'])
+        if first_dev is not None:
+            self.log(self.C_LOG_TYPE_W, 'Observations deviate from step', str(first_dev), 'on, max. deviation',
+                     str(max_dev))
+
+        return result
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless replay of an MPPS action trace')
+    parser.add_argument('trace', help='Trace file (.npz)')
+    parser.add_argument('--no-verify', action='store_true', help='Skip the verification of the observations')
+    args = parser.parse_args()
+
+    print(json.dumps(TraceReplay(args.trace).run(p_verify=not args.no_verify), indent=2))
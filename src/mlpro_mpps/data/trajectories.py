@@ -0,0 +1,314 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.data
+## -- Module  : trajectories.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a memory-mapped trajectory store for training data generated by MPPS-based
+environments.
+
+States, actions and rewards are written into fixed-dtype binary files (np.memmap), one row per
+step. The episodes are listed in an index sidecar (episodes.npy) with their first row and length,
+and the dimensions and data type are stored in meta.json. Opening a store only maps the files, so
+that multi-GB datasets are available instantly and are paged in on demand.
+
+The class TrajectoryWindowDataset provides a torch Dataset, which serves sliding windows of
+seq_len steps within the episodes directly from the mapped pages without copying them.
+"""
+
+
+import numpy as np
+import json
+import os
+
+try:
+    import torch
+    from torch.utils.data import Dataset
+except ImportError:
+    torch = None
+    Dataset = object
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class TrajectoryStore:
+    """
+    This class stores trajectories of states, actions and rewards in memory-mapped files.
+
+    Parameters
+    ----------
+    p_path : str
+        Directory of the store.
+    p_dims : dict
+        Dimensions of the fields in the form {'states': int, 'actions': int, 'rewards': int}. Only
+        required for new stores. Default: None.
+    p_dtype :
+        Data type of all fields. Default: np.float32.
+    p_capacity : int
+        Initial number of rows of a new store, which grows by doubling. Default: 65536.
+    p_mode : str
+        C_MODE_WRITE to create a new store, C_MODE_READ to open an existing one. Default:
+        C_MODE_WRITE.
+
+    Attributes
+    ----------
+    C_FIELDS : list
+        Names of the fields, which are also the names of the binary files.
+    C_MODE_WRITE : str
+        Creates a new store.
+    C_MODE_READ : str
+        Opens an existing store for reading.
+    """
+
+    C_FIELDS = ['states', 'actions', 'rewards']
+    C_MODE_WRITE = 'w'
+    C_MODE_READ = 'r'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_path:str,
+                 p_dims:dict=None,
+                 p_dtype=np.float32,
+                 p_capacity:int=65536,
+                 p_mode:str=C_MODE_WRITE):
+
+        self._path = p_path
+        self._mode = p_mode
+
+        if p_mode == self.C_MODE_WRITE:
+            if p_dims is None:
+                raise ValueError('Please provide the dimensions of the fields via p_dims')
+            os.makedirs(p_path, exist_ok=True)
+            self._dims = {field:int(p_dims[field]) for field in self.C_FIELDS}
+            self._dtype = np.dtype(p_dtype)
+            self._num_rows = 0
+            self._episodes = []
+            self._capacity = 0
+            self._maps = {}
+            self._resize(max(int(p_capacity), 1))
+        else:
+            with open(self._get_file('meta.json'), 'r') as f:
+                meta = json.load(f)
+            self._dims = meta['dims']
+            self._dtype = np.dtype(meta['dtype'])
+            self._num_rows = meta['num_rows']
+            self._capacity = self._num_rows
+            self._episodes = [tuple(x) for x in np.load(self._get_file('episodes.npy')).tolist()]
+            # Copy-on-write mapping: the files are never changed, but the arrays are writable,
+            # which is required by torch.from_numpy()
+            self._maps = {field:self._map(field, self._num_rows, 'c') for field in self.C_FIELDS}
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def open(cls, p_path:str):
+        """
+        Opens an existing store for reading.
+        """
+
+        return cls(p_path, p_mode=cls.C_MODE_READ)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_file(self, p_name:str) -> str:
+        return self._path + os.sep + p_name
+
+
+## -------------------------------------------------------------------------------------------------
+    def _map(self, p_field:str, p_rows:int, p_mode:str):
+        if p_rows == 0:
+            return np.zeros((0, self._dims[p_field]), dtype=self._dtype)
+
+        return np.memmap(self._get_file(p_field + '.bin'),
+                         dtype=self._dtype,
+                         mode=p_mode,
+                         shape=(p_rows, self._dims[p_field]))
+
+
+## -------------------------------------------------------------------------------------------------
+    def _resize(self, p_capacity:int):
+        """
+        Resizes the binary files to the given number of rows and maps them again.
+        """
+
+        for field in self.C_FIELDS:
+            if isinstance(self._maps.get(field), np.memmap):
+                self._maps.pop(field).flush()
+
+            row_bytes = self._dims[field] * self._dtype.itemsize
+            with open(self._get_file(field + '.bin'), 'ab') as f:
+                f.truncate(p_capacity * row_bytes)
+
+            self._maps[field] = self._map(field, p_capacity, 'r+')
+
+        self._capacity = p_capacity
+
+
+## -------------------------------------------------------------------------------------------------
+    def add_episode(self):
+        """
+        Starts a new episode. The following rows belong to this episode.
+        """
+
+        if self._mode != self.C_MODE_WRITE:
+            raise PermissionError('Store ' + self._path + ' is opened for reading')
+
+        self._episodes.append((self._num_rows, 0))
+
+
+## -------------------------------------------------------------------------------------------------
+    def append(self, p_states, p_actions, p_rewards):
+        """
+        Appends one or more rows to the current episode.
+
+        Parameters
+        ----------
+        p_states : np.ndarray
+            States of shape (dim,) or (num_rows, dim).
+        p_actions : np.ndarray
+            Actions of shape (dim,) or (num_rows, dim).
+        p_rewards : np.ndarray
+            Rewards of shape (dim,) or (num_rows, dim).
+        """
+
+        if len(self._episodes) == 0:
+            self.add_episode()
+
+        states = np.asarray(p_states).reshape(-1, self._dims['states'])
+        num = states.shape[0]
+        end = self._num_rows + num
+
+        if end > self._capacity:
+            capacity = self._capacity
+            while capacity < end:
+                capacity *= 2
+            self._resize(capacity)
+
+        self._maps['states'][self._num_rows:end] = states
+        self._maps['actions'][self._num_rows:end] = np.asarray(p_actions).reshape(num, self._dims['actions'])
+        self._maps['rewards'][self._num_rows:end] = np.asarray(p_rewards).reshape(num, self._dims['rewards'])
+
+        start, length = self._episodes[-1]
+        self._episodes[-1] = (start, length + num)
+        self._num_rows = end
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Trims the binary files to the number of stored rows and writes the index sidecar and the
+        meta data. The store can be opened for reading afterwards.
+        """
+
+        if self._mode != self.C_MODE_WRITE:
+            return
+
+        self._resize(self._num_rows)
+        np.save(self._get_file('episodes.npy'), np.array(self._episodes, dtype=np.int64).reshape(-1, 2))
+        with open(self._get_file('meta.json'), 'w') as f:
+            json.dump({'dims'     : self._dims,
+                       'dtype'    : self._dtype.str,
+                       'num_rows' : self._num_rows}, f)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_rows(self) -> int:
+        return self._num_rows
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_dims(self) -> dict:
+        return self._dims
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_episodes(self) -> np.ndarray:
+        """
+        Returns the episode index as an array of shape (num_episodes, 2) with first row and length.
+        """
+
+        return np.array(self._episodes, dtype=np.int64).reshape(-1, 2)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_field(self, p_field:str) -> np.ndarray:
+        """
+        Returns the mapped array of a field, limited to the stored rows.
+        """
+
+        return self._maps[p_field][:self._num_rows]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_episode(self, p_episode:int) -> dict:
+        """
+        Returns views of the states, actions and rewards of an episode.
+        """
+
+        start, length = self._episodes[p_episode]
+        return {field:self._maps[field][start:start+length] for field in self.C_FIELDS}
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class TrajectoryWindowDataset(Dataset):
+    """
+    This class provides a torch Dataset of sliding windows within the episodes of a trajectory
+    store. Each item is a tuple of tensors (states, actions, rewards) of seq_len rows each, which
+    share their memory with the mapped files.
+
+    Parameters
+    ----------
+    p_store : TrajectoryStore or str
+        Trajectory store or its directory.
+    p_seq_len : int
+        Number of steps per window. Default: 1.
+    p_stride : int
+        Distance between the first steps of two successive windows. Default: 1.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_store, p_seq_len:int=1, p_stride:int=1):
+
+        if torch is None:
+            raise ImportError('Package torch is required for TrajectoryWindowDataset')
+
+        super().__init__()
+
+        if isinstance(p_store, str):
+            p_store = TrajectoryStore.open(p_store)
+
+        self._store = p_store
+        self._seq_len = p_seq_len
+        self._fields = [p_store.get_field(field) for field in TrajectoryStore.C_FIELDS]
+
+        # First rows of all windows, which do not cross episode boundaries
+        starts = [np.arange(start, start + length - p_seq_len + 1, p_stride, dtype=np.int64)
+                  for start, length in p_store.get_episodes() if length >= p_seq_len]
+        self._starts = np.concatenate(starts) if len(starts) > 0 else np.zeros(0, dtype=np.int64)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __len__(self):
+        return self._starts.size
+
+
+## -------------------------------------------------------------------------------------------------
+    def __getitem__(self, index):
+        start = self._starts[index]
+        end = start + self._seq_len
+        return tuple(torch.from_numpy(field[start:end]) for field in self._fields)
@@ -0,0 +1,867 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : envs.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version, agent partitions and observation views
+## -- 2026-10-19  1.1.0     SY       Episode reset from given fill levels, plain action values
+## -- 2026-10-19  1.2.0     SY       Action repeat with accumulation of rewards and reward components
+## -- 2026-10-19  1.3.0     SY       Recording levels none, summary and full
+## -- 2026-10-19  1.4.0     SY       Bit-packed recording of binary sensors and actuators
+## -- 2026-10-19  1.5.0     SY       Action trace recording and plant parameters
+## -- 2026-10-19  1.6.0     SY       Snapshots, cloning and compact pickling
+## -- 2026-10-19  1.7.0     SY       Awaitable reset and step
+## -- 2026-10-19  1.7.1     SY       Agent observations from given states
+## -- 2026-10-19  1.7.2     SY       Agent spaces are spawned from get_agent_partition()
+## -- 2026-10-19  1.7.3     SY       Faster cloning with shared static attributes of the plant
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.7.3 (2026-10-19)
+
+This module provides shared functionalities for the MPPS-based environments and game boards in the
+pool of objects.
+
+The class MPPSEnv is combined with an MLPro Environment or GameBoard and provides a partition of
+the observation and action spaces for decentralized agents. Each agent of the partition receives a
+NumPy view into the single observation array of the environment, so that no per-agent copy of the
+state is required. The agents of mlpro_mpps.agents extract their observations by these views.
+
+Furthermore, MPPSEnv provides a lean episode reset from given fill levels and a state transition
+from plain action values. Both are used by the batched environment in mlpro_mpps.batch, which
+bypasses the construction of MLPro Action and Reward objects.
+
+An action can be held for a number of internal steps of the plant (parameter action_repeat of the
+environments). Rewards and reward components (e.g. margin, power, demand, overflow, transported
+material) are accumulated over these steps, so that an agent only observes the final state and the
+summed reward.
+
+The per-step recording of the environments (time, overflow, power, demand, transported material,
+...) can be switched off or reduced to streaming aggregates per episode (parameter recording of the
+environments), which is relevant for benchmarks and long trainings. Additionally, the binary
+sensors and actuators of the plant can be recorded as a packed bit matrix, see
+enable_binary_recording(). The exact action sequences of the episodes can be recorded as an action
+trace for a headless replay, see enable_trace_recording() and mlpro_mpps.data.trace.
+
+The dynamic state of an environment can be taken as a snapshot of plain data and restored, see
+get_snapshot() and set_snapshot(). Environments can be cloned without construction, see clone(). A
+pickled environment only contains its plant parameters and a snapshot, so that it can be shipped to
+worker processes cheaply. The plant is rebuilt during unpickling.
+
+The awaitable methods reset_async() and step_async() run a reset resp. a step in an executor, so
+that environments can be driven from asyncio-based code, see also mlpro_mpps.aio.
+"""
+
+
+from mlpro.bf.math import *
+from mlpro.bf.physics import TransferFunction
+from mlpro_mpps.data.recorder import EpisodeRecorder, EpisodeSummary
+from mlpro_mpps.data.bits import BinaryChannelRecorder
+from mlpro_mpps.data.trace import ActionTrace
+from mlpro_mpps.mpps import Module
+import numpy as np
+import asyncio
+import inspect
+import copy
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MPPSEnv:
+    """
+    This class serves as an extension of the MPPS-based environments. It is supposed to be inherited
+    together with an MLPro Environment or GameBoard, e.g. class BGLP_RLEnv(MPPSEnv, Environment).
+
+    The child class is expected to provide the attributes set_fill_levels (names of the fill-level
+    states that build the observation) and _fct_strans (the underlying SimMPPS).
+
+    Attributes
+    ----------
+    C_AGENT_PARTITION : dict
+        Partition of the environment for decentralized agents in the form of
+        {agent_name: ([state indices], [action indices])}. The order of the agents is equal to the
+        order of the keys. Default: {}.
+    action_repeat : int
+        Number of internal steps of the plant per action. It is set by the constructor of the child
+        class. Default: 1.
+    recording : str
+        Recording level of the environment, which is set by the constructor of the child class.
+        Default: C_RECORDING_FULL.
+    C_RECORDING_NONE : str
+        No recording. The attribute data_storing is None.
+    C_RECORDING_SUMMARY : str
+        Streaming aggregates of each recorded variable per episode, see EpisodeSummary.
+    C_RECORDING_FULL : str
+        All rows of each episode, see EpisodeRecorder.
+    C_EXECUTOR_INLINE : str
+        Executor parameter of reset_async() and step_async() to run the work directly on the event
+        loop.
+    C_SNAPSHOT_ATTRS : list
+        Attributes of the environment, which are part of a snapshot in addition to the values of
+        the elements of the plant, see get_snapshot().
+    C_PICKLE_ATTRS : list
+        Attributes of the environment, which are pickled as they are in addition to the plant
+        parameters and the snapshot, e.g. the persistence version and the file name.
+    binary_storing : BinaryChannelRecorder
+        Recorder of the binary sensors and actuators of the plant per internal step. Default: None
+        (no recording), see enable_binary_recording().
+    trace_storing : ActionTrace
+        Recorder of the initial fill levels and plain action values of the episodes. Default: None
+        (no recording), see enable_trace_recording().
+    """
+
+    C_AGENT_PARTITION = {}
+
+    C_RECORDING_NONE = 'none'
+    C_RECORDING_SUMMARY = 'summary'
+    C_RECORDING_FULL = 'full'
+
+    C_EXECUTOR_INLINE = 'inline'
+
+    C_SNAPSHOT_ATTRS = ['t', 'prod_reached', 'data_frame', '_num_cycles', '_reward_sum', '_components_sum']
+    C_PICKLE_ATTRS = ['_persistence_version', '_filename', '_filename_stub', '_suffix', '_id']
+    C_SHARED_ATTRS = ['_id', '_kwargs', '_log_color_map', '_boundaries', '_spec_components', '_spec_connections']
+    C_ATOMIC_TYPES = (type(None), bool, int, float, str)
+
+    action_repeat = 1
+    recording = C_RECORDING_FULL
+    binary_storing = None
+    trace_storing = None
+
+    _obs_elems = None
+    _obs_index = None
+    _reset_elems = None
+    _reward_sum = None
+    _components_sum = None
+    _reset_seed = None
+    _snapshot_elems = None
+    _plant_objs = None
+    _shared_objects = None
+    _async_busy = False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_recorder(self, p_variables:list, p_recording:str=C_RECORDING_FULL):
+        """
+        This method provides a functionality to create the recorder of the environment according
+        to the recording level.
+
+        Parameters
+        ----------
+        p_variables : list
+            Names of the recorded variables.
+        p_recording : str
+            Recording level, see C_RECORDING_NONE, C_RECORDING_SUMMARY and C_RECORDING_FULL.
+            Default: C_RECORDING_FULL.
+
+        Returns
+        -------
+        EpisodeRecorder, EpisodeSummary or None
+        """
+
+        self.recording = p_recording
+
+        if p_recording == self.C_RECORDING_FULL:
+            return EpisodeRecorder(p_variables)
+        elif p_recording == self.C_RECORDING_SUMMARY:
+            return EpisodeSummary(p_variables)
+        elif p_recording == self.C_RECORDING_NONE:
+            return None
+        else:
+            raise ValueError('Recording level ' + str(p_recording) + ' is not supported')
+
+
+## -------------------------------------------------------------------------------------------------
+    def enable_binary_recording(self, p_capacity:int=1024) -> BinaryChannelRecorder:
+        """
+        This method provides a functionality to record all binary sensors and actuators of the
+        underlying SimMPPS after each internal step, starting with the current episode.
+
+        Parameters
+        ----------
+        p_capacity : int
+            Initial number of steps of the recorder. Default: 1024.
+
+        Returns
+        -------
+        BinaryChannelRecorder
+            Recorder, which is also available as attribute binary_storing.
+        """
+
+        self.binary_storing = BinaryChannelRecorder(self._fct_strans, p_capacity=p_capacity)
+        self.binary_storing.add_frame(str(getattr(self, 'data_frame', 0)))
+        return self.binary_storing
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_plant_parameters(self) -> dict:
+        """
+        This method provides a functionality to determine the parameters of the constructor of the
+        environment from its attributes, e.g. t_set, lr_power or action_repeat. The parameters
+        p_logging and recording are excluded.
+
+        Returns
+        -------
+        dict
+            {parameter: value}
+        """
+
+        attrs = {'p_reward_type': 'reward_type', 'cycle_limit': 'C_CYCLE_LIMIT'}
+        params = {}
+
+        for name in list(inspect.signature(type(self).__init__).parameters)[1:]:
+            if name in ['p_logging', 'recording']:
+                continue
+            attr = attrs.get(name, name)
+            if hasattr(self, attr):
+                params[name] = getattr(self, attr)
+
+        return params
+
+
+## -------------------------------------------------------------------------------------------------
+    def enable_trace_recording(self, p_observations:bool=True) -> ActionTrace:
+        """
+        This method provides a functionality to record the action trace of all following episodes,
+        i.e. the seed and initial fill levels of each episode and the plain action values of each
+        action. The trace can be stored via ActionTrace.save() and replayed via TraceReplay.
+
+        Parameters
+        ----------
+        p_observations : bool
+            If True, the observation before each action is recorded for the verification of a
+            replay. Default: True.
+
+        Returns
+        -------
+        ActionTrace
+            Recorder, which is also available as attribute trace_storing.
+        """
+
+        self.trace_storing = ActionTrace(type(self).__module__ + ':' + type(self).__qualname__,
+                                         self.get_plant_parameters(),
+                                         p_observations=p_observations)
+        return self.trace_storing
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self, p_seed=None):
+        self._reset_seed = p_seed
+        return super().reset(p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_snapshot_elements(self) -> list:
+        """
+        Returns all sensors, actuators and component states of the underlying SimMPPS in a fixed
+        order, which is identical for all instances with the same plant parameters.
+        """
+
+        if self._snapshot_elems is None:
+            plant = self._fct_strans
+            self._snapshot_elems = list(plant.get_sensors().values())
+            self._snapshot_elems.extend(plant.get_actuators().values())
+            self._snapshot_elems.extend(plant.get_component_states().values())
+
+        return self._snapshot_elems
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_snapshot(self) -> dict:
+        """
+        This method provides a functionality to get the dynamic state of the environment, i.e. the
+        values of all elements of the underlying SimMPPS, the counters and accumulators of the
+        episode and the flags of the current state. The topology of the plant is not included.
+
+        Returns
+        -------
+        dict
+            Snapshot, which only consists of plain Python and NumPy data.
+        """
+
+        elems = self._get_snapshot_elements()
+        state = self._state
+
+        return {'values' : [elem._value for elem in elems],
+                'status' : [getattr(elem, '_status', None) for elem in elems],
+                'attrs'  : {name:copy.deepcopy(getattr(self, name)) for name in self.C_SNAPSHOT_ATTRS if hasattr(self, name)},
+                'flags'  : None if state is None else (state.get_success(), state.get_broken(), state.get_terminal(), state.get_timeout())}
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_snapshot(self, p_snapshot:dict):
+        """
+        This method provides a functionality to restore a snapshot of an environment with the same
+        plant parameters, see get_snapshot().
+
+        Parameters
+        ----------
+        p_snapshot : dict
+            Snapshot.
+        """
+
+        for elem, value, status in zip(self._get_snapshot_elements(), p_snapshot['values'], p_snapshot['status']):
+            elem._value = value
+            if status is not None:
+                elem._status = status
+
+        for name, value in p_snapshot['attrs'].items():
+            setattr(self, name, copy.deepcopy(value))
+
+        if p_snapshot['flags'] is not None:
+            self._state = self.get_states()
+            success, broken, terminal, timeout = p_snapshot['flags']
+            self._state.set_success(success)
+            self._state.set_broken(broken)
+            self._state.set_terminal(terminal)
+            self._state.set_timeout(timeout)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_plant_objects(self) -> list:
+        """
+        Returns the underlying SimMPPS with all its modules, components, elements, transfer
+        functions and the sets holding them. Profiled transfer functions are returned without their
+        timed proxies.
+        """
+
+        if self._plant_objs is None:
+            plant = self._fct_strans
+            elems = self._get_snapshot_elements()
+            self._plant_objs = [plant] + elems
+
+            comps = list(plant.get_elements().get_dims())
+            while comps:
+                comp = comps.pop()
+                self._plant_objs.append(comp)
+                if isinstance(comp, Module):
+                    comps.extend(comp.get_components().get_dims())
+
+            functions = [getattr(elem, '_function', None) for elem in elems]
+            functions = [getattr(function, 'fct', function) for function in functions]
+            self._plant_objs.extend(function for function in functions if isinstance(function, TransferFunction))
+            self._plant_objs.extend([value for obj in self._plant_objs for value in obj.__dict__.values()
+                                     if isinstance(value, Set)])
+            self._plant_objs = list({id(obj):obj for obj in self._plant_objs}.values())
+
+        return self._plant_objs
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_shared_objects(self) -> list:
+        """
+        Returns the objects, which are shared between an environment and its clones: the state and
+        action spaces with their dimensions, the cached boundaries of the observation and the static
+        attributes of all plant objects (see C_SHARED_ATTRS), i.e. their ids, construction
+        parameters, boundaries, log color maps and station specifications. These objects are not
+        modified during the simulation.
+        """
+
+        if self._shared_objects is None:
+            if self._obs_elems is None:
+                self._setup_observation()
+
+            shared = [self._obs_low, self._obs_range]
+            for space in [self.get_state_space(), self.get_action_space()]:
+                shared.append(space)
+                shared.extend(space.get_dim(dim_id) for dim_id in space.get_dim_ids())
+
+            for obj in self._get_plant_objects():
+                for name in self.C_SHARED_ATTRS:
+                    value = obj.__dict__.get(name)
+                    if type(value) not in self.C_ATOMIC_TYPES:
+                        shared.append(value)
+
+            self._shared_objects = shared
+
+        return self._shared_objects
+
+
+## -------------------------------------------------------------------------------------------------
+    def clone(self):
+        """
+        This method provides a functionality to create an independent copy of the environment
+        without its construction. The spaces, the boundaries of the observation and the static
+        attributes of the plant are shared with the original, see _get_shared_objects(). All other
+        attributes of the plant objects (see _get_plant_objects()) are copied attribute-wise, which
+        avoids the generic reconstruction of deepcopy for their many scalar attributes. The
+        remaining attributes of the environment, e.g. the recorders, are deep-copied.
+
+        Returns
+        -------
+        MPPSEnv
+            Clone of the environment.
+        """
+
+        shared = self._get_shared_objects()
+        memo = {id(obj):obj for obj in shared}
+        memo[id(shared)] = shared
+
+        clone = object.__new__(type(self))
+        memo[id(self)] = clone
+
+        objs = [obj for obj in self._get_plant_objects() if id(obj) not in memo]
+        for obj in objs:
+            memo[id(obj)] = object.__new__(type(obj))
+
+        atomic = self.C_ATOMIC_TYPES
+        for obj in objs:
+            memo[id(obj)].__dict__.update({name:(value if type(value) in atomic else copy.deepcopy(value, memo))
+                                           for name, value in obj.__dict__.items()})
+
+        clone.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return clone
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reduce_state(self, p_state:dict, p_path:str, p_os_sep:str, p_filename_stub:str):
+        """
+        The pickled state of an environment only consists of its class parameters, the plant
+        parameters and a snapshot. The topology of the plant with its bound methods and back
+        references is rebuilt during unpickling. Recorders are not pickled.
+        """
+
+        compact = {name:p_state[name] for name in self.C_PICKLE_ATTRS if name in p_state}
+        compact['_mpps_pickle'] = {'logging'   : self.get_log_level(),
+                                   'recording' : self.recording,
+                                   'params'    : self.get_plant_parameters(),
+                                   'snapshot'  : self.get_snapshot()}
+        p_state.clear()
+        p_state.update(compact)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _complete_state(self, p_path:str, p_os_sep:str, p_filename_stub:str):
+        compact = self.__dict__.pop('_mpps_pickle', None)
+        if compact is None:
+            return super()._complete_state(p_path, p_os_sep, p_filename_stub)
+
+        persistence = {name:self.__dict__[name] for name in self.C_PICKLE_ATTRS if name in self.__dict__}
+        type(self).__init__(self, p_logging=compact['logging'], recording=compact['recording'], **compact['params'])
+        self.__dict__.update(persistence)
+        self.set_snapshot(compact['snapshot'])
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_observation(self):
+        """
+        This method provides a functionality to cache the fill-level states and boundaries, which
+        build the observation array of the environment.
+        """
+
+        _sts = self._fct_strans.get_component_states()
+        self._obs_elems = [_sts[name] for name in self.set_fill_levels]
+        boundaries = np.array([elem.get_boundaries() for elem in self._obs_elems], dtype=float)
+        self._obs_low = boundaries[:,0]
+        self._obs_range = boundaries[:,1]-boundaries[:,0]
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_observation(self) -> np.ndarray:
+        """
+        This method provides a functionality to determine the normalized fill levels of all buffers
+        as a single observation array.
+
+        Returns
+        -------
+        np.ndarray
+            Normalized fill levels.
+        """
+
+        if self._obs_elems is None:
+            self._setup_observation()
+
+        values = np.fromiter((elem.get_value() for elem in self._obs_elems),
+                             dtype=float,
+                             count=len(self._obs_elems))
+        return (values-self._obs_low)/self._obs_range
+
+
+## -------------------------------------------------------------------------------------------------
+    def _deactivate_elements(self):
+        """
+        This method provides a functionality to deactivate all actuators and sensors of the
+        underlying SimMPPS. In contrast to SimActuator.deactivate() and SimSensor.deactivate(), no
+        log entry is created, which is relevant for frequent resets.
+        """
+
+        if self._reset_elems is None:
+            self._reset_elems = list(self._fct_strans.get_actuators().values())
+            self._reset_elems.extend(self._fct_strans.get_sensors().values())
+
+        for elem in self._reset_elems:
+            elem._value = None
+            elem._status = False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _set_fill_levels(self, p_levels):
+        """
+        This method provides a functionality to set the fill levels of all buffers at once.
+
+        Parameters
+        ----------
+        p_levels : list or np.ndarray
+            Normalized fill levels in [0,1], sorted in the order of set_fill_levels.
+        """
+
+        if self._obs_elems is None:
+            self._setup_observation()
+
+        fill_levels = self._obs_low + np.asarray(p_levels, dtype=float)*self._obs_range
+        for elem, level in zip(self._obs_elems, fill_levels):
+            elem._value = float(level)
+
+        if self.trace_storing is not None:
+            self.trace_storing.add_episode(p_levels, self._reset_seed)
+        self._reset_seed = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_episode(self, p_levels):
+        """
+        Custom method to start a new episode with the given initial fill levels. It is called by
+        _reset() after sampling the fill levels and by the batched environment. See method
+        _set_fill_levels() for further details.
+
+        Parameters
+        ----------
+        p_levels : list or np.ndarray
+            Normalized fill levels in [0,1], sorted in the order of set_fill_levels.
+        """
+
+        raise NotImplementedError
+
+
+## -------------------------------------------------------------------------------------------------
+    def process_action_values(self, p_action):
+        """
+        This method provides a functionality to process plain action values without the
+        construction of an MLPro Action object, see method simulate_action_values() of the
+        underlying SimMPPS.
+
+        Parameters
+        ----------
+        p_action : list or np.ndarray
+            Normalized action values, sorted in the order of the action space.
+        """
+
+        self._fct_strans.simulate_action_values(p_action)
+        self._num_cycles += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_done(self):
+        """
+        Returns the termination and truncation flags of the current episode in the same way as the
+        batched environment, i.e. the production target is reached resp. the cycle limit is reached
+        without reaching the target. Continuous production scenarios never terminate.
+
+        Returns
+        -------
+        terminated : bool
+        truncated : bool
+        """
+
+        if getattr(self, 'prod_scenario', None) == 'continuous':
+            terminated = False
+        else:
+            terminated = getattr(self, 'prod_reached', 0) >= getattr(self, 'prod_target', np.inf)
+
+        cycle_limit = self.get_cycle_limit()
+        truncated = (not terminated) and (cycle_limit > 0) and (self._num_cycles >= cycle_limit)
+        return bool(terminated), bool(truncated)
+
+
+## -------------------------------------------------------------------------------------------------
+    async def _run_async(self, p_executor, p_fct, *p_args):
+        if self._async_busy:
+            raise RuntimeError('The environment is already processing a reset or step')
+
+        self._async_busy = True
+        try:
+            if p_executor == self.C_EXECUTOR_INLINE:
+                return p_fct(*p_args)
+            return await asyncio.get_running_loop().run_in_executor(p_executor, p_fct, *p_args)
+        finally:
+            self._async_busy = False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_values(self, p_seed):
+        self.reset(p_seed)
+        return np.array(self.get_state().get_values(), dtype=float)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _step_values(self, p_action):
+        self.process_action_values(p_action)
+        terminated, truncated = self.get_done()
+        return (np.array(self.get_state().get_values(), dtype=float),
+                np.array(self.get_reward_values(), dtype=float),
+                terminated,
+                truncated)
+
+
+## -------------------------------------------------------------------------------------------------
+    async def reset_async(self, p_seed=None, p_executor=None) -> np.ndarray:
+        """
+        Awaitable reset of the environment. The reset runs in an executor, so that the event loop
+        stays responsive.
+
+        Parameters
+        ----------
+        p_seed :
+            Seed of the reset. Default: None.
+        p_executor :
+            Executor of the reset, e.g. a ThreadPoolExecutor, or C_EXECUTOR_INLINE to run the reset
+            directly on the event loop. Default: None (default executor of the event loop).
+
+        Returns
+        -------
+        np.ndarray
+            Initial observation.
+        """
+
+        return await self._run_async(p_executor, self._reset_values, p_seed)
+
+
+## -------------------------------------------------------------------------------------------------
+    async def step_async(self, p_action, p_executor=None):
+        """
+        Awaitable step with plain action values, see process_action_values(). The step runs in an
+        executor, so that the event loop stays responsive. A second reset or step of the same
+        environment before the end of the first one raises a RuntimeError. Many instances are
+        stepped more efficiently by the AsyncBatchStepper of mlpro_mpps.aio.
+
+        Parameters
+        ----------
+        p_action : list or np.ndarray
+            Normalized action values, sorted in the order of the action space.
+        p_executor :
+            Executor of the step, see reset_async(). Default: None.
+
+        Returns
+        -------
+        obs : np.ndarray
+            Observation after the step.
+        rewards : np.ndarray
+            Rewards of the step.
+        terminated : bool
+            True, if the production target is reached.
+        truncated : bool
+            True, if the cycle limit is reached.
+        """
+
+        return await self._run_async(p_executor, self._step_values, p_action)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _calc_reward_values(self) -> np.ndarray:
+        """
+        Computes the reward of all agents of the partition for the current internal step. Child
+        classes with agent-specific reward functions may redefine this method.
+        """
+
+        return np.asarray(self.calc_reward(), dtype=float)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_reward_components(self) -> dict:
+        """
+        Custom method to get the current reward components of the plant, e.g. margin, power,
+        demand, overflow and transported material.
+
+        Returns
+        -------
+        dict
+            {component_name: float or list}
+        """
+
+        return {}
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_accumulators(self):
+        """
+        Starts a new accumulation of rewards and reward components. It is called at the beginning of
+        each action and at the reset of an episode.
+        """
+
+        self._reward_sum = None
+        self._components_sum = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _begin_action(self, p_action):
+        """
+        Starts the processing of an action. The accumulators are reset and the action is added to
+        the action trace, if it is recorded.
+        """
+
+        if self.trace_storing is not None:
+            self.trace_storing.add_action(p_action, self._get_observation())
+
+        self._reset_accumulators()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _accumulate_step(self):
+        """
+        Adds the rewards and reward components of the current internal step to the accumulators.
+        """
+
+        reward = self._calc_reward_values()
+        components = self.get_reward_components()
+
+        if self._reward_sum is None:
+            self._reward_sum = reward
+            self._components_sum = {name:np.array(value, dtype=float) for name, value in components.items()}
+        else:
+            self._reward_sum += reward
+            for name, value in components.items():
+                self._components_sum[name] += value
+
+        if self.binary_storing is not None:
+            self.binary_storing.memorize()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_reward_values(self) -> np.ndarray:
+        """
+        This method provides a functionality to get the reward of all agents of the partition as a
+        single array, without the construction of an MLPro Reward object. The reward is summed up
+        over all internal steps of the last action.
+
+        Returns
+        -------
+        np.ndarray
+            Reward values.
+        """
+
+        if self._reward_sum is None:
+            return self._calc_reward_values()
+
+        return self._reward_sum
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_accumulated_components(self) -> dict:
+        """
+        This method provides a functionality to get the reward components summed up over all
+        internal steps of the last action.
+
+        Returns
+        -------
+        dict
+            {component_name: np.ndarray}
+        """
+
+        if self._components_sum is None:
+            return {name:np.array(value, dtype=float) for name, value in self.get_reward_components().items()}
+
+        return self._components_sum
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent_partition(self) -> dict:
+        """
+        This method provides a functionality to get the partition of the environment for
+        decentralized agents.
+
+        Returns
+        -------
+        dict
+            {agent_name: ([state indices], [action indices])}
+        """
+
+        return self.C_AGENT_PARTITION
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent_spaces(self, p_agent:str):
+        """
+        This method provides a functionality to spawn the observation and action space of an agent
+        according to the partition.
+
+        Parameters
+        ----------
+        p_agent : str
+            Name of the agent.
+
+        Returns
+        -------
+        ospace : MSpace
+            Observation space of the agent.
+        aspace : MSpace
+            Action space of the agent.
+        """
+
+        state_idx, action_idx = self.get_agent_partition()[p_agent]
+        state_ids = self.get_state_space().get_dim_ids()
+        action_ids = self.get_action_space().get_dim_ids()
+        ospace = self.get_state_space().spawn([state_ids[x] for x in state_idx])
+        aspace = self.get_action_space().spawn([action_ids[x] for x in action_idx])
+        return ospace, aspace
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_index(p_idx:list):
+        """
+        Converts a list of indices into a slice if the indices are contiguous. Basic slicing of a
+        NumPy array returns a view, whereas a list of indices returns a copy.
+        """
+
+        if (len(p_idx) > 0) and (list(p_idx) == list(range(p_idx[0], p_idx[-1]+1))):
+            return slice(p_idx[0], p_idx[-1]+1)
+        else:
+            return np.array(p_idx, dtype=int)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent_observation(self, p_agent:str, p_state=None) -> np.ndarray:
+        """
+        This method provides a functionality to get the observation of an agent as a view into the
+        observation array of a state. Non-contiguous state indices result in a copy. It is used by
+        the agents of mlpro_mpps.agents.
+
+        Parameters
+        ----------
+        p_agent : str
+            Name of the agent.
+        p_state : State
+            State of the environment. Default: None (current state).
+
+        Returns
+        -------
+        np.ndarray
+            Observation of the agent.
+        """
+
+        if self._obs_index is None:
+            self._obs_index = {agent:self._get_index(idx[0]) for agent, idx in self.get_agent_partition().items()}
+
+        if p_state is None:
+            p_state = self.get_state()
+
+        return np.asarray(p_state.get_values())[self._obs_index[p_agent]]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent_observations(self) -> dict:
+        """
+        This method provides a functionality to get the observations of all agents.
+
+        Returns
+        -------
+        dict
+            {agent_name: np.ndarray}
+        """
+
+        return {agent:self.get_agent_observation(agent) for agent in self.get_agent_partition()}
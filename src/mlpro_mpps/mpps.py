@@ -11,10 +11,16 @@
 ## -- 2023-01-13  1.0.2     SY       Add documentation
 ## -- 2023-01-16  1.0.3     SY       Update due to __call__ of TransferFunction
 ## -- 2023-02-01  1.1.0     SY       Refactoring and adding functionalities
+## -- 2026-10-19  1.2.0     SY       Opt-in profiling of signals and transfer functions
+## -- 2026-10-19  1.2.1     SY       Lazy imports: mlpro.rl.models and matplotlib removed
+## -- 2026-10-19  1.2.2     SY       Linear-time check and auto adjustment of duplicated element names
+## -- 2026-10-19  1.3.0     SY       Material flow connections of modules and automatic wiring of signals
+## -- 2026-10-19  1.4.0     SY       Update of all signals without an environment
+## -- 2026-10-19  1.4.1     SY       Signals with invalid inputs are skipped as a whole
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.1.0 (2023-02-01)
+Ver. 1.4.1 (2026-10-19)
 
 This module provides a multi-purpose environment for continuous and batch production systems with
 modular setting and high-flexibility.
@@ -24,6 +30,11 @@ actuators, reservoirs, processes, modules/stations, and components.
 We also provide the default implementations of actuators, reservoirs, components, processes and
 modules, which can be found in the pool of objects.
 
+The material flow of a plant can be declared by connections of transport components to their
+upstream and downstream buffers (see Module._add_connection()). The signals of the transported
+materials, power consumptions, fill levels, overflows and sensors are then derived from this
+topology by SimMPPS._derive_signals(), so that they do not have to be wired by hand.
+
 To be noted, the usage of this simulation is not limited to machine learning tasks, but it also
 can be as a testing environment for any kind of simulations, including GT tasks, evolutionary
 algorithms, supervised learning, model predictive control, domain learning, transfer learning,
@@ -31,7 +42,6 @@ and many more.
 """
 
 
-from mlpro.rl.models import *
 from mlpro.bf.various import *
 from mlpro.bf.math import *
 from mlpro.bf.systems import *
@@ -39,7 +49,6 @@ import numpy as np
 import random
 import uuid
 import math
-import matplotlib.pyplot as plt
 from mlpro.bf.physics import TransferFunction
 
 
@@ -543,11 +552,20 @@ class Component(PersonalisedStamp, EventManager, ScientificObject):
         Type of the base class. Default: 'Component'.
     C_NAME : str
         Name of the component. Default:''.
+    C_FLOW_ROLES : list
+        Suffixes of the names of the component states and their roles in the material flow, see
+        method get_flow_elements().
     """
 
     C_TYPE = 'Component'
     C_NAME = ''
 
+    C_FLOW_ROLES = [('FillLevel', 'fill'),
+                    ('Overflow', 'overflow'),
+                    ('TransportedMaterial', 'transported'),
+                    ('PowerConsumption', 'power'),
+                    ('Level', 'fill')]
+
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
@@ -889,6 +907,40 @@ class Component(PersonalisedStamp, EventManager, ScientificObject):
             return False
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_flow_elements(self) -> dict:
+        """
+        This method provides a functionality to return the elements of the component, which take
+        part in the material flow of the MPPS. The roles of the component states are determined
+        by the suffixes of their names (see C_FLOW_ROLES), whereby suffixes of the automatic name
+        adjustment are ignored. It can be redefined for components with other naming schemes.
+
+        Returns
+        -------
+        dict
+            {'fill': fill level or inventory level, 'overflow': overflow, 'transported':
+            transported material, 'power': power consumption, 'actuator': first actuator,
+            'sensors': list of sensors}. Roles without element are omitted.
+        """
+        _flow = {}
+
+        for el in self.get_component_states().get_dims():
+            _name, _, _suffix = el.get_name_short().rpartition('_')
+            if not (_name and _suffix.isdigit()):
+                _name = el.get_name_short()
+            for _suffix, _role in self.C_FLOW_ROLES:
+                if _name.endswith(_suffix):
+                    _flow.setdefault(_role, el)
+                    break
+
+        _actuators = self.get_actuators().get_dims()
+        if _actuators:
+            _flow['actuator'] = _actuators[0]
+        _flow['sensors'] = self.get_sensors().get_dims()
+
+        return _flow
+
+
 ## -------------------------------------------------------------------------------------------------
     def _setup_component(self):
         """
@@ -945,6 +997,7 @@ class Module(Component):
                  **p_kwargs):
         
         self._components = Set()
+        self._connections = []
         
         Component.__init__(self,
                            p_name=p_name,
@@ -984,6 +1037,40 @@ class Module(Component):
         self._components.add_dim(p_dim=p_component)
 
     
+## -------------------------------------------------------------------------------------------------
+    def _add_connection(self, p_transport:str, p_upstream=None, p_downstream=None):
+        """
+        This method provides a functionality to declare the material flow of a transport component
+        of the module, see method SimMPPS.get_connections().
+
+        Parameters
+        ----------
+        p_transport : str
+            Name of the transport component, e.g. a conveyor belt or a vacuum pump.
+        p_upstream : str or list
+            Name(s) of the buffers, from which the material is taken. They may belong to other
+            modules of the MPPS. Default: None (material from outside).
+        p_downstream : str or list
+            Name(s) of the buffers, to which the material is transported. Default: None.
+        """
+        _upstream = [p_upstream] if isinstance(p_upstream, str) else list(p_upstream or [])
+        _downstream = [p_downstream] if isinstance(p_downstream, str) else list(p_downstream or [])
+        self._connections.append((p_transport, _upstream, _downstream))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_connections(self) -> list:
+        """
+        This method provides a functionality to return the declared connections of the module.
+
+        Returns
+        -------
+        list
+            List of (transport, upstream buffers, downstream buffers).
+        """
+        return self._connections
+
+    
 ## -------------------------------------------------------------------------------------------------
     def get_components(self) -> Set:
         """
@@ -1135,6 +1222,9 @@ class Module(Component):
 
         # self._add_component(...)
 
+        # Optional: material flow between the components for the automatic wiring of the signals
+        # self._add_connection(p_transport='Belt', p_upstream='Silo', p_downstream='Hopper')
+
         raise NotImplementedError
 
 
@@ -1169,11 +1259,16 @@ class SimMPPS(FctSTrans, PersonalisedStamp, ScientificObject):
         Type of the base class. Default: 'SimMPPS'.
     C_NAME : str
         Name of the SimMPPS. Default:''.
+    C_SIGNAL_INPUTS : dict
+        Supported attributes of the inputs of signals given by names and the related methods of
+        the elements, see method _add_signals_by_name().
     """
 
     C_TYPE = 'SimMPPS'
     C_NAME = ''
 
+    C_SIGNAL_INPUTS = {'value': 'get_value', 'status': 'get_status'}
+
 
 ## -------------------------------------------------------------------------------------------------
     def __init__(self,
@@ -1190,6 +1285,7 @@ class SimMPPS(FctSTrans, PersonalisedStamp, ScientificObject):
         PersonalisedStamp.__init__(self, p_name, p_id)
         FctSTrans.__init__(self, p_logging)
         self._signals = []
+        self._profiler = None
         self._setup_mpps(p_auto_adjust_names)
 
 
@@ -1224,6 +1320,187 @@ class SimMPPS(FctSTrans, PersonalisedStamp, ScientificObject):
         _sig.extend(p_input_fcts)
         self._signals.append(_sig)
 
+
+
+## -------------------------------------------------------------------------------------------------
+    def _add_signals_by_name(self, p_signals:list) -> list:
+        """
+        This method provides a functionality to add signals, whose elements are given by their
+        names, e.g. ['Hopper9_FillLevel', 'Hopper9_FillLevel.value', 'CB1_TransportedMaterial.value'].
+        The inputs refer to the value or the status of an element, see C_SIGNAL_INPUTS.
+
+        Parameters
+        ----------
+        p_signals : list
+            Signals in the form [updated element, input 1, input 2, ...].
+
+        Returns
+        -------
+        list
+            Unknown elements, inputs and attributes of inputs. Signals with any of them are not
+            added at all.
+        """
+        _sens = self.get_sensors()
+        _sts = self.get_component_states()
+        _elems = {**self.get_actuators(), **_sens, **_sts}
+        _problems = []
+
+        for sig in p_signals:
+            _target = _sens.get(sig[0], _sts.get(sig[0]))
+            if _target is None:
+                _problems.append('Unknown sensor or component state ' + repr(sig[0]))
+                continue
+
+            _inputs = []
+            _valid = True
+            for inp in sig[1:]:
+                _name, _, _attr = inp.rpartition('.')
+                if _name not in _elems:
+                    _problems.append('Unknown input ' + repr(inp) + ' of signal ' + repr(sig[0]))
+                    _valid = False
+                elif _attr not in self.C_SIGNAL_INPUTS:
+                    _problems.append('Unknown attribute ' + repr(_attr) + ' of input ' + repr(inp) + ' of signal '
+                                     + repr(sig[0]) + ', expected one of ' + str(list(self.C_SIGNAL_INPUTS)))
+                    _valid = False
+                else:
+                    _inputs.append(getattr(_elems[_name], self.C_SIGNAL_INPUTS[_attr]))
+
+            if _valid:
+                self._add_signal(_target, *_inputs)
+
+        return _problems
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_connections(self) -> list:
+        """
+        This method provides a functionality to return the material flow topology of the MPPS,
+        i.e. the connections declared by its modules.
+
+        Returns
+        -------
+        list
+            List of (transport, upstream buffers, downstream buffers), where all entries are the
+            names of components.
+        """
+        _connections = []
+
+        for elem in self.get_elements().get_dims():
+            if isinstance(elem, Module):
+                _connections.extend(elem.get_connections())
+
+        return _connections
+
+
+## -------------------------------------------------------------------------------------------------
+    def _derive_signals(self, p_signals:list=None) -> list:
+        """
+        This method provides a functionality to derive the signals of the material flow from the
+        connections (see get_connections()) after the automatic adjustment of the element names.
+        The roles of the elements are given by Component.get_flow_elements(). The signals are
+        derived in the following order:
+
+            1. Transported material (actuator, fill levels of the upstream buffers) and power
+               consumption (actuator) of each transport in the order of the connections. Actuators
+               of base set Z only provide their status, other actuators their value and status.
+            2. Overflow and fill level (fill level, transported materials of the inflows and then
+               of the outflows) of each connected buffer in the order of the components.
+            3. Sensors (fill level) of each connected buffer.
+
+        Parameters
+        ----------
+        p_signals : list
+            Explicit signals given by names, e.g. for transfer functions with further inputs. They
+            replace the derived signals of the same elements or are appended. Default: None.
+
+        Returns
+        -------
+        list
+            Signals given by names, see _add_signals_by_name().
+        """
+        _comps = {}
+        for elem in self.get_elements().get_dims():
+            if isinstance(elem, Module):
+                for comp in elem.get_components().get_dims():
+                    _comps[comp.get_name_short()] = comp
+
+        # 1. Roles of the elements of the connected components
+        _connections = self.get_connections()
+        _flows = {}
+        _transports = set()
+        _problems = []
+
+        for _transport, _upstream, _downstream in _connections:
+            if _transport in _transports:
+                _problems.append('Duplicate connection of transport ' + repr(_transport))
+            _transports.add(_transport)
+
+            for _name in [_transport, *_upstream, *_downstream]:
+                if _name in _flows:
+                    continue
+                if _name not in _comps:
+                    _problems.append('Unknown component ' + repr(_name) + ' in connection of ' + repr(_transport))
+                    continue
+                _flows[_name] = _comps[_name].get_flow_elements()
+
+            for _name in [*_upstream, *_downstream]:
+                if (_name in _flows) and ('fill' not in _flows[_name]):
+                    _problems.append('Component ' + repr(_name) + ' in connection of ' + repr(_transport) + ' has no fill level')
+
+        if _problems:
+            raise ValueError('Invalid connections of ' + repr(self.get_name()) + ':\n  ' + '\n  '.join(_problems))
+
+        # 2. Transports
+        _signals = []
+        _inflows = {}
+        _outflows = {}
+
+        for _transport, _upstream, _downstream in _connections:
+            _flow = _flows[_transport]
+            _act = _flow.get('actuator')
+            if _act is None:
+                _inputs = []
+            elif _act.get_base_set() == Dimension.C_BASE_SET_Z:
+                _inputs = [_act.get_name_short() + '.status']
+            else:
+                _inputs = [_act.get_name_short() + '.value', _act.get_name_short() + '.status']
+
+            if 'transported' in _flow:
+                _tm = _flow['transported'].get_name_short()
+                _signals.append([_tm, *_inputs, *[_flows[_name]['fill'].get_name_short() + '.value' for _name in _upstream]])
+                for _name in _upstream:
+                    _outflows.setdefault(_name, []).append(_tm + '.value')
+                for _name in _downstream:
+                    _inflows.setdefault(_name, []).append(_tm + '.value')
+
+            if 'power' in _flow:
+                _signals.append([_flow['power'].get_name_short(), *_inputs])
+
+        # 3. Buffers
+        _buffers = [_name for _name in _comps if (_name in _inflows) or (_name in _outflows)]
+
+        for _name in _buffers:
+            _fill = _flows[_name]['fill'].get_name_short()
+            _inputs = [_fill + '.value', *_inflows.get(_name, []), *_outflows.get(_name, [])]
+            if 'overflow' in _flows[_name]:
+                _signals.append([_flows[_name]['overflow'].get_name_short(), *_inputs])
+            _signals.append([_fill, *_inputs])
+
+        for _name in _buffers:
+            _fill = _flows[_name]['fill'].get_name_short()
+            for sens in _flows[_name]['sensors']:
+                _signals.append([sens.get_name_short(), _fill + '.value'])
+
+        # 4. Explicit signals
+        _index = {sig[0]:idx for idx, sig in enumerate(_signals)}
+        for sig in p_signals or []:
+            if sig[0] in _index:
+                _signals[_index[sig[0]]] = list(sig)
+            else:
+                _signals.append(list(sig))
+
+        return _signals
+
     
 ## -------------------------------------------------------------------------------------------------
     def get_elements(self) -> Set:
@@ -1380,50 +1657,33 @@ class SimMPPS(FctSTrans, PersonalisedStamp, ScientificObject):
         bool
             True means pass the check (no duplication), otherwise False.
         """
-        _names = []
+        _names = set()
 
         for ids in self.get_elements().get_dim_ids():
-            for el in self.get_element(p_id=ids).get_component_states():
-                if el.get_name_short() in _names:
-                    return False
-                else:
-                    _names.append(el.get_name_short())
-            for el in self.get_element(p_id=ids).get_sensors():
+            elem = self.get_element(p_id=ids)
+            for el in [*elem.get_component_states(), *elem.get_sensors(), *elem.get_actuators()]:
                 if el.get_name_short() in _names:
                     return False
                 else:
-                    _names.append(el.get_name_short())
-            for el in self.get_element(p_id=ids).get_actuators():
-                if el.get_name_short() in _names:
-                    return False
-                else:
-                    _names.append(el.get_name_short())
+                    _names.add(el.get_name_short())
         return True
 
 
 ## -------------------------------------------------------------------------------------------------
     def _elements_names_auto_adjust(self):
         """
-        This method provides a functionality to auto adjust the same elements names.
+        This method provides a functionality to auto adjust the same elements names. The n-th
+        duplicate of a name receives the suffix '_n'.
         """
-        _names = []
+        _counter = {}
 
         for ids in self.get_elements().get_dim_ids():
-            for el in self.get_element(p_id=ids).get_component_states():
-                _names.append(el.get_name_short())
-                _counter = _names.count(el.get_name_short())
-                if _counter > 1:
-                    el._name_short = _names[-1]+'_'+str(_counter-1)
-            for el in self.get_element(p_id=ids).get_sensors():
-                _names.append(el.get_name_short())
-                _counter = _names.count(el.get_name_short())
-                if _counter > 1:
-                    el._name_short = _names[-1]+'_'+str(_counter-1)
-            for el in self.get_element(p_id=ids).get_actuators():
-                _names.append(el.get_name_short())
-                _counter = _names.count(el.get_name_short())
-                if _counter > 1:
-                    el._name_short = _names[-1]+'_'+str(_counter-1)
+            elem = self.get_element(p_id=ids)
+            for el in [*elem.get_component_states(), *elem.get_sensors(), *elem.get_actuators()]:
+                _name = el.get_name_short()
+                _counter[_name] = _counter.get(_name, 0) + 1
+                if _counter[_name] > 1:
+                    el._name_short = _name+'_'+str(_counter[_name]-1)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -1460,6 +1720,10 @@ class SimMPPS(FctSTrans, PersonalisedStamp, ScientificObject):
 
         # 4. Setup input signals for updating sensors or component states values
 
+        # Option 1: Derive the signals from the connections declared by the modules
+        # _problems = self._add_signals_by_name(self._derive_signals(p_signals=[...]))
+
+        # Option 2: Add the signals manually
         # _signals = []
         # _sens = self.get_sensors()
         # _acts = self.get_actuators()
@@ -1516,3 +1780,67 @@ class SimMPPS(FctSTrans, PersonalisedStamp, ScientificObject):
         raise NotImplementedError
         
 
+
+## -------------------------------------------------------------------------------------------------
+    def simulate_signals(self, p_range:float=None):
+        """
+        This method provides a functionality to update the values of all sensors and component
+        states once by their input signals, whereby the actuators keep their current values. It is
+        used to run a plant without an environment, e.g. by the plant server of mlpro_mpps.remote.
+
+        Parameters
+        ----------
+        p_range : float
+            Simulated duration of the update in seconds. Default: None.
+        """
+
+        for sig in self._signals:
+            if len(sig[1:]) == 1:
+                input = sig[1]()
+            else:
+                input = [fct() for fct in sig[1:]]
+            sig[0].simulate(input, p_range=p_range)
+
+
+
+## -------------------------------------------------------------------------------------------------
+    def enable_profiling(self):
+        """
+        This method provides a functionality to profile all signals and transfer functions of the
+        MPPS. See class MPPSProfiler in module mlpro_mpps.profiler for further details.
+
+        Returns
+        -------
+        profiler : MPPSProfiler
+            Attached profiler.
+        """
+        from mlpro_mpps.profiler import MPPSProfiler
+
+        if self._profiler is None:
+            self._profiler = MPPSProfiler(self)
+        self._profiler.attach()
+        return self._profiler
+
+
+## -------------------------------------------------------------------------------------------------
+    def disable_profiling(self):
+        """
+        This method provides a functionality to detach the profiler. The recorded statistics remain
+        available via get_profiler().
+        """
+        if self._profiler is not None:
+            self._profiler.detach()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_profiler(self):
+        """
+        This method provides a functionality to return the profiler of the MPPS.
+
+        Returns
+        -------
+        profiler : MPPSProfiler
+            Profiler, or None if profiling was never enabled.
+        """
+        return self._profiler
+
@@ -8,10 +8,18 @@
 ## -- 2023-11-13  0.0.0     SY       Creation
 ## -- 2023-11-13  1.0.0     SY       Release of first version
 ## -- 2024-02-12  1.0.1     SY       Refactoring due to MLPro-GT-DG
+## -- 2026-10-19  1.1.0     SY       Agent partition and observation views via MPPSEnv
+## -- 2026-10-19  1.2.0     SY       Masked episode reset and state transition from plain action values
+## -- 2026-10-19  1.3.0     SY       Action repeat with accumulated rewards and reward components
+## -- 2026-10-19  1.3.1     SY       Columnar episode recorder instead of DataStoring
+## -- 2026-10-19  1.4.0     SY       Recording levels none, summary and full
+## -- 2026-10-19  1.4.1     SY       Bit-packed recording of binary sensors and actuators
+## -- 2026-10-19  1.4.2     SY       Action trace recording
+## -- 2026-10-19  1.4.3     SY       Demand initialized by the episode reset
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.1 (2024-02-12)
+Ver. 1.4.3 (2026-10-19)
 
 This module provides a default implementation of the LS-BGLP for serial-parallel processes in
 MLPro-MPPS as a GT Game Board.
@@ -19,6 +27,7 @@ MLPro-MPPS as a GT Game Board.
 
 
 from mlpro_mpps.pool.mpps.PS003_LS_BGLP import LS_BGLP_SP
+from mlpro_mpps.envs import MPPSEnv
 from mlpro.bf.math import *
 from mlpro.gt.dynamicgames import *
 
@@ -50,11 +59,49 @@ class LS_BGLP_SP4GT(LS_BGLP_SP):
             action_elem = p_action.get_elem(agent_id)
             for action_id in action_elem.get_dim_ids():
                 action.append(action_elem.get_value(action_id))
-                
+
+        return self.simulate_action_values(action)
+
+
+## -------------------------------------------------------------------------------------------------
+    def simulate_action_values(self, p_action) -> State:
+        """
+        Simulates a state transition based on plain action values, which are normalized to [0,1]
+        and sorted in the order of the actuators. This is used by the batched environment and
+        bypasses the construction of MLPro Action objects.
+
+        The action is held for a number of internal steps given by the parameter action_repeat of
+        the parent environment. Rewards and reward components are accumulated over these steps.
+
+        Parameters
+        ----------
+        p_action : list
+            Normalized action values.
+
+        Returns
+        -------
+        State
+            Resulted state of the parent environment after the last internal step.
+        """
+
+        self.parent._begin_action(p_action)
+        for _ in range(self.parent.action_repeat):
+            self._simulate_step(p_action)
+            self.parent._accumulate_step()
+        return self.parent._state
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_step(self, p_action) -> State:
+        """
+        Simulates a single internal step of the plant, see method simulate_action_values().
+        """
+        
+        # 1. Set values to actuators
         for idx, (_, acts) in enumerate(self.get_actuators().items()):
             if idx != len(self.get_actuators())-1:
                 boundaries = acts.get_boundaries()
-                final_action = action[idx]*(boundaries[1]-boundaries[0])+boundaries[0]
+                final_action = p_action[idx]*(boundaries[1]-boundaries[0])+boundaries[0]
                 acts.set_value(final_action)
             else:
                 acts.set_value(True)
@@ -84,16 +131,13 @@ class LS_BGLP_SP4GT(LS_BGLP_SP):
         self.parent.current_demand = self.parent.get_demand(init_inventory_level, current_volume)
         self.parent.prod_reached += (current_volume-init_inventory_level)
         
-        self.parent.data_storing.memorize("time",str(self.parent.data_frame), self.parent.t)
-        for x in range(len(ind_overflow)):
-            _key_overflow = "overflow_" + str(x+1)
-            self.parent.data_storing.memorize(_key_overflow,str(self.parent.data_frame), ind_overflow[x]/self.parent.t_set)
-            if x != len(ind_overflow)-1:
-                _key_power = "power_" + str(x+1)
-                self.parent.data_storing.memorize(_key_power,str(self.parent.data_frame), ind_power[x]/self.parent.t_set)
-        self.parent.data_storing.memorize("total_overflow",str(self.parent.data_frame), overlfow/self.parent.t_set)
-        self.parent.data_storing.memorize("total_power",str(self.parent.data_frame), power/self.parent.t_set)
-        self.parent.data_storing.memorize("demand",str(self.parent.data_frame), self.parent.current_demand/self.parent.t_set)
+        if self.parent.data_storing is not None:
+            self.parent.data_storing.memorize_row([self.parent.t,
+                                                   *[x/self.parent.t_set for x in ind_overflow],
+                                                   overlfow/self.parent.t_set,
+                                                   *[x/self.parent.t_set for x in ind_power[:len(ind_overflow)-1]],
+                                                   power/self.parent.t_set,
+                                                   self.parent.current_demand/self.parent.t_set])
         
         return self.parent._state
 
@@ -102,11 +146,12 @@ class LS_BGLP_SP4GT(LS_BGLP_SP):
                         
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
-class LS_BGLP_SP_GTGameBoard(GameBoard):
+class LS_BGLP_SP_GTGameBoard(MPPSEnv, GameBoard):
 
     C_TYPE = 'Game Board'
     C_NAME = 'MPPS-based LS-BGLP-SP - GT Game Board'
     C_CYCLE_LIMIT = 0  # Recommended cycle limit for training episodes
+    C_AGENT_PARTITION = {'ACT_'+str(x+1) : ([x,x+1], [x]) for x in range(14)}
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -121,7 +166,9 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
                  margin_p=[0.2,0.8,4],
                  prod_target=10000,
                  prod_scenario='continuous',
-                 cycle_limit=0):
+                 cycle_limit=0,
+                 action_repeat=1,
+                 recording='full'):
 
         self.num_envs = 5                                                 # Number of internal sub-environments
         self.reward_type = p_reward_type
@@ -147,6 +194,7 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
         # self.C_SCIREF_DOI           = ""
         
         self.C_CYCLE_LIMIT  = cycle_limit
+        self.action_repeat  = action_repeat
         self.t              = 0
         self.t_set          = t_set
         self.demand         = demand
@@ -190,7 +238,7 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
                                "power_14",
                                "total_power",
                                "demand"]
-        self.data_storing   = DataStoring(self.data_lists)
+        self.data_storing   = self._create_recorder(self.data_lists, recording)
         self.data_frame     = None
         
         self.set_overflow       = ['SiloLoadingOverflow',
@@ -284,13 +332,7 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
 ## -------------------------------------------------------------------------------------------------
     def get_states(self) -> State:
         state = State(self._state_space)
-        ids = state.get_dim_ids()
-        
-        for x in range(len(ids)):
-            fill_level = self._fct_strans.get_component_states()[self.set_fill_levels[x]].get_value()
-            boundaries = self._fct_strans.get_component_states()[self.set_fill_levels[x]].get_boundaries()
-            norm_fill_level = (fill_level-boundaries[0])/(boundaries[1]-boundaries[0])
-            state.set_value(ids[x], norm_fill_level) 
+        state.set_values(self._get_observation())
         return state
 
 
@@ -349,12 +391,12 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
 
         if self.reward_type == Reward.C_TYPE_OVERALL:
             r_overall = 0
-            r_overall = r_overall + sum(self.calc_reward())
+            r_overall = r_overall + sum(self.get_reward_values())
             reward.set_overall_reward(r_overall)
         
         elif self.reward_type == Reward.C_TYPE_EVERY_AGENT:
            for agent_id in self._last_action.get_agent_ids():
-               r_reward = self.calc_reward()
+               r_reward = self.get_reward_values()
                idx = self._last_action.get_agent_ids().index(agent_id)
                reward.add_agent_reward(agent_id, r_reward[idx])
                
@@ -362,7 +404,7 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
            for agent_id in self._last_action.get_agent_ids():
                 agent_action_elem = self._last_action.get_elem(agent_id)
                 agent_action_ids = agent_action_elem.get_dim_ids()
-                r_reward = self.calc_reward()
+                r_reward = self.get_reward_values()
                 action_idx = 0
                 for action_id in agent_action_ids:
                     r_action = r_reward[action_idx]
@@ -392,23 +434,21 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
 ## -------------------------------------------------------------------------------------------------
     def _reset(self, p_seed=None) -> None:
         random.seed(p_seed)
+        levels_init = [random.uniform(0,1) for _ in range(len(self.set_fill_levels))]
+        self._reset_episode(levels_init)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_episode(self, p_levels) -> None:
         self._fct_strans.get_component_states()['DU_TransportedMaterial']._function.prod_target = self.demand
-        
-        for acts in self._fct_strans.get_actuators():
-            self._fct_strans.get_actuators()[acts].deactivate()
-        for sens in self._fct_strans.get_sensors():
-            self._fct_strans.get_sensors()[sens].deactivate()
-            
-        for st in range(len(self.set_fill_levels)):
-            buffer = self._fct_strans.get_component_states()[self.set_fill_levels[st]]
-            boundaries = buffer.get_boundaries()
-            levels_init = random.uniform(0,1)
-            fill_level = levels_init*(boundaries[1]-boundaries[0])+boundaries[0]
-            buffer.set_value(fill_level)
+        self._deactivate_elements()
+        self._set_fill_levels(p_levels)
+        self._reset_accumulators()
         self._fct_strans.get_component_states()['InventoryLevel'].set_value(0)
         
         self.t = 0
         self.prod_reached = 0
+        self.current_demand = 0
         self._state = self.get_states()
         self._state.set_success(False)
         self._state.set_broken(False)
@@ -417,7 +457,10 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
             self.data_frame = 0
         else:
             self.data_frame += 1
-        self.data_storing.add_frame(str(self.data_frame))
+        if self.data_storing is not None:
+            self.data_storing.add_frame(str(self.data_frame))
+        if self.binary_storing is not None:
+            self.binary_storing.add_frame(str(self.data_frame))
             
 
 ## -------------------------------------------------------------------------------------------------
@@ -439,4 +482,12 @@ class LS_BGLP_SP_GTGameBoard(GameBoard):
                 reward[actnum] += 1/(1-self.lr_demand*demand)
             else:
                 reward[actnum] += 1/(1+self.lr_margin*margin[actnum+1])
-        return reward
\ No newline at end of file
+        return reward
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_reward_components(self) -> dict:
+        return {'margin'    : self.get_margin(),
+                'power'     : self.get_power(),
+                'demand'    : self.current_demand,
+                'overflow'  : self.get_overflow()}
\ No newline at end of file
@@ -0,0 +1,468 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.pool.gt_gameboard
+## -- Module  : GT003_Lines.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Agent partition per instance via get_agent_partition()
+## -- 2026-10-19  1.0.2     SY       Upstream and downstream buffers from the layout, i.e. merging actuators of serial-parallel lines
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.2 (2026-10-19)
+
+This module provides generated production lines of arbitrary length and width in MLPro-MPPS as a
+GT Game Board with one agent per actuator, see mlpro_mpps.pool.mpps.PS003_Lines.
+
+The rewards follow the LS-BGLP game board: each actuator is rewarded for the margins of its
+upstream and downstream buffers and for its power consumption. The margin reward of a merging
+actuator of a serial-parallel line is the mean over its two upstream buffers. The last actuator of each lane is
+rewarded for the demand of the inventory of its lane instead of a downstream margin. All element
+lists are resolved once, so that a step scales linearly with the number of buffers. For the same
+reason, only the total overflow, total power and total demand are recorded per step.
+"""
+
+
+from mlpro_mpps.pool.mpps.PS003_Lines import ProductionLine
+from mlpro_mpps.envs import MPPSEnv
+from mlpro.bf.math import *
+from mlpro.gt.dynamicgames import *
+import numpy as np
+import random
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ProductionLine4GT(ProductionLine):
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_name:str=None, p_id:int=None, p_logging=Log.C_LOG_ALL, **p_kwargs):
+        try:
+            self.parent = p_kwargs.pop('p_parent')
+        except KeyError:
+            raise NotImplementedError('Please input the parent class of this class as p_parent')
+        super().__init__(p_name=p_name, p_id=p_id, p_logging=p_logging, **p_kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_reaction(self, p_state: State, p_action: Action) -> State:
+
+        # 1. Set values to actuators
+        action = []
+        for agent_id in p_action.get_agent_ids():
+            action_elem = p_action.get_elem(agent_id)
+            for action_id in action_elem.get_dim_ids():
+                action.append(action_elem.get_value(action_id))
+
+        return self.simulate_action_values(action)
+
+
+## -------------------------------------------------------------------------------------------------
+    def simulate_action_values(self, p_action) -> State:
+        """
+        Simulates a state transition based on plain action values, which are normalized to [0,1]
+        and sorted in the order of the action space, i.e. lane by lane in the direction of the
+        material flow.
+
+        The action is held for a number of internal steps given by the parameter action_repeat of
+        the parent environment. Rewards and reward components are accumulated over these steps.
+
+        Parameters
+        ----------
+        p_action : list
+            Normalized action values.
+
+        Returns
+        -------
+        State
+            Resulted state of the parent environment after the last internal step.
+        """
+
+        self.parent._begin_action(p_action)
+        for _ in range(self.parent.action_repeat):
+            self._simulate_step(p_action)
+            self.parent._accumulate_step()
+        return self.parent._state
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_step(self, p_action) -> State:
+        """
+        Simulates a single internal step of the plant, see method simulate_action_values().
+        """
+
+        parent = self.parent
+
+        # 1. Set values to actuators, switched actuators are turned on or off
+        values = parent._act_low + np.asarray(p_action, dtype=float)*parent._act_range
+        for acts, value, switch in zip(parent._act_elems, values.tolist(), parent._act_switches):
+            if switch:
+                value = round(value)
+            acts.set_value(value)
+            if switch and (value == 0):
+                acts.deactivate()
+
+        # 2. Update values of the sensors and component states
+        init_inventory_levels = parent.get_inventory_levels()
+        for sig in self._signals:
+            if len(sig) == 2:
+                input = sig[1]()
+            else:
+                input = [fct() for fct in sig[1:]]
+            sig[0].simulate(input, p_range=parent.t_set)
+
+        # 3. Return the resulted states in the form of State object
+        parent._state = parent.get_states()
+        parent._state.set_success(False)
+        parent._state.set_broken(False)
+
+        parent.t += parent.t_set
+        current_volumes = parent.get_inventory_levels()
+        parent.current_demand = parent.get_demand(init_inventory_levels, current_volumes)
+        parent.prod_reached += float(np.sum(current_volumes-init_inventory_levels))
+
+        if parent.data_storing is not None:
+            parent.data_storing.memorize_row([parent.t,
+                                              float(np.sum(parent.get_overflow()))/parent.t_set,
+                                              float(np.sum(parent.get_power()))/parent.t_set,
+                                              float(np.sum(parent.current_demand))/parent.t_set])
+
+        return parent._state
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ProductionLine_GTGameBoard(MPPSEnv, GameBoard):
+    """
+    GT Game Board of a generated production line with one agent per actuator. The agents are named
+    'ACT_1', 'ACT_2', ... in the order of the action space. Each agent observes the fill levels of
+    the upstream and downstream buffers of its actuator, i.e. two upstream buffers for the merging
+    actuators of serial-parallel lines.
+
+    Parameters
+    ----------
+    topology : str
+        Topology of the line, see mlpro_mpps.pool.specs.PS003_Lines. Default: 'serial'.
+    length : int
+        Number of buffers per lane. Default: 10.
+    width : int
+        Number of lanes. Default: 1.
+    buffers : list
+        Kinds of the buffers. Default: None (default kinds of the generator).
+    transports : list
+        Kinds of the transport actuators. Default: None (default kinds of the generator).
+    station_size : int
+        Number of buffers per lane and station. Default: 2.
+
+    The remaining parameters are equal to the LS-BGLP game board, whereby demand is the demand
+    per lane.
+    """
+
+    C_TYPE = 'Game Board'
+    C_NAME = 'MPPS-based Production Line - GT Game Board'
+    C_CYCLE_LIMIT = 0  # Recommended cycle limit for training episodes
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_reward_type=Reward.C_TYPE_EVERY_AGENT,
+                 p_logging=Log.C_LOG_ALL,
+                 topology='serial',
+                 length=10,
+                 width=1,
+                 buffers=None,
+                 transports=None,
+                 station_size=2,
+                 t_set=10.0,
+                 demand=0.1,
+                 lr_margin=1.0,
+                 lr_demand=4.0,
+                 lr_power=0.0010,
+                 margin_p=[0.2,0.8,4],
+                 prod_target=10000,
+                 prod_scenario='continuous',
+                 cycle_limit=0,
+                 action_repeat=1,
+                 recording='full'):
+
+        self.reward_type    = p_reward_type
+        self.topology       = topology
+        self.length         = length
+        self.width          = width
+        self.buffers        = buffers
+        self.transports     = transports
+        self.station_size   = station_size
+
+        plant = ProductionLine4GT(p_name='ProductionLine_GT',
+                                  p_topology=topology,
+                                  p_length=length,
+                                  p_width=width,
+                                  p_buffers=buffers,
+                                  p_transports=transports,
+                                  p_station_size=station_size,
+                                  p_logging=p_logging,
+                                  p_parent=self)
+        self._setup_layout(plant)
+
+        super().__init__(p_mode = Mode.C_MODE_SIM,
+                         p_latency = None,
+                         p_fct_strans = plant,
+                         p_fct_reward = None,
+                         p_fct_success = None,
+                         p_fct_broken = None,
+                         p_visualize = False,
+                         p_logging = p_logging)
+
+        self.C_CYCLE_LIMIT  = cycle_limit
+        self.action_repeat  = action_repeat
+        self.t              = 0
+        self.t_set          = t_set
+        self.demand         = demand
+        self.lr_margin      = lr_margin
+        self.lr_demand      = lr_demand
+        self.lr_power       = lr_power
+        self.prod_target    = prod_target
+        self.prod_scenario  = prod_scenario
+        self.margin_p       = margin_p
+
+        self.data_lists     = ["time",
+                               "total_overflow",
+                               "total_power",
+                               "demand"]
+        self.data_storing   = self._create_recorder(self.data_lists, recording)
+        self.data_frame     = None
+
+        self.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_layout(self, p_plant:ProductionLine):
+        """
+        Resolves the buffers, actuators and inventories of all lanes and sets up the agent
+        partition, see LineSpecGenerator.get_layout().
+        """
+
+        layout = p_plant.get_layout()
+        sts = p_plant.get_component_states()
+        acts = p_plant.get_actuators()
+
+        self.set_fill_levels = [name for lane in layout for name in lane['fill_levels']]
+        self.set_overflow = [name for lane in layout for name in lane['overflows']]
+        self.set_power = [name for lane in layout for name in lane['power']]
+        self.set_actuators = [name for lane in layout for name in lane['actuators']]
+        self.set_inventories = [lane['sink'] for lane in layout]
+
+        self._overflow_elems = [sts[name] for name in self.set_overflow]
+        self._power_elems = [sts[name] for name in self.set_power]
+        self._inventory_elems = [sts[name] for name in self.set_inventories]
+        self._act_elems = [acts[name] for name in self.set_actuators]
+        self._act_switches = [switch for lane in layout for switch in lane['switches']]
+        boundaries = np.array([elem.get_boundaries() for elem in self._act_elems], dtype=float)
+        self._act_low = boundaries[:,0]
+        self._act_range = boundaries[:,1]-boundaries[:,0]
+
+        power_max = []
+        for elem in self._power_elems:
+            try:
+                power_max.append(elem._function.max_power)
+            except AttributeError:
+                power_max.append(elem._function.power)
+        self._power_max = np.array(power_max, dtype=float)
+
+        # Upstream and downstream buffers of each actuator, the last actuator of a lane feeds the
+        # inventory of the lane. Merging actuators of serial-parallel lines have two upstream
+        # buffers, otherwise both upstream indices are equal.
+        levels = {name:idx for idx, name in enumerate(self.set_fill_levels)}
+        self._act_up = []
+        self._act_up2 = []
+        self._act_down = []
+        self._act_lane = []
+        self._agent_partition = {}
+        for lane_id, lane in enumerate(layout):
+            for upstream, downstream in zip(lane['upstream'], lane['downstream']):
+                up = [levels[name] for name in upstream]
+                down = None if downstream is None else levels[downstream]
+                self._act_up.append(up[0])
+                self._act_up2.append(up[-1])
+                self._act_down.append(down)
+                self._act_lane.append(lane_id)
+                state_idx = up if down is None else up + [down]
+                self._agent_partition['ACT_'+str(len(self._act_up))] = (state_idx, [len(self._act_up)-1])
+
+        self._act_up = np.array(self._act_up, dtype=int)
+        self._act_up2 = np.array(self._act_up2, dtype=int)
+        self._act_last = np.array([down is None for down in self._act_down], dtype=bool)
+        self._act_down = np.array([up if down is None else down for up, down in zip(self._act_up, self._act_down)], dtype=int)
+        self._act_lane = np.array(self._act_lane, dtype=int)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent_partition(self) -> dict:
+        """
+        Returns the agent partition of the generated line, which depends on its layout. The class
+        attribute C_AGENT_PARTITION is not used.
+        """
+
+        return self._agent_partition
+
+
+## -------------------------------------------------------------------------------------------------
+    def setup_spaces(self):
+        state_space = ESpace()
+        action_space = ESpace()
+
+        for idx, name in enumerate(self.set_fill_levels):
+            state_space.add_dim(Dimension('R-'+str(idx+1)+' Lvl', 'R', 'Res-'+str(idx+1)+' Level of '+name, '', '', '', [0, 1]))
+
+        for idx, (name, switch) in enumerate(zip(self.set_actuators, self._act_switches)):
+            action_space.add_dim(Dimension('A-'+str(idx+1)+' Act', 'Z' if switch else 'R', 'Act-'+str(idx+1)+' '+name, '', '', '', [0, 1]))
+
+        return state_space, action_space
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_states(self) -> State:
+        state = State(self._state_space)
+        state.set_values(self._get_observation())
+        return state
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_margin(self) -> np.ndarray:
+        norm_fill_level = self._get_observation()
+        margin = np.zeros_like(norm_fill_level)
+        low = norm_fill_level < self.margin_p[0]
+        high = norm_fill_level > self.margin_p[1]
+        margin[low] = (0-self.margin_p[2])/(self.margin_p[0])*(norm_fill_level[low]-self.margin_p[0])*self.t_set
+        margin[high] = self.margin_p[2]/(1-self.margin_p[1])*(norm_fill_level[high]-self.margin_p[1])*self.t_set
+        return margin
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_overflow(self) -> np.ndarray:
+        return np.fromiter((elem.get_value() for elem in self._overflow_elems), dtype=float, count=len(self._overflow_elems))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_power(self) -> np.ndarray:
+        return np.fromiter((elem.get_value() for elem in self._power_elems), dtype=float, count=len(self._power_elems))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_inventory_levels(self) -> np.ndarray:
+        return np.fromiter((elem.get_value() for elem in self._inventory_elems), dtype=float, count=len(self._inventory_elems))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_demand(self, init_volume, cur_volume) -> np.ndarray:
+        delta = np.asarray(cur_volume, dtype=float)-np.asarray(init_volume, dtype=float)
+        return np.where((self.demand*self.t_set) > delta, delta-self.demand*self.t_set, 0.0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_reward(self, p_state_old: State = None, p_state_new: State = None) -> Reward:
+        reward = Reward(self.reward_type)
+
+        if self.reward_type == Reward.C_TYPE_OVERALL:
+            r_overall = 0
+            r_overall = r_overall + sum(self.get_reward_values())
+            reward.set_overall_reward(r_overall)
+
+        elif self.reward_type == Reward.C_TYPE_EVERY_AGENT:
+           for agent_id in self._last_action.get_agent_ids():
+               r_reward = self.get_reward_values()
+               idx = self._last_action.get_agent_ids().index(agent_id)
+               reward.add_agent_reward(agent_id, r_reward[idx])
+
+        else:
+           for agent_id in self._last_action.get_agent_ids():
+                agent_action_elem = self._last_action.get_elem(agent_id)
+                agent_action_ids = agent_action_elem.get_dim_ids()
+                r_reward = self.get_reward_values()
+                action_idx = 0
+                for action_id in agent_action_ids:
+                    r_action = r_reward[action_idx]
+                    action_idx += 1
+                    reward.add_action_reward(agent_id, action_id, r_action)
+
+        return reward
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_success(self, p_state: State) -> bool:
+        if self.prod_scenario == 'continuous':
+            return False
+        else:
+            if self.prod_reached >= self.prod_target:
+                self._state.set_terminal(True)
+                return True
+            else:
+                return False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _compute_broken(self, p_state: State) -> bool:
+        return False
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset(self, p_seed=None) -> None:
+        random.seed(p_seed)
+        levels_init = [random.uniform(0,1) for _ in range(len(self.set_fill_levels))]
+        self._reset_episode(levels_init)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_episode(self, p_levels) -> None:
+        self._deactivate_elements()
+        self._set_fill_levels(p_levels)
+        self._reset_accumulators()
+        for elem in self._inventory_elems:
+            elem.set_value(0)
+
+        self.t = 0
+        self.prod_reached = 0
+        self.current_demand = np.zeros(len(self._inventory_elems))
+        self._state = self.get_states()
+        self._state.set_success(False)
+        self._state.set_broken(False)
+
+        if self.data_frame == None:
+            self.data_frame = 0
+        else:
+            self.data_frame += 1
+        if self.data_storing is not None:
+            self.data_storing.add_frame(str(self.data_frame))
+        if self.binary_storing is not None:
+            self.binary_storing.add_frame(str(self.data_frame))
+
+
+## -------------------------------------------------------------------------------------------------
+    def calc_reward(self):
+        margin = self.get_margin()
+        power = self.get_power()
+        demand = self.current_demand[self._act_lane]/self.t_set
+
+        reward = 0.5/(1+self.lr_margin*margin[self._act_up]) + 0.5/(1+self.lr_margin*margin[self._act_up2])
+        reward += 1/(1+self.lr_power*power/(self._power_max/1000.0))
+        reward += np.where(self._act_last,
+                           1/(1-self.lr_demand*demand),
+                           1/(1+self.lr_margin*margin[self._act_down]))
+        return reward
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_reward_components(self) -> dict:
+        return {'margin'    : self.get_margin(),
+                'power'     : self.get_power(),
+                'demand'    : float(np.sum(self.current_demand)),
+                'overflow'  : self.get_overflow()}
@@ -8,16 +8,25 @@
 ## -- 2023-02-17  0.0.0     SY       Creation
 ## -- 2023-02-17  1.0.0     SY       Release of first version
 ## -- 2023-03-28  1.0.1     SY       Refactoring compute_reward
+## -- 2026-10-19  1.1.0     SY       Agent partition and observation views via MPPSEnv
+## -- 2026-10-19  1.2.0     SY       Masked episode reset and state transition from plain action values
+## -- 2026-10-19  1.3.0     SY       Action repeat with accumulated rewards and reward components
+## -- 2026-10-19  1.3.1     SY       Columnar episode recorder instead of DataStoring
+## -- 2026-10-19  1.4.0     SY       Recording levels none, summary and full
+## -- 2026-10-19  1.4.1     SY       Bit-packed recording of binary sensors and actuators
+## -- 2026-10-19  1.4.2     SY       Action trace recording
+## -- 2026-10-19  1.4.3     SY       Demand initialized by the episode reset
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.1 (2023-03-28)
+Ver. 1.4.3 (2026-10-19)
 
 This module provides a default implementation of the BGLP in MLPro-MPPS as RL Environment.
 """
 
 
 from mlpro_mpps.pool.mpps.PS001_BGLP import BGLP
+from mlpro_mpps.envs import MPPSEnv
 from mlpro.bf.math import *
 from mlpro.rl.models import *
 
@@ -49,11 +58,49 @@ class BGLP4RL(BGLP):
             action_elem = p_action.get_elem(agent_id)
             for action_id in action_elem.get_dim_ids():
                 action.append(action_elem.get_value(action_id))
-                
+
+        return self.simulate_action_values(action)
+
+
+## -------------------------------------------------------------------------------------------------
+    def simulate_action_values(self, p_action) -> State:
+        """
+        Simulates a state transition based on plain action values, which are normalized to [0,1]
+        and sorted in the order of the actuators. This is used by the batched environment and
+        bypasses the construction of MLPro Action objects.
+
+        The action is held for a number of internal steps given by the parameter action_repeat of
+        the parent environment. Rewards and reward components are accumulated over these steps.
+
+        Parameters
+        ----------
+        p_action : list
+            Normalized action values.
+
+        Returns
+        -------
+        State
+            Resulted state of the parent environment after the last internal step.
+        """
+
+        self.parent._begin_action(p_action)
+        for _ in range(self.parent.action_repeat):
+            self._simulate_step(p_action)
+            self.parent._accumulate_step()
+        return self.parent._state
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_step(self, p_action) -> State:
+        """
+        Simulates a single internal step of the plant, see method simulate_action_values().
+        """
+        
+        # 1. Set values to actuators
         for idx, (_, acts) in enumerate(self.get_actuators().items()):
             if idx != len(self.get_actuators())-1:
                 boundaries = acts.get_boundaries()
-                final_action = action[idx]*(boundaries[1]-boundaries[0])+boundaries[0]
+                final_action = p_action[idx]*(boundaries[1]-boundaries[0])+boundaries[0]
                 acts.set_value(final_action)
                 if (idx == 2) and (final_action == 0):
                     acts.deactivate()
@@ -84,15 +131,12 @@ class BGLP4RL(BGLP):
         self.parent.current_demand = self.parent.get_demand(init_inventory_level, current_volume)
         self.parent.prod_reached += (current_volume-init_inventory_level)
         
-        self.parent.data_storing.memorize("time",str(self.parent.data_frame), self.parent.t)
-        self.parent.data_storing.memorize("overflow",str(self.parent.data_frame), overlfow/self.parent.t_set)
-        self.parent.data_storing.memorize("power",str(self.parent.data_frame), power/self.parent.t_set)
-        self.parent.data_storing.memorize("demand",str(self.parent.data_frame), self.parent.current_demand/self.parent.t_set)
-        self.parent.data_storing.memorize("CBTransportedMaterial",str(self.parent.data_frame), transport[0])
-        self.parent.data_storing.memorize("VC1TransportedMaterial",str(self.parent.data_frame), transport[1])
-        self.parent.data_storing.memorize("VCTransportedMaterial",str(self.parent.data_frame), transport[2])
-        self.parent.data_storing.memorize("VC2TransportedMaterial",str(self.parent.data_frame), transport[3])
-        self.parent.data_storing.memorize("RFTransportedMaterial",str(self.parent.data_frame), transport[4])
+        if self.parent.data_storing is not None:
+            self.parent.data_storing.memorize_row([self.parent.t,
+                                                   overlfow/self.parent.t_set,
+                                                   power/self.parent.t_set,
+                                                   self.parent.current_demand/self.parent.t_set,
+                                                   *transport])
         
         return self.parent._state
 
@@ -101,11 +145,16 @@ class BGLP4RL(BGLP):
                         
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
-class BGLP_RLEnv(Environment):
+class BGLP_RLEnv(MPPSEnv, Environment):
 
     C_TYPE = 'Environment'
     C_NAME = 'MPPS-based BGLP - RL Environment'
     C_CYCLE_LIMIT = 0  # Recommended cycle limit for training episodes
+    C_AGENT_PARTITION = {'BELT_CONVEYOR_A'      : ([0,1], [0]),
+                         'VACUUM_PUMP_B'        : ([1,2], [1]),
+                         'VIBRATORY_CONVEYOR_B' : ([2,3], [2]),
+                         'VACUUM_PUMP_C'        : ([3,4], [3]),
+                         'ROTARY_FEEDER_C'      : ([4,5], [4])}
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -120,7 +169,9 @@ class BGLP_RLEnv(Environment):
                  margin_p=[0.2,0.8,4],
                  prod_target=10000,
                  prod_scenario='continuous',
-                 cycle_limit=0):
+                 cycle_limit=0,
+                 action_repeat=1,
+                 recording='full'):
 
         self.num_envs = 5                                                 # Number of internal sub-environments
         self.reward_type = p_reward_type
@@ -147,6 +198,7 @@ class BGLP_RLEnv(Environment):
         self.C_SCIREF_DOI     = "10.1016/j.compchemeng.2021.107382"
         
         self.C_CYCLE_LIMIT = cycle_limit
+        self.action_repeat = action_repeat
         self.t = 0
         self.t_set = t_set
         self.demand = demand
@@ -166,7 +218,7 @@ class BGLP_RLEnv(Environment):
                            "VCTransportedMaterial",
                            "VC2TransportedMaterial",
                            "RFTransportedMaterial"]
-        self.data_storing = DataStoring(self.data_lists)
+        self.data_storing = self._create_recorder(self.data_lists, recording)
         self.data_frame = None
         
         self.set_overflow = ['SiloLoadingOverflow',
@@ -220,13 +272,7 @@ class BGLP_RLEnv(Environment):
 ## -------------------------------------------------------------------------------------------------
     def get_states(self) -> State:
         state = State(self._state_space)
-        ids = state.get_dim_ids()
-        
-        for x in range(len(ids)):
-            fill_level = self._fct_strans.get_component_states()[self.set_fill_levels[x]].get_value()
-            boundaries = self._fct_strans.get_component_states()[self.set_fill_levels[x]].get_boundaries()
-            norm_fill_level = (fill_level-boundaries[0])/(boundaries[1]-boundaries[0])
-            state.set_value(ids[x], norm_fill_level) 
+        state.set_values(self._get_observation())
         return state
 
 
@@ -295,12 +341,12 @@ class BGLP_RLEnv(Environment):
 
         if self.reward_type == Reward.C_TYPE_OVERALL:
             r_overall = 0
-            r_overall = r_overall + sum(self.calc_reward())
+            r_overall = r_overall + sum(self.get_reward_values())
             reward.set_overall_reward(r_overall)
         
         elif self.reward_type == Reward.C_TYPE_EVERY_AGENT:
            for agent_id in self._last_action.get_agent_ids():
-               r_reward = self.calc_reward()
+               r_reward = self.get_reward_values()
                idx = self._last_action.get_agent_ids().index(agent_id)
                reward.add_agent_reward(agent_id, r_reward[idx])
                
@@ -308,7 +354,7 @@ class BGLP_RLEnv(Environment):
            for agent_id in self._last_action.get_agent_ids():
                 agent_action_elem = self._last_action.get_elem(agent_id)
                 agent_action_ids = agent_action_elem.get_dim_ids()
-                r_reward = self.calc_reward()
+                r_reward = self.get_reward_values()
                 action_idx = 0
                 for action_id in agent_action_ids:
                     r_action = r_reward[action_idx]
@@ -338,23 +384,21 @@ class BGLP_RLEnv(Environment):
 ## -------------------------------------------------------------------------------------------------
     def _reset(self, p_seed=None) -> None:
         random.seed(p_seed)
+        levels_init = [random.uniform(0,1) for _ in range(len(self.set_fill_levels))]
+        self._reset_episode(levels_init)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_episode(self, p_levels) -> None:
         self._fct_strans.get_component_states()['VC1TransportedMaterial_1']._function.prod_target = self.demand
-        
-        for acts in self._fct_strans.get_actuators():
-            self._fct_strans.get_actuators()[acts].deactivate()
-        for sens in self._fct_strans.get_sensors():
-            self._fct_strans.get_sensors()[sens].deactivate()
-            
-        for st in range(len(self.set_fill_levels)):
-            buffer = self._fct_strans.get_component_states()[self.set_fill_levels[st]]
-            boundaries = buffer.get_boundaries()
-            levels_init = random.uniform(0,1)
-            fill_level = levels_init*(boundaries[1]-boundaries[0])+boundaries[0]
-            buffer.set_value(fill_level)
+        self._deactivate_elements()
+        self._set_fill_levels(p_levels)
+        self._reset_accumulators()
         self._fct_strans.get_component_states()['InventoryLevel'].set_value(0)
         
         self.t = 0
         self.prod_reached = 0
+        self.current_demand = 0
         self._state = self.get_states()
         self._state.set_success(False)
         self._state.set_broken(False)
@@ -363,7 +407,10 @@ class BGLP_RLEnv(Environment):
             self.data_frame = 0
         else:
             self.data_frame += 1
-        self.data_storing.add_frame(str(self.data_frame))
+        if self.data_storing is not None:
+            self.data_storing.add_frame(str(self.data_frame))
+        if self.binary_storing is not None:
+            self.binary_storing.add_frame(str(self.data_frame))
             
 
 ## -------------------------------------------------------------------------------------------------
@@ -388,6 +435,15 @@ class BGLP_RLEnv(Environment):
         return reward
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_reward_components(self) -> dict:
+        return {'margin'    : self.get_margin(),
+                'power'     : self.get_power(),
+                'demand'    : self.current_demand,
+                'overflow'  : self.get_overflow(),
+                'transport' : self.get_transported_material()}
+
+
 
 
 
@@ -7,16 +7,24 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2023-03-10  0.0.0     ML       Creation
 ## -- 2023-03-29  1.0.0     ML/SY    Release of first version
+## -- 2026-10-19  1.1.0     SY       Agent partition and observation views via MPPSEnv
+## -- 2026-10-19  1.2.0     SY       Masked episode reset and state transition from plain action values
+## -- 2026-10-19  1.3.0     SY       Action repeat with accumulated rewards and reward components
+## -- 2026-10-19  1.3.1     SY       Columnar episode recorder instead of DataStoring
+## -- 2026-10-19  1.4.0     SY       Recording levels none, summary and full
+## -- 2026-10-19  1.4.1     SY       Bit-packed recording of binary sensors and actuators
+## -- 2026-10-19  1.4.2     SY       Action trace recording
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2023-03-29)
+Ver. 1.4.2 (2026-10-19)
 
 This module provides a default implementation of the Liquid Station in MLPro-MPPS as SL Environment.
 """
 
 
 from mlpro_mpps.pool.mpps.PS002_Liquid_Station import Liquid_Station
+from mlpro_mpps.envs import MPPSEnv
 from mlpro.bf.math import *
 from mlpro.rl.models import *
 
@@ -80,12 +88,49 @@ class LS4SL(Liquid_Station):
             action_elem = p_action.get_elem(agent_id)
             for action_id in action_elem.get_dim_ids():
                 action.append(action_elem.get_value(action_id))
+
+        return self.simulate_action_values(action)
+
+
+## -------------------------------------------------------------------------------------------------
+    def simulate_action_values(self, p_action) -> State:
+        """
+        Simulates a state transition based on plain action values, which are normalized to [0,1]
+        and sorted in the order of the actuators. This is used by the batched environment and
+        bypasses the construction of MLPro Action objects.
+
+        The action is held for a number of internal steps given by the parameter action_repeat of
+        the parent environment. Rewards and reward components are accumulated over these steps.
+
+        Parameters
+        ----------
+        p_action : list
+            Normalized action values.
+
+        Returns
+        -------
+        State
+            Resulted state of the parent environment after the last internal step.
+        """
+
+        self.parent._begin_action(p_action)
+        for _ in range(self.parent.action_repeat):
+            self._simulate_step(p_action)
+            self.parent._accumulate_step()
+        return self.parent._state
+
+
+## -------------------------------------------------------------------------------------------------
+    def _simulate_step(self, p_action) -> State:
+        """
+        Simulates a single internal step of the plant, see method simulate_action_values().
+        """
         
         # 1.2 Write action values to actuators
         for idx, (_, acts) in enumerate(self.get_actuators().items()):
             if idx != len(self.get_actuators())-1:
                 boundaries = acts.get_boundaries()
-                final_action = action[idx]*(boundaries[1]-boundaries[0])+boundaries[0]
+                final_action = p_action[idx]*(boundaries[1]-boundaries[0])+boundaries[0]
                 acts.set_value(final_action)
             else:
                 acts.set_value(True)   
@@ -123,11 +168,12 @@ class LS4SL(Liquid_Station):
         current_volume = self.get_component_states()['TankFillLevel'].get_value()
         
         # store parameters in data frame
-        self.parent.data_storing.memorize("time",str(self.parent.data_frame), self.parent.t)
-        self.parent.data_storing.memorize("transport",str(self.parent.data_frame), transport/self.parent.t_set)
-        self.parent.data_storing.memorize("overflow",str(self.parent.data_frame), overlfow/self.parent.t_set)
-        self.parent.data_storing.memorize("power",str(self.parent.data_frame), power/self.parent.t_set)
-        self.parent.data_storing.memorize("level",str(self.parent.data_frame), current_volume)
+        if self.parent.data_storing is not None:
+            self.parent.data_storing.memorize_row([self.parent.t,
+                                                   transport/self.parent.t_set,
+                                                   overlfow/self.parent.t_set,
+                                                   power/self.parent.t_set,
+                                                   current_volume])
         
         return self.parent._state
 
@@ -136,11 +182,14 @@ class LS4SL(Liquid_Station):
                         
 ## -------------------------------------------------------------------------------------------------
 ## -------------------------------------------------------------------------------------------------
-class LS_SLEnv(Environment):
+class LS_SLEnv(MPPSEnv, Environment):
 
     C_TYPE = 'Environment'
     C_NAME = 'MPPS-based Liquid Station - SL Environment'
     C_CYCLE_LIMIT = 0  # Recommended cycle limit for training episodes
+    C_AGENT_PARTITION = {'Agent - Pump 1' : ([0], [0]),
+                         'Agent - Pump 2' : ([0], [1]),
+                         'Agent - Pump 3' : ([0], [2])}
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -153,7 +202,9 @@ class LS_SLEnv(Environment):
                  lr_power=0.0010, 
                  max_transport=[5, 5, 5],
                  prod_scenario='continuous',
-                 cycle_limit=0):
+                 cycle_limit=0,
+                 action_repeat=1,
+                 recording='full'):
 
         #self.num_envs = 5                                                 # Number of internal sub-environments
         self.reward_type = p_reward_type
@@ -181,6 +232,7 @@ class LS_SLEnv(Environment):
         self.C_SCIREF_DOI     = ""
         
         self.C_CYCLE_LIMIT = cycle_limit
+        self.action_repeat = action_repeat
         self.t = 0
         self.t_set = t_set
         self.lr_transport = lr_transport
@@ -190,7 +242,7 @@ class LS_SLEnv(Environment):
         self.prod_scenario = prod_scenario
         
         self.data_lists = ["time","transport","overflow","power", "level"]
-        self.data_storing = DataStoring(self.data_lists)
+        self.data_storing = self._create_recorder(self.data_lists, recording)
         self.data_frame = None
         
         # tank overflow 
@@ -236,13 +288,7 @@ class LS_SLEnv(Environment):
 ## -------------------------------------------------------------------------------------------------
     def get_states(self) -> State:
         state = State(self._state_space)
-        ids = state.get_dim_ids()
-        
-        for x in range(len(ids)):
-            fill_level = self._fct_strans.get_component_states()[self.set_fill_levels[x]].get_value()
-            boundaries = self._fct_strans.get_component_states()[self.set_fill_levels[x]].get_boundaries()
-            norm_fill_level = (fill_level-boundaries[0])/(boundaries[1]-boundaries[0])
-            state.set_value(ids[x], norm_fill_level) 
+        state.set_values(self._get_observation())
         return state
 
 ## -------------------------------------------------------------------------------------------------
@@ -296,19 +342,19 @@ class LS_SLEnv(Environment):
 
         if self.reward_type == Reward.C_TYPE_OVERALL:
             r_overall = 0
-            r_overall = r_overall + sum(self.calc_reward())
+            r_overall = r_overall + sum(self.get_reward_values())
             reward.set_overall_reward(r_overall)
         
         elif self.reward_type == Reward.C_TYPE_EVERY_AGENT:
            for agent_id in self._last_action.get_agent_ids():
-               r_reward = self.calc_reward()
+               r_reward = self.get_reward_values()
                reward.add_agent_reward(agent_id, r_reward)
                
         else:
            for agent_id in self._last_action.get_agent_ids():
                 agent_action_elem = self._last_action.get_elem(agent_id)
                 agent_action_ids = agent_action_elem.get_dim_ids()
-                r_reward = self.calc_reward()
+                r_reward = self.get_reward_values()
                 action_idx = 0
                 for action_id in agent_action_ids:
                     r_action = r_reward[action_idx]
@@ -337,22 +383,20 @@ class LS_SLEnv(Environment):
         # set seed
         random.seed(p_seed)
 
-        # deactivate all actuators
-        for acts in self._fct_strans.get_actuators():
-            self._fct_strans.get_actuators()[acts].deactivate()
+        # init tank fill level from uniform distribution
+        levels_init = [random.uniform(0,1) for _ in range(len(self.set_fill_levels))]
+        self._reset_episode(levels_init)
 
-        # deactivate all sensors
-        for sens in self._fct_strans.get_sensors():
-            self._fct_strans.get_sensors()[sens].deactivate()
-            
-        # init tank fill level 
-        for st in range(len(self.set_fill_levels)):
-            buffer = self._fct_strans.get_component_states()[self.set_fill_levels[st]]          # get tank 
-            boundaries = buffer.get_boundaries()                                                # get boundaries
-            levels_init = random.uniform(0,1)                                                   # init uniform distribution
-            fill_level = levels_init*(boundaries[1]-boundaries[0])+boundaries[0]                # compute fill level
-            buffer.set_value(fill_level)                                                        # set fill level
-        
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_episode(self, p_levels) -> None:
+
+        # deactivate all actuators and sensors
+        self._deactivate_elements()
+
+        # set tank fill level
+        self._set_fill_levels(p_levels)
+        self._reset_accumulators()
         
         self.t = 0                              # reset time set
         self._state = self.get_states()         # set state
@@ -364,7 +408,10 @@ class LS_SLEnv(Environment):
             self.data_frame = 0
         else:
             self.data_frame += 1
-        self.data_storing.add_frame(str(self.data_frame))
+        if self.data_storing is not None:
+            self.data_storing.add_frame(str(self.data_frame))
+        if self.binary_storing is not None:
+            self.binary_storing.add_frame(str(self.data_frame))
             
 
 ## -------------------------------------------------------------------------------------------------
@@ -380,6 +427,13 @@ class LS_SLEnv(Environment):
         return reward
 
 
+## -------------------------------------------------------------------------------------------------
+    def get_reward_components(self) -> dict:
+        return {'transport' : self.get_transport(),
+                'overflow'  : self.get_overflow(),
+                'power'     : self.get_power()}
+
+
 
 
 
@@ -9,10 +9,11 @@
 ## -- 2022-12-29  1.0.0     SY       Release of first version
 ## -- 2022-12-30  1.0.1     SY       Update Silo A component with SiloLoading
 ## -- 2023-02-01  1.0.2     SY       Refactoring
+## -- 2026-10-19  1.1.0     SY       Material flow connections of the components
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.2 (2023-02-01)
+Ver. 1.1.0 (2026-10-19)
 
 This module provides a default implementation of a module of the BGLP, which is a Loading station
 """
@@ -43,4 +44,6 @@ class LoadingStation(Module):
         self._add_component(p_component=silo)
         self._add_component(p_component=hopper)
         self._add_component(p_component=belt)
+
+        self._add_connection(p_transport='BeltA', p_upstream='SiloA', p_downstream='HopperA')
     
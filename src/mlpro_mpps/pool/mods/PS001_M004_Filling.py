@@ -8,10 +8,11 @@
 ## -- 2022-12-30  0.0.0     SY       Creation
 ## -- 2022-12-30  1.0.0     SY       Release of first version
 ## -- 2023-02-01  1.0.1     SY       Refactoring
+## -- 2026-10-19  1.1.0     SY       Material flow connections of the components
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.1 (2023-02-01)
+Ver. 1.1.0 (2026-10-19)
 
 This module provides a default implementation of a module of the BGLP, which is a Filling station
 """
@@ -39,4 +40,6 @@ class FillingStation(Module):
         
         self._add_component(p_component=inv)
         self._add_component(p_component=vac)
+
+        self._add_connection(p_transport='VacD', p_upstream='HopperC', p_downstream='Inventory')
     
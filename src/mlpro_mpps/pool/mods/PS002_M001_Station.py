@@ -7,10 +7,11 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2023-01-19  0.0.0     ML       Creation
 ## -- 2023-03-28  1.0.0     ML/SY    Release of first version
+## -- 2026-10-19  1.1.0     SY       Material flow connections of the components
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2023-03-28)
+Ver. 1.1.0 (2026-10-19)
 
 This module provides a default implementation of single module Liquid Station
 """
@@ -44,4 +45,8 @@ class Station(Module):
         self._add_component(p_component=pump_in_1)
         self._add_component(p_component=pump_out_2)
         self._add_component(p_component=pump_out_3)
+
+        self._add_connection(p_transport='Pump_in_1', p_downstream='Tank')
+        self._add_connection(p_transport='Pump_out_2', p_upstream='Tank')
+        self._add_connection(p_transport='Pump_out_3', p_upstream='Tank')
     
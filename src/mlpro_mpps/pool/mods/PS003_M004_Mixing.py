@@ -7,10 +7,11 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2023-11-12  0.0.0     SY       Creation
 ## -- 2023-11-12  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Material flow connections of the components
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2023-11-12)
+Ver. 1.1.0 (2026-10-19)
 
 This module provides a default implementation of a module of the LS-BGLP, which is a Mixing station.
 """
@@ -42,4 +43,7 @@ class MixingStation(Module):
         self._add_component(p_component=hopper)
         self._add_component(p_component=act1)
         self._add_component(p_component=act2)
+
+        self._add_connection(p_transport='ActD1', p_upstream='HopperC', p_downstream='SiloD')
+        self._add_connection(p_transport='ActD2', p_upstream='SiloD', p_downstream='HopperD')
     
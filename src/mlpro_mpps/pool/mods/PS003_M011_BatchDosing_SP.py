@@ -7,10 +7,11 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2023-11-12  0.0.0     SY       Creation
 ## -- 2023-11-13  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Material flow connections of the components
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2023-11-13)
+Ver. 1.1.0 (2026-10-19)
 
 This module provides a default implementation of a module of the LS-BGLP, which is a Batch Dosing
 station.
@@ -43,4 +44,7 @@ class BatchDosingStation_SP(Module):
         self._add_component(p_component=inventory)
         self._add_component(p_component=act1)
         self._add_component(p_component=act2)
+
+        self._add_connection(p_transport='ActH1', p_upstream='HopperG', p_downstream='SiloH')
+        self._add_connection(p_transport='ActH2', p_upstream='SiloH', p_downstream='Inventory')
     
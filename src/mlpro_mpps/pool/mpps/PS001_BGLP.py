@@ -14,20 +14,31 @@
 ## -- 2023-02-02  1.0.5     SY       Refactoring
 ## -- 2023-02-27  1.0.6     SY       Refactoring
 ## -- 2023-11-14  1.0.7     SY       Refactoring
+## -- 2026-10-19  1.1.0     SY       Set up from the plant specification in mlpro_mpps.pool.specs
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.7 (2023-11-14)
+Ver. 1.1.0 (2026-10-19)
 
 This module provides a default implementation of the BGLP in MLPro-MPPS.
 """
 
 
 from mlpro_mpps.mpps import *
-from mlpro_mpps.pool.mods.PS001_M001_Loading import *
-from mlpro_mpps.pool.mods.PS001_M002_Storing import *
-from mlpro_mpps.pool.mods.PS001_M003_Weighing import *
-from mlpro_mpps.pool.mods.PS001_M004_Filling import *
+from mlpro_mpps.spec import PlantSpec
+from mlpro_mpps.pool.specs.PS001_BGLP import SPEC_BGLP
+from mlpro_mpps.pool.registry import ComponentRegistry
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def __getattr__(p_name):
+    # Stations and components are imported on first use, see ComponentRegistry
+    try:
+        return ComponentRegistry.get_class(p_name, p_system='PS001')
+    except KeyError:
+        raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(p_name))
 
 
                      
@@ -51,237 +62,8 @@ class BGLP(SimMPPS):
         self.C_SCIREF_VOLUME  = "152"
         self.C_SCIREF_DOI     = "10.1016/j.compchemeng.2021.107382"
         
-        # 1. Add elements
-        loading = LoadingStation(p_name='LoadingStation')
-        storing = StoringStation(p_name='StoringStation')
-        weighing = WeighingStation(p_name='WeighingStation')
-        filling = FillingStation(p_name='FillingStation')
-        
-        self._add_element(p_elem=loading)
-        self._add_element(p_elem=storing)
-        self._add_element(p_elem=weighing)
-        self._add_element(p_elem=filling)
-        
-        # 2. Check duplications of the elements names
-        while not self._elements_names_checker():
-            if p_auto_adjust_names:
-                self._elements_names_auto_adjust()
-            else:
-                raise NameError('There are duplications of the elements names. You can just simply set p_auto_adjust_names to True.')
-
-        # 3. Setup which actions connected to which actuators
-        self._actions_in_order = False
-
-        # 4. Setup input signals for updating sensors or component states values
-        _sens = self.get_sensors()
-        _acts = self.get_actuators()
-        _sts = self.get_component_states()
-        
-        # 4.1. Actuators-related states
-        self._add_signal(
-            _sts['CBTransportedMaterial'],              # p_updated_elem
-            _acts['Motor'].get_value,                   # p_input_fcts[0]
-            _acts['Motor'].get_status,                  # p_input_fcts[1]
-            _sts['SiloLoadingFillLevel'].get_value      # p_input_fcts[2]
-            )
-        
-        self._add_signal(
-            _sts['CBPowerConsumption'],
-            _acts['Motor'].get_value, 
-            _acts['Motor'].get_status
-            )
-        
-        self._add_signal(
-            _sts['VC1TransportedMaterial'],
-            _acts['Timer'].get_value, 
-            _acts['Timer'].get_status, 
-            _sts['HopperFillLevel'].get_value
-            )
-        
-        self._add_signal(
-            _sts['VC1PowerConsumption'],
-            _acts['Timer'].get_value, 
-            _acts['Timer'].get_status
-            )
-        
-        self._add_signal(
-            _sts['VCTransportedMaterial'],
-            _acts['Switch'].get_status,
-            _sts['SiloFillLevel'].get_value
-            )
-        
-        self._add_signal(
-            _sts['VCPowerConsumption'],
-            _acts['Switch'].get_status
-            )
-        
-        self._add_signal(
-            _sts['VC2TransportedMaterial'],
-            _acts['Timer_1'].get_value, 
-            _acts['Timer_1'].get_status, 
-            _sts['HopperFillLevel_1'].get_value
-            )
-        
-        self._add_signal(
-            _sts['VC2PowerConsumption'],
-            _acts['Timer_1'].get_value,
-            _acts['Timer_1'].get_status
-            )
-        
-        self._add_signal(
-            _sts['RFTransportedMaterial'],
-            _acts['Motor_1'].get_value, 
-            _acts['Motor_1'].get_status, 
-            _sts['SiloFillLevel_1'].get_value
-            )
-        
-        self._add_signal(
-            _sts['RFPowerConsumption'],
-            _acts['Motor_1'].get_value, 
-            _acts['Motor_1'].get_status
-            )
-        
-        self._add_signal(
-            _sts['VC1TransportedMaterial_1'],
-            _acts['Switch_1'].get_status,
-            _sts['HopperFillLevel_2'].get_value
-            )
-        
-        # 4.2. Buffers-related states
-        self._add_signal(
-            _sts['SiloLoadingOverflow'],
-            _sts['SiloLoadingFillLevel'].get_value, 
-            _sts['CBTransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['SiloLoadingFillLevel'],
-            _sts['SiloLoadingFillLevel'].get_value, 
-            _sts['CBTransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['HopperOverflow'], 
-            _sts['HopperFillLevel'].get_value, 
-            _sts['CBTransportedMaterial'].get_value,
-            _sts['VC1TransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['HopperFillLevel'],
-            _sts['HopperFillLevel'].get_value,
-            _sts['CBTransportedMaterial'].get_value, 
-            _sts['VC1TransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['SiloOverflow'], 
-            _sts['SiloFillLevel'].get_value, 
-            _sts['VC1TransportedMaterial'].get_value, 
-            _sts['VCTransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['SiloFillLevel'], 
-            _sts['SiloFillLevel'].get_value, 
-            _sts['VC1TransportedMaterial'].get_value, 
-            _sts['VCTransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['HopperOverflow_1'], 
-            _sts['HopperFillLevel_1'].get_value, 
-            _sts['VCTransportedMaterial'].get_value, 
-            _sts['VC2TransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['HopperFillLevel_1'], 
-            _sts['HopperFillLevel_1'].get_value, 
-            _sts['VCTransportedMaterial'].get_value, 
-            _sts['VC2TransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['SiloOverflow_1'], 
-            _sts['SiloFillLevel_1'].get_value, 
-            _sts['VC2TransportedMaterial'].get_value, 
-            _sts['RFTransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['SiloFillLevel_1'], 
-            _sts['SiloFillLevel_1'].get_value, 
-            _sts['VC2TransportedMaterial'].get_value, 
-            _sts['RFTransportedMaterial'].get_value
-            )
-        
-        self._add_signal(
-            _sts['HopperOverflow_2'], 
-            _sts['HopperFillLevel_2'].get_value, 
-            _sts['RFTransportedMaterial'].get_value, 
-            _sts['VC1TransportedMaterial_1'].get_value
-            )
-        
-        self._add_signal(
-            _sts['HopperFillLevel_2'], 
-            _sts['HopperFillLevel_2'].get_value, 
-            _sts['RFTransportedMaterial'].get_value, 
-            _sts['VC1TransportedMaterial_1'].get_value
-            )
-        
-        self._add_signal(
-            _sts['InventoryLevel'], 
-            _sts['InventoryLevel'].get_value, 
-            _sts['VC1TransportedMaterial_1'].get_value
-            )        
-                
-        # 4.3. Buffers-related sensor
-        self._add_signal(
-            _sens['SiloSensor1'],
-            _sts['SiloLoadingFillLevel'].get_value
-            )
-        
-        self._add_signal(
-            _sens['SiloSensor2'], 
-            _sts['SiloLoadingFillLevel'].get_value
-            )
-        
-        self._add_signal(
-            _sens['HopperSensor'], 
-            _sts['HopperFillLevel'].get_value
-            )
-   
-        self._add_signal(
-            _sens['SiloSensor1_1'], 
-            _sts['SiloFillLevel'].get_value
-            )
-   
-        self._add_signal(
-            _sens['SiloSensor2_1'], 
-            _sts['SiloFillLevel'].get_value
-            )
-        
-        self._add_signal(
-            _sens['HopperSensor_1'], 
-            _sts['HopperFillLevel_1'].get_value
-            )
-        
-        self._add_signal(
-            _sens['SiloSensor1_2'], 
-            _sts['SiloFillLevel_1'].get_value
-            )
-   
-        self._add_signal(
-            _sens['SiloSensor2_2'], 
-            _sts['SiloFillLevel_1'].get_value
-            )
-   
-        self._add_signal(
-            _sens['HopperSensor_2'], 
-            _sts['HopperFillLevel_2'].get_value
-            )
-
+        # 1. Add elements and signals according to the plant specification
+        PlantSpec(SPEC_BGLP).compile(self, p_auto_adjust_names)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -7,17 +7,31 @@
 ## -- yyyy-mm-dd  Ver.      Auth.    Description
 ## -- 2023-01-19  0.0.0     ML       Creation
 ## -- 2023-03-28  1.0.0     ML/SY    Release of first version
+## -- 2026-10-19  1.1.0     SY       Set up from the plant specification in mlpro_mpps.pool.specs
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.0 (2023-03-28)
+Ver. 1.1.0 (2026-10-19)
 
 This module provides a default implementation of the Liquid Station in MLPro-MPPS.
 """
 
 
 from mlpro_mpps.mpps import *
-from mlpro_mpps.pool.mods.PS002_M001_Station import Station
+from mlpro_mpps.spec import PlantSpec
+from mlpro_mpps.pool.specs.PS002_Liquid_Station import SPEC_LIQUID_STATION
+from mlpro_mpps.pool.registry import ComponentRegistry
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+def __getattr__(p_name):
+    # Stations and components are imported on first use, see ComponentRegistry
+    try:
+        return ComponentRegistry.get_class(p_name, p_system='PS002')
+    except KeyError:
+        raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(p_name))
 
 
                      
@@ -30,96 +44,8 @@ class Liquid_Station(SimMPPS):
 ## -------------------------------------------------------------------------------------------------
     def _setup_mpps(self, p_auto_adjust_names=True):
         
-        # 0. Add elements
-        station = Station(p_name='LiquidStation')
-        
-        self._add_element(p_elem=station)
-
-
-       # 1. Check duplications of the elements names
-        while not self._elements_names_checker():
-            if p_auto_adjust_names:
-                self._elements_names_auto_adjust()
-            else:
-                raise NameError('There are duplications of the elements names. You can just simply set p_auto_adjust_names to True.')
-
-        # 2. Setup which actions connected to which actuators
-        self._actions_in_order = False
-
-        # 3. Setup input signals for updating sensors or component states values
-        _sens = self.get_sensors()
-        _acts = self.get_actuators()
-        _sts = self.get_component_states()
-        
-        # 3.1. Actuators-related states
-        # transport pump 1
-        self._add_signal(_sts['PC1TransportedMaterial'],             # calculate transport matirial Pump 1
-                         _acts['Timer1'].get_value,                  # get timer value Pump 1
-                         _acts['Timer1'].get_status,                 # get status Pump 1
-                         )
-        
-        # energy pump 1 
-        self._add_signal(_sts['PC1PowerConsumption'],                # calculate energy consumption Pump 1
-                         _acts['Timer1'].get_value,                  # get timer value Pump 1
-                         _acts['Timer1'].get_status,                 # get status Pump 1
-                         )
-        
-        # transport pump 2
-        self._add_signal(_sts['PC2TransportedMaterial'],             # calculate transport matirial pump 2
-                         _acts['Timer2'].get_value,                  # get timer value pump 2
-                         _acts['Timer2'].get_status,                 # get status pump 2
-                         _sts['TankFillLevel'].get_value,            # get fill level tank
-                         )
-        
-        # energy pump 2
-        self._add_signal(_sts['PC2PowerConsumption'],                # calculate energy consumption Pump 2
-                         _acts['Timer2'].get_value,                  # get timer value pump 2
-                         _acts['Timer2'].get_status,                 # get status pump 2
-                         )
-
-        # transport pump 3
-        self._add_signal(_sts['PC3TransportedMaterial'],             # calculate transport matirial pump 3
-                         _acts['Timer3'].get_value,                  # get timer value pump 3
-                         _acts['Timer3'].get_status,                 # get status pump 3
-                         _sts['TankFillLevel'].get_value,            # get fill level tank
-                         )
-        
-        # energy pump 3
-        self._add_signal(_sts['PC3PowerConsumption'],                # calculate energy consumption Pump 3
-                         _acts['Timer3'].get_value,                  # get timer value pump 3
-                         _acts['Timer3'].get_status,                 # get status pump 3
-                         )
-        
-         # tank overflow 
-        self._add_signal(_sts['TankOverflow'],                      # calculate tank overflow
-                         _sts['TankFillLevel'].get_value,           # get fill level tank
-                         _sts['PC1TransportedMaterial'].get_value,  # get transport matirial pump 1
-                         _sts['PC2TransportedMaterial'].get_value,  # get transport matirial pump 2
-                         _sts['PC3TransportedMaterial'].get_value,  # get transport matirial pump 3
-                         )
-
-        # tank level
-        self._add_signal(_sts['TankFillLevel'],                     # calculate tank fill level 
-                         _sts['TankFillLevel'].get_value,           # get tank fill level
-                         _sts['PC1TransportedMaterial'].get_value,  # get transport matirial pump 1
-                         _sts['PC2TransportedMaterial'].get_value,  # get transport matirial pump 2
-                         _sts['PC3TransportedMaterial'].get_value,  # get transport matirial pump 3
-                         )
-
-        # tank sensor 1
-        self._add_signal(_sens['TankSensor1'],                      # calculate signal tank sensor 1
-                         _sts['TankFillLevel'].get_value            # get tank fill level
-                         )
-        
-        # tank sensor 2
-        self._add_signal(_sens['TankSensor2'],                      # calculate signal tank sensor 2
-                         _sts['TankFillLevel'].get_value            # get tank fill level
-                         )
-        
-        # tank sensor 3
-        self._add_signal(_sens['TankSensor3'],                      # calculate signal tank sensor 3
-                         _sts['TankFillLevel'].get_value            # get tank fill level
-                         )
+        # 1. Add elements and signals according to the plant specification
+        PlantSpec(SPEC_LIQUID_STATION).compile(self, p_auto_adjust_names)
 
 
 ## -------------------------------------------------------------------------------------------------
@@ -0,0 +1,97 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.pool.mpps
+## -- Module  : PS003_Lines.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides generated production lines of arbitrary length and width in MLPro-MPPS, which
+consist of the components of the LS-BGLP. They are intended for the investigation of large plants,
+see mlpro_mpps.pool.specs.PS003_Lines for the supported topologies.
+"""
+
+
+from mlpro_mpps.mpps import *
+from mlpro_mpps.spec import SpecMPPS
+from mlpro_mpps.pool.specs.PS003_Lines import LineSpecGenerator
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ProductionLine(SpecMPPS):
+    """
+    This class provides a generated production line.
+
+    Parameters
+    ----------
+    p_name : str
+        Name of the plant. Default: None (name of the generated specification).
+    p_topology : str
+        Topology of the line, see LineSpecGenerator. Default: 'serial'.
+    p_length : int
+        Number of buffers per lane. Default: 10.
+    p_width : int
+        Number of lanes. Default: 1.
+    p_buffers : list
+        Kinds of the buffers. Default: None (LineSpecGenerator.C_BUFFERS).
+    p_transports : list
+        Kinds of the transport actuators. Default: None (LineSpecGenerator.C_TRANSPORTS).
+    p_station_size : int
+        Number of buffers per lane and station. Default: 2.
+    p_id : int
+        Unique id. Default: None
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_auto_adjust_names : bool
+        Auto adjusting duplicated names of the elements. Default: True
+    p_kwargs : dict
+        Further keyword arguments
+    """
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_name:str=None,
+                 p_topology:str=LineSpecGenerator.C_TOPOLOGY_SERIAL,
+                 p_length:int=10,
+                 p_width:int=1,
+                 p_buffers:list=None,
+                 p_transports:list=None,
+                 p_station_size:int=2,
+                 p_id:int=None,
+                 p_logging=Log.C_LOG_ALL,
+                 p_auto_adjust_names:bool=True,
+                 **p_kwargs):
+
+        self._generator = LineSpecGenerator(p_topology=p_topology,
+                                            p_length=p_length,
+                                            p_width=p_width,
+                                            p_buffers=p_buffers,
+                                            p_transports=p_transports,
+                                            p_station_size=p_station_size)
+
+        SpecMPPS.__init__(self,
+                          p_spec=self._generator.get_spec(),
+                          p_name=p_name,
+                          p_id=p_id,
+                          p_logging=p_logging,
+                          p_auto_adjust_names=p_auto_adjust_names,
+                          **p_kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_layout(self) -> list:
+        """
+        Returns the layout of the lanes, see LineSpecGenerator.get_layout().
+        """
+
+        return self._generator.get_layout()
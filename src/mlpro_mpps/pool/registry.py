@@ -0,0 +1,185 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.pool
+## -- Module  : registry.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides an on-demand registry of the components and modules of the pool.
+
+The registry maps kind names (e.g. 'VacuumPump1', 'Hopper9', 'FeedingStation') to the pool files
+that define them, without importing these files. The index is built on first use by scanning the
+class definitions in the sources of mlpro_mpps.pool.comps and mlpro_mpps.pool.mods. A file is only
+imported when one of its classes is requested, so that a plant (and a worker process) only loads the
+components it actually uses.
+
+Several production systems define classes with the same name (e.g. VacuumPump1 in PS001 and PS003).
+Such names are resolved via the production system, which is the prefix of the file name, e.g.
+
+    ComponentRegistry.create('VacuumPump1', p_system='PS003', p_name='ActB1')
+
+User-defined components can be added via ComponentRegistry.register().
+"""
+
+
+import importlib
+import os
+import re
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class ComponentRegistry:
+    """
+    Registry of the classes of the pool, which are imported on first use. All methods are class
+    methods, i.e. there is a single registry per process.
+
+    Attributes
+    ----------
+    C_PACKAGES : list
+        Scanned subpackages of mlpro_mpps.pool.
+    """
+
+    C_PACKAGES = ['comps', 'mods']
+
+    _index = None
+    _classes = {}
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def _get_index(cls) -> dict:
+        """
+        Returns the index {kind: {system: module}} and builds it on first use.
+        """
+
+        if cls._index is not None:
+            return cls._index
+
+        cls._index = {}
+        pattern = re.compile(r'^class\s+(\w+)\s*[\(:]', re.MULTILINE)
+        root = os.path.dirname(os.path.abspath(__file__))
+
+        for package in cls.C_PACKAGES:
+            for file in sorted(os.listdir(os.path.join(root, package))):
+                if not file.endswith('.py') or file.startswith('_'):
+                    continue
+
+                with open(os.path.join(root, package, file)) as f:
+                    kinds = pattern.findall(f.read())
+
+                system = file.split('_')[0]
+                module = 'mlpro_mpps.pool.' + package + '.' + file[:-3]
+                for kind in kinds:
+                    cls._index.setdefault(kind, {}).setdefault(system, module)
+
+        return cls._index
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def register(cls, p_kind:str, p_module:str, p_system:str=None):
+        """
+        Registers a class that is defined in the given module.
+
+        Parameters
+        ----------
+        p_kind : str
+            Name of the class.
+        p_module : str
+            Full name of the module, e.g. 'my_package.my_components'.
+        p_system : str
+            Production system, under which the class is registered. Default: None.
+        """
+
+        cls._get_index().setdefault(p_kind, {})[p_system] = p_module
+        cls._classes.pop((p_kind, p_system), None)
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def get_kinds(cls, p_system:str=None) -> list:
+        """
+        Returns the sorted names of all registered classes, optionally of a single production
+        system.
+        """
+
+        index = cls._get_index()
+        return sorted(kind for kind, systems in index.items() if (p_system is None) or (p_system in systems))
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def get_module(cls, p_kind:str, p_system:str=None) -> str:
+        """
+        Returns the name of the module that defines a class, without importing it.
+
+        Parameters
+        ----------
+        p_kind : str
+            Name of the class.
+        p_system : str
+            Production system, e.g. 'PS003'. Only required if the name is ambiguous. Default: None.
+        """
+
+        try:
+            systems = cls._get_index()[p_kind]
+        except KeyError:
+            raise KeyError('Unknown component kind ' + repr(p_kind))
+
+        if p_system is not None:
+            try:
+                return systems[p_system]
+            except KeyError:
+                raise KeyError('Component kind ' + repr(p_kind) + ' is not available in ' + repr(p_system))
+
+        if len(systems) > 1:
+            raise KeyError('Component kind ' + repr(p_kind) + ' is ambiguous, please specify one of the systems '
+                           + str(sorted(str(system) for system in systems)))
+
+        return next(iter(systems.values()))
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def get_class(cls, p_kind:str, p_system:str=None):
+        """
+        Returns a class of the pool and imports its module on first use.
+        """
+
+        try:
+            return cls._classes[(p_kind, p_system)]
+        except KeyError:
+            pass
+
+        component_cls = getattr(importlib.import_module(cls.get_module(p_kind, p_system)), p_kind)
+        cls._classes[(p_kind, p_system)] = component_cls
+        return component_cls
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def create(cls, p_kind:str, p_system:str=None, **p_kwargs):
+        """
+        Instantiates a class of the pool by name.
+
+        Parameters
+        ----------
+        p_kind : str
+            Name of the class.
+        p_system : str
+            Production system, e.g. 'PS003'. Only required if the name is ambiguous. Default: None.
+        p_kwargs : dict
+            Parameters of the constructor, e.g. p_name.
+        """
+
+        return cls.get_class(p_kind, p_system)(**p_kwargs)
@@ -0,0 +1,53 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.pool.specs
+## -- Module  : PS001_BGLP.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Signals derived from the connections of the stations
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides the plant specification of the BGLP, see mlpro_mpps.spec and
+mlpro_mpps.pool.mpps.PS001_BGLP.
+"""
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+SPEC_BGLP = {
+    'name'             : 'BGLP',
+    'system'           : 'PS001',
+    'stations'         : [
+        {'name'        : 'LoadingStation',
+         'components'  : [{'kind': 'SiloLoading', 'name': 'SiloA'},
+                          {'kind': 'Hopper', 'name': 'HopperA'},
+                          {'kind': 'ConveyorBelt', 'name': 'BeltA'}],
+         'connections' : [{'transport': 'BeltA', 'from': 'SiloA', 'to': 'HopperA'}]},
+        {'name'        : 'StoringStation',
+         'components'  : [{'kind': 'Silo', 'name': 'SiloB'},
+                          {'kind': 'Hopper', 'name': 'HopperB'},
+                          {'kind': 'VacuumPump1', 'name': 'VacB'},
+                          {'kind': 'VibratoryConveyor', 'name': 'BeltB'}],
+         'connections' : [{'transport': 'VacB', 'from': 'HopperA', 'to': 'SiloB'},
+                          {'transport': 'BeltB', 'from': 'SiloB', 'to': 'HopperB'}]},
+        {'name'        : 'WeighingStation',
+         'components'  : [{'kind': 'Silo', 'name': 'SiloC'},
+                          {'kind': 'Hopper', 'name': 'HopperC'},
+                          {'kind': 'VacuumPump2', 'name': 'VacC'},
+                          {'kind': 'RotaryFeeder', 'name': 'BeltC'}],
+         'connections' : [{'transport': 'VacC', 'from': 'HopperB', 'to': 'SiloC'},
+                          {'transport': 'BeltC', 'from': 'SiloC', 'to': 'HopperC'}]},
+        {'name'        : 'FillingStation',
+         'components'  : [{'kind': 'FinishedGoodsInventory', 'name': 'Inventory'},
+                          {'kind': 'VacuumPump3', 'name': 'VacD'}],
+         'connections' : [{'transport': 'VacD', 'from': 'HopperC', 'to': 'Inventory'}]},
+        ],
+    'actions_in_order' : False
+    }
@@ -0,0 +1,38 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.pool.specs
+## -- Module  : PS002_Liquid_Station.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Signals derived from the connections of the stations
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides the plant specification of the Liquid Station, see mlpro_mpps.spec and
+mlpro_mpps.pool.mpps.PS002_Liquid_Station.
+"""
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+SPEC_LIQUID_STATION = {
+    'name'             : 'Liquid_Station',
+    'system'           : 'PS002',
+    'stations'         : [
+        {'name'        : 'LiquidStation',
+         'components'  : [{'kind': 'Tank', 'name': 'Tank'},
+                          {'kind': 'Pump1', 'name': 'Pump_in_1'},
+                          {'kind': 'Pump2', 'name': 'Pump_out_2'},
+                          {'kind': 'Pump3', 'name': 'Pump_out_3'}],
+         'connections' : [{'transport': 'Pump_in_1', 'to': 'Tank'},
+                          {'transport': 'Pump_out_2', 'from': 'Tank'},
+                          {'transport': 'Pump_out_3', 'from': 'Tank'}]},
+        ],
+    'actions_in_order' : False
+    }
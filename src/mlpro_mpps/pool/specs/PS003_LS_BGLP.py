@@ -0,0 +1,157 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.pool.specs
+## -- Module  : PS003_LS_BGLP.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Signals derived from the connections of the stations
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides the plant specifications of the LS-BGLP and the serial-parallel LS-BGLP, see
+mlpro_mpps.spec and mlpro_mpps.pool.mpps.PS003_LS_BGLP.
+"""
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+SPEC_LS_BGLP = {
+    'name'             : 'LS_BGLP',
+    'system'           : 'PS003',
+    'stations'         : [
+        {'name'        : 'LoadingStation',
+         'components'  : [{'kind': 'SiloLoading', 'name': 'SiloA'},
+                          {'kind': 'Hopper9', 'name': 'HopperA'},
+                          {'kind': 'ConveyorBelt1', 'name': 'ActA1'}],
+         'connections' : [{'transport': 'ActA1', 'from': 'SiloA', 'to': 'HopperA'}]},
+        {'name'        : 'FeedingStation',
+         'components'  : [{'kind': 'Silo15', 'name': 'SiloB'},
+                          {'kind': 'Hopper10', 'name': 'HopperB'},
+                          {'kind': 'VacuumPump1', 'name': 'ActB1'},
+                          {'kind': 'ScrewConveyor1', 'name': 'ActB2'}],
+         'connections' : [{'transport': 'ActB1', 'from': 'HopperA', 'to': 'SiloB'},
+                          {'transport': 'ActB2', 'from': 'SiloB', 'to': 'HopperB'}]},
+        {'name'        : 'TransportingStation',
+         'components'  : [{'kind': 'Silo12', 'name': 'SiloC'},
+                          {'kind': 'Hopper9', 'name': 'HopperC'},
+                          {'kind': 'BeltElevator1', 'name': 'ActC1'},
+                          {'kind': 'ConveyorBelt2', 'name': 'ActC2'}],
+         'connections' : [{'transport': 'ActC1', 'from': 'HopperB', 'to': 'SiloC'},
+                          {'transport': 'ActC2', 'from': 'SiloC', 'to': 'HopperC'}]},
+        {'name'        : 'MixingStation',
+         'components'  : [{'kind': 'MixingSilo17', 'name': 'SiloD'},
+                          {'kind': 'Hopper8', 'name': 'HopperD'},
+                          {'kind': 'VacuumPump2', 'name': 'ActD1'},
+                          {'kind': 'ScrewConveyor2', 'name': 'ActD2'}],
+         'connections' : [{'transport': 'ActD1', 'from': 'HopperC', 'to': 'SiloD'},
+                          {'transport': 'ActD2', 'from': 'SiloD', 'to': 'HopperD'}]},
+        {'name'        : 'StoringStation',
+         'components'  : [{'kind': 'Silo17', 'name': 'SiloE'},
+                          {'kind': 'Hopper10', 'name': 'HopperE'},
+                          {'kind': 'VacuumPump1', 'name': 'ActE1'},
+                          {'kind': 'VibratoryConveyor', 'name': 'ActE2'}],
+         'connections' : [{'transport': 'ActE1', 'from': 'HopperD', 'to': 'SiloE'},
+                          {'transport': 'ActE2', 'from': 'SiloE', 'to': 'HopperE'}]},
+        {'name'        : 'WeighingStation',
+         'components'  : [{'kind': 'Silo15', 'name': 'SiloF'},
+                          {'kind': 'Hopper9', 'name': 'HopperF'},
+                          {'kind': 'BeltElevator2', 'name': 'ActF1'},
+                          {'kind': 'RotaryFeeder', 'name': 'ActF2'}],
+         'connections' : [{'transport': 'ActF1', 'from': 'HopperE', 'to': 'SiloF'},
+                          {'transport': 'ActF2', 'from': 'SiloF', 'to': 'HopperF'}]},
+        {'name'        : 'FillingStation',
+         'components'  : [{'kind': 'Silo17', 'name': 'SiloG'},
+                          {'kind': 'Hopper12', 'name': 'HopperG'},
+                          {'kind': 'BucketElevator', 'name': 'ActG1'},
+                          {'kind': 'DomeValve', 'name': 'ActG2'}],
+         'connections' : [{'transport': 'ActG1', 'from': 'HopperF', 'to': 'SiloG'},
+                          {'transport': 'ActG2', 'from': 'SiloG', 'to': 'HopperG'}]},
+        {'name'        : 'BatchDosingStation',
+         'components'  : [{'kind': 'Silo30', 'name': 'SiloH'},
+                          {'kind': 'FinishedGoodsInventory', 'name': 'Inventory'},
+                          {'kind': 'VacuumPump3', 'name': 'ActH1'},
+                          {'kind': 'DosingUnit', 'name': 'ActH2'}],
+         'connections' : [{'transport': 'ActH1', 'from': 'HopperG', 'to': 'SiloH'},
+                          {'transport': 'ActH2', 'from': 'SiloH', 'to': 'Inventory'}]},
+        ],
+    'actions_in_order' : False
+    }
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+SPEC_LS_BGLP_SP = {
+    'name'             : 'LS_BGLP_SP',
+    'system'           : 'PS003',
+    'stations'         : [
+        {'name'        : 'LoadingStation',
+         'components'  : [{'kind': 'SiloLoading', 'name': 'SiloA'},
+                          {'kind': 'Hopper9', 'name': 'HopperA'},
+                          {'kind': 'ConveyorBelt1', 'name': 'ActA1'}],
+         'connections' : [{'transport': 'ActA1', 'from': 'SiloA', 'to': 'HopperA'}]},
+        {'name'        : 'FeedingStation',
+         'components'  : [{'kind': 'Silo15', 'name': 'SiloB'},
+                          {'kind': 'Hopper10SP', 'name': 'HopperB'},
+                          {'kind': 'VacuumPump1', 'name': 'ActB1'},
+                          {'kind': 'ScrewConveyor1', 'name': 'ActB2'}],
+         'connections' : [{'transport': 'ActB1', 'from': 'HopperA', 'to': 'SiloB'},
+                          {'transport': 'ActB2', 'from': 'SiloB', 'to': 'HopperB'}]},
+        {'name'        : 'TransportingStation',
+         'components'  : [{'kind': 'Silo12', 'name': 'SiloC'},
+                          {'kind': 'Hopper9', 'name': 'HopperC'},
+                          {'kind': 'BeltElevator1', 'name': 'ActC1'},
+                          {'kind': 'ConveyorBelt2', 'name': 'ActC2'}],
+         'connections' : [{'transport': 'ActC1', 'from': 'HopperB', 'to': 'SiloC'},
+                          {'transport': 'ActC2', 'from': 'SiloC', 'to': 'HopperC'}]},
+        {'name'        : 'MixingStation',
+         'components'  : [{'kind': 'MixingSilo17', 'name': 'SiloD'},
+                          {'kind': 'Hopper8', 'name': 'HopperD'},
+                          {'kind': 'VacuumPump2SP', 'name': 'ActD1'},
+                          {'kind': 'ScrewConveyor2', 'name': 'ActD2'}],
+         'connections' : [{'transport': 'ActD1', 'from': ['HopperB', 'HopperC'], 'to': 'SiloD'},
+                          {'transport': 'ActD2', 'from': 'SiloD', 'to': 'HopperD'}]},
+        {'name'        : 'StoringStation',
+         'components'  : [{'kind': 'Silo17SP', 'name': 'SiloE'},
+                          {'kind': 'Hopper10SP', 'name': 'HopperE'},
+                          {'kind': 'VacuumPump1SP', 'name': 'ActE1'},
+                          {'kind': 'VibratoryConveyor', 'name': 'ActE2'}],
+         'connections' : [{'transport': 'ActE1', 'from': 'HopperD', 'to': 'SiloE'},
+                          {'transport': 'ActE2', 'from': 'SiloE', 'to': 'HopperE'}]},
+        {'name'        : 'WeighingStation',
+         'components'  : [{'kind': 'Silo15', 'name': 'SiloF'},
+                          {'kind': 'Hopper9', 'name': 'HopperF'},
+                          {'kind': 'BeltElevator2', 'name': 'ActF1'},
+                          {'kind': 'RotaryFeeder', 'name': 'ActF2'}],
+         'connections' : [{'transport': 'ActF1', 'from': 'HopperE', 'to': 'SiloF'},
+                          {'transport': 'ActF2', 'from': 'SiloF', 'to': 'HopperF'}]},
+        {'name'        : 'FillingStation',
+         'components'  : [{'kind': 'Silo17', 'name': 'SiloG'},
+                          {'kind': 'Hopper12', 'name': 'HopperG'},
+                          {'kind': 'BucketElevatorSP', 'name': 'ActG1'},
+                          {'kind': 'DomeValve', 'name': 'ActG2'}],
+         'connections' : [{'transport': 'ActG1', 'from': ['HopperE', 'HopperF'], 'to': 'SiloG'},
+                          {'transport': 'ActG2', 'from': 'SiloG', 'to': 'HopperG'}]},
+        {'name'        : 'BatchDosingStation',
+         'components'  : [{'kind': 'Silo30SP', 'name': 'SiloH'},
+                          {'kind': 'FinishedGoodsInventory', 'name': 'Inventory'},
+                          {'kind': 'VacuumPump3SP', 'name': 'ActH1'},
+                          {'kind': 'DosingUnit', 'name': 'ActH2'}],
+         'connections' : [{'transport': 'ActH1', 'from': 'HopperG', 'to': 'SiloH'},
+                          {'transport': 'ActH2', 'from': 'SiloH', 'to': 'Inventory'}]},
+        ],
+    'actions_in_order' : False,
+    # Transported materials of the actuators of the serial-parallel stages with further inputs
+    'signals'          : [
+        ['VC2SP_TransportedMaterial', 'Timer_1.value', 'Timer_1.status', 'Hopper10SP_FillLevel.value', 'BE1_TransportedMaterial.value'],
+        ['VC1SP_TransportedMaterial', 'Timer_2.value', 'Timer_2.status', 'Hopper9_FillLevel_1.value', 'Hopper8_FillLevel.value'],
+        ['BuESP_TransportedMaterial', 'Switch_1.status', 'Hopper10SP_FillLevel_1.value', 'BE2_TransportedMaterial.value'],
+        ['VC3SP_TransportedMaterial', 'Timer_3.value', 'Timer_3.status', 'Hopper9_FillLevel_2.value', 'Hopper12_FillLevel.value'],
+        ]
+    }
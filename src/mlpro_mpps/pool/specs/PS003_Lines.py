@@ -0,0 +1,399 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.pool.specs
+## -- Module  : PS003_Lines.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Signals derived from the connections of the stations
+## -- 2026-10-19  1.2.0     SY       Serial-parallel topology removed, see module description
+## -- 2026-10-19  1.3.0     SY       Serial-parallel topology with merging and branching lanes
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.3.0 (2026-10-19)
+
+This module provides a generator of plant specifications for production lines of arbitrary length
+and width, which are built from the buffers and transport actuators of the LS-BGLP (PS003), see
+mlpro_mpps.spec and mlpro_mpps.pool.mpps.PS003_Lines.
+
+A line consists of one or more lanes. Each lane starts with a loading silo, followed by a number of
+buffers (silos and hoppers) and ends in a finished goods inventory. Every buffer is connected to
+its neighbours by a transport actuator (vacuum pumps, conveyors, elevators, ...), i.e. a lane with
+n buffers has n+1 actuators. The supported topologies differ in the arrangement of the lanes into
+stations and in the material flow between the lanes:
+
+    - serial: a single lane, whose stations each comprise p_station_size buffers,
+    - parallel: p_width lanes with separate stations, which do not exchange material,
+    - serial_parallel: p_width lanes, where each station comprises the same stages of all lanes.
+      Between two stations, neighbouring lanes are merged and branched again by the
+      serial-parallel components of the LS-BGLP-SP: a merging vacuum pump (C_MERGES) of the first
+      lane draws from the last buffers of both lanes into a hopper with two outflows
+      (C_BRANCH_BUFFER), which feeds the next transport of the first lane and a branching
+      transport (C_BRANCHES) of the second lane. The branching transport takes the material that
+      is left by its parallel transport. With more than two lanes, the pairs of lanes alternate
+      from station to station, so that the material is exchanged across all lanes.
+
+As in LS_BGLP_SP, the fill levels of both buffers upstream of a merging vacuum pump are reduced by
+its transported material.
+
+The stations declare the connections of their transport actuators, from which SimMPPS derives the
+signals of the material flow. The element names (e.g. 'Hopper9_FillLevel_12') follow the automatic
+name adjustment of SimMPPS. The names of the fill levels, overflows, actuators,
+transported materials and power consumptions of each lane are provided by get_layout().
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Dimension
+from mlpro_mpps.pool.registry import ComponentRegistry
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class LineSpecGenerator:
+    """
+    This class generates the plant specification and the layout of a production line.
+
+    Parameters
+    ----------
+    p_topology : str
+        Topology of the line, see C_TOPOLOGY_SERIAL, C_TOPOLOGY_PARALLEL and
+        C_TOPOLOGY_SERIAL_PARALLEL. Default: C_TOPOLOGY_SERIAL.
+    p_length : int
+        Number of buffers per lane, excluding the loading silo and the inventory. Default: 10.
+    p_width : int
+        Number of lanes. Default: 1.
+    p_buffers : list
+        Kinds of the buffers, which are used cyclically. Default: C_BUFFERS.
+    p_transports : list
+        Kinds of the transport actuators, which are used cyclically. Default: C_TRANSPORTS.
+    p_station_size : int
+        Number of buffers per lane and station. Default: 2.
+    p_name : str
+        Name of the specification. Default: None (derived from the topology and size).
+
+    Attributes
+    ----------
+    C_SYSTEM : str
+        Production system of the component kinds.
+    C_SOURCE : str
+        Kind of the first buffer of each lane.
+    C_SINK : str
+        Kind of the last buffer of each lane.
+    C_BUFFERS : list
+        Default kinds of the buffers.
+    C_TRANSPORTS : list
+        Default kinds of the transport actuators.
+    C_MERGES : list
+        Kinds of the merging transport actuators of serial-parallel lines, which draw from two
+        buffers.
+    C_BRANCHES : list
+        Kinds of the branching transport actuators of serial-parallel lines, which share their
+        buffer with a parallel transport.
+    C_BRANCH_BUFFER : str
+        Kind of the buffers with two outflows of serial-parallel lines.
+    """
+
+    C_TOPOLOGY_SERIAL = 'serial'
+    C_TOPOLOGY_PARALLEL = 'parallel'
+    C_TOPOLOGY_SERIAL_PARALLEL = 'serial_parallel'
+
+    C_SYSTEM = 'PS003'
+    C_SOURCE = 'SiloLoading'
+    C_SINK = 'FinishedGoodsInventory'
+    C_BUFFERS = ['Silo15', 'Hopper9', 'Silo12', 'Hopper10', 'MixingSilo17', 'Hopper8', 'Silo17', 'Hopper12']
+    C_TRANSPORTS = ['ConveyorBelt1', 'VacuumPump1', 'ScrewConveyor1', 'BeltElevator1', 'ConveyorBelt2',
+                    'VacuumPump2', 'ScrewConveyor2', 'BeltElevator2', 'RotaryFeeder', 'VacuumPump3']
+    C_MERGES = ['VacuumPump1SP', 'VacuumPump3SP']
+    C_BRANCHES = ['VacuumPump2SP', 'BucketElevatorSP']
+    C_BRANCH_BUFFER = 'Hopper10SP'
+
+    _roles = {}
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_topology:str=C_TOPOLOGY_SERIAL,
+                 p_length:int=10,
+                 p_width:int=1,
+                 p_buffers:list=None,
+                 p_transports:list=None,
+                 p_station_size:int=2,
+                 p_name:str=None):
+
+        if p_topology not in [self.C_TOPOLOGY_SERIAL, self.C_TOPOLOGY_PARALLEL, self.C_TOPOLOGY_SERIAL_PARALLEL]:
+            raise ValueError('Topology ' + repr(p_topology) + ' is not supported')
+        if (p_topology == self.C_TOPOLOGY_SERIAL) and (p_width != 1):
+            raise ValueError('A serial line consists of a single lane, please use p_width=1')
+        if (p_topology == self.C_TOPOLOGY_SERIAL_PARALLEL) and (p_width < 2):
+            raise ValueError('A serial-parallel line consists of at least two lanes, please use p_width>=2')
+        if min(p_length, p_width, p_station_size) < 1:
+            raise ValueError('Length, width and station size must be at least 1')
+
+        self._topology = p_topology
+        self._length = p_length
+        self._width = p_width
+        self._buffers = list(p_buffers or self.C_BUFFERS)
+        self._transports = list(p_transports or self.C_TRANSPORTS)
+        self._station_size = p_station_size
+        self._name = p_name or 'Line_' + p_topology + '_' + str(p_width) + 'x' + str(p_length)
+        self._spec = None
+        self._layout = None
+        self._connections = None
+        self._branches = None
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def _get_roles(cls, p_kind:str) -> dict:
+        """
+        Determines the names of the elements of a component kind from a prototype and assigns them
+        to their roles, i.e. fill level, overflow, sensors, actuator, transported material and power
+        consumption. The result is cached per kind.
+        """
+
+        try:
+            return cls._roles[p_kind]
+        except KeyError:
+            pass
+
+        comp = ComponentRegistry.create(p_kind, p_system=cls.C_SYSTEM, p_name=p_kind, p_logging=Log.C_LOG_NOTHING)
+        states = [el.get_name_short() for el in comp.get_component_states().get_dims()]
+        sensors = [el.get_name_short() for el in comp.get_sensors().get_dims()]
+        actuators = comp.get_actuators().get_dims()
+
+        roles = {'states'    : states,
+                 'sensors'   : sensors,
+                 'actuators' : [el.get_name_short() for el in actuators],
+                 'switch'    : (len(actuators) == 1) and (actuators[0].get_base_set() == Dimension.C_BASE_SET_Z)}
+        for name in states:
+            for role, suffix in [('fill', 'FillLevel'), ('overflow', 'Overflow'), ('transported', 'TransportedMaterial'),
+                                 ('power', 'PowerConsumption'), ('level', 'Level')]:
+                if name.endswith(suffix):
+                    roles.setdefault(role, name)
+                    break
+
+        cls._roles[p_kind] = roles
+        return roles
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_couplings(self, p_num_stations:int) -> dict:
+        """
+        Determines the pairs of lanes of a serial-parallel line, which are merged and branched
+        between two stations.
+
+        Returns
+        -------
+        dict
+            {stage: [(first lane, second lane), ...]}, where stage is the index of the first stage
+            of the next station.
+        """
+
+        if self._topology != self.C_TOPOLOGY_SERIAL_PARALLEL:
+            return {}
+
+        couplings = {}
+        for station in range(1, p_num_stations):
+            offset = (station-1) % 2 if self._width > 2 else 0
+            couplings[station*self._station_size] = [(lane, lane+1) for lane in range(offset, self._width-1, 2)]
+        return couplings
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_stations(self) -> list:
+        """
+        Arranges the components of all lanes into stations and determines the connections of their
+        transport actuators.
+
+        Returns
+        -------
+        list
+            [(station name, [(lane, key, kind), ...]), ...], where key is the name of the component
+            within its station.
+        """
+
+        # 1. Pairs of lanes, which are merged and branched at the beginning of a stage
+        num_stations = -(-self._length // self._station_size)
+        couplings = self._get_couplings(num_stations)
+        roles = {}
+        for stage, pairs in couplings.items():
+            for pair_id, (first, second) in enumerate(pairs):
+                roles[(first, stage)] = ('merge', second, pair_id)
+                roles[(second, stage)] = ('branch', first, pair_id)
+
+        # 2. Components and connections of each lane, grouped by stages of p_station_size buffers
+        self._connections = {}
+        self._branches = {}
+        lanes = []
+        for lane in range(self._width):
+            lane_id = str(lane+1)
+            groups = [[] for _ in range(num_stations)]
+            groups[0].append((lane, 'Source_' + lane_id, self.C_SOURCE))
+            for stage in range(self._length + 1):
+                group = groups[min(stage // self._station_size, num_stations-1)]
+                transport = 'Transport_' + lane_id + '_' + str(stage+1)
+                upstream = 'Source_' + lane_id if stage == 0 else 'Buffer_' + lane_id + '_' + str(stage)
+                downstream = 'Sink_' + lane_id if stage == self._length else 'Buffer_' + lane_id + '_' + str(stage+1)
+                kind = self._transports[stage % len(self._transports)]
+                buffer = self._buffers[stage % len(self._buffers)]
+                role, other, pair_id = roles.get((lane, stage), (None, None, None))
+                counter = stage // self._station_size - 1 + pair_id if role else 0
+
+                if role == 'merge':
+                    # The first lane draws from the last buffers of both lanes into a buffer with
+                    # two outflows
+                    kind = self.C_MERGES[counter % len(self.C_MERGES)]
+                    upstream = [upstream, 'Buffer_' + str(other+1) + '_' + str(stage)]
+                    buffer = self.C_BRANCH_BUFFER
+                elif role == 'branch':
+                    # The second lane branches off from the buffer of the first lane
+                    kind = self.C_BRANCHES[counter % len(self.C_BRANCHES)]
+                    upstream = 'Buffer_' + str(other+1) + '_' + str(stage+1)
+                    self._branches[transport] = upstream
+
+                group.append((lane, transport, kind))
+                self._connections[transport] = {'transport': transport, 'from': upstream, 'to': downstream}
+                if stage < self._length:
+                    group.append((lane, 'Buffer_' + lane_id + '_' + str(stage+1), buffer))
+                else:
+                    group.append((lane, 'Sink_' + lane_id, self.C_SINK))
+            lanes.append(groups)
+
+        # 3. Stations according to the topology
+        stations = []
+        if self._topology == self.C_TOPOLOGY_SERIAL_PARALLEL:
+            for station in range(num_stations):
+                stations.append(('Station_' + str(station+1), [comp for groups in lanes for comp in groups[station]]))
+        else:
+            for lane, groups in enumerate(lanes):
+                prefix = 'Station_' if self._topology == self.C_TOPOLOGY_SERIAL else 'Line_' + str(lane+1) + '_Station_'
+                for station, group in enumerate(groups):
+                    stations.append((prefix + str(station+1), group))
+
+        return stations
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_parallel(self, p_transport:str) -> str:
+        """
+        Returns the transport, which shares the buffer of a branching transport.
+        """
+
+        buffer = self._branches[p_transport]
+        for transport, conn in self._connections.items():
+            upstream = conn['from'] if isinstance(conn['from'], list) else [conn['from']]
+            if (transport != p_transport) and (buffer in upstream):
+                return transport
+
+
+## -------------------------------------------------------------------------------------------------
+    def _generate(self):
+        stations = self._get_stations()
+
+        # 1. Element names after the automatic name adjustment of SimMPPS, i.e. per station all
+        #    component states, then all sensors and then all actuators
+        counter = {}
+        names = {}
+        for _, comps in stations:
+            for group in ['states', 'sensors', 'actuators']:
+                for _, key, kind in comps:
+                    adjusted = names.setdefault(key, {})
+                    for name in self._get_roles(kind)[group]:
+                        counter[name] = counter.get(name, 0) + 1
+                        adjusted[name] = name if counter[name] == 1 else name + '_' + str(counter[name]-1)
+
+        # 2. Layout of the lanes
+        lanes = [{'fill_levels': [], 'overflows': [], 'actuators': [], 'switches': [], 'transported': [],
+                  'power': [], 'upstream': [], 'downstream': [], 'sink': None} for _ in range(self._width)]
+        kinds = {key:kind for _, comps in stations for _, key, kind in comps}
+        fills = {key:names[key][self._get_roles(kind)['fill']] for key, kind in kinds.items() if 'fill' in self._get_roles(kind)}
+        for _, comps in stations:
+            for lane, key, kind in comps:
+                roles = self._get_roles(kind)
+                layout = lanes[lane]
+                if kind == self.C_SINK:
+                    layout['sink'] = names[key][roles['level']]
+                elif 'fill' in roles:
+                    layout['fill_levels'].append(names[key][roles['fill']])
+                    layout['overflows'].append(names[key][roles['overflow']])
+                else:
+                    layout['actuators'].append(names[key][roles['actuators'][0]])
+                    layout['switches'].append(roles['switch'])
+                    layout['transported'].append(names[key][roles['transported']])
+                    layout['power'].append(names[key][roles['power']])
+                    conn = self._connections[key]
+                    upstream = conn['from'] if isinstance(conn['from'], list) else [conn['from']]
+                    layout['upstream'].append([fills[name] for name in upstream])
+                    layout['downstream'].append(fills.get(conn['to']))
+
+        # 3. Material flow: each transport connects its upstream buffers with the next buffer of its
+        #    lane, the signals are derived by SimMPPS. A branching transport is declared after its
+        #    parallel transport, since it takes the material that is left by the parallel one.
+        connections = [[key for _, key, _ in comps if key in self._connections] for _, comps in stations]
+        signals = []
+        for transport in self._branches:
+            for conns in connections:
+                if transport in conns:
+                    conns.remove(transport)
+            parallel = self._get_parallel(transport)
+            for conns in connections:
+                if parallel in conns:
+                    conns.insert(conns.index(parallel)+1, transport)
+
+            roles = self._get_roles(kinds[transport])
+            act = names[transport][roles['actuators'][0]]
+            inputs = [act + '.status'] if roles['switch'] else [act + '.value', act + '.status']
+            signals.append([names[transport][roles['transported']],
+                            *inputs,
+                            fills[self._branches[transport]] + '.value',
+                            names[parallel][self._get_roles(kinds[parallel])['transported']] + '.value'])
+
+        self._spec = {'name'             : self._name,
+                      'system'           : self.C_SYSTEM,
+                      'stations'         : [{'name'        : station,
+                                             'components'  : [{'kind': kind, 'name': key} for _, key, kind in comps],
+                                             'connections' : [self._connections[key] for key in conns]}
+                                            for (station, comps), conns in zip(stations, connections)],
+                      'actions_in_order' : False}
+        if signals:
+            # Transported materials of the branching transports with the material of their parallel
+            # transports as further input
+            self._spec['signals'] = signals
+        self._layout = lanes
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_spec(self) -> dict:
+        """
+        Returns the plant specification of the line, see mlpro_mpps.spec.
+        """
+
+        if self._spec is None:
+            self._generate()
+        return self._spec
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_layout(self) -> list:
+        """
+        Returns the layout of the line.
+
+        Returns
+        -------
+        list
+            One dictionary per lane with the names of the fill levels and overflows of its buffers
+            (starting with the loading silo), the names of its actuators with their transported
+            materials and power consumptions, the flags of the switched actuators, the fill levels
+            upstream (list) and downstream (None for the inventory) of each actuator and the name
+            of the inventory level.
+        """
+
+        if self._layout is None:
+            self._generate()
+        return self._layout
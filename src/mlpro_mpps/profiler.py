@@ -0,0 +1,273 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : profiler.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Proxies are copyable and picklable
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides an opt-in profiler for the execution plan (signals) of a SimMPPS.
+
+While the profiler is attached, each callable of each signal is replaced by a timed proxy: the input
+getters of the signal, the method simulate() of the updated element, its transfer function and its
+method set_value() (which includes the logging). The proxies record call counts and the cumulative
+and maximum time per call. Detaching the profiler restores the original callables, so that a plant
+without profiler runs without any overhead.
+
+The results are available as a sorted report or as a collapsed-stack file, which can be rendered by
+flamegraph tools (e.g. flamegraph.pl or speedscope). The stack frames are tagged with the names of
+the elements, e.g. BGLP;VC1TransportedMaterial;simulate;TF_VacuumPump.
+"""
+
+
+import time
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class _ProfiledCall:
+    """
+    Timed proxy of a callable.
+    """
+
+    __slots__ = ['fct', 'count', 'total', 'max']
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_fct):
+        self.fct = p_fct
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def __call__(self, *p_args, **p_kwargs):
+        tstart = time.perf_counter_ns()
+        result = self.fct(*p_args, **p_kwargs)
+        duration = time.perf_counter_ns() - tstart
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        return result
+
+
+## -------------------------------------------------------------------------------------------------
+    def __getattr__(self, p_name):
+        # Attributes of the original callable, e.g. of a transfer function. Special attributes and
+        # the slots of an incomplete proxy (e.g. during copying) are not forwarded.
+        if p_name.startswith('__') or (p_name in _ProfiledCall.__slots__):
+            raise AttributeError(p_name)
+        return getattr(self.fct, p_name)
+
+
+## -------------------------------------------------------------------------------------------------
+    def __setattr__(self, p_name, p_value):
+        if p_name in _ProfiledCall.__slots__:
+            object.__setattr__(self, p_name, p_value)
+        else:
+            setattr(self.fct, p_name, p_value)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class MPPSProfiler:
+    """
+    This class profiles the signals and transfer functions of a SimMPPS. It is usually created via
+    SimMPPS.enable_profiling().
+
+    Parameters
+    ----------
+    p_mpps : SimMPPS
+        Plant to be profiled.
+
+    Attributes
+    ----------
+    C_SORT_TOTAL : str
+        Sorting of the report by cumulative time.
+    C_SORT_MAX : str
+        Sorting of the report by maximum time per call.
+    C_SORT_COUNT : str
+        Sorting of the report by call count.
+    """
+
+    C_SORT_TOTAL = 'total'
+    C_SORT_MAX = 'max'
+    C_SORT_COUNT = 'count'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_mpps):
+
+        self._mpps = p_mpps
+        self._stacks = {}
+        self._restore = []
+        self._attached = False
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_name(p_fct) -> str:
+        owner = getattr(p_fct, '__self__', None)
+        if (owner is not None) and hasattr(owner, 'get_name_short'):
+            return owner.get_name_short() + '.' + p_fct.__name__
+        return getattr(p_fct, '__qualname__', type(p_fct).__name__)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _add(self, p_stack:tuple, p_fct) -> _ProfiledCall:
+        proxy = self._stacks.get(p_stack)
+        if proxy is None:
+            proxy = _ProfiledCall(p_fct)
+            self._stacks[p_stack] = proxy
+        else:
+            proxy.fct = p_fct
+        return proxy
+
+
+## -------------------------------------------------------------------------------------------------
+    def attach(self):
+        """
+        Replaces the callables of all signals by timed proxies.
+        """
+
+        if self._attached:
+            return
+
+        root = self._mpps.get_name()
+
+        for sig in self._mpps._signals:
+            elem = sig[0]
+            name = elem.get_name_short()
+            signal = (root, name)
+
+            # 1. Input getters of the signal
+            originals = list(sig[1:])
+            for idx, fct in enumerate(originals):
+                sig[idx+1] = self._add(signal + ('input:' + self._get_name(fct),), fct)
+            self._restore.append((sig, originals))
+
+            # 2. Element: simulate(), transfer function and set_value()
+            if elem.__dict__.get('simulate') is None:
+                elem.simulate = self._add(signal + ('simulate',), elem.simulate)
+                elem.set_value = self._add(signal + ('simulate', 'set_value'), elem.set_value)
+                function = elem._function
+                tf_name = function.get_name() if hasattr(function, 'get_name') else type(function).__name__
+                elem._function = self._add(signal + ('simulate', tf_name), function)
+                self._restore.append((elem, function))
+
+        self._attached = True
+
+
+## -------------------------------------------------------------------------------------------------
+    def detach(self):
+        """
+        Restores the original callables of all signals. The recorded statistics are kept.
+        """
+
+        for target, original in self._restore:
+            if isinstance(target, list):
+                target[1:] = original
+            else:
+                del target.simulate
+                del target.set_value
+                target._function = original
+
+        self._restore = []
+        self._attached = False
+
+
+## -------------------------------------------------------------------------------------------------
+    def is_attached(self) -> bool:
+        return self._attached
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        """
+        Resets all statistics.
+        """
+
+        for proxy in self._stacks.values():
+            proxy.count = 0
+            proxy.total = 0
+            proxy.max = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_self_time(self, p_stack:tuple) -> int:
+        depth = len(p_stack)
+        children = sum(proxy.total for stack, proxy in self._stacks.items()
+                       if (len(stack) == depth+1) and (stack[:depth] == p_stack))
+        return max(self._stacks[p_stack].total - children, 0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_report(self, p_sort:str=C_SORT_TOTAL) -> list:
+        """
+        Returns the statistics of all profiled callables.
+
+        Parameters
+        ----------
+        p_sort : str
+            Sorting of the entries in descending order, see C_SORT_*. Default: C_SORT_TOTAL.
+
+        Returns
+        -------
+        list
+            List of dicts with the keys element, callable, count, total, mean, max and self (times
+            in seconds).
+        """
+
+        report = []
+        for stack, proxy in self._stacks.items():
+            report.append({'element'  : stack[1],
+                           'callable' : ';'.join(stack[2:]),
+                           'count'    : proxy.count,
+                           'total'    : proxy.total * 1e-9,
+                           'mean'     : proxy.total * 1e-9 / proxy.count if proxy.count > 0 else 0.0,
+                           'max'      : proxy.max * 1e-9,
+                           'self'     : self._get_self_time(stack) * 1e-9})
+
+        return sorted(report, key=lambda entry: entry[p_sort], reverse=True)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_report_str(self, p_sort:str=C_SORT_TOTAL, p_top:int=None) -> str:
+        """
+        Returns the report as a formatted table.
+        """
+
+        report = self.get_report(p_sort)[:p_top]
+        lines = ['%-32s %-48s %10s %12s %12s %12s' % ('Element', 'Callable', 'Count', 'Total [ms]', 'Mean [us]', 'Max [us]')]
+        for entry in report:
+            lines.append('%-32s %-48s %10d %12.3f %12.3f %12.3f' % (entry['element'], entry['callable'], entry['count'],
+                                                                    entry['total']*1e3, entry['mean']*1e6, entry['max']*1e6))
+        return '\n'.join(lines)
+
+
+## -------------------------------------------------------------------------------------------------
+    def save_collapsed(self, p_file:str):
+        """
+        Stores the self times in microseconds in the collapsed-stack format of flamegraph tools, one
+        line per stack, e.g. 'BGLP;VC1TransportedMaterial;simulate;TF_VacuumPump 1234'.
+        """
+
+        with open(p_file, 'w') as f:
+            for stack in self._stacks:
+                value = self._get_self_time(stack) // 1000
+                if value > 0:
+                    f.write(';'.join(stack) + ' ' + str(value) + '\n')
@@ -0,0 +1,384 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : realtime.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a soft real-time runner, which advances an MPPS-based environment in step with
+the wall clock, e.g. for tests against external controllers.
+
+The period of a step is the simulated duration of a step (t_set * action_repeat of the environment)
+divided by a speed factor, i.e. a speed of 1.0 means real time and a speed of 10.0 ten times faster
+than real time. The steps are scheduled against the monotonic clock time.perf_counter(). With drift
+compensation, the deadline of step k is t0 + k * period, so that delays do not accumulate. Without
+it, each deadline is computed relative to the start of the previous step. Waiting is done by a
+sleep followed by a short busy wait to reduce the jitter.
+
+A step misses its deadline, if it ends after the start deadline of the next step. By default, the
+runner then skips the deadlines that already passed instead of running the delayed steps in a
+burst (parameter p_catch_up).
+
+The controller exchanges actions and observations via single-slot mailboxes, so that the pacing
+loop never waits for the controller: the last action given by set_action() is held until a new one
+arrives, and get_observation() returns the latest observation. Controllers that act once per step
+can wait for the next observation via wait_observation().
+"""
+
+
+from mlpro.bf.various import Log
+import numpy as np
+import threading
+import time
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RealTimeRunner(Log):
+    """
+    This class runs an MPPS-based environment (a child of MPPSEnv) in soft real time.
+
+    Parameters
+    ----------
+    p_env :
+        Environment, which is reset by the runner.
+    p_speed : float
+        Speed relative to the wall clock. Default: 1.0.
+    p_period : float
+        Period of a step in seconds, which overrides the period given by the speed. Default: None.
+    p_drift_compensation : bool
+        If True, the deadlines are computed from the start time of the run. Default: True.
+    p_catch_up : bool
+        If True, delayed steps are run without waiting until the schedule is met again. Otherwise
+        the passed deadlines are skipped. Default: False.
+    p_spin_time : float
+        Duration of the busy wait before a deadline in seconds. Default: 0.0005.
+    p_capacity : int
+        Number of steps, whose timings are kept for the statistics. Default: 100000.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+    """
+
+    C_TYPE = 'Real-Time Runner'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_env,
+                 p_speed:float=1.0,
+                 p_period:float=None,
+                 p_drift_compensation:bool=True,
+                 p_catch_up:bool=False,
+                 p_spin_time:float=0.0005,
+                 p_capacity:int=100000,
+                 p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._env = p_env
+        self._sim_step = getattr(p_env, 't_set', 1.0) * getattr(p_env, 'action_repeat', 1)
+        self._period = p_period if p_period is not None else self._sim_step / p_speed
+        self._drift_compensation = p_drift_compensation
+        self._catch_up = p_catch_up
+        self._spin_time = p_spin_time
+        self._num_actions = p_env.get_action_space().get_num_dim()
+
+        self._lateness = np.zeros(p_capacity)
+        self._execution = np.zeros(p_capacity)
+        self._thread = None
+        self._running = False
+        self._stop = threading.Event()
+        self._cond = threading.Condition()
+        self._error = None
+        self._obs = (0, None, None)
+        self._action = np.zeros(self._num_actions)
+        self._reset_statistics()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_statistics(self):
+        self._num_steps = 0
+        self._missed = 0
+        self._skipped = 0
+        self._busy = 0.0
+        self._t_start = None
+        self._t_end = None
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_period(self) -> float:
+        return self._period
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_sim_time(self) -> float:
+        """
+        Returns the simulated time of the current run in seconds.
+        """
+
+        return self._num_steps * self._sim_step
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_action(self, p_action):
+        """
+        Sets the action of the next steps. The action is held until a new one is set.
+
+        Parameters
+        ----------
+        p_action : list or np.ndarray
+            Normalized action values, sorted in the order of the action space.
+        """
+
+        self._action = np.array(p_action, dtype=float).reshape(self._num_actions)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_observation(self):
+        """
+        Returns the latest observation without waiting.
+
+        Returns
+        -------
+        step : int
+            Number of processed steps, 0 after the reset.
+        obs : np.ndarray
+            Observation after the step.
+        rewards : np.ndarray
+            Rewards of the step, None after the reset.
+        """
+
+        return self._obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def wait_observation(self, p_step:int, p_timeout:float=None):
+        """
+        Waits until more than p_step steps are processed or the run is finished and returns the
+        latest observation, see get_observation(). Only the calling controller waits, the pacing
+        loop is not affected.
+
+        Parameters
+        ----------
+        p_step : int
+            Number of the last step known to the controller.
+        p_timeout : float
+            Maximum waiting time in seconds. Default: None.
+        """
+
+        with self._cond:
+            self._cond.wait_for(lambda: (self._obs[0] > p_step) or not self.is_running(), timeout=p_timeout)
+            return self._obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def _publish(self, p_step:int, p_rewards):
+        obs = (p_step, np.array(self._env.get_state().get_values(), dtype=float), p_rewards)
+        with self._cond:
+            self._obs = obs
+            self._cond.notify_all()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _prepare(self, p_seed):
+        self._env.reset(p_seed)
+        self._action = np.zeros(self._num_actions)
+        self._reset_statistics()
+        self._error = None
+        self._stop.clear()
+        self._running = True
+        self._publish(0, None)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _run(self, p_steps:int):
+        env = self._env
+        clock = time.perf_counter
+        period = self._period
+        capacity = self._lateness.size
+
+        self._t_start = clock()
+        deadline = self._t_start
+
+        try:
+            while ((p_steps is None) or (self._num_steps < p_steps)) and not self._stop.is_set():
+
+                # 1. Wait for the deadline
+                remaining = deadline - clock()
+                if remaining > self._spin_time:
+                    time.sleep(remaining - self._spin_time)
+                while clock() < deadline:
+                    pass
+
+                # 2. Step with the latest action
+                start = clock()
+                env.process_action_values(self._action)
+                self._publish(self._num_steps + 1, np.array(env.get_reward_values(), dtype=float))
+                end = clock()
+
+                idx = self._num_steps % capacity
+                self._lateness[idx] = start - deadline
+                self._execution[idx] = end - start
+                self._busy += end - start
+                self._num_steps += 1
+
+                # 3. Next deadline
+                if self._drift_compensation:
+                    deadline += period
+                else:
+                    deadline = start + period
+
+                if end > deadline:
+                    self._missed += 1
+                    if not self._catch_up:
+                        skipped = int((end - deadline) // period) + 1
+                        deadline += skipped * period
+                        self._skipped += skipped
+
+        except Exception as error:
+            self._error = error
+            self.log(self.C_LOG_TYPE_E, 'Run aborted:', repr(error))
+
+        finally:
+            self._t_end = clock()
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
+
+
+## -------------------------------------------------------------------------------------------------
+    def run(self, p_steps:int, p_seed=None) -> dict:
+        """
+        Resets the environment and runs the given number of steps in the calling thread.
+
+        Returns
+        -------
+        dict
+            Statistics of the run, see get_statistics().
+        """
+
+        self._prepare(p_seed)
+        self.log(self.C_LOG_TYPE_I, 'Run of', str(p_steps), 'steps with a period of %.6f s' % self._period)
+        self._run(p_steps)
+        if self._error is not None:
+            raise self._error
+        return self.get_statistics()
+
+
+## -------------------------------------------------------------------------------------------------
+    def start(self, p_steps:int=None, p_seed=None):
+        """
+        Resets the environment and starts the pacing loop in a background thread.
+
+        Parameters
+        ----------
+        p_steps : int
+            Number of steps. Default: None (until stop() is called).
+        p_seed :
+            Seed of the reset. Default: None.
+        """
+
+        if self.is_running():
+            raise RuntimeError('The runner is already running')
+
+        self._prepare(p_seed)
+        self._thread = threading.Thread(target=self._run, args=(p_steps,), name='MPPS real-time runner', daemon=True)
+        self.log(self.C_LOG_TYPE_I, 'Start with a period of %.6f s' % self._period)
+        self._thread.start()
+
+
+## -------------------------------------------------------------------------------------------------
+    def is_running(self) -> bool:
+        return self._running
+
+
+## -------------------------------------------------------------------------------------------------
+    def stop(self, p_timeout:float=None) -> dict:
+        """
+        Stops the pacing loop and waits for the end of the current step.
+
+        Returns
+        -------
+        dict
+            Statistics of the run, see get_statistics().
+        """
+
+        self._stop.set()
+        return self.join(p_timeout)
+
+
+## -------------------------------------------------------------------------------------------------
+    def join(self, p_timeout:float=None) -> dict:
+        """
+        Waits for the end of the run started by start().
+
+        Returns
+        -------
+        dict
+            Statistics of the run, see get_statistics().
+        """
+
+        if self._thread is not None:
+            self._thread.join(p_timeout)
+        if self._error is not None:
+            raise self._error
+        self.log(self.C_LOG_TYPE_I, 'Stopped after', str(self._num_steps), 'steps')
+        return self.get_statistics()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_statistics(self) -> dict:
+        """
+        Returns the timing statistics of the current or last run. Lateness is the delay of the
+        start of a step after its deadline, execution the duration of a step. Times are given in
+        seconds and percentiles refer to the last p_capacity steps.
+
+        Returns
+        -------
+        dict
+            steps, period, sim_time, wall_time, speed (simulated per wall-clock time),
+            lateness_p50/p99/max/mean, execution_p50/p99/max, utilization (share of the wall-clock
+            time spent in steps), missed_deadlines and skipped_deadlines.
+        """
+
+        num = min(self._num_steps, self._lateness.size)
+        lateness = self._lateness[:num]
+        execution = self._execution[:num]
+
+        if self._t_start is None:
+            wall_time = 0.0
+        else:
+            wall_time = (self._t_end if self._t_end is not None else time.perf_counter()) - self._t_start
+
+        if num > 0:
+            late_p50, late_p99 = np.percentile(lateness, [50, 99])
+            exec_p50, exec_p99 = np.percentile(execution, [50, 99])
+            late_max, late_mean, exec_max = lateness.max(), lateness.mean(), execution.max()
+        else:
+            late_p50 = late_p99 = late_max = late_mean = exec_p50 = exec_p99 = exec_max = 0.0
+
+        return {'steps'             : self._num_steps,
+                'period'            : self._period,
+                'sim_time'          : self.get_sim_time(),
+                'wall_time'         : wall_time,
+                'speed'             : self.get_sim_time() / wall_time if wall_time > 0 else 0.0,
+                'lateness_p50'      : float(late_p50),
+                'lateness_p99'      : float(late_p99),
+                'lateness_max'      : float(late_max),
+                'lateness_mean'     : float(late_mean),
+                'execution_p50'     : float(exec_p50),
+                'execution_p99'     : float(exec_p99),
+                'execution_max'     : float(exec_max),
+                'utilization'       : self._busy / wall_time if wall_time > 0 else 0.0,
+                'missed_deadlines'  : self._missed,
+                'skipped_deadlines' : self._skipped}
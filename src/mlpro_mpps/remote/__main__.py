@@ -0,0 +1,70 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.remote
+## -- Module  : __main__.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Rollout servers
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+Command line entry point of the servers, e.g.
+
+    python -m mlpro_mpps.remote plant --plant BGLP --address 127.0.0.1:5020
+    python -m mlpro_mpps.remote plant --plant LS_BGLP --address /tmp/ls_bglp.sock --period 0.1
+    python -m mlpro_mpps.remote rollout --plant BGLP --num-envs 64 --address 0.0.0.0:5030
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.bench.engines import EngineBenchmark
+from mlpro_mpps.remote.plant_server import PlantServer
+from mlpro_mpps.remote.rollout_server import RolloutServer
+import argparse
+
+
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m mlpro_mpps.remote', description='Servers of MPPS-based plants')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plant = commands.add_parser('plant', help='Serve the sensors, states and actuators of a plant')
+    plant.add_argument('--plant', default='BGLP', choices=list(EngineBenchmark.C_PLANTS.keys()))
+    plant.add_argument('--address', default='127.0.0.1:5020', help='host:port or path of a Unix socket')
+    plant.add_argument('--period', type=float, default=None, help='Period of free-running steps in seconds')
+    plant.add_argument('--seed', type=int, default=0)
+    plant.add_argument('--quiet', action='store_true')
+
+    rollout = commands.add_parser('rollout', help='Serve batched rollouts of a plant for a rollout worker pool')
+    rollout.add_argument('--plant', default='BGLP', choices=list(EngineBenchmark.C_PLANTS.keys()))
+    rollout.add_argument('--num-envs', type=int, default=16)
+    rollout.add_argument('--address', default='127.0.0.1:5030', help='host:port or path of a Unix socket')
+    rollout.add_argument('--seed', type=int, default=None)
+    rollout.add_argument('--quiet', action='store_true')
+
+    args = parser.parse_args()
+    logging = Log.C_LOG_NOTHING if args.quiet else Log.C_LOG_ALL
+
+    if args.command == 'plant':
+        server = PlantServer.create_for_plant(p_plant=args.plant,
+                                              p_address=args.address,
+                                              p_seed=args.seed,
+                                              p_period=args.period,
+                                              p_logging=logging)
+    else:
+        server = RolloutServer(p_env_cls=args.plant,
+                               p_num_envs=args.num_envs,
+                               p_seed=args.seed,
+                               p_address=args.address,
+                               p_logging=logging)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
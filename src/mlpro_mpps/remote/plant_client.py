@@ -0,0 +1,261 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.remote
+## -- Module  : plant_client.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a blocking client of the plant server of mlpro_mpps.remote.plant_server.
+
+Channels are addressed by their names or by their indices. Indices of frequently used sets of
+channels should be resolved once via get_indices(), so that the requests do not carry names.
+Notifications of subscriptions, which arrive while the client waits for a response, are queued
+and returned by get_notifications().
+"""
+
+
+from mlpro_mpps.remote.protocol import FrameProtocol, FrameBuffer
+from collections import deque
+import numpy as np
+import socket
+import struct
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class PlantClient:
+    """
+    This class connects to a plant server.
+
+    Parameters
+    ----------
+    p_address :
+        Address of the server in the form (host, port), 'host:port' or the path of a Unix socket.
+    p_timeout : float
+        Timeout of the socket operations in seconds. Default: 10.0.
+
+    Attributes
+    ----------
+    channels : list
+        Channels of the plant in the form [(name, kind, integer, lower, upper), ...], see
+        FrameProtocol.C_KIND_*.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_address, p_timeout:float=10.0):
+
+        family, address = FrameProtocol.parse_address(p_address)
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.settimeout(p_timeout)
+        self._sock.connect(address)
+        if family == socket.AF_INET:
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._buffer = FrameBuffer()
+        self._frames = deque()
+        self._notifications = deque()
+
+        body = self._request(FrameProtocol.C_OP_LIST)
+        num = struct.unpack_from('<H', body)[0]
+        offset = 2
+        self.channels = []
+        for _ in range(num):
+            kind, integer, lower, upper, length = struct.unpack_from('<BBddB', body, offset)
+            offset += 19
+            name = body[offset:offset+length].decode('utf-8')
+            offset += length
+            self.channels.append((name, kind, bool(integer), lower, upper))
+
+        self._index = {channel[0]:idx for idx, channel in enumerate(self.channels)}
+
+
+## -------------------------------------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+
+## -------------------------------------------------------------------------------------------------
+    def __exit__(self, p_type, p_value, p_traceback):
+        self.close()
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        self._sock.close()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_names(self, p_kind:int=None) -> list:
+        """
+        Returns the names of all channels or of the channels of a kind, see FrameProtocol.C_KIND_*.
+        """
+
+        return [channel[0] for channel in self.channels if (p_kind is None) or (channel[1] == p_kind)]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_indices(self, p_channels) -> np.ndarray:
+        """
+        Returns the indices of channels given by names or indices.
+        """
+
+        if isinstance(p_channels, np.ndarray) and (p_channels.dtype.kind in 'iu'):
+            return p_channels.astype('<u2', copy=False)
+        return np.array([self._index[ch] if isinstance(ch, str) else ch for ch in p_channels], dtype='<u2')
+
+
+## -------------------------------------------------------------------------------------------------
+    def _receive(self):
+        while not self._frames:
+            data = self._sock.recv(1 << 16)
+            if not data:
+                raise ConnectionError('Connection closed by the plant server')
+            for op, body in self._buffer.feed(data):
+                if op == FrameProtocol.C_OP_NOTIFY:
+                    self._notifications.append(self._decode_notification(body))
+                else:
+                    self._frames.append((op, body))
+            if self._notifications and not self._frames:
+                return
+        return self._frames.popleft()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _request(self, p_op:int, p_body:bytes=b'') -> bytes:
+        self._sock.sendall(FrameProtocol.encode(p_op, p_body))
+        frame = None
+        while frame is None:
+            frame = self._receive()
+
+        op, body = frame
+        if op == FrameProtocol.C_OP_ERROR:
+            raise RuntimeError('Plant server: ' + body.decode('utf-8'))
+        return body
+
+
+## -------------------------------------------------------------------------------------------------
+    def _pack_channels(self, p_channels) -> bytes:
+        if p_channels is None:
+            return FrameProtocol.pack_indices([])
+        return FrameProtocol.pack_indices(self.get_indices(p_channels))
+
+
+## -------------------------------------------------------------------------------------------------
+    def read(self, p_channels=None):
+        """
+        Reads the values of channels by a single request.
+
+        Parameters
+        ----------
+        p_channels : list
+            Names or indices of the channels. Default: None (all channels).
+
+        Returns
+        -------
+        t : float
+            Simulated time of the plant.
+        values : np.ndarray
+            Values of the channels. Deactivated elements are NaN.
+        """
+
+        body = self._request(FrameProtocol.C_OP_READ, self._pack_channels(p_channels))
+        t, num = struct.unpack_from('<dH', body)
+        return t, FrameProtocol.unpack_values(body, num, 10)
+
+
+## -------------------------------------------------------------------------------------------------
+    def write(self, p_channels, p_values) -> np.ndarray:
+        """
+        Writes the values of channels by a single request. NaN deactivates a sensor or actuator.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean status per channel, False if the value is out of the boundaries.
+        """
+
+        body = self._pack_channels(p_channels) + np.asarray(p_values, dtype='<f8').tobytes()
+        body = self._request(FrameProtocol.C_OP_WRITE, body)
+        return np.frombuffer(body, dtype=np.uint8, offset=2).astype(bool)
+
+
+## -------------------------------------------------------------------------------------------------
+    def step(self, p_steps:int=1) -> float:
+        """
+        Advances the plant by a number of steps and returns its simulated time.
+        """
+
+        return struct.unpack('<d', self._request(FrameProtocol.C_OP_STEP, struct.pack('<I', p_steps)))[0]
+
+
+## -------------------------------------------------------------------------------------------------
+    def subscribe(self, p_channels=None, p_deadband:float=0.0) -> int:
+        """
+        Subscribes to the changes of channels. The first notification contains all channels, the
+        following ones the channels that changed by more than the deadband.
+
+        Parameters
+        ----------
+        p_channels : list
+            Names or indices of the channels. Default: None (all channels).
+        p_deadband : float
+            Minimum absolute change of a value. Default: 0.0.
+
+        Returns
+        -------
+        int
+            Id of the subscription.
+        """
+
+        body = struct.pack('<d', p_deadband) + self._pack_channels(p_channels)
+        return struct.unpack('<H', self._request(FrameProtocol.C_OP_SUBSCRIBE, body))[0]
+
+
+## -------------------------------------------------------------------------------------------------
+    def unsubscribe(self, p_id:int):
+        self._request(FrameProtocol.C_OP_UNSUBSCRIBE, struct.pack('<H', p_id))
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _decode_notification(p_body:bytes):
+        sub_id, t, num = struct.unpack_from('<HdH', p_body)
+        indices = np.frombuffer(p_body, dtype='<u2', count=num, offset=12)
+        values = FrameProtocol.unpack_values(p_body, num, 12 + 2*num)
+        return sub_id, t, indices, values
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_notifications(self, p_timeout:float=0.0) -> list:
+        """
+        Returns the queued notifications. If there are none, it receives pending ones and waits up
+        to p_timeout seconds for further ones.
+
+        Returns
+        -------
+        list
+            Notifications in the form [(subscription, t, indices, values), ...].
+        """
+
+        if not self._notifications:
+            timeout = self._sock.gettimeout()
+            self._sock.settimeout(p_timeout)
+            try:
+                self._receive()
+            except (socket.timeout, BlockingIOError):
+                pass
+            finally:
+                self._sock.settimeout(timeout)
+
+        notifications = list(self._notifications)
+        self._notifications.clear()
+        return notifications
@@ -0,0 +1,324 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.remote
+## -- Module  : plant_server.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Socket handling moved to FrameServer
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides a plant server, which hosts a SimMPPS and exposes all its sensors, component
+states and actuators as channels over the binary protocol of mlpro_mpps.remote.protocol on a TCP
+socket on localhost or on a Unix socket. Controllers, e.g. PLC-style test clients, connect via
+the PlantClient of mlpro_mpps.remote.plant_client.
+
+The channels are numbered in the order sensors, component states, actuators. A single request
+reads or writes any number of channels. Subscriptions notify a client about the channels, whose
+values changed by more than a deadband after a step or a write. The notifications caused by a
+request are sent ahead of its response.
+
+The plant advances by steps of p_t_step simulated seconds, see SimMPPS.simulate_signals(). Steps
+are either requested by the clients (STEP) or, if a period is given, run by the server in step with
+the wall clock. The server is a FrameServer of mlpro_mpps.remote.server and runs in the calling
+thread (serve_forever()), in a background thread (start()) or in a separate process, e.g.
+
+    python -m mlpro_mpps.remote plant --plant BGLP --address 127.0.0.1:5020
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro.bf.math import Dimension
+from mlpro_mpps.remote.protocol import FrameProtocol
+from mlpro_mpps.remote.server import FrameServer
+import numpy as np
+import struct
+import time
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class PlantServer(FrameServer):
+    """
+    This class serves the channels of a SimMPPS.
+
+    Parameters
+    ----------
+    p_mpps : SimMPPS
+        Plant, e.g. the attribute _fct_strans of an environment of the pool after its reset.
+    p_address :
+        Address in the form (host, port), 'host:port' or the path of a Unix socket. Port 0 selects
+        a free port, see get_address(). Default: ('127.0.0.1', 0).
+    p_t_step : float
+        Simulated duration of a step in seconds. Default: 10.0.
+    p_period : float
+        Period of the free-running steps in seconds. Default: None (steps on request only).
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_TYPE : str
+        Type of the class. Default: 'Plant Server'.
+    C_NAME : str
+        Name of the class. Default: 'MPPS'.
+    """
+
+    C_TYPE = 'Plant Server'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_mpps,
+                 p_address=('127.0.0.1', 0),
+                 p_t_step:float=10.0,
+                 p_period:float=None,
+                 p_logging=Log.C_LOG_ALL):
+
+        FrameServer.__init__(self, p_address=p_address, p_logging=p_logging)
+
+        self._mpps = p_mpps
+        self._env = None
+        self._t_step = p_t_step
+        self._period = p_period
+        self.t = 0.0
+
+        # 1. Channel table
+        elems = [(FrameProtocol.C_KIND_SENSOR, name, elem) for name, elem in p_mpps.get_sensors().items()]
+        elems += [(FrameProtocol.C_KIND_STATE, name, elem) for name, elem in p_mpps.get_component_states().items()]
+        elems += [(FrameProtocol.C_KIND_ACTUATOR, name, elem) for name, elem in p_mpps.get_actuators().items()]
+        if len(elems) > FrameProtocol.C_MAX_CHANNELS:
+            raise ValueError('The plant has more than ' + str(FrameProtocol.C_MAX_CHANNELS) + ' channels')
+
+        self._elems = [elem for _, _, elem in elems]
+        self._names = [name for _, name, _ in elems]
+        self._integer = [elem.get_base_set() == Dimension.C_BASE_SET_Z for elem in self._elems]
+        self._values = np.zeros(len(self._elems))
+
+        table = [struct.pack('<H', len(elems))]
+        for (kind, name, elem), integer in zip(elems, self._integer):
+            lower, upper = elem.get_boundaries()
+            encoded = name.encode('utf-8')
+            table.append(struct.pack('<BBddB', kind, integer, lower, upper, len(encoded)) + encoded)
+        self._table = b''.join(table)
+
+        self._dirty = False
+        self._deadline = None
+        self._num_steps = 0
+        self._num_notifications = 0
+
+        self._handlers = {FrameProtocol.C_OP_LIST        : self._handle_list,
+                          FrameProtocol.C_OP_READ        : self._handle_read,
+                          FrameProtocol.C_OP_WRITE       : self._handle_write,
+                          FrameProtocol.C_OP_STEP        : self._handle_step,
+                          FrameProtocol.C_OP_SUBSCRIBE   : self._handle_subscribe,
+                          FrameProtocol.C_OP_UNSUBSCRIBE : self._handle_unsubscribe}
+
+        self.log(self.C_LOG_TYPE_I, str(len(self._elems)), 'channels served at', str(self._address))
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def create_for_plant(cls,
+                         p_plant:str,
+                         p_address=('127.0.0.1', 0),
+                         p_seed=0,
+                         p_period:float=None,
+                         p_logging=Log.C_LOG_ALL):
+        """
+        Creates a server for a plant of the benchmark, see EngineBenchmark.C_PLANTS. The plant is
+        taken from a new environment after its reset, and the step of the server is equal to the
+        step of the environment.
+
+        Parameters
+        ----------
+        p_plant : str
+            Name of the plant, e.g. 'BGLP' or 'LS_BGLP'.
+        p_seed :
+            Seed of the reset of the environment. Default: 0.
+
+        See the class description for the further parameters.
+        """
+
+        from mlpro_mpps.bench.engines import EngineBenchmark
+
+        env = EngineBenchmark.get_env_cls(p_plant)(p_logging=Log.C_LOG_NOTHING)
+        env.reset(p_seed)
+        server = cls(p_mpps=env._fct_strans,
+                     p_address=p_address,
+                     p_t_step=getattr(env, 't_set', 1.0),
+                     p_period=p_period,
+                     p_logging=p_logging)
+        server._env = env
+        return server
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def serve_plant(cls, p_plant:str, p_address, p_conn=None, p_period:float=None, p_logging=Log.C_LOG_NOTHING):
+        """
+        Creates a server for a plant and serves it until the process is terminated. This is the
+        target of server processes, see FrameServer.spawn_process().
+        """
+
+        server = cls.create_for_plant(p_plant=p_plant, p_address=p_address, p_period=p_period, p_logging=p_logging)
+        server.serve_process(p_conn)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_channel_names(self) -> list:
+        return self._names
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_statistics(self) -> dict:
+        return {'clients'       : len(self._clients),
+                'steps'         : self._num_steps,
+                'requests'      : self._num_requests,
+                'notifications' : self._num_notifications}
+
+
+## -------------------------------------------------------------------------------------------------
+    def _read_values(self) -> np.ndarray:
+        values = self._values
+        for idx, elem in enumerate(self._elems):
+            value = elem._value
+            values[idx] = np.nan if value is None else value
+        return values
+
+
+## -------------------------------------------------------------------------------------------------
+    def step(self, p_steps:int=1):
+        """
+        Advances the plant by a number of steps with the current values of the actuators.
+        """
+
+        for _ in range(p_steps):
+            self._mpps.simulate_signals(self._t_step)
+            self.t += self._t_step
+            self._num_steps += 1
+        self._dirty = True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_list(self, p_client, p_body:bytes) -> bytes:
+        return self._table
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_read(self, p_client, p_body:bytes) -> bytes:
+        indices, _ = FrameProtocol.unpack_indices(p_body)
+        values = self._read_values()
+        if indices.size > 0:
+            values = values[indices]
+        return struct.pack('<dH', self.t, values.size) + values.astype('<f8').tobytes()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_write(self, p_client, p_body:bytes) -> bytes:
+        indices, offset = FrameProtocol.unpack_indices(p_body)
+        values = FrameProtocol.unpack_values(p_body, indices.size, offset)
+        status = np.zeros(indices.size, dtype=np.uint8)
+
+        for pos, (idx, value) in enumerate(zip(indices, values)):
+            elem = self._elems[idx]
+            if np.isnan(value):
+                status[pos] = hasattr(elem, 'deactivate') and elem.deactivate()
+            else:
+                status[pos] = elem.set_value(int(value) if self._integer[idx] else float(value))
+
+        self._notify()
+        return struct.pack('<H', int(status.sum())) + status.tobytes()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_step(self, p_client, p_body:bytes) -> bytes:
+        # Notifications of the step are sent ahead of the response
+        self.step(struct.unpack('<I', p_body)[0])
+        self._notify()
+        return struct.pack('<d', self.t)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_subscribe(self, p_client, p_body:bytes) -> bytes:
+        deadband = struct.unpack_from('<d', p_body)[0]
+        indices, _ = FrameProtocol.unpack_indices(p_body, 8)
+        if indices.size == 0:
+            indices = np.arange(len(self._elems))
+
+        # The first notification contains all channels of the subscription
+        sub_id = p_client['next_id']
+        p_client['next_id'] += 1
+        p_client['subs'][sub_id] = [indices.astype(int), deadband, np.full(indices.size, np.nan), True]
+        self._dirty = True
+        return struct.pack('<H', sub_id)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_unsubscribe(self, p_client, p_body:bytes) -> bytes:
+        p_client['subs'].pop(struct.unpack('<H', p_body)[0], None)
+        return b''
+
+
+## -------------------------------------------------------------------------------------------------
+    def _notify(self):
+        self._dirty = False
+        values = None
+
+        for conn, client in self._clients.items():
+            for sub_id, sub in client['subs'].items():
+                if values is None:
+                    values = self._read_values()
+
+                indices, deadband, last, initial = sub
+                current = values[indices]
+                if initial:
+                    changed = np.ones(indices.size, dtype=bool)
+                    sub[3] = False
+                else:
+                    with np.errstate(invalid='ignore'):
+                        changed = (np.abs(current - last) > deadband) | (np.isnan(current) != np.isnan(last))
+                if not changed.any():
+                    continue
+
+                last[changed] = current[changed]
+                body = (struct.pack('<HdH', sub_id, self.t, int(changed.sum())) +
+                        indices[changed].astype('<u2').tobytes() +
+                        current[changed].astype('<f8').tobytes())
+                self._send(conn, client, FrameProtocol.encode(FrameProtocol.C_OP_NOTIFY, body))
+                self._num_notifications += 1
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_client(self) -> dict:
+        client = FrameServer._create_client(self)
+        client['subs'] = {}
+        client['next_id'] = 1
+        return client
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_timeout(self) -> float:
+        if self._period is None:
+            return None
+        if self._deadline is None:
+            self._deadline = time.perf_counter() + self._period
+        return max(self._deadline - time.perf_counter(), 0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _on_cycle(self):
+        if (self._deadline is not None) and (time.perf_counter() >= self._deadline):
+            self.step()
+            self._deadline += self._period
+
+        if self._dirty:
+            self._notify()
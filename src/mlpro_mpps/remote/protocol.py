@@ -0,0 +1,188 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.remote
+## -- Module  : protocol.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.1.0     SY       Opcodes of the rollout protocol
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides the framing of the binary protocols of the plant server and the rollout
+server, see mlpro_mpps.remote.plant_server and mlpro_mpps.remote.rollout_server.
+
+Each frame consists of a header of 5 bytes (little endian), i.e. the length of the body (uint32)
+and an opcode (uint8), followed by the body. Requests are answered in order by a frame with the
+same opcode or by an error frame. Notifications are pushed by the server at any time and are
+distinguished by their opcode.
+
+Bodies of the plant protocol (n: uint16, indices: uint16[n], values: float64[n], t: float64):
+
+    LIST        request: -                        response: n, n * (kind uint8, integer uint8,
+                                                  lower float64, upper float64, len uint8, name)
+    READ        request: n, indices               response: t, n, values
+    WRITE       request: n, indices, values       response: accepted uint16, status uint8[n]
+    STEP        request: steps uint32             response: t
+    SUBSCRIBE   request: deadband float64, n,     response: subscription uint16
+                indices
+    UNSUBSCRIBE request: subscription uint16      response: -
+    NOTIFY      push: subscription uint16, t, n, indices, values
+    ERROR       response: message (utf-8)
+
+An empty list of indices (n = 0) refers to all channels. Deactivated elements (value None) are
+transferred as NaN, and writing NaN deactivates a sensor or an actuator.
+
+Bodies of the rollout protocol (seq: uint32 sequence number of the request, which is returned by
+the response, dt: float64 compute time of the server in seconds, N instances, obs: float64[N, O],
+rewards: float64[N, R], k: uint32, idx: uint32[k]):
+
+    INFO        request: seq                      response: seq, N, O, actions A (uint32 each)
+    RESET       request: seq, k, idx              response: seq, dt, obs
+    STEP        request: seq, actions float64[N, A]
+                response: seq, dt, R uint16, obs, rewards, terminated uint8[N], truncated
+                uint8[N], k, idx, final observations float64[k, O]
+    PING        request: seq                      response: seq, instance steps uint64,
+                                                  requests uint64, busy time float64
+
+A RESET with k = 0 resets all instances. The final observations of a STEP belong to the instances
+idx, which were reset automatically.
+"""
+
+
+import numpy as np
+import socket
+import struct
+import os
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class FrameProtocol:
+    """
+    This class provides the opcodes and the encoding of the frames of the plant and rollout
+    protocols.
+
+    Attributes
+    ----------
+    C_HEADER : struct.Struct
+        Header of a frame, i.e. length of the body and opcode.
+    C_MAX_CHANNELS : int
+        Maximum number of channels, which can be addressed by an index.
+    """
+
+    C_HEADER = struct.Struct('<IB')
+    C_MAX_CHANNELS = 65535
+
+    C_OP_LIST = 0x01
+    C_OP_READ = 0x02
+    C_OP_WRITE = 0x03
+    C_OP_STEP = 0x04
+    C_OP_SUBSCRIBE = 0x05
+    C_OP_UNSUBSCRIBE = 0x06
+    C_OP_INFO = 0x10
+    C_OP_RESET = 0x11
+    C_OP_STEP_BATCH = 0x12
+    C_OP_PING = 0x13
+    C_OP_ERROR = 0x7F
+    C_OP_NOTIFY = 0x80
+
+    C_KIND_SENSOR = 0
+    C_KIND_STATE = 1
+    C_KIND_ACTUATOR = 2
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def encode(cls, p_op:int, p_body:bytes=b'') -> bytes:
+        return cls.C_HEADER.pack(len(p_body), p_op) + p_body
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def pack_indices(p_indices) -> bytes:
+        indices = np.asarray(p_indices, dtype='<u2')
+        return struct.pack('<H', indices.size) + indices.tobytes()
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def unpack_indices(p_body:bytes, p_offset:int=0):
+        """
+        Returns the indices of a body and the offset behind them.
+        """
+
+        num = struct.unpack_from('<H', p_body, p_offset)[0]
+        indices = np.frombuffer(p_body, dtype='<u2', count=num, offset=p_offset+2)
+        return indices, p_offset + 2 + 2*num
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def unpack_values(p_body:bytes, p_num:int, p_offset:int=0) -> np.ndarray:
+        return np.frombuffer(p_body, dtype='<f8', count=p_num, offset=p_offset)
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def parse_address(p_address):
+        """
+        Returns the socket family and address of an address given as (host, port), 'host:port' or
+        the path of a Unix socket.
+        """
+
+        if isinstance(p_address, str):
+            host, sep, port = p_address.rpartition(':')
+            if sep and port.isdigit() and (os.sep not in p_address):
+                return socket.AF_INET, (host, int(port))
+            return socket.AF_UNIX, p_address
+
+        return socket.AF_INET, (p_address[0], int(p_address[1]))
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class FrameBuffer:
+    """
+    This class collects the received bytes of a connection and splits them into frames.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self):
+        self._data = bytearray()
+
+
+## -------------------------------------------------------------------------------------------------
+    def feed(self, p_data:bytes) -> list:
+        """
+        Appends received bytes and returns the completed frames.
+
+        Returns
+        -------
+        list
+            Frames in the form [(opcode, body), ...].
+        """
+
+        self._data += p_data
+        frames = []
+        size = FrameProtocol.C_HEADER.size
+        pos = 0
+
+        while len(self._data) - pos >= size:
+            length, op = FrameProtocol.C_HEADER.unpack_from(self._data, pos)
+            if len(self._data) - pos - size < length:
+                break
+            frames.append((op, bytes(self._data[pos+size:pos+size+length])))
+            pos += size + length
+
+        if pos > 0:
+            del self._data[:pos]
+        return frames
@@ -0,0 +1,720 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.remote
+## -- Module  : rollout_pool.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Responses to abandoned requests are discarded by their sequence numbers
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This module provides a pool of rollout workers, which presents the batched environments of a
+number of rollout servers (see mlpro_mpps.remote.rollout_server) as a single batched environment
+with the interface of BatchedMPPSEnv, i.e. reset(p_mask), step(p_actions), get_observations(),
+get_final_observations() and get_num_envs().
+
+The instances of the workers are concatenated in the order of the given addresses. The actions of
+a step are split into one request per worker, which are sent at once, so that all servers compute
+in parallel. The responses are received in the order of their arrival and written to the rows of
+the respective worker, so that the results are always in the order of the instances. Each request
+carries a sequence number, which is checked against the response. Responses to requests that were
+abandoned, e.g. after a timeout of a health check or after an error of another worker, are
+discarded when they arrive, so that a late response is never taken for the result of a later
+request.
+
+Each worker counts its requests, instance steps, transferred bytes, errors, round-trip latencies
+and the compute time reported by its server. The latter two reveal the overhead of transport and
+serialization per worker. The health of the workers is checked by check_health().
+
+For tests on a single host, spawn_local() starts a number of rollout servers as local processes.
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.remote.protocol import FrameProtocol, FrameBuffer
+from mlpro_mpps.remote.server import FrameServer
+from mlpro_mpps.remote.rollout_server import RolloutServer
+from collections import deque
+import numpy as np
+import selectors
+import socket
+import struct
+import time
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RolloutWorker:
+    """
+    This class is the connection of a pool to a rollout server.
+
+    Parameters
+    ----------
+    p_address :
+        Address of the server in the form (host, port), 'host:port' or the path of a Unix socket.
+    p_offset : int
+        Index of the first instance of the worker in the pool.
+    p_timeout : float
+        Timeout of the connection and of blocking receives in seconds. Default: 60.0.
+
+    Attributes
+    ----------
+    address :
+        Address of the server.
+    offset : int
+        Index of the first instance of the worker in the pool.
+    num_envs : int
+        Number of instances of the server.
+    num_obs : int
+        Dimension of the observations.
+    num_actions : int
+        Dimension of the actions.
+    healthy : bool
+        False, if the worker failed or did not answer in time.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_address, p_offset:int, p_timeout:float=60.0):
+
+        family, address = FrameProtocol.parse_address(p_address)
+        self.address = p_address
+        self.offset = p_offset
+        self.healthy = True
+
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.settimeout(p_timeout)
+        self._sock.connect(address)
+        if family == socket.AF_INET:
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._buffer = FrameBuffer()
+        self._frames = deque()
+        self._pending = deque()
+        self._seq = 0
+
+        self.num_requests = 0
+        self.num_responses = 0
+        self.num_discarded = 0
+        self.num_steps = 0
+        self.num_resets = 0
+        self.num_errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_last = 0.0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.step_time = 0.0
+        self.compute_time = 0.0
+        self.last_response = None
+
+        self.send(FrameProtocol.C_OP_INFO)
+        _, self.num_envs, self.num_obs, self.num_actions = struct.unpack('<IIII', self.receive())
+
+
+## -------------------------------------------------------------------------------------------------
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        self._sock.close()
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_slice(self) -> slice:
+        return slice(self.offset, self.offset + self.num_envs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def send(self, p_op:int, p_body:bytes=b'') -> int:
+        """
+        Sends a request with a new sequence number and returns the sequence number.
+        """
+
+        self._seq = (self._seq + 1) & 0xFFFFFFFF
+        data = FrameProtocol.encode(p_op, struct.pack('<I', self._seq) + p_body)
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            self.healthy = False
+            raise
+
+        self._pending.append((p_op, self._seq, time.perf_counter()))
+        self.num_requests += 1
+        self.bytes_sent += len(data)
+        return self._seq
+
+
+## -------------------------------------------------------------------------------------------------
+    def poll(self) -> bool:
+        """
+        Receives the available bytes and returns True, if a response is complete. It is supposed
+        to be called when the socket is readable.
+        """
+
+        if not self._frames:
+            data = self._sock.recv(1 << 20)
+            if not data:
+                self.healthy = False
+                raise ConnectionError('Rollout worker ' + str(self.address) + ': connection closed')
+            self.bytes_received += len(data)
+            self._frames.extend(self._buffer.feed(data))
+        return len(self._frames) > 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def _pop_response(self, p_seq):
+        """
+        Checks the oldest complete response against the oldest pending request. Responses to
+        requests older than p_seq were abandoned by the pool and are discarded.
+
+        Returns
+        -------
+        bytes
+            Body of the response to request p_seq or None, if the response was discarded.
+        """
+
+        op, body = self._frames.popleft()
+        expected_op, expected_seq, t_sent = self._pending.popleft()
+        now = time.perf_counter()
+
+        if op == FrameProtocol.C_OP_ERROR:
+            self.num_errors += 1
+            if expected_seq != p_seq:
+                self.num_discarded += 1
+                return None
+            raise RuntimeError('Rollout worker ' + str(self.address) + ': ' + body.decode('utf-8'))
+
+        seq = struct.unpack_from('<I', body)[0]
+        if (op != expected_op) or (seq != expected_seq):
+            self.num_errors += 1
+            self.healthy = False
+            raise RuntimeError('Rollout worker ' + str(self.address) + ': response ' + str((op, seq)) +
+                               ' does not match request ' + str((expected_op, expected_seq)))
+
+        if seq != p_seq:
+            self.num_discarded += 1
+            return None
+
+        latency = now - t_sent
+        self.latency_last = latency
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.last_response = time.time()
+        if op == FrameProtocol.C_OP_STEP_BATCH:
+            self.step_time += latency
+        self.num_responses += 1
+        return body
+
+
+## -------------------------------------------------------------------------------------------------
+    def read(self, p_seq=None):
+        """
+        Reads the available bytes and processes all complete responses. It is supposed to be called
+        when the socket is readable.
+
+        Parameters
+        ----------
+        p_seq : int
+            Sequence number of the awaited request. Responses to older requests are discarded.
+            Default: None (no request awaited, all responses are discarded).
+
+        Returns
+        -------
+        bytes
+            Body of the response to request p_seq or None, if it is not complete yet.
+        """
+
+        if self.poll():
+            while self._frames:
+                body = self._pop_response(p_seq)
+                if body is not None:
+                    return body
+        return None
+
+
+## -------------------------------------------------------------------------------------------------
+    def receive(self, p_seq=None) -> bytes:
+        """
+        Waits for the response of a request, checks it and returns its body. Responses to older
+        requests are discarded.
+
+        Parameters
+        ----------
+        p_seq : int
+            Sequence number of the request. Default: None (latest request).
+        """
+
+        if p_seq is None:
+            p_seq = self._seq
+
+        try:
+            while True:
+                body = self.read(p_seq)
+                if body is not None:
+                    return body
+        except socket.timeout:
+            self.healthy = False
+            raise TimeoutError('Rollout worker ' + str(self.address) + ': no response')
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_statistics(self) -> dict:
+        """
+        Returns the counters of the worker.
+
+        Returns
+        -------
+        dict
+            address, num_envs, healthy, requests, steps (instance steps), resets, errors,
+            discarded (responses to abandoned requests), bytes_sent, bytes_received,
+            latency_last/mean/max (round trips of the answered requests in seconds),
+            compute_time (reported by the server), steps_per_sec (instance steps per second of
+            step round trips) and overhead (share of the round trips not spent in computations).
+        """
+
+        return {'address'        : str(self.address),
+                'num_envs'       : self.num_envs,
+                'healthy'        : self.healthy,
+                'requests'       : self.num_requests,
+                'steps'          : self.num_steps,
+                'resets'         : self.num_resets,
+                'errors'         : self.num_errors,
+                'discarded'      : self.num_discarded,
+                'bytes_sent'     : self.bytes_sent,
+                'bytes_received' : self.bytes_received,
+                'latency_last'   : self.latency_last,
+                'latency_mean'   : self.latency_sum / self.num_responses if self.num_responses > 0 else 0.0,
+                'latency_max'    : self.latency_max,
+                'compute_time'   : self.compute_time,
+                'steps_per_sec'  : self.num_steps / self.step_time if self.step_time > 0 else 0.0,
+                'overhead'       : 1 - self.compute_time / self.latency_sum if self.latency_sum > 0 else 0.0}
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RolloutWorkerPool(Log):
+    """
+    This class presents a number of rollout servers as a single batched environment.
+
+    Parameters
+    ----------
+    p_addresses : list
+        Addresses of the rollout servers.
+    p_timeout : float
+        Maximum waiting time for a response in seconds. Default: 60.0.
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_TYPE : str
+        Type of the class. Default: 'Rollout Worker Pool'.
+    C_NAME : str
+        Name of the class. Default: 'MPPS'.
+    """
+
+    C_TYPE = 'Rollout Worker Pool'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_addresses:list, p_timeout:float=60.0, p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._timeout = p_timeout
+        self._workers = []
+        self._processes = []
+        self._selector = selectors.DefaultSelector()
+
+        offset = 0
+        try:
+            for address in p_addresses:
+                worker = RolloutWorker(address, offset, p_timeout)
+                self._workers.append(worker)
+                self._selector.register(worker, selectors.EVENT_READ, worker)
+                offset += worker.num_envs
+        except:
+            self.close()
+            raise
+
+        dims = {(worker.num_obs, worker.num_actions) for worker in self._workers}
+        if len(dims) != 1:
+            self.close()
+            raise ValueError('The rollout servers host environments of different dimensions: ' + str(dims))
+
+        self._num_envs = offset
+        self._num_obs, self._num_actions = dims.pop()
+        self._obs = np.zeros((self._num_envs, self._num_obs))
+        self._final_obs = np.zeros_like(self._obs)
+        self._rewards = None
+        self._terminated = np.zeros(self._num_envs, dtype=bool)
+        self._truncated = np.zeros(self._num_envs, dtype=bool)
+
+        self._step_pending = False
+        self._num_steps = 0
+        self._wall_time = 0.0
+        self._t_step = None
+
+        self.log(self.C_LOG_TYPE_I, str(len(self._workers)), 'workers with', str(self._num_envs), 'instances')
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def spawn_local(cls,
+                    p_env_cls,
+                    p_num_workers:int,
+                    p_num_envs:int,
+                    p_seed=None,
+                    p_timeout:float=60.0,
+                    p_logging=Log.C_LOG_ALL,
+                    **p_kwargs):
+        """
+        Starts rollout servers as local processes and creates a pool of them. The processes are
+        terminated by close().
+
+        Parameters
+        ----------
+        p_env_cls : type or str
+            Class of the environment or name of a plant, see RolloutServer.
+        p_num_workers : int
+            Number of rollout servers.
+        p_num_envs : int
+            Number of instances per rollout server.
+        p_seed : int
+            Seed, from which the seeds of the servers are derived. Default: None.
+        p_kwargs : dict
+            Further parameters for the constructor of the environment.
+        """
+
+        if p_seed is None:
+            seeds = [None] * p_num_workers
+        else:
+            seeds = [int(seq.generate_state(1)[0]) for seq in np.random.SeedSequence(p_seed).spawn(p_num_workers)]
+
+        kwargs = [dict(p_kwargs, p_env_cls=p_env_cls, p_num_envs=p_num_envs, p_seed=seed, p_address=('127.0.0.1', 0))
+                  for seed in seeds]
+        servers = FrameServer.spawn_processes(RolloutServer.serve_rollouts, kwargs)
+
+        try:
+            pool = cls(p_addresses=[address for _, address in servers], p_timeout=p_timeout, p_logging=p_logging)
+        except:
+            for process, _ in servers:
+                process.terminate()
+            raise
+
+        pool._processes = [process for process, _ in servers]
+        return pool
+
+
+## -------------------------------------------------------------------------------------------------
+    def __enter__(self):
+        return self
+
+
+## -------------------------------------------------------------------------------------------------
+    def __exit__(self, p_type, p_value, p_traceback):
+        self.close()
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        Closes the connections and terminates the processes started by spawn_local().
+        """
+
+        for worker in self._workers:
+            worker.close()
+        self._selector.close()
+        for process in self._processes:
+            process.terminate()
+            process.join()
+        self._processes = []
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_workers(self) -> list:
+        return self._workers
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_num_envs(self) -> int:
+        return self._num_envs
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_observations(self) -> np.ndarray:
+        return self._obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_final_observations(self) -> np.ndarray:
+        """
+        Returns the last observations of the instances before their automatic reset, see
+        BatchedMPPSEnv.get_final_observations().
+        """
+
+        return self._final_obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def _gather(self, p_workers:list, p_fct):
+        """
+        Receives the responses to the latest requests of the given workers in the order of their
+        arrival and passes them to p_fct(worker, body). Responses to abandoned requests are
+        discarded, also those of the other workers. If a worker fails, the responses of the
+        remaining workers are still received before the first error is raised.
+        """
+
+        waiting = {worker:worker._seq for worker in p_workers}
+        error = None
+
+        while waiting:
+            events = self._selector.select(self._timeout)
+            if not events:
+                for worker in waiting:
+                    worker.healthy = False
+                raise TimeoutError('No response of the rollout workers ' + str([str(w.address) for w in waiting]))
+
+            for key, _ in events:
+                worker = key.data
+                try:
+                    body = worker.read(waiting.get(worker))
+                except (ConnectionError, RuntimeError) as worker_error:
+                    if isinstance(worker_error, ConnectionError):
+                        self._selector.unregister(worker)
+                    if worker in waiting:
+                        del waiting[worker]
+                        error = error or worker_error
+                    continue
+
+                if body is not None:
+                    del waiting[worker]
+                    p_fct(worker, body)
+
+        if error is not None:
+            raise error
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self, p_mask:np.ndarray=None) -> np.ndarray:
+        """
+        Resets the selected instances, see BatchedMPPSEnv.reset().
+
+        Parameters
+        ----------
+        p_mask : np.ndarray
+            Boolean mask of shape (num_envs,) or array of instance indices. Default: None (all
+            instances).
+
+        Returns
+        -------
+        np.ndarray
+            Observations of all instances.
+        """
+
+        if self._step_pending:
+            raise RuntimeError('A step is pending, see step_wait()')
+
+        if p_mask is None:
+            idx = np.arange(self._num_envs)
+        else:
+            p_mask = np.asarray(p_mask)
+            idx = np.flatnonzero(p_mask) if p_mask.dtype == bool else p_mask
+
+        # 1. One request per affected worker
+        workers = []
+        for worker in self._workers:
+            local = idx[(idx >= worker.offset) & (idx < worker.offset + worker.num_envs)] - worker.offset
+            if local.size == 0:
+                continue
+            if local.size == worker.num_envs:
+                local = local[:0]
+            worker.send(FrameProtocol.C_OP_RESET, struct.pack('<I', local.size) + local.astype('<u4').tobytes())
+            workers.append(worker)
+
+        # 2. Responses
+        def _unpack(p_worker, p_body):
+            dt = struct.unpack_from('<d', p_body, 4)[0]
+            self._obs[p_worker.get_slice()] = np.frombuffer(p_body, dtype='<f8', offset=12).reshape(p_worker.num_envs, self._num_obs)
+            p_worker.compute_time += dt
+            p_worker.num_resets += 1
+
+        self._gather(workers, _unpack)
+        self._terminated[idx] = False
+        self._truncated[idx] = False
+        return self._obs
+
+
+## -------------------------------------------------------------------------------------------------
+    def step_async(self, p_actions:np.ndarray):
+        """
+        Sends the actions of all instances to the workers without waiting for the results, see
+        step_wait().
+
+        Parameters
+        ----------
+        p_actions : np.ndarray
+            Normalized actions of shape (num_envs, num_actions).
+        """
+
+        if self._step_pending:
+            raise RuntimeError('A step is pending, see step_wait()')
+
+        p_actions = np.asarray(p_actions, dtype='<f8').reshape(self._num_envs, self._num_actions)
+        self._t_step = time.perf_counter()
+        for worker in self._workers:
+            worker.send(FrameProtocol.C_OP_STEP_BATCH, p_actions[worker.get_slice()].tobytes())
+        self._step_pending = True
+
+
+## -------------------------------------------------------------------------------------------------
+    def _unpack_step(self, p_worker, p_body:bytes):
+        _, dt, num_rewards = struct.unpack_from('<IdH', p_body)
+        num, num_obs = p_worker.num_envs, self._num_obs
+        rows = p_worker.get_slice()
+
+        if self._rewards is None:
+            self._rewards = np.zeros((self._num_envs, num_rewards))
+
+        offset = 14
+        self._obs[rows] = np.frombuffer(p_body, dtype='<f8', count=num*num_obs, offset=offset).reshape(num, num_obs)
+        offset += 8*num*num_obs
+        self._rewards[rows] = np.frombuffer(p_body, dtype='<f8', count=num*num_rewards, offset=offset).reshape(num, num_rewards)
+        offset += 8*num*num_rewards
+        self._terminated[rows] = np.frombuffer(p_body, dtype=np.uint8, count=num, offset=offset)
+        self._truncated[rows] = np.frombuffer(p_body, dtype=np.uint8, count=num, offset=offset+num)
+        offset += 2*num
+
+        num_final = struct.unpack_from('<I', p_body, offset)[0]
+        if num_final > 0:
+            final_idx = np.frombuffer(p_body, dtype='<u4', count=num_final, offset=offset+4)
+            final_obs = np.frombuffer(p_body, dtype='<f8', count=num_final*num_obs, offset=offset+4+4*num_final)
+            self._final_obs[p_worker.offset + final_idx.astype(int)] = final_obs.reshape(num_final, num_obs)
+
+        p_worker.compute_time += dt
+        p_worker.num_steps += num
+
+
+## -------------------------------------------------------------------------------------------------
+    def step_wait(self):
+        """
+        Waits for the results of the step started by step_async().
+
+        Returns
+        -------
+        obs : np.ndarray
+            Observations of shape (num_envs, num_states).
+        rewards : np.ndarray
+            Rewards of shape (num_envs, num_rewards).
+        terminated : np.ndarray
+            Boolean mask of instances that reached their production target.
+        truncated : np.ndarray
+            Boolean mask of instances that reached their cycle limit.
+
+        The returned arrays are internal buffers, which are overwritten by the next step.
+        """
+
+        if not self._step_pending:
+            raise RuntimeError('No step is pending, see step_async()')
+
+        try:
+            self._gather(self._workers, self._unpack_step)
+        finally:
+            self._step_pending = False
+
+        self._num_steps += 1
+        self._wall_time += time.perf_counter() - self._t_step
+        return self._obs, self._rewards, self._terminated, self._truncated
+
+
+## -------------------------------------------------------------------------------------------------
+    def step(self, p_actions:np.ndarray):
+        """
+        Processes one action per instance, see step_async() and step_wait().
+        """
+
+        self.step_async(p_actions)
+        return self.step_wait()
+
+
+## -------------------------------------------------------------------------------------------------
+    def check_health(self, p_timeout:float=1.0) -> list:
+        """
+        Pings all workers and waits up to p_timeout seconds for their answers. Workers without an
+        answer are marked as unhealthy.
+
+        Returns
+        -------
+        list
+            Per worker: address, healthy, latency of the ping in seconds and the counters of the
+            server, i.e. server_steps (instance steps), server_requests and server_busy_time.
+        """
+
+        if self._step_pending:
+            raise RuntimeError('A step is pending, see step_wait()')
+
+        results = {}
+        for worker in self._workers:
+            try:
+                worker.send(FrameProtocol.C_OP_PING)
+            except OSError:
+                results[worker] = {'address': str(worker.address), 'healthy': False}
+
+        def _unpack(p_worker, p_body):
+            _, steps, requests, busy = struct.unpack('<IQQd', p_body)
+            results[p_worker] = {'address'          : str(p_worker.address),
+                                 'healthy'          : True,
+                                 'latency'          : p_worker.latency_last,
+                                 'server_steps'     : steps,
+                                 'server_requests'  : requests,
+                                 'server_busy_time' : busy}
+
+        timeout = self._timeout
+        self._timeout = p_timeout
+        try:
+            self._gather([w for w in self._workers if w not in results], _unpack)
+        except (TimeoutError, ConnectionError, RuntimeError) as error:
+            self.log(self.C_LOG_TYPE_W, 'Health check failed:', str(error))
+        finally:
+            self._timeout = timeout
+
+        report = []
+        for worker in self._workers:
+            result = results.get(worker, {'address': str(worker.address), 'healthy': False})
+            worker.healthy = result['healthy']
+            report.append(result)
+        return report
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_statistics(self) -> dict:
+        """
+        Returns the statistics of the pool and its workers.
+
+        Returns
+        -------
+        dict
+            num_envs, num_workers, steps (steps of the pool), instance_steps, wall_time (of the
+            steps in seconds), steps_per_sec (instance steps per second) and workers (list of the
+            counters of the workers, see RolloutWorker.get_statistics()).
+        """
+
+        return {'num_envs'       : self._num_envs,
+                'num_workers'    : len(self._workers),
+                'steps'          : self._num_steps,
+                'instance_steps' : self._num_steps * self._num_envs,
+                'wall_time'      : self._wall_time,
+                'steps_per_sec'  : self._num_steps * self._num_envs / self._wall_time if self._wall_time > 0 else 0.0,
+                'workers'        : [worker.get_statistics() for worker in self._workers]}
@@ -0,0 +1,178 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.remote
+## -- Module  : rollout_server.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a rollout server, which hosts a batched environment of mlpro_mpps.batch and
+processes resets and batched steps over the rollout protocol of mlpro_mpps.remote.protocol. It is
+the remote counterpart of a worker of the RolloutWorkerPool of mlpro_mpps.remote.rollout_pool.
+
+Each server is supposed to be used by a single pool. Servers run in separate processes on the
+same host or on further hosts, e.g.
+
+    python -m mlpro_mpps.remote rollout --plant BGLP --num-envs 64 --address 0.0.0.0:5030
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.batch import BatchedMPPSEnv
+from mlpro_mpps.remote.protocol import FrameProtocol
+from mlpro_mpps.remote.server import FrameServer
+import numpy as np
+import struct
+import time
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class RolloutServer(FrameServer):
+    """
+    This class serves the resets and steps of a batched environment.
+
+    Parameters
+    ----------
+    p_env_cls : type or str
+        Class of the environment, e.g. BGLP_RLEnv, or the name of a plant of the benchmark, see
+        EngineBenchmark.C_PLANTS.
+    p_num_envs : int
+        Number of instances.
+    p_seed : int
+        Seed of the batched environment. Default: None.
+    p_auto_reset : bool
+        Automatic reset of finished instances, see BatchedMPPSEnv. Default: True.
+    p_address :
+        Address in the form (host, port), 'host:port' or the path of a Unix socket. Default:
+        ('127.0.0.1', 0).
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further parameters for the constructor of the environment.
+
+    Attributes
+    ----------
+    C_TYPE : str
+        Type of the class. Default: 'Rollout Server'.
+    C_NAME : str
+        Name of the class. Default: 'MPPS'.
+    """
+
+    C_TYPE = 'Rollout Server'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_env_cls,
+                 p_num_envs:int,
+                 p_seed=None,
+                 p_auto_reset:bool=True,
+                 p_address=('127.0.0.1', 0),
+                 p_logging=Log.C_LOG_ALL,
+                 **p_kwargs):
+
+        if isinstance(p_env_cls, str):
+            from mlpro_mpps.bench.engines import EngineBenchmark
+            p_env_cls = EngineBenchmark.get_env_cls(p_env_cls)
+
+        self._batch = BatchedMPPSEnv(p_env_cls=p_env_cls,
+                                     p_num_envs=p_num_envs,
+                                     p_seed=p_seed,
+                                     p_auto_reset=p_auto_reset,
+                                     **p_kwargs)
+
+        FrameServer.__init__(self, p_address=p_address, p_logging=p_logging)
+
+        self._auto_reset = p_auto_reset
+        env = self._batch.get_envs()[0]
+        self._num_envs = p_num_envs
+        self._num_obs = self._batch.get_observations().shape[1]
+        self._num_actions = env.get_action_space().get_num_dim()
+        self._num_steps = 0
+        self._busy = 0.0
+
+        self._handlers = {FrameProtocol.C_OP_INFO       : self._handle_info,
+                          FrameProtocol.C_OP_RESET      : self._handle_reset,
+                          FrameProtocol.C_OP_STEP_BATCH : self._handle_step,
+                          FrameProtocol.C_OP_PING       : self._handle_ping}
+
+        self.log(self.C_LOG_TYPE_I, str(p_num_envs), 'instances of', p_env_cls.__name__, 'served at', str(self._address))
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def serve_rollouts(cls, p_env_cls, p_num_envs:int, p_address, p_conn=None, p_logging=Log.C_LOG_NOTHING, **p_kwargs):
+        """
+        Creates a rollout server and serves it until the process is terminated. This is the target
+        of server processes, see FrameServer.spawn_processes().
+        """
+
+        server = cls(p_env_cls=p_env_cls, p_num_envs=p_num_envs, p_address=p_address, p_logging=p_logging, **p_kwargs)
+        server.serve_process(p_conn)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_batch(self) -> BatchedMPPSEnv:
+        return self._batch
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_info(self, p_client, p_body:bytes) -> bytes:
+        seq = struct.unpack('<I', p_body)[0]
+        return struct.pack('<IIII', seq, self._num_envs, self._num_obs, self._num_actions)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_reset(self, p_client, p_body:bytes) -> bytes:
+        seq, num = struct.unpack_from('<II', p_body)
+        idx = np.frombuffer(p_body, dtype='<u4', count=num, offset=8)
+
+        start = time.perf_counter()
+        obs = self._batch.reset(idx if num > 0 else None)
+        duration = time.perf_counter() - start
+        self._busy += duration
+
+        return struct.pack('<Id', seq, duration) + obs.astype('<f8').tobytes()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_step(self, p_client, p_body:bytes) -> bytes:
+        seq = struct.unpack_from('<I', p_body)[0]
+        actions = np.frombuffer(p_body, dtype='<f8', offset=4)
+        if actions.size != self._num_envs * self._num_actions:
+            raise ValueError('Expected ' + str(self._num_envs * self._num_actions) + ' action values, got ' + str(actions.size))
+
+        start = time.perf_counter()
+        obs, rewards, terminated, truncated = self._batch.step(actions)
+        if self._auto_reset:
+            final_idx = np.flatnonzero(terminated | truncated).astype('<u4')
+        else:
+            final_idx = np.zeros(0, dtype='<u4')
+        duration = time.perf_counter() - start
+        self._busy += duration
+        self._num_steps += self._num_envs
+
+        return b''.join([struct.pack('<IdH', seq, duration, rewards.shape[1]),
+                         obs.astype('<f8').tobytes(),
+                         rewards.astype('<f8').tobytes(),
+                         terminated.astype(np.uint8).tobytes(),
+                         truncated.astype(np.uint8).tobytes(),
+                         struct.pack('<I', final_idx.size),
+                         final_idx.tobytes(),
+                         self._batch.get_final_observations()[final_idx].astype('<f8').tobytes()])
+
+
+## -------------------------------------------------------------------------------------------------
+    def _handle_ping(self, p_client, p_body:bytes) -> bytes:
+        seq = struct.unpack('<I', p_body)[0]
+        return struct.pack('<IQQd', seq, self._num_steps, self._num_requests, self._busy)
@@ -0,0 +1,339 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps.remote
+## -- Module  : server.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides the base class of the servers of mlpro_mpps.remote, which serve requests in
+the frame format of mlpro_mpps.remote.protocol on a TCP socket or a Unix socket.
+
+A server is single-threaded. It multiplexes its connections by a selector and answers the requests
+of each connection in order via the handlers of the opcodes. It runs in the calling thread
+(serve_forever()), in a background thread (start()) or in separate processes (spawn_processes()).
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.remote.protocol import FrameProtocol, FrameBuffer
+import multiprocessing
+import selectors
+import threading
+import socket
+import os
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class FrameServer(Log):
+    """
+    This class serves the frames of its clients. Child classes register the handlers of their
+    opcodes in the dictionary _handlers in the form {opcode: method(p_client, p_body) -> body}.
+    Exceptions of a handler are answered by an error frame.
+
+    Parameters
+    ----------
+    p_address :
+        Address in the form (host, port), 'host:port' or the path of a Unix socket. Port 0 selects
+        a free port, see get_address(). Default: ('127.0.0.1', 0).
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+
+    Attributes
+    ----------
+    C_TYPE : str
+        Type of the class. Default: 'Frame Server'.
+    C_NAME : str
+        Name of the class. Default: 'MPPS'.
+    """
+
+    C_TYPE = 'Frame Server'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_address=('127.0.0.1', 0), p_logging=Log.C_LOG_ALL):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._family, address = FrameProtocol.parse_address(p_address)
+        if (self._family == socket.AF_UNIX) and os.path.exists(address):
+            os.unlink(address)
+
+        self._listener = socket.socket(self._family, socket.SOCK_STREAM)
+        if self._family == socket.AF_INET:
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(address)
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self._address = self._listener.getsockname()
+
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, None)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ, None)
+
+        self._handlers = {}
+        self._clients = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._num_requests = 0
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_address(self):
+        """
+        Returns the bound address, i.e. (host, port) or the path of the Unix socket.
+        """
+
+        return self._address
+
+
+## -------------------------------------------------------------------------------------------------
+    def _create_client(self) -> dict:
+        """
+        Returns the state of a new connection. Child classes can add further entries.
+        """
+
+        return {'buffer': FrameBuffer(), 'out': bytearray()}
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_timeout(self) -> float:
+        """
+        Returns the maximum waiting time for the next events in seconds, None means no limit.
+        """
+
+        return None
+
+
+## -------------------------------------------------------------------------------------------------
+    def _on_cycle(self):
+        """
+        Custom method, which is called after the events of each iteration of the server loop.
+        """
+
+        pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def _send(self, p_conn, p_client, p_data:bytes):
+        out = p_client['out']
+        if not out:
+            try:
+                sent = p_conn.send(p_data)
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                return
+            p_data = p_data[sent:]
+            if not p_data:
+                return
+            self._selector.modify(p_conn, selectors.EVENT_READ | selectors.EVENT_WRITE, p_client)
+        out += p_data
+
+
+## -------------------------------------------------------------------------------------------------
+    def _accept(self):
+        conn, _ = self._listener.accept()
+        conn.setblocking(False)
+        if self._family == socket.AF_INET:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = self._create_client()
+        self._clients[conn] = client
+        self._selector.register(conn, selectors.EVENT_READ, client)
+        self.log(self.C_LOG_TYPE_I, 'Client connected,', str(len(self._clients)), 'clients')
+
+
+## -------------------------------------------------------------------------------------------------
+    def _close(self, p_conn):
+        self._selector.unregister(p_conn)
+        self._clients.pop(p_conn, None)
+        p_conn.close()
+        self.log(self.C_LOG_TYPE_I, 'Client disconnected,', str(len(self._clients)), 'clients')
+
+
+## -------------------------------------------------------------------------------------------------
+    def _serve_client(self, p_conn, p_client, p_events):
+
+        # 1. Pending output
+        if p_events & selectors.EVENT_WRITE:
+            out = p_client['out']
+            try:
+                sent = p_conn.send(out)
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                return self._close(p_conn)
+            del out[:sent]
+            if not out:
+                self._selector.modify(p_conn, selectors.EVENT_READ, p_client)
+
+        if not (p_events & selectors.EVENT_READ):
+            return
+
+        # 2. Requests
+        try:
+            data = p_conn.recv(1 << 16)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            return self._close(p_conn)
+
+        for op, body in p_client['buffer'].feed(data):
+            self._num_requests += 1
+            try:
+                response = FrameProtocol.encode(op, self._handlers[op](p_client, body))
+            except Exception as error:
+                response = FrameProtocol.encode(FrameProtocol.C_OP_ERROR, repr(error).encode('utf-8'))
+            self._send(p_conn, p_client, response)
+
+
+## -------------------------------------------------------------------------------------------------
+    def serve_forever(self):
+        """
+        Serves the clients in the calling thread until stop() is called.
+        """
+
+        self._stop.clear()
+
+        try:
+            while not self._stop.is_set():
+                for key, events in self._selector.select(self._get_timeout()):
+                    if key.fileobj is self._listener:
+                        self._accept()
+                    elif key.fileobj is self._wakeup_recv:
+                        self._wakeup_recv.recv(64)
+                    else:
+                        self._serve_client(key.fileobj, key.data, events)
+
+                self._on_cycle()
+
+        finally:
+            for conn in list(self._clients):
+                self._close(conn)
+            self._selector.close()
+            self._listener.close()
+            self._wakeup_recv.close()
+            self._wakeup_send.close()
+            if self._family == socket.AF_UNIX:
+                try:
+                    os.unlink(self._address)
+                except OSError:
+                    pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def serve_process(self, p_conn=None):
+        """
+        Reports the bound address via the connection p_conn, e.g. one end of a
+        multiprocessing.Pipe(), and serves the clients until the process is terminated.
+        """
+
+        if p_conn is not None:
+            p_conn.send(self.get_address())
+            p_conn.close()
+        self.serve_forever()
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def spawn_processes(p_target, p_kwargs:list) -> list:
+        """
+        Starts a number of server processes at once and waits for their addresses.
+
+        Parameters
+        ----------
+        p_target :
+            Target of the processes, which creates a server and calls its method serve_process()
+            with the parameter p_conn, e.g. PlantServer.serve_plant.
+        p_kwargs : list
+            Parameters of the target per process.
+
+        Returns
+        -------
+        list
+            Server processes and their bound addresses in the form [(process, address), ...]. The
+            processes are stopped by terminate().
+        """
+
+        started = []
+        for kwargs in p_kwargs:
+            recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=p_target, kwargs=dict(kwargs, p_conn=send_conn), daemon=True)
+            process.start()
+            send_conn.close()
+            started.append((process, recv_conn))
+
+        servers = []
+        try:
+            for process, recv_conn in started:
+                try:
+                    servers.append((process, recv_conn.recv()))
+                except EOFError:
+                    process.join()
+                    raise RuntimeError('Server process exited with code ' + str(process.exitcode))
+        except:
+            for process, _ in started:
+                process.terminate()
+            raise
+        finally:
+            for _, recv_conn in started:
+                recv_conn.close()
+
+        return servers
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def spawn_process(p_target, **p_kwargs):
+        """
+        Starts a server process and waits for its address, see spawn_processes().
+
+        Returns
+        -------
+        process : multiprocessing.Process
+            Server process, which is stopped by terminate().
+        address :
+            Bound address of the server.
+        """
+
+        return FrameServer.spawn_processes(p_target, [p_kwargs])[0]
+
+
+## -------------------------------------------------------------------------------------------------
+    def start(self):
+        """
+        Serves the clients in a background thread.
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever, name='MPPS ' + self.C_TYPE.lower(), daemon=True)
+        self._thread.start()
+
+
+## -------------------------------------------------------------------------------------------------
+    def stop(self, p_timeout:float=None):
+        """
+        Stops serving and closes all connections.
+        """
+
+        self._stop.set()
+        try:
+            self._wakeup_send.send(b'\0')
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join(p_timeout)
+        self.log(self.C_LOG_TYPE_I, 'Stopped after', str(self._num_requests), 'requests')
@@ -0,0 +1,306 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : sb3.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This module provides a direct Stable-Baselines3 adapter for decentralized agents of MPPS-based
+environments.
+
+A single batched plant (see mlpro_mpps.batch) is shared between all agents of the agent partition
+of the environment. Each agent receives its own SB3-compatible VecEnv, which observes and actuates
+only its own part of the plant. The actions of all agents are joined into a single step of the
+batched plant, so that the agents can be trained with a large number of parallel instances
+without the per-cycle overhead of an MLPro scenario.
+
+Since every agent is trained by its own SB3 model, the models are executed in separate threads,
+which are synchronized at each reset and step of the plant, see method SB3MultiAgentEnv.learn().
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.batch import BatchedMPPSEnv
+from stable_baselines3.common.vec_env import VecEnv
+from gymnasium import spaces
+import numpy as np
+import threading
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SB3AgentVecEnv(VecEnv):
+    """
+    VecEnv view of a single decentralized agent onto a shared batched plant. Instances of this class
+    are created by SB3MultiAgentEnv and should not be instantiated directly.
+
+    Parameters
+    ----------
+    p_parent : SB3MultiAgentEnv
+        Shared multi-agent environment.
+    p_agent : str
+        Name of the agent in the agent partition of the environment.
+    p_agent_idx : int
+        Index of the agent in the agent partition, which is also the index of its reward.
+    p_state_idx : list
+        Indices of the observed states.
+    p_action_idx : list
+        Indices of the actions.
+    """
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_parent, p_agent:str, p_agent_idx:int, p_state_idx:list, p_action_idx:list):
+
+        self._parent = p_parent
+        self._agent = p_agent
+        self._agent_idx = p_agent_idx
+        self._state_idx = np.array(p_state_idx, dtype=int)
+        self._action_idx = np.array(p_action_idx, dtype=int)
+
+        super().__init__(num_envs=p_parent.get_batch().get_num_envs(),
+                         observation_space=spaces.Box(low=0.0, high=1.0, shape=(len(p_state_idx),), dtype=np.float32),
+                         action_space=spaces.Box(low=0.0, high=1.0, shape=(len(p_action_idx),), dtype=np.float32))
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent(self) -> str:
+        return self._agent
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_obs(self, p_obs:np.ndarray) -> np.ndarray:
+        # Fancy indexing returns a copy, which is required since SB3 keeps the last observation
+        # while the batched plant overwrites its buffers in place
+        return p_obs[:, self._state_idx].astype(np.float32)
+
+
+## -------------------------------------------------------------------------------------------------
+    def reset(self):
+        return self._get_obs(self._parent._sync_reset())
+
+
+## -------------------------------------------------------------------------------------------------
+    def step_async(self, actions:np.ndarray) -> None:
+        self._parent._actions[:, self._action_idx] = np.clip(np.asarray(actions).reshape(self.num_envs, -1), 0.0, 1.0)
+
+
+## -------------------------------------------------------------------------------------------------
+    def step_wait(self):
+        obs, rewards, terminated, truncated = self._parent._sync_step()
+        dones = terminated | truncated
+        infos = [{} for _ in range(self.num_envs)]
+
+        if dones.any():
+            final_obs = self._get_obs(self._parent.get_batch().get_final_observations())
+            for i in np.flatnonzero(dones):
+                infos[i]['terminal_observation'] = final_obs[i]
+                infos[i]['TimeLimit.truncated'] = bool(truncated[i])
+
+        return self._get_obs(obs), rewards[:, self._agent_idx].astype(np.float32), dones, infos
+
+
+## -------------------------------------------------------------------------------------------------
+    def close(self) -> None:
+        pass
+
+
+## -------------------------------------------------------------------------------------------------
+    def _get_target_envs(self, indices) -> list:
+        envs = self._parent.get_batch().get_envs()
+        return [envs[i] for i in self._get_indices(indices)]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_attr(self, attr_name:str, indices=None) -> list:
+        # MPPS-based environments are not rendered
+        if attr_name == 'render_mode':
+            return [None for _ in self._get_indices(indices)]
+
+        return [getattr(env, attr_name) for env in self._get_target_envs(indices)]
+
+
+## -------------------------------------------------------------------------------------------------
+    def set_attr(self, attr_name:str, value, indices=None) -> None:
+        for env in self._get_target_envs(indices):
+            setattr(env, attr_name, value)
+
+
+## -------------------------------------------------------------------------------------------------
+    def env_method(self, method_name:str, *method_args, indices=None, **method_kwargs) -> list:
+        return [getattr(env, method_name)(*method_args, **method_kwargs) for env in self._get_target_envs(indices)]
+
+
+## -------------------------------------------------------------------------------------------------
+    def env_is_wrapped(self, wrapper_class, indices=None) -> list:
+        return [False for _ in self._get_indices(indices)]
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SB3MultiAgentEnv(Log):
+    """
+    This class shares one batched MPPS-based plant between the decentralized agents of its agent
+    partition and provides an SB3-compatible VecEnv for each agent.
+
+    Parameters
+    ----------
+    p_env_cls : type
+        Class of the environment, e.g. BGLP_RLEnv. It must provide an agent partition.
+    p_num_envs : int
+        Number of parallel instances of the plant (n_envs of SB3).
+    p_seed : int
+        Seed of the random generator for the initial fill levels. Default: None.
+    p_timeout : float
+        Maximum time in seconds an agent waits for the other agents at a reset or step. Default:
+        None (no timeout).
+    p_logging :
+        Log level. Default: Log.C_LOG_ALL.
+    p_kwargs : dict
+        Further parameters for the constructor of the environment.
+
+    Attributes
+    ----------
+    C_TYPE : str
+        Type of the class. Default: 'SB3 Multi-Agent Env'.
+    C_NAME : str
+        Name of the class. Default: 'MPPS'.
+    """
+
+    C_TYPE = 'SB3 Multi-Agent Env'
+    C_NAME = 'MPPS'
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_env_cls,
+                 p_num_envs:int,
+                 p_seed=None,
+                 p_timeout:float=None,
+                 p_logging=Log.C_LOG_ALL,
+                 **p_kwargs):
+
+        Log.__init__(self, p_logging=p_logging)
+
+        self._batch = BatchedMPPSEnv(p_env_cls=p_env_cls,
+                                     p_num_envs=p_num_envs,
+                                     p_seed=p_seed,
+                                     p_auto_reset=True,
+                                     p_logging=p_logging,
+                                     **p_kwargs)
+
+        partition = self._batch.get_envs()[0].get_agent_partition()
+        if len(partition) == 0:
+            raise NotImplementedError('Environment ' + p_env_cls.__name__ + ' provides no agent partition')
+
+        num_actions = self._batch.get_envs()[0].get_action_space().get_num_dim()
+        self._actions = np.zeros((p_num_envs, num_actions))
+        self._result = None
+        self._reset_barrier = threading.Barrier(len(partition), action=self._reset_plant, timeout=p_timeout)
+        self._step_barrier = threading.Barrier(len(partition), action=self._step_plant, timeout=p_timeout)
+
+        self._agent_envs = {}
+        for agent_idx, (agent, (state_idx, action_idx)) in enumerate(partition.items()):
+            self._agent_envs[agent] = SB3AgentVecEnv(self, agent, agent_idx, state_idx, action_idx)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_batch(self) -> BatchedMPPSEnv:
+        return self._batch
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent_env(self, p_agent:str) -> SB3AgentVecEnv:
+        return self._agent_envs[p_agent]
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_agent_envs(self) -> dict:
+        return self._agent_envs
+
+
+## -------------------------------------------------------------------------------------------------
+    def _reset_plant(self):
+        self._batch.reset()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _step_plant(self):
+        self._result = self._batch.step(self._actions)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _sync_reset(self) -> np.ndarray:
+        self._reset_barrier.wait()
+        return self._batch.get_observations()
+
+
+## -------------------------------------------------------------------------------------------------
+    def _sync_step(self):
+        self._step_barrier.wait()
+        return self._result
+
+
+## -------------------------------------------------------------------------------------------------
+    def learn(self, p_models:dict, p_total_timesteps:int, **p_kwargs) -> dict:
+        """
+        Trains the SB3 models of all agents at once. Each model is trained in its own thread and the
+        threads are synchronized at each reset and step of the shared plant. Training is finished
+        as soon as the first model has reached its number of time steps.
+
+        Parameters
+        ----------
+        p_models : dict
+            SB3 models in the form {agent_name: model}. The environment of each model is to be set
+            to get_agent_env(agent_name).
+        p_total_timesteps : int
+            Number of time steps per agent and instance of the plant, summed over all instances.
+        p_kwargs : dict
+            Further parameters for method learn() of the models.
+
+        Returns
+        -------
+        dict
+            Trained models in the form {agent_name: model}.
+        """
+
+        errors = []
+
+        def _learn(p_agent, p_model):
+            try:
+                p_model.learn(total_timesteps=p_total_timesteps, **p_kwargs)
+            except threading.BrokenBarrierError:
+                self.log(self.C_LOG_TYPE_W, 'Training of agent', p_agent, 'stopped by the other agents')
+            except Exception as e:
+                errors.append(e)
+            finally:
+                # Releases the remaining agents, since no further joint step is possible
+                self._reset_barrier.abort()
+                self._step_barrier.abort()
+
+        self.log(self.C_LOG_TYPE_I, 'Training of', str(len(p_models)), 'agents started')
+        threads = [threading.Thread(target=_learn, args=(agent, model), name=agent) for agent, model in p_models.items()]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self._reset_barrier.reset()
+        self._step_barrier.reset()
+
+        if len(errors) > 0:
+            raise errors[0]
+
+        self.log(self.C_LOG_TYPE_I, 'Training of', str(len(p_models)), 'agents finished')
+        return p_models
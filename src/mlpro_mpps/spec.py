@@ -0,0 +1,484 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : spec.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Linear-time validation, log level passed to stations and components
+## -- 2026-10-19  1.1.0     SY       Connections of stations, signals derived from the material flow
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.1.0 (2026-10-19)
+
+This module provides declarative specifications of MPPS plants and their compiler.
+
+A plant specification is a plain dictionary, which can also be stored as JSON or YAML file. It
+lists the stations of the plant with their components and the signals, i.e. the material and
+information flows between the sensors, actuators and component states, e.g.
+
+    {'name'     : 'MyPlant',
+     'system'   : 'PS003',
+     'stations' : [{'name'       : 'FeedingStation',
+                    'components' : [{'kind': 'Silo15', 'name': 'SiloB'},
+                                    {'kind': 'VacuumPump1', 'name': 'ActB1'}]}],
+     'signals'  : [['VC1_TransportedMaterial', 'Timer.value', 'Timer.status', 'Silo15_FillLevel.value'],
+                   ...]}
+
+The component kinds are resolved via the ComponentRegistry of the pool within the given production
+system, parameters of the constructors of the components can be given as 'params'. A station can
+alternatively be given by the kind of an existing module class, e.g. {'kind': 'LoadingStation',
+'name': 'LoadingStation'}. Each signal consists of the updated element and its inputs in the form
+'<element>.value' or '<element>.status'. The signals are executed in the given order.
+
+Instead of listing all signals, the stations can declare the material flow of their transport
+components, e.g.
+
+    {'name'        : 'FeedingStation',
+     'components'  : [...],
+     'connections' : [{'transport': 'ActB1', 'from': 'HopperA', 'to': 'SiloB'}, ...]}
+
+where 'from' and 'to' are the names of one or more buffers of any station. The signals of the
+material flow are then derived by SimMPPS._derive_signals(). The given signals replace the derived
+signals of the same elements or are appended, e.g. for transfer functions with further inputs.
+
+The compiler checks the specification for duplicate stations, components and signals, unknown
+elements and sensors or component states that are not updated by any signal. It creates the
+elements and signals of a SimMPPS directly, which are then executed by the environments and the
+batched environment. The plants of the pool are defined by specifications, see
+mlpro_mpps.pool.specs.
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.mpps import SimMPPS, Module
+from mlpro_mpps.pool.registry import ComponentRegistry
+import copy
+import json
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SpecStation(Module):
+    """
+    This class provides a station (module), whose components are given by a plant specification.
+
+    Parameters
+    ----------
+    p_name : str
+        Name of the station.
+    p_components : list
+        Components of the station in the form [{'kind': ..., 'name': ..., 'params': {...}}, ...].
+    p_system : str
+        Production system, in which the component kinds are resolved. Default: None.
+    p_connections : list
+        Material flow of the transport components in the form [{'transport': ..., 'from': ...,
+        'to': ...}, ...]. Default: None.
+    p_id : int
+        Unique id. Default: None
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_kwargs : dict
+        Further keyword arguments
+    """
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_name:str,
+                 p_components:list,
+                 p_system:str=None,
+                 p_connections:list=None,
+                 p_id:int=None,
+                 p_logging=Log.C_LOG_ALL,
+                 **p_kwargs):
+
+        self._spec_components = p_components
+        self._spec_system = p_system
+        self._spec_connections = p_connections or []
+        Module.__init__(self, p_name=p_name, p_id=p_id, p_logging=p_logging, **p_kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_module(self):
+        for comp in self._spec_components:
+            component = ComponentRegistry.create(comp['kind'],
+                                                 p_system=comp.get('system', self._spec_system),
+                                                 p_name=comp['name'],
+                                                 p_logging=self.get_log_level(),
+                                                 **comp.get('params', {}))
+            self._add_component(p_component=component)
+
+        for conn in self._spec_connections:
+            self._add_connection(p_transport=conn['transport'], p_upstream=conn.get('from'), p_downstream=conn.get('to'))
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class PlantSpec:
+    """
+    This class provides a declarative specification of an MPPS plant, see module description.
+
+    Parameters
+    ----------
+    p_spec : dict or PlantSpec
+        Specification. The dictionary is copied.
+
+    Attributes
+    ----------
+    C_INPUTS : dict
+        Supported attributes of the inputs of a signal and the related methods of the elements.
+    """
+
+    C_INPUTS = SimMPPS.C_SIGNAL_INPUTS
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self, p_spec):
+
+        if isinstance(p_spec, PlantSpec):
+            p_spec = p_spec.get_dict()
+        self._spec = copy.deepcopy(p_spec)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_dict(self) -> dict:
+        return self._spec
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_name(self) -> str:
+        return self._spec.get('name', '')
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def load(cls, p_file:str):
+        """
+        Loads a specification from a JSON or YAML file (.yaml, .yml). YAML requires the package
+        PyYAML.
+        """
+
+        with open(p_file) as f:
+            if p_file.endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError('Please install PyYAML to load plant specifications from YAML files')
+                return cls(yaml.safe_load(f))
+            return cls(json.load(f))
+
+
+## -------------------------------------------------------------------------------------------------
+    def save(self, p_file:str):
+        """
+        Stores the specification as JSON or YAML file (.yaml, .yml). YAML requires the package
+        PyYAML.
+        """
+
+        with open(p_file, 'w') as f:
+            if p_file.endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError('Please install PyYAML to store plant specifications as YAML files')
+                yaml.safe_dump(self._spec, f, sort_keys=False)
+            else:
+                json.dump(self._spec, f, indent=2)
+
+
+## -------------------------------------------------------------------------------------------------
+    def validate(self) -> list:
+        """
+        Checks the structure of the specification without creating the plant, i.e. duplicate
+        stations, components and signals, unknown component kinds, the format of the signals and
+        the components of the connections.
+
+        Returns
+        -------
+        list
+            Problems found. An empty list means that the specification is valid.
+        """
+
+        problems = []
+        system = self._spec.get('system')
+        stations = self._spec.get('stations')
+        signals = self._spec.get('signals')
+
+        if not isinstance(stations, list) or len(stations) == 0:
+            problems.append('No stations specified')
+            stations = []
+        connected = isinstance(stations, list) and any(isinstance(station, dict) and station.get('connections')
+                                                       for station in stations)
+        if signals is None and connected:
+            signals = []
+        if not isinstance(signals, list):
+            problems.append('No signals specified')
+            signals = []
+
+        # 1. Stations and components
+        station_names = set()
+        all_comp_names = set()
+        all_known = True
+        for station in stations:
+            name = station.get('name')
+            if name is None:
+                problems.append('Station without name: ' + str(station))
+                continue
+            if name in station_names:
+                problems.append('Duplicate station ' + repr(name))
+            station_names.add(name)
+
+            if 'kind' in station:
+                entries = [(station['kind'], station.get('system', system))]
+                all_known = False
+            elif isinstance(station.get('components'), list):
+                entries = []
+                comp_names = set()
+                for comp in station['components']:
+                    if (comp.get('name') is None) or (comp.get('kind') is None):
+                        problems.append('Component without name or kind in station ' + repr(name) + ': ' + str(comp))
+                        continue
+                    if comp['name'] in comp_names:
+                        problems.append('Duplicate component ' + repr(comp['name']) + ' in station ' + repr(name))
+                    comp_names.add(comp['name'])
+                    entries.append((comp['kind'], comp.get('system', system)))
+                all_comp_names.update(comp_names)
+            else:
+                problems.append('Station ' + repr(name) + ' has neither a kind nor components')
+                continue
+
+            for kind, kind_system in entries:
+                try:
+                    ComponentRegistry.get_module(kind, kind_system)
+                except KeyError as error:
+                    problems.append(str(error.args[0]))
+
+        # 2. Connections
+        transports = set()
+        for station in stations:
+            for conn in station.get('connections', []):
+                if not isinstance(conn, dict) or (conn.get('transport') is None):
+                    problems.append('Connection without transport in station ' + repr(station.get('name')) + ': ' + str(conn))
+                    continue
+                if conn['transport'] in transports:
+                    problems.append('Duplicate connection of transport ' + repr(conn['transport']))
+                transports.add(conn['transport'])
+                if not all_known:
+                    continue
+                for name in [conn['transport'], *self._get_names(conn.get('from')), *self._get_names(conn.get('to'))]:
+                    if name not in all_comp_names:
+                        problems.append('Unknown component ' + repr(name) + ' in connection of ' + repr(conn['transport']))
+
+        # 3. Signals
+        targets = set()
+        for signal in signals:
+            if (not isinstance(signal, (list, tuple))) or (len(signal) < 2):
+                problems.append('Signal without inputs: ' + str(signal))
+                continue
+            if signal[0] in targets:
+                problems.append('Duplicate signal for ' + repr(signal[0]))
+            targets.add(signal[0])
+            for inp in signal[1:]:
+                if inp.rpartition('.')[2] not in self.C_INPUTS:
+                    problems.append('Input ' + repr(inp) + ' of signal ' + repr(signal[0]) + ' must end with '
+                                    + ' or '.join('.' + attr for attr in self.C_INPUTS))
+
+        return problems
+
+
+## -------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _get_names(p_names) -> list:
+        if p_names is None:
+            return []
+        return [p_names] if isinstance(p_names, str) else list(p_names)
+
+
+## -------------------------------------------------------------------------------------------------
+    def compile(self, p_mpps:SimMPPS, p_auto_adjust_names:bool=True):
+        """
+        Creates the elements and signals of the given SimMPPS according to the specification. It is
+        usually called in method _setup_mpps() of the plant.
+
+        Parameters
+        ----------
+        p_mpps : SimMPPS
+            Plant to be set up.
+        p_auto_adjust_names : bool
+            Auto adjusting duplicated names of the elements. Default: True.
+        """
+
+        problems = self.validate()
+        if problems:
+            raise ValueError('Invalid plant specification ' + repr(self.get_name()) + ':\n  ' + '\n  '.join(problems))
+
+        system = self._spec.get('system')
+
+        # 1. Add elements
+        for station in self._spec['stations']:
+            if 'kind' in station:
+                elem = ComponentRegistry.create(station['kind'],
+                                                p_system=station.get('system', system),
+                                                p_name=station['name'],
+                                                p_logging=p_mpps.get_log_level(),
+                                                **station.get('params', {}))
+            else:
+                elem = SpecStation(p_name=station['name'],
+                                   p_components=station['components'],
+                                   p_system=system,
+                                   p_connections=station.get('connections'),
+                                   p_logging=p_mpps.get_log_level())
+            p_mpps._add_element(p_elem=elem)
+
+        # 2. Check duplications of the elements names
+        while not p_mpps._elements_names_checker():
+            if p_auto_adjust_names:
+                p_mpps._elements_names_auto_adjust()
+            else:
+                raise NameError('There are duplications of the elements names. You can just simply set p_auto_adjust_names to True.')
+
+        # 3. Setup which actions connected to which actuators
+        p_mpps._actions_in_order = self._spec.get('actions_in_order', False)
+
+        # 4. Setup input signals for updating sensors or component states values, derived from the
+        #    connections and completed or replaced by the given signals
+        signals = p_mpps._derive_signals(p_signals=self._spec.get('signals', []))
+        problems = p_mpps._add_signals_by_name(signals)
+
+        updated = set(signal[0] for signal in signals)
+        for name in list(p_mpps.get_sensors()) + list(p_mpps.get_component_states()):
+            if name not in updated:
+                problems.append('Missing signal for ' + repr(name))
+
+        if problems:
+            raise ValueError('Invalid plant specification ' + repr(self.get_name()) + ':\n  ' + '\n  '.join(problems))
+
+
+## -------------------------------------------------------------------------------------------------
+    @classmethod
+    def from_plant(cls, p_mpps:SimMPPS, p_system:str=None):
+        """
+        Creates the specification of an existing plant, e.g. for the migration of an imperatively
+        defined plant. If the plant declares connections, only the signals that differ from the
+        derived signals are listed, provided that the derived signals reproduce the plant.
+
+        Parameters
+        ----------
+        p_mpps : SimMPPS
+            Plant.
+        p_system : str
+            Production system of the component kinds. Default: None.
+
+        Returns
+        -------
+        PlantSpec
+            Specification of the plant.
+        """
+
+        stations = []
+        for station in p_mpps.get_elements().get_dims():
+            if isinstance(station, Module):
+                components = [{'kind': type(comp).__name__, 'name': comp.get_name_short()}
+                              for comp in station.get_components().get_dims()]
+                connections = []
+                for transport, upstream, downstream in station.get_connections():
+                    conn = {'transport': transport}
+                    for key, names in [('from', upstream), ('to', downstream)]:
+                        if names:
+                            conn[key] = names[0] if len(names) == 1 else list(names)
+                    connections.append(conn)
+                stations.append({'name': station.get_name_short(), 'components': components})
+                if connections:
+                    stations[-1]['connections'] = connections
+            else:
+                stations.append({'name': station.get_name_short(), 'kind': type(station).__name__})
+
+        owners = {}
+        for elems in [p_mpps.get_sensors(), p_mpps.get_actuators(), p_mpps.get_component_states()]:
+            owners.update({id(elem):name for name, elem in elems.items()})
+        methods = {method:attr for attr, method in cls.C_INPUTS.items()}
+
+        signals = []
+        for sig in p_mpps._signals:
+            signals.append([owners[id(sig[0])]] + [owners[id(fct.__self__)] + '.' + methods[fct.__name__] for fct in sig[1:]])
+
+        derived = {sig[0]:sig for sig in p_mpps._derive_signals()}
+        explicit = [sig for sig in signals if derived.get(sig[0]) != sig]
+        if derived and (p_mpps._derive_signals(p_signals=explicit) == signals):
+            signals = explicit
+        else:
+            for station in stations:
+                station.pop('connections', None)
+
+        spec = {'name': p_mpps.get_name()}
+        if p_system is not None:
+            spec['system'] = p_system
+        spec['stations'] = stations
+        spec['actions_in_order'] = p_mpps._actions_in_order
+        if signals or not derived:
+            spec['signals'] = signals
+
+        return cls(spec)
+
+
+
+
+
+## -------------------------------------------------------------------------------------------------
+## -------------------------------------------------------------------------------------------------
+class SpecMPPS(SimMPPS):
+    """
+    This class provides a SimMPPS, which is set up from a plant specification.
+
+    Parameters
+    ----------
+    p_spec : dict, PlantSpec or str
+        Specification or its JSON/YAML file.
+    p_name : str
+        Name of the plant. Default: None (name of the specification).
+    p_id : int
+        Unique id. Default: None
+    p_logging
+        Log level (see constants of class Log). Default: Log.C_LOG_ALL
+    p_auto_adjust_names : bool
+        Auto adjusting duplicated names of the elements. Default: True
+    p_kwargs : dict
+        Further keyword arguments
+    """
+
+
+## -------------------------------------------------------------------------------------------------
+    def __init__(self,
+                 p_spec,
+                 p_name:str=None,
+                 p_id:int=None,
+                 p_logging=Log.C_LOG_ALL,
+                 p_auto_adjust_names:bool=True,
+                 **p_kwargs):
+
+        self._spec = PlantSpec.load(p_spec) if isinstance(p_spec, str) else PlantSpec(p_spec)
+        SimMPPS.__init__(self,
+                         p_name=p_name or self._spec.get_name(),
+                         p_id=p_id,
+                         p_logging=p_logging,
+                         p_auto_adjust_names=p_auto_adjust_names,
+                         **p_kwargs)
+
+
+## -------------------------------------------------------------------------------------------------
+    def get_spec(self) -> PlantSpec:
+        return self._spec
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup_mpps(self, p_auto_adjust_names=True):
+        self._spec.compile(self, p_auto_adjust_names)
@@ -0,0 +1,101 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_003_declarative_plant_specification.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Export of plants with connections
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This example shows how to set up a plant from a declarative specification.
+
+You will learn:
+
+    1) How to define a plant as a dictionary of stations, components and signals
+
+    2) How to store and load a specification as JSON file and create the plant via SpecMPPS
+
+    3) How the compiler reports incomplete specifications
+
+    4) How to export the specification of an existing plant
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.spec import PlantSpec, SpecMPPS
+from mlpro_mpps.pool.specs.PS002_Liquid_Station import SPEC_LIQUID_STATION
+from mlpro_mpps.pool.mpps.PS002_Liquid_Station import Liquid_Station
+import tempfile
+import os
+
+
+
+if __name__ == "__main__":
+    logging = Log.C_LOG_ALL
+else:
+    logging = Log.C_LOG_NOTHING
+
+
+
+# 1. A small plant with one tank and an inflow pump
+my_spec = {
+    'name'     : 'MyTank',
+    'system'   : 'PS002',
+    'stations' : [
+        {'name'       : 'Station',
+         'components' : [{'kind': 'Tank', 'name': 'Tank'},
+                         {'kind': 'Pump1', 'name': 'Pump_in'}]},
+        ],
+    'signals'  : [
+        ['PC1TransportedMaterial', 'Timer1.value', 'Timer1.status'],
+        ['PC1PowerConsumption', 'Timer1.value', 'Timer1.status'],
+        ['TankOverflow', 'TankFillLevel.value', 'PC1TransportedMaterial.value'],
+        ['TankFillLevel', 'TankFillLevel.value', 'PC1TransportedMaterial.value'],
+        ['TankSensor1', 'TankFillLevel.value'],
+        ['TankSensor2', 'TankFillLevel.value'],
+        ['TankSensor3', 'TankFillLevel.value'],
+        ]
+    }
+
+
+
+# 2. Store and load the specification, create the plant
+with tempfile.TemporaryDirectory() as path:
+    file = os.path.join(path, 'my_tank.json')
+    PlantSpec(my_spec).save(file)
+    plant = SpecMPPS(p_spec=file, p_logging=logging)
+
+print('Sensors:', list(plant.get_sensors().keys()))
+print('Actuators:', list(plant.get_actuators().keys()))
+print('Component states:', list(plant.get_component_states().keys()))
+
+
+
+# 3. Incomplete specifications are rejected
+incomplete = PlantSpec(my_spec).get_dict()
+incomplete['signals'] = incomplete['signals'][:-2] + [['TankSensor2', 'TankLevel.value']]
+try:
+    SpecMPPS(p_spec=incomplete, p_logging=logging)
+    raise RuntimeError('Incomplete specification not detected')
+except ValueError as error:
+    print(error)
+
+
+
+# 4. The plants of the pool are defined by specifications. The specification of an existing plant
+#    can also be exported, e.g. to derive a new plant from it. Their signals are derived from the
+#    connections of the stations.
+liquid_station = Liquid_Station(p_name='Liquid_Station', p_logging=logging)
+exported = PlantSpec.from_plant(liquid_station, p_system='PS002').get_dict()
+
+if exported != SPEC_LIQUID_STATION:
+    raise RuntimeError('The exported specification differs from the Liquid Station')
+print('Liquid Station:', len(exported['stations']), 'station(s),', len(exported['stations'][0]['connections']), 'connections,',
+      len(liquid_station._signals), 'signals')
@@ -0,0 +1,136 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_004_automatic_signal_wiring.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Reporting of invalid signals
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This example shows how the signals of an MPPS are derived from the material flow topology, which
+is declared by the modules.
+
+You will learn:
+
+    1) How modules declare the connections of their transport components
+
+    2) How to derive the signals of the material flow in an MPPS
+
+    3) How invalid signals given by names are reported
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.mpps import SimMPPS, Module
+from mlpro_mpps.pool.mods.PS003_M001_Loading import LoadingStation
+from mlpro_mpps.pool.mods.PS003_M002_Feeding import FeedingStation
+from mlpro_mpps.pool.comps.PS003_C013_VacuumPump3 import VacuumPump3
+from mlpro_mpps.pool.comps.PS003_C023_Inventory import FinishedGoodsInventory
+
+
+
+
+if __name__ == "__main__":
+    logging = Log.C_LOG_ALL
+else:
+    logging = Log.C_LOG_NOTHING
+
+
+
+# 1. Modules declare the connections of their transport components to the buffers of any module,
+#    e.g. the FeedingStation of the pool:
+#    self._add_connection(p_transport='ActB1', p_upstream='HopperA', p_downstream='SiloB')
+class MyDosingStation(Module):
+
+    C_NAME = 'MyDosingStation'
+
+
+    def _setup_module(self):
+        self._add_component(p_component=VacuumPump3(p_name='ActX', p_logging=self.get_log_level()))
+        self._add_component(p_component=FinishedGoodsInventory(p_name='Inventory', p_logging=self.get_log_level()))
+
+        self._add_connection(p_transport='ActX', p_upstream='HopperB', p_downstream='Inventory')
+
+
+
+
+# 2. Signals of an MPPS derived from the connections of its modules
+class MyPlant(SimMPPS):
+
+    C_NAME = 'MyPlant'
+
+
+    def _setup_mpps(self, p_auto_adjust_names=True):
+
+        # 2.1. Add elements
+        self._add_element(p_elem=LoadingStation(p_name='LoadingStation', p_logging=self.get_log_level()))
+        self._add_element(p_elem=FeedingStation(p_name='FeedingStation', p_logging=self.get_log_level()))
+        self._add_element(p_elem=MyDosingStation(p_name='DosingStation', p_logging=self.get_log_level()))
+
+        # 2.2. Check duplications of the elements names
+        while not self._elements_names_checker():
+            if p_auto_adjust_names:
+                self._elements_names_auto_adjust()
+            else:
+                raise NameError('There are duplications of the elements names. You can just simply set p_auto_adjust_names to True.')
+
+        # 2.3. Setup which actions connected to which actuators
+        self._actions_in_order = False
+
+        # 2.4. Derive the signals from the connections. Explicit signals for transfer functions with
+        #      further inputs can be given by parameter p_signals.
+        _problems = self._add_signals_by_name(self._derive_signals())
+        if _problems:
+            raise ValueError('\n'.join(_problems))
+
+
+
+# 3. Derived material flow
+plant = MyPlant(p_name='MyPlant', p_logging=logging)
+
+for transport, upstream, downstream in plant.get_connections():
+    print(transport, ':', upstream, '->', downstream)
+
+for signal in plant._derive_signals():
+    print(signal)
+
+
+
+# 4. One simulation step of 10 seconds with a full loading silo and all actuators switched on
+for name, state in plant.get_component_states().items():
+    state.set_value(state.get_boundaries()[1] if name == 'SiloLoadingFillLevel' else 0)
+
+for actuator in plant.get_actuators().values():
+    actuator.set_value(actuator.get_boundaries()[1])
+
+for sig in plant._signals:
+    if len(sig[1:]) == 1:
+        input = sig[1]()
+    else:
+        input = [fct() for fct in sig[1:]]
+    sig[0].simulate(input, p_range=10)
+
+for name, state in plant.get_component_states().items():
+    print(name, state.get_value())
+
+
+
+# 5. Signals with unknown inputs or unknown attributes of inputs are reported and not added at all
+target, *inputs = plant._derive_signals()[0]
+num_signals = len(plant._signals)
+problems = plant._add_signals_by_name([[target, *inputs, 'NoSuchElement.value'],
+                                       [target, inputs[0].rpartition('.')[0] + '.level', *inputs[1:]]])
+
+assert len(problems) == 2, problems
+assert ('NoSuchElement' in problems[0]) and ("'level'" in problems[1])
+assert len(plant._signals) == num_signals
+
+for problem in problems:
+    print(problem)
@@ -0,0 +1,88 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_005_plant_server.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example shows how a PLC-style controller accesses the simulated BGLP via the plant server as
+if it were real hardware.
+
+You will learn:
+
+    1) How to serve the sensors, states and actuators of a plant on a local socket
+
+    2) How a client reads and writes many channels by a single request
+
+    3) How to subscribe to the changes of channels
+
+"""
+
+
+from mlpro.bf.various import Log
+from mlpro_mpps.remote.plant_server import PlantServer
+from mlpro_mpps.remote.plant_client import PlantClient
+from mlpro_mpps.remote.protocol import FrameProtocol
+import numpy as np
+
+
+
+
+if __name__ == "__main__":
+    logging     = Log.C_LOG_ALL
+    num_cycles  = 100
+else:
+    logging     = Log.C_LOG_NOTHING
+    num_cycles  = 10
+
+
+
+# 1. Serve the BGLP in a background thread. Alternatively, the server runs in a separate process:
+#    python -m mlpro_mpps.remote plant --plant BGLP --address 127.0.0.1:5020
+server = PlantServer.create_for_plant(p_plant='BGLP', p_address=('127.0.0.1', 0), p_logging=logging)
+server.start()
+
+
+
+# 2. The controller resolves the indices of its channels once
+client = PlantClient(server.get_address())
+actuators = client.get_indices(client.get_names(FrameProtocol.C_KIND_ACTUATOR))
+lower = np.array([client.channels[idx][3] for idx in actuators])
+upper = np.array([client.channels[idx][4] for idx in actuators])
+fill_levels = client.get_indices([name for name in client.get_names(FrameProtocol.C_KIND_STATE) if 'FillLevel' in name])
+
+t, values = client.read()
+if logging == Log.C_LOG_ALL:
+    print(len(client.channels), 'channels, e.g.', client.channels[0])
+
+
+
+# 3. Subscription to the fill levels with a deadband of 0.01
+subscription = client.subscribe(p_channels=fill_levels, p_deadband=0.01)
+
+
+
+# 4. Scan cycles: write all actuators, step the plant, receive the changed fill levels
+rng = np.random.default_rng(1)
+num_changes = 0
+
+for cycle in range(num_cycles):
+    status = client.write(actuators, lower + rng.uniform(size=actuators.size) * (upper - lower))
+    t = client.step()
+    for sub_id, t_notify, indices, values in client.get_notifications():
+        num_changes += indices.size
+
+t, values = client.read(fill_levels)
+if logging == Log.C_LOG_ALL:
+    print('Simulated time:', t, 's, changed fill levels:', num_changes)
+    print(dict(zip([client.channels[idx][0] for idx in fill_levels], values.round(3).tolist())))
+
+client.close()
+server.stop()
@@ -0,0 +1,83 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_006_recording_levels.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates the recording levels of the MPPS-based environments at the example of
+the BGLP.
+
+You will learn:
+
+    1) How to record all rows of each episode, only streaming aggregates per episode or nothing.
+
+    2) How to read the aggregates (count, sum, mean, min, max, variance) of an episode.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.data.recorder import EpisodeRecorder, EpisodeSummary
+from mlpro.bf.various import Log
+import numpy as np
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_episodes    = 5
+    num_cycles      = 1000
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_episodes    = 2
+    num_cycles      = 30
+
+
+# 1. Three identical environments with different recording levels
+envs = {level:BGLP_RLEnv(p_logging=Log.C_LOG_NOTHING, recording=level)
+        for level in [BGLP_RLEnv.C_RECORDING_FULL, BGLP_RLEnv.C_RECORDING_SUMMARY, BGLP_RLEnv.C_RECORDING_NONE]}
+
+full = envs[BGLP_RLEnv.C_RECORDING_FULL].data_storing
+summary = envs[BGLP_RLEnv.C_RECORDING_SUMMARY].data_storing
+assert isinstance(full, EpisodeRecorder) and isinstance(summary, EpisodeSummary)
+assert envs[BGLP_RLEnv.C_RECORDING_NONE].data_storing is None
+
+
+# 2. Simulation with the same random actions
+rng = np.random.default_rng(1)
+
+for episode in range(num_episodes):
+    for env in envs.values():
+        env.reset(p_seed=episode)
+
+    for cycle in range(num_cycles):
+        action = rng.uniform(size=len(BGLP_RLEnv.C_AGENT_PARTITION))
+        for env in envs.values():
+            env.process_action_values(action)
+
+
+# 3. The aggregates of each episode match the full recording
+log = Log(p_logging=logging)
+
+for frame_id in summary.frame_id[-num_episodes:]:
+    aggregates = summary.get_summary(frame_id)
+
+    for name in summary.names:
+        values = full.get_values(name, frame_id)
+        assert aggregates[name]['count'] == values.size == num_cycles
+        assert np.isclose(aggregates[name]['sum'], values.sum())
+        assert np.isclose(aggregates[name]['mean'], values.mean())
+        assert np.isclose(aggregates[name]['var'], values.var())
+        assert (aggregates[name]['min'] == values.min()) and (aggregates[name]['max'] == values.max())
+
+    log.log(Log.C_LOG_TYPE_I, 'Episode', frame_id, ': mean power', '%.4f' % aggregates['power']['mean'],
+            ', max overflow', '%.4f' % aggregates['overflow']['max'])
@@ -0,0 +1,90 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_007_binary_recording.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates the bit-packed recording of the binary sensors and actuators of the
+MPPS-based BGLP.
+
+You will learn:
+
+    1) How to record all binary channels of a plant per internal step.
+
+    2) How to query the recorded channels, e.g. the steps, in which any silo sensor was set.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro.bf.various import Log
+import numpy as np
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_episodes    = 5
+    num_cycles      = 2000
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_episodes    = 2
+    num_cycles      = 50
+
+
+# 1. Environment with recording of the binary channels
+env = BGLP_RLEnv(p_logging=Log.C_LOG_NOTHING)
+recorder = env.enable_binary_recording(p_capacity=16)
+plant = env._fct_strans
+elems = {**plant.get_sensors(), **plant.get_actuators()}
+
+assert env.binary_storing is recorder
+assert 'Switch' in recorder.names
+assert all(recorder.is_binary(elems[name]) for name in recorder.names)
+
+
+# 2. Simulation with random actions, the last row always equals the current channel values
+rng = np.random.default_rng(1)
+
+for episode in range(num_episodes):
+    env.reset(p_seed=episode)
+    for cycle in range(num_cycles):
+        env.process_action_values(rng.uniform(size=len(BGLP_RLEnv.C_AGENT_PARTITION)))
+        current = [bool(elems[name].get_value()) for name in recorder.names]
+        assert np.array_equal(recorder.get_bits()[-1], current)
+
+num_steps = recorder.get_num_steps()
+assert num_steps >= num_episodes * num_cycles
+assert sum(recorder.get_packed(frame_id).shape[0] for frame_id in recorder.frame_id) == num_steps
+
+
+# 3. Vectorized queries on the packed bit matrix
+bits = np.unpackbits(recorder.get_packed(), axis=1, count=len(recorder.names)).astype(bool)
+assert np.array_equal(recorder.get_bits(), bits)
+
+for idx, name in enumerate(recorder.names):
+    assert np.array_equal(recorder.get_channel(name), bits[:, idx])
+
+silo_sensors = recorder.get_channel_names('SiloSensor*')
+silo_bits = recorder.get_bits(silo_sensors)
+assert len(silo_sensors) > 0
+assert np.array_equal(recorder.any_set(silo_sensors), silo_bits.any(axis=1))
+assert np.array_equal(recorder.all_set('SiloSensor*'), silo_bits.all(axis=1))
+assert np.array_equal(recorder.count_set(silo_sensors), silo_bits.sum(axis=0))
+
+frame_id = recorder.frame_id[-1]
+assert np.array_equal(recorder.get_channel('Switch', frame_id), bits[num_steps-recorder.get_packed(frame_id).shape[0]:, recorder.names.index('Switch')])
+
+log = Log(p_logging=logging)
+log.log(Log.C_LOG_TYPE_I, 'Binary channels:', str(len(recorder.names)), ', steps:', str(num_steps),
+        ', packed:', str(recorder.get_packed().nbytes), 'bytes')
+log.log(Log.C_LOG_TYPE_I, 'Steps with any silo sensor set:', str(recorder.any_set(silo_sensors).sum()))
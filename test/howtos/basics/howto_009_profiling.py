@@ -0,0 +1,101 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_009_profiling.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates how the signals and transfer functions of the MPPS-based BGLP are
+profiled.
+
+You will learn:
+
+    1) How to attach a profiler to the plant of an environment and read its report.
+
+    2) How to store the profile as a collapsed-stack file for flamegraph tools.
+
+    3) That environments can be cloned and pickled while the profiler is attached.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro.bf.various import Log
+import numpy as np
+import tempfile
+import pickle
+import os
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_cycles      = 1000
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_cycles      = 20
+
+
+# 1. Profiling of the plant while simulating with random actions
+env = BGLP_RLEnv(p_logging=Log.C_LOG_NOTHING)
+profiler = env._fct_strans.enable_profiling()
+assert profiler.is_attached()
+
+rng = np.random.default_rng(1)
+actions = rng.uniform(size=(2*num_cycles, len(BGLP_RLEnv.C_AGENT_PARTITION)))
+env.reset(p_seed=1)
+
+for action in actions[:num_cycles]:
+    env.process_action_values(action)
+
+report = profiler.get_report(p_sort=profiler.C_SORT_TOTAL)
+assert len(report) > 0
+assert all(entry['count'] > 0 for entry in report)
+assert all(report[idx]['total'] >= report[idx+1]['total'] for idx in range(len(report)-1))
+
+log = Log(p_logging=logging)
+log.log(Log.C_LOG_TYPE_I, 'Most expensive callables:\n' + profiler.get_report_str(p_top=10))
+
+
+# 2. Collapsed stacks for flamegraph tools
+with tempfile.TemporaryDirectory() as dest_path:
+    collapsed = os.path.join(dest_path, 'bglp.collapsed')
+    profiler.save_collapsed(collapsed)
+    with open(collapsed) as f:
+        stacks = [line.rsplit(' ', 1) for line in f.read().splitlines()]
+
+assert all(stack.startswith(env._fct_strans.get_name() + ';') and int(value) > 0 for stack, value in stacks)
+
+
+# 3. Cloning and pickling with attached profiler
+clone = env.clone()
+restored = pickle.loads(pickle.dumps(env))
+
+clone_profiler = clone._fct_strans.get_profiler()
+assert clone_profiler is not profiler and clone_profiler.is_attached()
+assert restored._fct_strans.get_profiler() is None
+
+for action in actions[num_cycles:]:
+    for instance in [env, clone, restored]:
+        instance.process_action_values(action)
+
+assert np.array_equal(clone._get_observation(), env._get_observation())
+assert np.array_equal(restored._get_observation(), env._get_observation())
+
+counts = {(entry['element'], entry['callable']):entry['count'] for entry in profiler.get_report()}
+assert counts == {(entry['element'], entry['callable']):entry['count'] for entry in clone_profiler.get_report()}
+
+
+# 4. Detaching the profiler of the clone restores its original callables
+clone._fct_strans.disable_profiling()
+assert not clone_profiler.is_attached() and profiler.is_attached()
+clone.process_action_values(actions[0])
+assert counts == {(entry['element'], entry['callable']):entry['count'] for entry in clone_profiler.get_report()}
@@ -0,0 +1,66 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_010_import_time.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates how the import time of MPPS plants is measured, which is relevant for
+the start-up of headless worker processes.
+
+You will learn:
+
+    1) Which modules a headless worker imports, if it only loads a plant.
+
+    2) How to measure the import time of a plant with the import benchmark.
+
+"""
+
+
+from mlpro_mpps.bench.imports import ImportBenchmark
+from mlpro.bf.various import Log
+import subprocess
+import sys
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_repeats     = 5
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_repeats     = 1
+
+module = 'mlpro_mpps.pool.mpps.PS003_LS_BGLP'
+
+
+# 1. A plant does not import the RL models of MLPro
+script = 'import sys, ' + module + '; print(",".join(sorted(sys.modules)))'
+process = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+imported = process.stdout.strip().splitlines()[-1].split(',')
+
+assert module in imported
+assert 'mlpro.rl.models' not in imported
+assert not any(name.startswith('mlpro.rl.') for name in imported)
+
+
+# 2. Import time of the plant in fresh interpreters
+benchmark = ImportBenchmark(p_modules=[module], p_repeats=num_repeats, p_top=5, p_logging=logging)
+result = benchmark.run()[module]
+
+assert result['cumulative'] > 0
+assert result['within_budget'] == (result['cumulative'] <= ImportBenchmark.C_BUDGET)
+assert len(result['top']) == 5
+assert all(entry['cumulative'] <= result['cumulative'] for entry in result['top'])
+assert all(entry['module'] in imported for entry in result['top'])
+
+for entry in result['top']:
+    benchmark.log(Log.C_LOG_TYPE_I, '   ', entry['module'], '%.3f s' % entry['cumulative'])
@@ -0,0 +1,116 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_011_component_registry.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates the on-demand registry of the components and modules of the pool.
+
+You will learn:
+
+    1) That loading a plant only imports the components it actually uses.
+
+    2) How to look up and instantiate components by their kind names.
+
+    3) How to register user-defined components.
+
+"""
+
+
+from mlpro_mpps.pool.registry import ComponentRegistry
+from mlpro_mpps.mpps import Component
+from mlpro.bf.various import Log
+import subprocess
+import tempfile
+import sys
+import os
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+else:
+    logging         = Log.C_LOG_NOTHING
+
+log = Log(p_logging=logging)
+
+
+# 1. Pool modules, which are imported by a fresh process that loads and builds the plant LS_BGLP
+script = """
+import sys
+from mlpro.bf.various import Log
+from mlpro_mpps.pool.mpps.PS003_LS_BGLP import LS_BGLP
+
+def pool_modules():
+    return sorted(name for name in sys.modules if name.startswith(('mlpro_mpps.pool.comps.', 'mlpro_mpps.pool.mods.')))
+
+before = pool_modules()
+LS_BGLP(p_name='LS_BGLP', p_logging=Log.C_LOG_NOTHING)
+print('#', ','.join(before), '#', ','.join(pool_modules()))
+"""
+
+process = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+before, after = [names.strip().split(',') if names.strip() else [] for names in process.stdout.splitlines()[-1].split('#')[1:]]
+available = set(ComponentRegistry.get_module(kind, 'PS003') for kind in ComponentRegistry.get_kinds('PS003'))
+
+assert before == []
+assert 0 < len(after) < len(available)
+assert set(after) <= available
+assert 'mlpro_mpps.pool.comps.PS003_C026_Hopper_10L_SP' not in after
+
+log.log(Log.C_LOG_TYPE_I, 'LS_BGLP imports', str(len(after)), 'of', str(len(available)), 'pool files of PS003')
+
+
+# 2. Look-up and instantiation by kind names
+assert ComponentRegistry.get_module('Hopper9') == 'mlpro_mpps.pool.comps.PS003_C002_Hopper_9L'
+
+try:
+    ComponentRegistry.get_module('VacuumPump1')
+    raise AssertionError('Ambiguous kind resolved')
+except KeyError:
+    pass
+
+try:
+    ComponentRegistry.get_class('NoSuchComponent')
+    raise AssertionError('Unknown kind resolved')
+except KeyError:
+    pass
+
+pump = ComponentRegistry.create('VacuumPump1', p_system='PS003', p_name='ActB1', p_logging=Log.C_LOG_NOTHING)
+assert type(pump).__module__ == ComponentRegistry.get_module('VacuumPump1', 'PS003')
+assert ComponentRegistry.get_class('VacuumPump1', 'PS003') is type(pump)
+assert ComponentRegistry.get_class('VacuumPump1', 'PS001') is not type(pump)
+
+hopper = ComponentRegistry.create('Hopper9', p_name='Hopper', p_logging=Log.C_LOG_NOTHING)
+sensors = [hopper.get_sensor(p_id=idx).get_name_short() for idx in hopper.get_sensors().get_dim_ids()]
+assert sensors == ['Hopper9_Sensor1']
+
+
+# 3. Registration of a user-defined component, which is imported on first use as well
+with tempfile.TemporaryDirectory() as dest_path:
+    with open(os.path.join(dest_path, 'howto_user_components.py'), 'w') as f:
+        f.write('from mlpro_mpps.mpps import Component\n\n'
+                'class HowtoBuffer(Component):\n'
+                '    def _setup_component(self):\n'
+                '        pass\n')
+
+    sys.path.insert(0, dest_path)
+    try:
+        ComponentRegistry.register('HowtoBuffer', 'howto_user_components', p_system='User')
+        assert 'HowtoBuffer' in ComponentRegistry.get_kinds('User')
+        assert 'howto_user_components' not in sys.modules
+
+        buffer = ComponentRegistry.create('HowtoBuffer', p_system='User', p_name='Buffer', p_logging=Log.C_LOG_NOTHING)
+        assert isinstance(buffer, Component) and ('howto_user_components' in sys.modules)
+    finally:
+        sys.path.remove(dest_path)
+        sys.modules.pop('howto_user_components', None)
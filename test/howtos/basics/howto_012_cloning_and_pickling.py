@@ -0,0 +1,113 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_012_cloning_and_pickling.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Clones must be faster than the construction
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This example demonstrates how MPPS-based environments are copied without their construction, at the
+example of the LS-BGLP-SP game board and the BGLP.
+
+You will learn:
+
+    1) How to take and restore snapshots of the dynamic state of an environment.
+
+    2) How to clone an environment faster than constructing it, e.g. for evaluations.
+
+    3) How to pickle an environment compactly, e.g. to ship it to a worker process.
+
+"""
+
+
+from mlpro_mpps.pool.ml.gt_gameboard.GT002_LS_BGLP_SP import LS_BGLP_SP_GTGameBoard
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro.bf.various import Log
+import numpy as np
+import pickle
+import timeit
+import time
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_cycles      = 200
+    num_repeats     = 20
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_cycles      = 10
+    num_repeats     = 5
+
+log = Log(p_logging=logging)
+
+
+for env_cls in [LS_BGLP_SP_GTGameBoard, BGLP_RLEnv]:
+
+    # 1. Construction and some random actions
+    duration_init = min(timeit.repeat(lambda: env_cls(p_logging=Log.C_LOG_NOTHING, recording='none'),
+                                      number=1, repeat=num_repeats))
+    env = env_cls(p_logging=Log.C_LOG_NOTHING, recording='none')
+
+    rng = np.random.default_rng(1)
+    actions = rng.uniform(size=(3*num_cycles, len(env.get_agent_partition())))
+    env.reset(p_seed=1)
+    for action in actions[:num_cycles]:
+        env.process_action_values(action)
+
+
+    # 2. A snapshot restores the dynamic state of the environment
+    snapshot = env.get_snapshot()
+    obs = env._get_observation()
+    for action in actions[num_cycles:2*num_cycles]:
+        env.process_action_values(action)
+
+    assert not np.array_equal(env._get_observation(), obs)
+    env.set_snapshot(snapshot)
+    assert np.array_equal(env._get_observation(), obs)
+
+
+    # 3. Clones evolve like the original, but independently of it
+    duration_clone = min(timeit.repeat(env.clone, number=1, repeat=num_repeats))
+    assert duration_clone < duration_init
+
+    clone = env.clone()
+    assert clone._fct_strans is not env._fct_strans
+    assert clone.get_action_space() is env.get_action_space()
+
+    for action in actions[num_cycles:2*num_cycles]:
+        clone.process_action_values(action)
+    assert np.array_equal(env._get_observation(), obs)
+
+    for action in actions[num_cycles:2*num_cycles]:
+        env.process_action_values(action)
+    assert np.array_equal(clone._get_observation(), env._get_observation())
+    assert np.array_equal(clone.get_reward_values(), env.get_reward_values())
+
+
+    # 4. Pickled environments only consist of their parameters and a snapshot
+    tstart = time.perf_counter()
+    data = pickle.dumps(env)
+    restored = pickle.loads(data)
+    duration_pickle = time.perf_counter() - tstart
+
+    assert type(restored) is env_cls
+    assert restored.get_plant_parameters() == env.get_plant_parameters()
+    assert np.array_equal(restored._get_observation(), env._get_observation())
+
+    for action in actions[2*num_cycles:]:
+        env.process_action_values(action)
+        restored.process_action_values(action)
+    assert np.array_equal(restored._get_observation(), env._get_observation())
+
+    log.log(Log.C_LOG_TYPE_I, env_cls.__name__ + ': construction', '%.1f ms,' % (duration_init*1e3),
+            'clone', '%.1f ms,' % (duration_clone*1e3), 'pickle round trip', '%.1f ms' % (duration_pickle*1e3),
+            'with', str(len(data)), 'bytes')
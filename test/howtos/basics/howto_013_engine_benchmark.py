@@ -0,0 +1,108 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_013_engine_benchmark.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates how the simulation engines of the MPPS-based pool environments are
+benchmarked.
+
+You will learn:
+
+    1) How to run the engine benchmark for selected plants and numbers of batched instances.
+
+    2) Which results are stored in the JSON file of a benchmark run.
+
+    3) How to run the benchmark from the command line.
+
+"""
+
+
+from mlpro_mpps.bench.engines import EngineBenchmark
+from mlpro.bf.various import Log
+import subprocess
+import tempfile
+import json
+import sys
+import os
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    plants          = None
+    num_steps       = 1000
+    batch_sizes     = [1, 4, 16, 64]
+    batch_steps     = 100
+else:
+    logging         = Log.C_LOG_NOTHING
+    plants          = ['BGLP']
+    num_steps       = 10
+    batch_sizes     = [1, 2]
+    batch_steps     = 5
+
+machine_keys = ['timestamp', 'platform', 'machine', 'processor', 'cpu_count', 'python', 'numpy', 'mlpro', 'mlpro-mpps']
+plant_keys = ['env', 'construction_time', 'reset_time', 'simulate_reaction_steps_per_sec', 'process_action_steps_per_sec', 'batched']
+batched_keys = ['construction_time', 'steps_per_sec', 'transitions_per_sec']
+
+
+def check_plant(p_result:dict, p_batch_sizes:list):
+    assert list(p_result.keys()) == plant_keys
+    assert all(p_result[key] > 0 for key in plant_keys[1:-1])
+    assert list(p_result['batched'].keys()) == [str(num_envs) for num_envs in p_batch_sizes]
+    for num_envs, batched in p_result['batched'].items():
+        assert list(batched.keys()) == batched_keys
+        assert batched['transitions_per_sec'] > 0
+        assert abs(batched['transitions_per_sec'] - int(num_envs) * batched['steps_per_sec']) < 1e-6 * batched['transitions_per_sec']
+
+
+# 1. Benchmark of the engines with a few steps
+benchmark = EngineBenchmark(p_plants=plants,
+                            p_steps=num_steps,
+                            p_repeats=1,
+                            p_batch_sizes=batch_sizes,
+                            p_batch_steps=batch_steps,
+                            p_logging=logging)
+results = benchmark.run()
+
+assert list(results.keys()) == ['machine', 'config', 'plants']
+assert list(results['machine'].keys()) == machine_keys
+assert results['config'] == {'steps': num_steps, 'repeats': 1, 'batch_sizes': batch_sizes, 'batch_steps': batch_steps}
+assert list(results['plants'].keys()) == (plants or list(EngineBenchmark.C_PLANTS.keys()))
+
+for plant, result in results['plants'].items():
+    assert result['env'] == EngineBenchmark.get_env_cls(plant).__name__
+    check_plant(result, batch_sizes)
+
+
+with tempfile.TemporaryDirectory() as dest_path:
+
+    # 2. The results are stored as JSON
+    results_file = os.path.join(dest_path, 'engines.json')
+    EngineBenchmark.save(results, results_file)
+    with open(results_file) as f:
+        assert json.load(f) == results
+
+
+    # 3. Benchmark of a single plant from the command line
+    cli_file = os.path.join(dest_path, 'engines_cli.json')
+    subprocess.run([sys.executable, '-m', 'mlpro_mpps.bench', '--plants', 'BGLP', '--steps', '5', '--repeats', '1',
+                    '--batch-sizes', '1', '2', '--batch-steps', '2', '--quiet', '--output', cli_file],
+                   capture_output=True, text=True, check=True)
+    with open(cli_file) as f:
+        cli_results = json.load(f)
+
+    assert list(cli_results.keys()) == ['machine', 'config', 'plants']
+    assert list(cli_results['plants'].keys()) == ['BGLP']
+    check_plant(cli_results['plants']['BGLP'], [1, 2])
+
+benchmark.log(Log.C_LOG_TYPE_I, 'Benchmark of', str(len(results['plants'])), 'plant(s) completed')
@@ -12,10 +12,12 @@
 ## -- 2023-11-09  1.0.3     SY       Refactoring
 ## -- 2024-02-12  1.0.4     SY       Refactoring due to MLPro-GT-DG
 ## -- 2024-02-21  1.0.5     SY       Shifting and renaming module
+## -- 2026-10-19  1.0.6     SY       Agent spaces spawned from the agent partition of the environment
+## -- 2026-10-19  1.0.7     SY       Agents observe their part of the agent partition by MPPSAgent/MPPSPlayer
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.5 (2024-02-21)
+Ver. 1.0.7 (2026-10-19)
 
 This example demonstrates the implementation of the MPPS-based BGLP as an GT Game Board.
 
@@ -29,6 +31,7 @@ You will learn:
 
 
 from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.agents import MPPSPlayer
 from mlpro.bf.math import *
 from mlpro.gt.dynamicgames import *
 from mlpro.rl.pool.policies.randomgenerator import RandomGenerator
@@ -89,18 +92,16 @@ class MyGame(Game):
     def _setup(self, p_mode, p_ada, p_visualize, p_logging):
         self._env = BGLP_GTGameBoard(p_logging=p_logging)
         self._player = MultiPlayer(p_name='Random Policy', p_ada=1, p_logging=p_logging)
-        state_space = self._env.get_state_space()
-        action_space = self._env.get_action_space()
         
         
         # Player 1
         _name         = 'BELT_CONVEYOR_A'
         _id           = 0
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[0],state_space.get_dim_ids()[1]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[0]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
         self._player.add_player(
-            p_player=Agent(
+            p_player=MPPSPlayer(
+                p_env=self._env,
                 p_policy=_policy,
                 p_envmodel=None,
                 p_name=_name,
@@ -114,11 +115,11 @@ class MyGame(Game):
         # Player 2
         _name         = 'VACUUM_PUMP_B'
         _id           = 1
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[1],state_space.get_dim_ids()[2]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[1]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
         self._player.add_player(
-            p_player=Agent(
+            p_player=MPPSPlayer(
+                p_env=self._env,
                 p_policy=_policy,
                 p_envmodel=None,
                 p_name=_name,
@@ -132,11 +133,11 @@ class MyGame(Game):
         # Player 3
         _name         = 'VIBRATORY_CONVEYOR_B'
         _id           = 2
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[2],state_space.get_dim_ids()[3]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[2]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
         self._player.add_player(
-            p_player=Agent(
+            p_player=MPPSPlayer(
+                p_env=self._env,
                 p_policy=_policy,
                 p_envmodel=None,
                 p_name=_name,
@@ -150,11 +151,11 @@ class MyGame(Game):
         # Player 4
         _name         = 'VACUUM_PUMP_C'
         _id           = 3
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[3],state_space.get_dim_ids()[4]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[3]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
         self._player.add_player(
-            p_player=Agent(
+            p_player=MPPSPlayer(
+                p_env=self._env,
                 p_policy=_policy,
                 p_envmodel=None,
                 p_name=_name,
@@ -168,11 +169,11 @@ class MyGame(Game):
         # Player 5
         _name         = 'ROTARY_FEEDER_C'
         _id           = 4
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[4],state_space.get_dim_ids()[5]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[4]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
         self._player.add_player(
-            p_player=Agent(
+            p_player=MPPSPlayer(
+                p_env=self._env,
                 p_policy=_policy,
                 p_envmodel=None,
                 p_name=_name,
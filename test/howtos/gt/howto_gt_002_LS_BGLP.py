@@ -9,10 +9,12 @@
 ## -- 2023-11-14  1.0.0     SY       Release of first version
 ## -- 2024-02-12  1.0.1     SY       Refactoring due to MLPro-GT-DG
 ## -- 2024-02-21  1.0.2     SY       Shifting and renaming module
+## -- 2026-10-19  1.0.3     SY       Agent spaces spawned from the agent partition of the environment
+## -- 2026-10-19  1.0.4     SY       Agents observe their part of the agent partition by MPPSAgent/MPPSPlayer
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.2 (2024-02-21)
+Ver. 1.0.4 (2026-10-19)
 
 This example demonstrates the implementation of the MPPS-based Larger-Scale BGLP as an GT Game Board.
 
@@ -27,6 +29,7 @@ You will learn:
 
 from mlpro_mpps.pool.ml.gt_gameboard.GT001_LS_BGLP import LS_BGLP_GTGameBoard
 from mlpro_mpps.pool.ml.gt_gameboard.GT002_LS_BGLP_SP import LS_BGLP_SP_GTGameBoard
+from mlpro_mpps.agents import MPPSPlayer
 from mlpro.bf.math import *
 from mlpro.gt.dynamicgames import *
 from mlpro.rl.pool.policies.randomgenerator import RandomGenerator
@@ -48,17 +51,15 @@ class MyGame(Game):
     def _setup(self, p_mode, p_ada, p_visualize, p_logging):
         self._env = LS_BGLP_GTGameBoard(p_logging=p_logging)
         self._player = MultiPlayer(p_name='Random Policy', p_ada=1, p_logging=p_logging)
-        state_space = self._env.get_state_space()
-        action_space = self._env.get_action_space()
 
         for x in range(14):
             _name         = 'ACT_' + str(x+1)
             _id           = x
-            _ospace       = state_space.spawn([state_space.get_dim_ids()[x],state_space.get_dim_ids()[x+1]])
-            _aspace       = action_space.spawn([action_space.get_dim_ids()[x]])
+            _ospace, _aspace = self._env.get_agent_spaces(_name)
             _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
             self._player.add_player(
-                p_player=Agent(
+                p_player=MPPSPlayer(
+                    p_env=self._env,
                     p_policy=_policy,
                     p_envmodel=None,
                     p_name=_name,
@@ -86,17 +87,15 @@ class MyGameSP(Game):
     def _setup(self, p_mode, p_ada, p_visualize, p_logging):
         self._env = LS_BGLP_SP_GTGameBoard(p_logging=p_logging)
         self._player = MultiPlayer(p_name='Random Policy', p_ada=1, p_logging=p_logging)
-        state_space = self._env.get_state_space()
-        action_space = self._env.get_action_space()
 
         for x in range(14):
             _name         = 'ACT_' + str(x+1)
             _id           = x
-            _ospace       = state_space.spawn([state_space.get_dim_ids()[x],state_space.get_dim_ids()[x+1]])
-            _aspace       = action_space.spawn([action_space.get_dim_ids()[x]])
+            _ospace, _aspace = self._env.get_agent_spaces(_name)
             _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
             self._player.add_player(
-                p_player=Agent(
+                p_player=MPPSPlayer(
+                    p_env=self._env,
                     p_policy=_policy,
                     p_envmodel=None,
                     p_name=_name,
@@ -0,0 +1,160 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_gt_003_generated_production_lines.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Agents observe their part of the agent partition by MPPSAgent/MPPSPlayer
+## -- 2026-10-19  1.0.2     SY       Agent partitions of game boards of different sizes
+## -- 2026-10-19  1.0.3     SY       Serial-parallel topology removed
+## -- 2026-10-19  1.0.4     SY       Serial-parallel lines with merging and branching lanes
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.4 (2026-10-19)
+
+This example demonstrates generated production lines of arbitrary length and width and their GT
+Game Board with one agent per actuator.
+
+You will learn:
+
+    1) How to generate serial, parallel and serial-parallel lines from the components of the
+       LS-BGLP.
+
+    2) That the lanes of a serial-parallel line exchange material.
+
+    3) How to set up a GT game with one player per actuator of a generated line.
+
+"""
+
+
+from mlpro_mpps.pool.mpps.PS003_Lines import ProductionLine
+from mlpro_mpps.pool.ml.gt_gameboard.GT003_Lines import ProductionLine_GTGameBoard
+from mlpro_mpps.agents import MPPSPlayer
+from mlpro.bf.math import *
+from mlpro.gt.dynamicgames import *
+from mlpro.rl.pool.policies.randomgenerator import RandomGenerator
+from pathlib import Path
+import numpy as np
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    visualize       = False
+    dest_path       = str(Path.home())
+    length          = 100
+    width           = 4
+    cycle_limit     = 2000
+    cycle_per_ep    = 100
+else:
+    logging         = Log.C_LOG_NOTHING
+    visualize       = False
+    dest_path       = None
+    length          = 4
+    width           = 2
+    cycle_limit     = 10
+    cycle_per_ep    = 5
+
+
+
+# 1. Generated lines with different topologies
+for topology, line_width in [('serial', 1), ('parallel', width), ('serial_parallel', width)]:
+    line = ProductionLine(p_topology=topology, p_length=length, p_width=line_width, p_logging=logging)
+    layout = line.get_layout()
+    print(line.get_name() + ':',
+          line.get_elements().get_num_dim(), 'stations,',
+          sum(len(lane['fill_levels']) for lane in layout), 'buffers,',
+          len(line.get_actuators()), 'actuators,',
+          len(line._signals), 'signals')
+
+# Serial-parallel lines consist of at least two lanes
+try:
+    ProductionLine(p_topology='serial_parallel', p_length=length, p_width=1, p_logging=logging)
+    raise AssertionError('Serial-parallel line with a single lane generated')
+except ValueError:
+    pass
+
+
+
+
+# 2. The agent partition depends on the size of each game board
+small = ProductionLine_GTGameBoard(p_logging=Log.C_LOG_NOTHING, length=2)
+large = ProductionLine_GTGameBoard(p_logging=Log.C_LOG_NOTHING, topology='parallel', length=length, width=width)
+
+assert len(small.get_agent_partition()) == len(small.get_action_space().get_dim_ids()) == 3
+assert len(large.get_agent_partition()) == len(large.get_action_space().get_dim_ids()) == width * (length+1)
+assert ProductionLine_GTGameBoard.C_AGENT_PARTITION == {}
+assert small.get_agent_spaces('ACT_3')[0].get_num_dim() == 1
+
+
+
+
+# 3. The lanes of a serial-parallel line are merged and branched between the stations, so that an
+#    empty second lane is supplied by the first one. Merging actuators observe both upstream buffers.
+board = ProductionLine_GTGameBoard(p_logging=Log.C_LOG_NOTHING, topology='serial_parallel', length=4, width=2)
+layout = board._fct_strans.get_layout()
+num_levels = len(layout[0]['fill_levels'])
+board._reset_episode([1.0] * num_levels + [0.0] * len(layout[1]['fill_levels']))
+
+for cycle in range(5):
+    board.process_action_values(np.ones(len(board.get_agent_partition())))
+
+assert any(len(upstream) == 2 for upstream in layout[0]['upstream'])
+assert max(len(states) for states, _ in board.get_agent_partition().values()) == 3
+assert np.any(board._get_observation()[num_levels+1:] > 0)
+assert board.get_inventory_levels()[1] > 0
+
+
+
+
+# 4. GT game with one player per actuator of a serial-parallel line
+class MyGame(Game):
+
+    C_NAME = 'MyGame'
+
+
+## -------------------------------------------------------------------------------------------------
+    def _setup(self, p_mode, p_ada, p_visualize, p_logging):
+        self._env = ProductionLine_GTGameBoard(p_logging=p_logging,
+                                               topology='serial_parallel',
+                                               length=length,
+                                               width=width)
+        self._player = MultiPlayer(p_name='Random Policy', p_ada=1, p_logging=p_logging)
+
+        for _id, _name in enumerate(self._env.get_agent_partition()):
+            _ospace, _aspace = self._env.get_agent_spaces(_name)
+            _policy       = RandomGenerator(p_observation_space=_ospace, p_action_space=_aspace, p_buffer_size=1, p_ada=1, p_logging=False)
+            self._player.add_player(
+                p_player=MPPSPlayer(
+                    p_env=self._env,
+                    p_policy=_policy,
+                    p_envmodel=None,
+                    p_name=_name,
+                    p_id=_id,
+                    p_ada=True,
+                    p_logging=False),
+                p_weight=1.0
+                )
+
+        return self._player
+
+
+
+training = GTTraining(
+    p_game_cls=MyGame,
+    p_cycle_limit=cycle_limit,
+    p_cycles_per_epi_limit=cycle_per_ep,
+    p_collect_states=True,
+    p_collect_actions=True,
+    p_collect_rewards=True,
+    p_collect_training=True,
+    p_visualize=visualize,
+    p_path=dest_path,
+    p_logging=logging)
+
+training.run()
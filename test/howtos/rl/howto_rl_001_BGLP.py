@@ -15,10 +15,12 @@
 ## -- 2023-11-14  1.0.6     SY       Refactoring
 ## -- 2024-02-21  1.0.7     SY       Shifting and renaming module
 ## -- 2024-04-23  1.0.8     SY       Refactoring due to MLPro-Int-SB3
+## -- 2026-10-19  1.0.9     SY       Agent spaces spawned from the agent partition of the environment
+## -- 2026-10-19  1.0.10    SY       Agents observe their part of the agent partition by MPPSAgent/MPPSPlayer
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.8 (2024-04-23)
+Ver. 1.0.10 (2026-10-19)
 
 This example demonstrates the implementation of the MPPS-based BGLP as an RL Environment.
 
@@ -34,6 +36,7 @@ You will learn:
 
 
 from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.agents import MPPSAgent
 from mlpro.bf.math import *
 from mlpro.rl.models import *
 from stable_baselines3 import PPO, A2C
@@ -57,8 +60,6 @@ class MyBGLP(RLScenario):
     def _setup(self, p_mode, p_ada, p_visualize, p_logging):
         self._env = BGLP_RLEnv(p_logging=p_logging)
         self._agent = MultiAgent(p_name='SB3 Policy', p_ada=1, p_logging=p_logging)
-        state_space = self._env.get_state_space()
-        action_space = self._env.get_action_space()
         
         policy_kwargs = dict(activation_fn=torch.nn.ReLU,
                               net_arch=[dict(pi=[128, 128], vf=[128, 128])])
@@ -75,8 +76,7 @@ class MyBGLP(RLScenario):
         # Agent 1
         _name         = 'BELT_CONVEYOR_A'
         _id           = 0
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[0],state_space.get_dim_ids()[1]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[0]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         _policy_wrapped = WrPolicySB32MLPro(
             p_sb3_policy=deepcopy(policy_sb3),
@@ -88,7 +88,8 @@ class MyBGLP(RLScenario):
             p_logging=p_logging)
         
         self._agent.add_agent(
-            p_agent=Agent(
+            p_agent=MPPSAgent(
+                p_env=self._env,
                 p_policy=_policy_wrapped,
                 p_envmodel=None,
                 p_name=_name,
@@ -102,8 +103,7 @@ class MyBGLP(RLScenario):
         # Agent 2
         _name         = 'VACUUM_PUMP_B'
         _id           = 1
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[1],state_space.get_dim_ids()[2]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[1]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         _policy_wrapped = WrPolicySB32MLPro(
             p_sb3_policy=deepcopy(policy_sb3),
@@ -115,7 +115,8 @@ class MyBGLP(RLScenario):
             p_logging=p_logging)
         
         self._agent.add_agent(
-            p_agent=Agent(
+            p_agent=MPPSAgent(
+                p_env=self._env,
                 p_policy=_policy_wrapped,
                 p_envmodel=None,
                 p_name=_name,
@@ -129,8 +130,7 @@ class MyBGLP(RLScenario):
         # Agent 3
         _name         = 'VIBRATORY_CONVEYOR_B'
         _id           = 2
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[2],state_space.get_dim_ids()[3]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[2]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         _policy_wrapped = WrPolicySB32MLPro(
             p_sb3_policy=deepcopy(policy_sb3),
@@ -142,7 +142,8 @@ class MyBGLP(RLScenario):
             p_logging=p_logging)
         
         self._agent.add_agent(
-            p_agent=Agent(
+            p_agent=MPPSAgent(
+                p_env=self._env,
                 p_policy=_policy_wrapped,
                 p_envmodel=None,
                 p_name=_name,
@@ -156,8 +157,7 @@ class MyBGLP(RLScenario):
         # Agent 4
         _name         = 'VACUUM_PUMP_C'
         _id           = 3
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[3],state_space.get_dim_ids()[4]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[3]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         _policy_wrapped = WrPolicySB32MLPro(
             p_sb3_policy=deepcopy(policy_sb3),
@@ -169,7 +169,8 @@ class MyBGLP(RLScenario):
             p_logging=p_logging)
         
         self._agent.add_agent(
-            p_agent=Agent(
+            p_agent=MPPSAgent(
+                p_env=self._env,
                 p_policy=_policy_wrapped,
                 p_envmodel=None,
                 p_name=_name,
@@ -183,8 +184,7 @@ class MyBGLP(RLScenario):
         # Agent 5
         _name         = 'ROTARY_FEEDER_C'
         _id           = 4
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[4],state_space.get_dim_ids()[5]])
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[4]])
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         _policy_wrapped = WrPolicySB32MLPro(
             p_sb3_policy=deepcopy(policy_sb3),
@@ -196,7 +196,8 @@ class MyBGLP(RLScenario):
             p_logging=p_logging)
         
         self._agent.add_agent(
-            p_agent=Agent(
+            p_agent=MPPSAgent(
+                p_env=self._env,
                 p_policy=_policy_wrapped,
                 p_envmodel=None,
                 p_name=_name,
@@ -10,10 +10,12 @@
 ## -- 2023-04-13  1.0.1     SY       Code Cleaning
 ## -- 2024-02-21  1.0.2     SY       Shifting and renaming module
 ## -- 2024-04-23  1.0.3     SY       Refactoring due to MLPro-Int-SB3
+## -- 2026-10-19  1.0.4     SY       Agent spaces spawned from the agent partition of the environment
+## -- 2026-10-19  1.0.5     SY       Agents observe their part of the agent partition by MPPSAgent/MPPSPlayer
 ## -------------------------------------------------------------------------------------------------
 
 """
-Ver. 1.0.3 (2024-04-23)
+Ver. 1.0.5 (2026-10-19)
 
 This example demonstrates the implementation of the MPPS-based Liquid Station as an RL Environment.
 
@@ -29,6 +31,7 @@ You will learn:
 
 
 from mlpro_mpps.pool.ml.rl_environment.RL002_LS import LS_RLEnv
+from mlpro_mpps.agents import MPPSAgent
 from mlpro.bf.math import *
 from mlpro.rl.models import *
 from stable_baselines3 import PPO, A2C
@@ -51,10 +54,8 @@ class RL_Liquid_Station_Scenario(RLScenario):
         # 1.1.1 Setup Multi-Agent Environment (consisting of 3 OpenAI Gym Cartpole envs)
         self._env = LS_RLEnv(p_logging=p_logging)
         
-        # 1.1.2 Get state and action space
-        state_space = self._env.get_state_space()
-        action_space = self._env.get_action_space()
-        
+        # 1.1.2 State and action spaces of the agents are spawned from the agent partition of the
+        # environment, see LS_RLEnv.C_AGENT_PARTITION
 
         # 1.2 Setup Multi-Agent 
         # 1.2.1 Create empty Multi-Agent
@@ -80,8 +81,7 @@ class RL_Liquid_Station_Scenario(RLScenario):
         # Agent 1 - Pump 1 activation
         _name         = 'Agent - Pump 1'
         _id           = 0
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[0]])       # get fill level tank
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[0]])     # get pump 1 activation
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         # wrappe SB3 policy for Agemt 1
         _policy_wrapped = WrPolicySB32MLPro(p_sb3_policy=deepcopy(policy_sb3),
@@ -94,12 +94,13 @@ class RL_Liquid_Station_Scenario(RLScenario):
                                             )
         
         # add Agent 1
-        self._agent.add_agent(p_agent=Agent(p_policy=_policy_wrapped,
-                                            p_envmodel=None,
-                                            p_name=_name,
-                                            p_id=_id,
-                                            p_ada=True,
-                                            p_logging=True),
+        self._agent.add_agent(p_agent=MPPSAgent(p_env=self._env,
+                                                p_policy=_policy_wrapped,
+                                                p_envmodel=None,
+                                                p_name=_name,
+                                                p_id=_id,
+                                                p_ada=True,
+                                                p_logging=True),
                                             p_weight=1.0
                                             )
         
@@ -107,8 +108,7 @@ class RL_Liquid_Station_Scenario(RLScenario):
         # Agent 2 - Pump 2 activation
         _name         = 'Agent - Pump 2'
         _id           = 1
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[0]])       # get fill level tank
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[1]])     # get pump 2 activation
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         # wrappe SB3 policy for Agemt 2
         _policy_wrapped = WrPolicySB32MLPro(p_sb3_policy=deepcopy(policy_sb3),
@@ -121,7 +121,8 @@ class RL_Liquid_Station_Scenario(RLScenario):
                                             )
         
         # add Agent 2
-        self._agent.add_agent(p_agent=Agent(
+        self._agent.add_agent(p_agent=MPPSAgent(
+                              p_env=self._env,
                               p_policy=_policy_wrapped,
                               p_envmodel=None,
                               p_name=_name,
@@ -135,8 +136,7 @@ class RL_Liquid_Station_Scenario(RLScenario):
         # Agent 3 - Pump 3 activation
         _name         = 'Agent - Pump 3'
         _id           = 2
-        _ospace       = state_space.spawn([state_space.get_dim_ids()[0]])       # get fill level tank
-        _aspace       = action_space.spawn([action_space.get_dim_ids()[2]])     # get pump 3 activation
+        _ospace, _aspace = self._env.get_agent_spaces(_name)
         
         # wrappe SB3 policy for Agemt 3
         _policy_wrapped = WrPolicySB32MLPro(p_sb3_policy=deepcopy(policy_sb3),
@@ -149,7 +149,8 @@ class RL_Liquid_Station_Scenario(RLScenario):
                                             )
         
         # add Agent 3
-        self._agent.add_agent(p_agent=Agent(
+        self._agent.add_agent(p_agent=MPPSAgent(
+                              p_env=self._env,
                               p_policy=_policy_wrapped,
                               p_envmodel=None,
                               p_name=_name,
@@ -0,0 +1,83 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_rl_003_batched_rollouts_BGLP.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Step with an empty mask
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This example demonstrates batched rollouts of a number of MPPS-based BGLP instances.
+
+You will learn:
+
+    1) How to set up a batched environment from a built-in MPPS-based RL environment.
+
+    2) How to reset a subset of the instances by a boolean mask.
+
+    3) How to use the termination and truncation masks with automatic resets.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.batch import BatchedMPPSEnv
+from mlpro.bf.various import Log
+import numpy as np
+
+
+
+
+if __name__ == "__main__":
+    logging     = Log.C_LOG_ALL
+    num_envs    = 64
+    num_steps   = 1000
+else:
+    logging     = Log.C_LOG_NOTHING
+    num_envs    = 4
+    num_steps   = 10
+
+
+# 1. Set up the batched environment
+batch = BatchedMPPSEnv(p_env_cls=BGLP_RLEnv,
+                       p_num_envs=num_envs,
+                       p_seed=1,
+                       p_logging=logging,
+                       prod_scenario='batch',
+                       prod_target=1.0,
+                       cycle_limit=num_steps//2)
+obs = batch.reset()
+
+
+# 2. Reset every second instance only
+mask = np.zeros(num_envs, dtype=bool)
+mask[::2] = True
+obs = batch.reset(p_mask=mask)
+
+
+# 3. A step with an empty mask leaves all instances untouched
+num_actions = len(BGLP_RLEnv.C_AGENT_PARTITION)
+obs_before = obs.copy()
+obs, rewards, terminated, truncated = batch.step(np.zeros((num_envs, num_actions)), p_mask=np.zeros(num_envs, dtype=bool))
+assert rewards.shape == (num_envs, num_actions)
+assert np.array_equal(obs, obs_before) and not (terminated.any() or truncated.any())
+
+
+# 4. Run random actions, finished instances are reset automatically
+rng = np.random.default_rng(2)
+num_terminated = 0
+num_truncated = 0
+
+for step in range(num_steps):
+    actions = rng.uniform(size=(num_envs, num_actions))
+    obs, rewards, terminated, truncated = batch.step(actions)
+    num_terminated += terminated.sum()
+    num_truncated += truncated.sum()
+
+batch.log(Log.C_LOG_TYPE_I, 'Terminated episodes:', str(num_terminated), ', truncated episodes:', str(num_truncated))
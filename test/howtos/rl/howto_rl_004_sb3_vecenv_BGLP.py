@@ -0,0 +1,71 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_rl_004_sb3_vecenv_BGLP.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates the training of decentralized SB3 agents on a shared batched BGLP plant.
+
+You will learn:
+    
+    1) How to set up a VecEnv for each decentralized agent of the MPPS-based BGLP.
+    
+    2) How to train the SB3 models of all agents with a number of parallel instances of the plant.
+    
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.sb3 import SB3MultiAgentEnv
+from mlpro.bf.various import Log
+from stable_baselines3 import PPO
+import torch
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_envs        = 32
+    n_steps         = 100
+    total_timesteps = 320000
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_envs        = 4
+    n_steps         = 8
+    total_timesteps = 32
+
+
+# 1. Set up the shared plant and a VecEnv for each agent of the partition
+env = SB3MultiAgentEnv(p_env_cls=BGLP_RLEnv,
+                       p_num_envs=num_envs,
+                       p_seed=1,
+                       p_logging=logging,
+                       cycle_limit=1000)
+
+
+# 2. Set up an SB3 model for each agent
+policy_kwargs = dict(activation_fn=torch.nn.ReLU,
+                     net_arch=dict(pi=[128, 128], vf=[128, 128]))
+
+models = {}
+for agent, agent_env in env.get_agent_envs().items():
+    models[agent] = PPO(policy="MlpPolicy",
+                        env=agent_env,
+                        n_steps=n_steps,
+                        batch_size=n_steps*num_envs//4,
+                        policy_kwargs=policy_kwargs,
+                        device="cpu",
+                        seed=2)
+
+
+# 3. Train all agents at once, the actions of all agents are joined into a single plant step
+env.learn(p_models=models, p_total_timesteps=total_timesteps)
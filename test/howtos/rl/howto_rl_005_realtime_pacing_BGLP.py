@@ -0,0 +1,70 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_rl_005_realtime_pacing_BGLP.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates the soft real-time runner with an external controller, which is
+simulated by a random policy.
+
+You will learn:
+
+    1) How to run an MPPS-based environment in step with the wall clock at a scaled speed.
+
+    2) How a controller exchanges actions and observations with the running plant.
+
+    3) How to evaluate the lateness and the missed deadlines of the run.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.realtime import RealTimeRunner
+from mlpro.bf.various import Log
+import numpy as np
+
+
+
+
+if __name__ == "__main__":
+    logging     = Log.C_LOG_ALL
+    speed       = 100
+    num_steps   = 200
+else:
+    logging     = Log.C_LOG_NOTHING
+    speed       = 1000
+    num_steps   = 20
+
+
+# 1. Set up the environment and the runner. A step of the BGLP takes 10 s of simulated time, i.e.
+#    the period of a step is 10 s / speed.
+env = BGLP_RLEnv(p_logging=Log.C_LOG_NOTHING)
+runner = RealTimeRunner(p_env=env, p_speed=speed, p_logging=logging)
+
+
+# 2. The controller waits for each observation and answers with a new action, while the runner
+#    keeps its schedule independently of the controller
+rng = np.random.default_rng(1)
+runner.start(p_steps=num_steps, p_seed=1)
+step = 0
+
+while runner.is_running():
+    step, obs, rewards = runner.wait_observation(p_step=step, p_timeout=1.0)
+    runner.set_action(rng.uniform(size=len(BGLP_RLEnv.C_AGENT_PARTITION)))
+
+stats = runner.join()
+
+
+# 3. Timing statistics
+runner.log(Log.C_LOG_TYPE_I, 'Period: %.2f ms, lateness p50/p99/max: %.3f/%.3f/%.3f ms' %
+           (stats['period']*1e3, stats['lateness_p50']*1e3, stats['lateness_p99']*1e3, stats['lateness_max']*1e3))
+runner.log(Log.C_LOG_TYPE_I, 'Missed deadlines:', str(stats['missed_deadlines']),
+           ', achieved speed: %.1f' % stats['speed'])
@@ -0,0 +1,102 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_rl_006_asyncio_BGLP.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates how BGLP environments are driven from asyncio-based code.
+
+You will learn:
+
+    1) How to await the reset and the steps of a single environment.
+
+    2) How to interleave the steps of many plant instances with I/O on one event loop by the
+       coroutine-friendly batch stepper.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.batch import BatchedMPPSEnv
+from mlpro_mpps.aio import AsyncBatchStepper
+from mlpro.bf.various import Log
+import numpy as np
+import asyncio
+
+
+
+
+if __name__ == "__main__":
+    logging     = Log.C_LOG_ALL
+    num_envs    = 200
+    num_steps   = 50
+else:
+    logging     = Log.C_LOG_NOTHING
+    num_envs    = 8
+    num_steps   = 5
+
+num_actions = len(BGLP_RLEnv.C_AGENT_PARTITION)
+
+
+
+# 1. A single environment, whose steps run in the default executor of the event loop, while a
+#    further coroutine stays responsive
+async def single_env():
+    env = BGLP_RLEnv(p_logging=Log.C_LOG_NOTHING)
+    rng = np.random.default_rng(1)
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    task = asyncio.create_task(heartbeat())
+    obs = await env.reset_async(p_seed=1)
+    for _ in range(num_steps):
+        obs, rewards, terminated, truncated = await env.step_async(rng.uniform(size=num_actions))
+    task.cancel()
+    return obs, ticks
+
+
+obs, ticks = asyncio.run(single_env())
+if logging == Log.C_LOG_ALL:
+    print('Single environment: final observation', obs, ', heartbeat ticks:', ticks)
+
+
+
+# 2. One coroutine per plant instance, e.g. a PLC stand-in with some I/O latency. The batch stepper
+#    collects the concurrent step requests and processes them by masked batched steps.
+batch = BatchedMPPSEnv(p_env_cls=BGLP_RLEnv, p_num_envs=num_envs, p_seed=1)
+stepper = AsyncBatchStepper(p_batch=batch, p_max_wait=0.002, p_logging=logging)
+
+
+async def plc(p_index:int):
+    rng = np.random.default_rng(p_index)
+    await stepper.reset(p_index)
+    reward_sum = 0.0
+    for _ in range(num_steps):
+        await asyncio.sleep(rng.uniform(0, 0.001))
+        obs, rewards, terminated, truncated = await stepper.step(p_index, rng.uniform(size=num_actions))
+        reward_sum += rewards.sum()
+    return reward_sum
+
+
+async def plant_fleet():
+    return await asyncio.gather(*[plc(i) for i in range(num_envs)])
+
+
+reward_sums = asyncio.run(plant_fleet())
+stats = stepper.get_statistics()
+stepper.log(Log.C_LOG_TYPE_I, str(stats['steps']), 'steps in', str(stats['batches']),
+            'batches, mean batch size: %.1f' % stats['mean_batch_size'])
+stepper.log(Log.C_LOG_TYPE_I, 'Mean reward sum per instance: %.3f' % np.mean(reward_sums))
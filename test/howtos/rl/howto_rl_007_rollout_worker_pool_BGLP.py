@@ -0,0 +1,122 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_rl_007_rollout_worker_pool_BGLP.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Late responses after a failed health check and a server error
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This example demonstrates how the rollouts of the BGLP are distributed over several rollout
+servers, which are presented to the learner as one large batched environment.
+
+You will learn:
+
+    1) How to start rollout servers as local processes and connect a worker pool to them.
+
+    2) How to step all instances of all servers by one call.
+
+    3) How to monitor the health and the throughput of the workers.
+
+    4) That late responses after a failed health check or a server error do not disturb the
+       following steps.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.remote.rollout_pool import RolloutWorkerPool
+from mlpro_mpps.remote.protocol import FrameProtocol
+from mlpro.bf.various import Log
+import numpy as np
+
+
+
+
+if __name__ == "__main__":
+    logging     = Log.C_LOG_ALL
+    num_workers = 3
+    num_envs    = 8
+    num_steps   = 100
+else:
+    logging     = Log.C_LOG_NOTHING
+    num_workers = 2
+    num_envs    = 2
+    num_steps   = 5
+
+num_actions = len(BGLP_RLEnv.C_AGENT_PARTITION)
+
+
+
+# 1. Start the rollout servers as local processes. On further hosts, the servers are started by
+#        python -m mlpro_mpps.remote rollout --plant BGLP --num-envs 8 --address 0.0.0.0:5030
+#    and the pool is created by RolloutWorkerPool(p_addresses=['host1:5030', 'host2:5030', ...]).
+pool = RolloutWorkerPool.spawn_local(p_env_cls=BGLP_RLEnv,
+                                     p_num_workers=num_workers,
+                                     p_num_envs=num_envs,
+                                     p_seed=1,
+                                     p_logging=logging)
+
+
+
+# 2. Rollouts with random actions over all instances of all servers
+rng = np.random.default_rng(1)
+actions = rng.uniform(size=(2*num_steps, pool.get_num_envs(), num_actions))
+obs = pool.reset()
+returns = np.zeros(pool.get_num_envs())
+
+for step in range(num_steps):
+    obs, rewards, terminated, truncated = pool.step(actions[step])
+    returns += rewards.sum(axis=1)
+
+
+
+# 3. Health and throughput of the workers
+health = pool.check_health()
+stats = pool.get_statistics()
+
+if logging == Log.C_LOG_ALL:
+    print('Observations:', obs.shape, 'mean return per instance:', returns.mean().round(3))
+    print('Instance steps per second:', round(stats['steps_per_sec'], 1))
+    for worker, ping in zip(stats['workers'], health):
+        print(worker['address'], 'healthy:', ping['healthy'],
+              'steps/s:', round(worker['steps_per_sec'], 1),
+              'mean latency:', round(worker['latency_mean'] * 1000, 2), 'ms',
+              'transport overhead:', round(worker['overhead'] * 100, 1), '%')
+
+
+
+
+# 4. A health check without waiting time leaves its responses unread and a malformed request lets
+#    a server answer with an error. Both late responses are discarded by the following steps, which
+#    match the steps of a pool of identical servers without these incidents.
+health = pool.check_health(p_timeout=0.0)
+pool.get_workers()[0].send(FrameProtocol.C_OP_STEP_BATCH, b'\x00')
+
+with RolloutWorkerPool.spawn_local(p_env_cls=BGLP_RLEnv,
+                                   p_num_workers=num_workers,
+                                   p_num_envs=num_envs,
+                                   p_seed=1,
+                                   p_logging=Log.C_LOG_NOTHING) as pool_ref:
+    pool_ref.reset()
+    for step in range(2*num_steps):
+        obs_ref, rewards_ref, _, _ = pool_ref.step(actions[step])
+
+for step in range(num_steps, 2*num_steps):
+    obs, rewards, terminated, truncated = pool.step(actions[step])
+
+assert np.array_equal(obs, obs_ref) and np.array_equal(rewards, rewards_ref)
+assert all(ping['healthy'] for ping in pool.check_health())
+
+stats = pool.get_statistics()['workers']
+assert stats[0]['errors'] == 1
+for idx, (worker, ping) in enumerate(zip(stats, health)):
+    assert worker['discarded'] == (0 if ping['healthy'] else 1) + (1 if idx == 0 else 0)
+
+pool.close()
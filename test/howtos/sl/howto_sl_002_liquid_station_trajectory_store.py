@@ -0,0 +1,78 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_sl_002_liquid_station_trajectory_store.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates the generation of a memory-mapped dataset from the MPPS-based Liquid
+Laboratory Station and its usage as a torch Dataset of sliding windows.
+
+You will learn:
+    
+    1) How to store states, actions and rewards of an MPPS environment in a trajectory store.
+    
+    2) How to serve sliding windows of a trajectory store to a torch DataLoader without copies.
+    
+"""
+
+
+from mlpro_mpps.pool.ml.sl_environment.SL001_LS import LS_SLEnv
+from mlpro_mpps.data.trajectories import TrajectoryStore, TrajectoryWindowDataset
+from mlpro.bf.various import Log
+from torch.utils.data import DataLoader
+from pathlib import Path
+import numpy as np
+import tempfile
+import os
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    dest_path       = str(Path.home()) + os.sep + 'ls_trajectories'
+    num_episodes    = 10
+    num_cycles      = 10000
+    seq_len         = 10
+else:
+    logging         = Log.C_LOG_NOTHING
+    dest_path       = tempfile.mkdtemp()
+    num_episodes    = 2
+    num_cycles      = 50
+    seq_len         = 5
+
+
+# 1. Generate the dataset with random actions
+env = LS_SLEnv(p_logging=logging)
+store = TrajectoryStore(p_path=dest_path,
+                        p_dims={'states'  : env.get_state_space().get_num_dim(),
+                                'actions' : env.get_action_space().get_num_dim(),
+                                'rewards' : 3})         # transport, overflow, power
+rng = np.random.default_rng(1)
+
+for episode in range(num_episodes):
+    env.reset(p_seed=episode)
+    store.add_episode()
+
+    for cycle in range(num_cycles):
+        action = rng.uniform(size=env.get_action_space().get_num_dim())
+        env.process_action_values(action)
+        store.append(env.get_state().get_values(), action, env.get_reward_values())
+
+store.close()
+
+
+# 2. Open the dataset and iterate over sliding windows
+dataset = TrajectoryWindowDataset(p_store=dest_path, p_seq_len=seq_len)
+env.log(Log.C_LOG_TYPE_I, 'Number of windows:', str(len(dataset)))
+
+for states, actions, rewards in DataLoader(dataset, batch_size=32, shuffle=True):
+    pass
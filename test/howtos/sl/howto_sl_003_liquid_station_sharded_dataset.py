@@ -0,0 +1,96 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_sl_003_liquid_station_sharded_dataset.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Temporary directory removed after the run, checks of the manifest
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.1 (2026-10-19)
+
+This example demonstrates the parallel generation of a sharded dataset from the MPPS-based Liquid
+Laboratory Station.
+
+You will learn:
+    
+    1) How to generate a dataset with several worker processes and deterministic seed streams.
+    
+    2) How to read the manifest and the shards of the dataset.
+    
+"""
+
+
+from mlpro_mpps.pool.ml.sl_environment.SL001_LS import LS_SLEnv
+from mlpro_mpps.data.generator import ShardedDataGenerator
+from mlpro_mpps.data.actions import HoldActionGenerator
+from mlpro_mpps.data.trajectories import TrajectoryStore
+from mlpro.bf.various import Log
+from pathlib import Path
+import contextlib
+import tempfile
+import os
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    dest_dir        = contextlib.nullcontext(str(Path.home()) + os.sep + 'ls_dataset')
+    num_workers     = None
+    num_shards      = 16
+    num_episodes    = 10
+    num_cycles      = 10000
+else:
+    logging         = Log.C_LOG_NOTHING
+    dest_dir        = tempfile.TemporaryDirectory()
+    num_workers     = 2
+    num_shards      = 4
+    num_episodes    = 2
+    num_cycles      = 50
+
+
+with dest_dir as dest_path:
+
+    # 1. Generate the dataset
+    generator = ShardedDataGenerator(p_env_cls=LS_SLEnv,
+                                     p_path=dest_path,
+                                     p_num_shards=num_shards,
+                                     p_num_episodes=num_episodes,
+                                     p_num_cycles=num_cycles,
+                                     p_num_workers=num_workers,
+                                     p_seed=1,
+                                     p_env_kwargs={'t_set':10.0, 'action_repeat':2},
+                                     p_action_cls=HoldActionGenerator,
+                                     p_action_kwargs={'p_max_hold':20},
+                                     p_logging=logging)
+    generator.run()
+
+
+    # 2. Read the manifest and the shards
+    manifest = ShardedDataGenerator.load_manifest(dest_path)
+    assert manifest['num_rows'] == num_shards * num_episodes * num_cycles
+    assert manifest['env_params']['t_set'] == 10.0 and manifest['env_params']['action_repeat'] == 2
+    assert 'lr_power' in manifest['env_params']
+
+    for shard in manifest['shards']:
+        store = TrajectoryStore.open(dest_path + os.sep + shard['path'])
+        assert store.get_num_rows() == shard['num_rows']
+        generator.log(Log.C_LOG_TYPE_I, shard['path'], str(store.get_num_rows()), 'rows')
+
+
+    # 3. A dataset without episodes only consists of its manifest
+    empty_path = dest_path + os.sep + 'empty'
+    ShardedDataGenerator(p_env_cls=LS_SLEnv,
+                         p_path=empty_path,
+                         p_num_shards=2,
+                         p_num_episodes=0,
+                         p_num_cycles=num_cycles,
+                         p_num_workers=1,
+                         p_seed=1,
+                         p_logging=logging).run()
+    assert ShardedDataGenerator.load_manifest(empty_path)['num_rows'] == 0
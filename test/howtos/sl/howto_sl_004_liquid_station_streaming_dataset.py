@@ -0,0 +1,124 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_sl_004_liquid_station_streaming_dataset.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -- 2026-10-19  1.0.1     SY       Reward components of the last step of an episode
+## -- 2026-10-19  1.0.2     SY       Early leaving of the stream and repeated iterations
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.2 (2026-10-19)
+
+This example demonstrates the online training of a simple world model of the MPPS-based Liquid
+Laboratory Station, whose training data is streamed directly from the simulator.
+
+You will learn:
+    
+    1) How to stream transitions of batched MPPS environments as a torch IterableDataset.
+    
+    2) How to train a model on the stream, while the next batches are simulated in the background.
+
+    3) That a stream can be left early and that each iteration repeats the same transitions.
+    
+"""
+
+
+from mlpro_mpps.pool.ml.sl_environment.SL001_LS import LS_SLEnv
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.data.streaming import SimulatorIterableDataset
+from mlpro_mpps.data.actions import HoldActionGenerator
+from mlpro.bf.various import Log
+import threading
+import torch
+import time
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_envs        = 64
+    num_batches     = 5000
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_envs        = 4
+    num_batches     = 20
+
+
+# 1. Set up the stream of transitions
+dataset = SimulatorIterableDataset(p_env_cls=LS_SLEnv,
+                                   p_num_envs=num_envs,
+                                   p_num_batches=num_batches,
+                                   p_seed=1,
+                                   p_action_cls=HoldActionGenerator,
+                                   p_prefetch=8,
+                                   p_logging=logging)
+
+
+# 2. Train a model, which predicts the next state and the reward components
+model = None
+log = Log(p_logging=logging)
+
+for cycle, (states, actions, next_states, components) in enumerate(dataset):
+    if model is None:
+        model = torch.nn.Sequential(torch.nn.Linear(states.shape[1] + actions.shape[1], 64),
+                                    torch.nn.ReLU(),
+                                    torch.nn.Linear(64, next_states.shape[1] + components.shape[1]))
+        optimizer = torch.optim.Adam(model.parameters(), lr=1e-3)
+
+    prediction = model(torch.cat([states, actions], dim=1))
+    loss = torch.nn.functional.mse_loss(prediction, torch.cat([next_states, components], dim=1))
+    optimizer.zero_grad()
+    loss.backward()
+    optimizer.step()
+
+    if cycle % 100 == 0:
+        log.log(Log.C_LOG_TYPE_I, 'Batch', str(cycle), 'loss', '%.4f' % loss.item())
+
+
+
+# 3. Episodes limited to a few cycles: the transitions of the last step of each episode carry the
+#    reward components before the automatic reset, i.e. the same ones as without reset. The BGLP is
+#    used here, since its reward components (e.g. margins) depend on the fill levels.
+cycle_limit = 5
+streams = [SimulatorIterableDataset(p_env_cls=BGLP_RLEnv,
+                                    p_num_envs=num_envs,
+                                    p_num_batches=cycle_limit,
+                                    p_seed=2,
+                                    p_prefetch=0,
+                                    p_auto_reset=auto_reset,
+                                    cycle_limit=cycle_limit)
+           for auto_reset in [True, False]]
+
+for (states, actions, next_states, components), (_, _, next_states_ref, components_ref) in zip(*streams):
+    assert torch.equal(next_states, next_states_ref)
+    assert torch.equal(components, components_ref)
+
+
+
+# 4. Leaving the stream early stops the background simulation, even if the prefetch queue is full
+stream = SimulatorIterableDataset(p_env_cls=LS_SLEnv,
+                                  p_num_envs=num_envs,
+                                  p_num_batches=5,
+                                  p_seed=3,
+                                  p_prefetch=4)
+iterator = iter(stream)
+next(iterator)
+time.sleep(0.5)
+
+closing = threading.Thread(target=iterator.close, daemon=True)
+closing.start()
+closing.join(timeout=10)
+assert not closing.is_alive()
+
+
+# 5. Each iteration over the stream provides the same transitions
+epochs = [[batch for batch in stream] for epoch in range(2)]
+assert len(epochs[0]) == len(epochs[1]) == 5
+for batch, batch_ref in zip(*epochs):
+    assert all(torch.equal(tensor, tensor_ref) for tensor, tensor_ref in zip(batch, batch_ref))
@@ -0,0 +1,93 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_sl_005_liquid_station_parquet_log.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates how the simulation log of the MPPS-based Liquid Laboratory Station is
+streamed to a partitioned Parquet dataset while simulating.
+
+You will learn:
+
+    1) How to replace the in-memory episode recorder of an environment by a Parquet log sink.
+
+    2) How to read the dataset and single episodes back.
+
+"""
+
+
+from mlpro_mpps.pool.ml.sl_environment.SL001_LS import LS_SLEnv
+from mlpro_mpps.data.parquet import ParquetLogSink
+from mlpro.bf.various import Log
+import numpy as np
+import tempfile
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_episodes    = 5
+    num_cycles      = 2000
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_episodes    = 2
+    num_cycles      = 50
+
+
+# 1. Two identical environments, the second one streams its log to Parquet files
+env = LS_SLEnv(p_logging=logging)
+env_ref = LS_SLEnv(p_logging=Log.C_LOG_NOTHING)
+
+with tempfile.TemporaryDirectory() as dest_path:
+    sink = ParquetLogSink(p_path=dest_path,
+                          p_variables=env.data_storing.names,
+                          p_mpps=env._fct_strans,
+                          p_row_group_size=256)
+
+    # Rows are only accepted within an episode
+    try:
+        sink.memorize_row(np.zeros(len(sink.names)))
+        raise AssertionError('Row without episode accepted')
+    except RuntimeError:
+        pass
+
+    env.data_storing = sink
+
+
+    # 2. Simulation with random actions
+    rng = np.random.default_rng(1)
+
+    for episode in range(num_episodes):
+        env.reset(p_seed=episode)
+        env_ref.reset(p_seed=episode)
+
+        for cycle in range(num_cycles):
+            action = rng.uniform(size=env.get_action_space().get_num_dim())
+            env.process_action_values(action)
+            env_ref.process_action_values(action)
+
+    sink.close()
+
+
+    # 3. Read the dataset and compare each episode with the in-memory recording
+    table = sink.read()
+    assert table.num_rows == num_episodes * num_cycles == sink.get_num_rows()
+    assert len(sink.frame_id) == num_episodes
+
+    for frame_id in sink.frame_id:
+        episode = sink.read(frame_id)
+        values = np.column_stack([episode.column(name).to_numpy() for name in sink.names])
+        assert np.allclose(values, env_ref.data_storing.get_frame(frame_id).astype(np.float32), equal_nan=True)
+
+    env.log(Log.C_LOG_TYPE_I, 'Episodes:', str(len(sink.frame_id)), ', rows:', str(table.num_rows),
+            ', columns:', str(table.column_names))
+    env.log(Log.C_LOG_TYPE_I, 'Plant elements in the schema:', str(len(sink.get_schema().metadata[b'mpps_elements'])), 'bytes')
@@ -0,0 +1,98 @@
+## -------------------------------------------------------------------------------------------------
+## -- Project : MLPro - A Synoptic Framework for Standardized Machine Learning Tasks
+## -- Package : mlpro_mpps
+## -- Module  : howto_sl_006_BGLP_trajectory_archive.py
+## -------------------------------------------------------------------------------------------------
+## -- History :
+## -- yyyy-mm-dd  Ver.      Auth.    Description
+## -- 2026-10-19  0.0.0     SY       Creation
+## -- 2026-10-19  1.0.0     SY       Release of first version
+## -------------------------------------------------------------------------------------------------
+
+"""
+Ver. 1.0.0 (2026-10-19)
+
+This example demonstrates how the recorded episodes of the MPPS-based BGLP are stored in a compact
+trajectory archive.
+
+You will learn:
+
+    1) How to archive all episodes of the recorder of an environment.
+
+    2) How to archive channels of different kinds, i.e. continuous, binary and sparse channels.
+
+    3) How to load the archive and which precision the decoded channels have.
+
+"""
+
+
+from mlpro_mpps.pool.ml.rl_environment.RL001_BGLP import BGLP_RLEnv
+from mlpro_mpps.data.archive import TrajectoryArchive
+from mlpro.bf.various import Log
+import numpy as np
+import io
+
+
+
+
+if __name__ == "__main__":
+    logging         = Log.C_LOG_ALL
+    num_episodes    = 5
+    num_cycles      = 2000
+else:
+    logging         = Log.C_LOG_NOTHING
+    num_episodes    = 2
+    num_cycles      = 50
+
+
+# 1. Record some episodes with random actions
+env = BGLP_RLEnv(p_logging=Log.C_LOG_NOTHING)
+rng = np.random.default_rng(1)
+levels = []
+actions = []
+
+for episode in range(num_episodes):
+    env.reset(p_seed=episode)
+    for cycle in range(num_cycles):
+        action = rng.uniform(size=len(BGLP_RLEnv.C_AGENT_PARTITION))
+        env.process_action_values(action)
+        levels.append(env.get_state().get_values().copy())
+        actions.append(action)
+
+
+# 2. Archive all episodes of the recorder and decode them again
+archive = io.BytesIO()
+TrajectoryArchive.save_recorder(archive, env.data_storing, p_attrs=env.get_plant_parameters())
+archive.seek(0)
+frames = TrajectoryArchive.load_frames(archive)
+
+assert sorted(frames.keys()) == sorted(str(frame) for frame in env.data_storing.frame_id)
+for frame_id in env.data_storing.frame_id:
+    for name in env.data_storing.names:
+        values = env.data_storing.get_values(name, frame_id)
+        assert np.array_equal(frames[str(frame_id)][name], values.astype(np.float32))
+
+
+# 3. Channels of different kinds: continuous fill levels, binary switches and a sparse channel
+levels = np.array(levels)
+switches = np.array(actions) > 0.5
+overflow = np.where(rng.uniform(size=len(levels)) > 0.95, rng.uniform(size=len(levels)), 0.0)
+channels = {'levels': levels, 'switches': switches, 'overflow': overflow}
+
+archive = io.BytesIO()
+TrajectoryArchive.save(archive, channels, p_attrs={'t_set': env.t_set})
+size = archive.tell()
+archive.seek(0)
+decoded, attrs = TrajectoryArchive.load(archive)
+
+assert TrajectoryArchive.get_kind(switches) == TrajectoryArchive.C_KIND_BITS
+assert TrajectoryArchive.get_kind(overflow) == TrajectoryArchive.C_KIND_SPARSE
+assert TrajectoryArchive.get_kind(levels) == TrajectoryArchive.C_KIND_DELTA
+assert np.array_equal(decoded['levels'], levels.astype(np.float32))
+assert np.array_equal(decoded['switches'], switches)
+assert np.array_equal(decoded['overflow'], overflow.astype(np.float32))
+assert attrs['t_set'] == env.t_set
+
+raw = io.BytesIO()
+np.savez_compressed(raw, **channels)
+Log(p_logging=logging).log(Log.C_LOG_TYPE_I, 'Archive:', str(size), 'bytes, compressed raw arrays:', str(raw.tell()), 'bytes')